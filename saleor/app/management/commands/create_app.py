@@ -11,6 +11,7 @@ from .... import schema_version
 from ....app.headers import AppHeaders, DeprecatedAppHeaders
 from ....core.http_client import HTTPClient
 from ....core.utils import build_absolute_uri, get_domain
+from ....webhook.utils import invalidate_webhooks_routing_table
 from ...models import App
 from .utils import clean_permissions
 
@@ -84,6 +85,7 @@ class Command(BaseCommand):
             app.identifier = graphene.Node.to_global_id("App", app.pk)
             app.save(update_fields=["identifier"])
         app.permissions.set(permissions)
+        invalidate_webhooks_routing_table()
         _, auth_token = app.tokens.create()  # type: ignore[call-arg] # method of a related manager # noqa: E501
         data = {
             "auth_token": auth_token,
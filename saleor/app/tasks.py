@@ -9,6 +9,7 @@ from requests import HTTPError, RequestException
 from .. import celeryconf
 from ..core import JobStatus
 from ..core.models import EventDelivery, EventDeliveryAttempt, EventPayload
+from ..core.tasks import delete_files_from_storage_task
 from ..webhook.models import Webhook
 from .installation_utils import AppInstallationError, install_app
 from .models import App, AppExtension, AppInstallation, AppToken
@@ -61,12 +62,15 @@ def _raw_remove_deliveries(deliveries_ids):
         ).values_list("id", flat=True)
     )
     payloads = EventPayload.objects.filter(id__in=payloads_ids)
+    payload_file_paths = payloads.get_payload_file_paths()
     attempts = EventDeliveryAttempt.objects.filter(
         Exists(deliveries.filter(id=OuterRef("delivery_id")))
     )
     attempts._raw_delete(attempts.db)  # type: ignore[attr-defined] # raw access # noqa: E501
     deliveries._raw_delete(deliveries.db)  # type: ignore[attr-defined] # raw access # noqa: E501
     payloads._raw_delete(payloads.db)  # type: ignore[attr-defined] # raw access # noqa: E501
+    if payload_file_paths:
+        delete_files_from_storage_task.delay(payload_file_paths)
 
 
 @celeryconf.app.task
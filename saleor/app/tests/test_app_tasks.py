@@ -1,6 +1,7 @@
 from unittest.mock import Mock
 
 import pytest
+from django.core.files.storage import default_storage
 from django.utils import timezone
 from requests import RequestException
 from requests_hardened import HTTPSession
@@ -133,6 +134,25 @@ def test_remove_app_task_not_remove_not_own_payloads(
     assert EventPayload.objects.count() == 1
 
 
+def test_remove_app_task_removes_payload_files(
+    event_delivery_removed_app, settings, media_root
+):
+    # given
+    settings.EVENT_PAYLOAD_FILE_THRESHOLD = 1
+    payload = EventPayload.objects.create_with_payload('{"key": "data"}')
+    event_delivery_removed_app.payload = payload
+    event_delivery_removed_app.save(update_fields=["payload"])
+    path = payload.payload_file.name
+    assert default_storage.exists(path)
+
+    # when
+    remove_apps_task()
+
+    # then
+    assert not EventPayload.objects.filter(pk=payload.pk).exists()
+    assert not default_storage.exists(path)
+
+
 def test_remove_app_task_no_app_to_remove(app):
     # given
     assert App.objects.count() == 1
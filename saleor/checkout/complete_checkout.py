@@ -57,6 +57,7 @@ from ..tax.utils import (
     get_tax_class_kwargs_for_order_line,
 )
 from ..warehouse.availability import check_stock_and_preorder_quantity_bulk
+from ..warehouse.available_quantity import invalidate_available_quantities
 from ..warehouse.management import allocate_preorders, allocate_stocks
 from ..warehouse.models import Reservation, Stock
 from ..warehouse.reservations import is_reservation_enabled
@@ -1648,4 +1649,5 @@ def _reserve_stocks_without_availability_check(
                 )
             )
     Reservation.objects.bulk_create(reservations)
+    invalidate_available_quantities(variants_stocks_map.keys())
     return reservations
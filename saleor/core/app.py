@@ -3,6 +3,7 @@ from typing import Callable, Optional
 from django.apps import AppConfig
 from django.conf import settings
 from django.db.models import Field
+from django.db.models.signals import post_delete
 from django.utils.module_loading import import_string
 
 from .db.filters import PostgresILike
@@ -12,7 +13,15 @@ class CoreAppConfig(AppConfig):
     name = "saleor.core"
 
     def ready(self):
+        from .models import EventPayload
+        from .signals import delete_event_payload_file
+
         Field.register_lookup(PostgresILike)
+        post_delete.connect(
+            delete_event_payload_file,
+            sender=EventPayload,
+            dispatch_uid="delete_event_payload_file",
+        )
 
         if settings.SENTRY_DSN:
             settings.SENTRY_INIT(settings.SENTRY_DSN, settings.SENTRY_OPTS)
@@ -1,5 +1,16 @@
+import threading
+import time
+from contextlib import contextmanager
+from copy import copy
+from dataclasses import dataclass
+from http.cookiejar import CookiePolicy
+from typing import Optional
+
+import opentracing
 import requests_hardened
 from django.conf import settings
+from requests_hardened.host_header_adapter import HostHeaderSSLAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
 
 from .. import user_agent_version
 
@@ -11,4 +22,195 @@ HTTPConfig = requests_hardened.Config(
     user_agent_override=user_agent_version,
 )
 
-HTTPClient = requests_hardened.Manager(HTTPConfig)
+
+@dataclass
+class ConnectionPoolStats:
+    requests: int = 0
+    new_connections: int = 0
+    wait_time: float = 0.0
+
+    @property
+    def reuse_ratio(self) -> float:
+        """Return the share of requests sent over an already open connection."""
+        if not self.requests:
+            return 0.0
+        return max(self.requests - self.new_connections, 0) / self.requests
+
+
+_pool_stats: dict[str, ConnectionPoolStats] = {}
+_pool_stats_lock = threading.Lock()
+
+
+def get_connection_pool_stats() -> dict[str, ConnectionPoolStats]:
+    """Return connection pool statistics of the current process, by host."""
+    with _pool_stats_lock:
+        return {
+            host: ConnectionPoolStats(**vars(stats))
+            for host, stats in _pool_stats.items()
+        }
+
+
+def reset_connection_pool_stats():
+    with _pool_stats_lock:
+        _pool_stats.clear()
+
+
+def _record_pool_usage(host: str, wait_time: float, reused: bool):
+    with _pool_stats_lock:
+        stats = _pool_stats.setdefault(host, ConnectionPoolStats())
+        stats.requests += 1
+        stats.new_connections += 0 if reused else 1
+        stats.wait_time += wait_time
+    if span := opentracing.global_tracer().active_span:
+        span.set_tag("http.connection_reused", reused)
+        span.set_tag("http.connection_pool_wait_time", wait_time)
+
+
+class MeteredConnectionPoolMixin:
+    """Record connection reuse and time spent waiting for a pooled connection."""
+
+    last_used: float
+
+    def _get_conn(self, timeout=None):
+        num_connections = self.num_connections  # type: ignore[attr-defined]
+        start = time.monotonic()
+        conn = super()._get_conn(timeout)  # type: ignore[misc]
+        self.last_used = time.monotonic()
+        # Pools are keyed by the resolved IP when the IP filter is enabled, the
+        # original hostname is kept as the asserted hostname of HTTPS pools.
+        host = getattr(self, "assert_hostname", None) or self.host  # type: ignore[attr-defined]
+        _record_pool_usage(
+            host,
+            wait_time=self.last_used - start,
+            reused=self.num_connections == num_connections,  # type: ignore[attr-defined]
+        )
+        return conn
+
+
+class MeteredHTTPConnectionPool(MeteredConnectionPoolMixin, HTTPConnectionPool):
+    pass
+
+
+class MeteredHTTPSConnectionPool(MeteredConnectionPoolMixin, HTTPSConnectionPool):
+    pass
+
+
+class PooledHTTPAdapter(HostHeaderSSLAdapter):
+    """Adapter keeping bounded per-host pools of keep-alive connections.
+
+    Pools that were not used for `idle_timeout` seconds are closed before sending
+    the next request, so connections dropped by the other side are not reused.
+    """
+
+    def __init__(self, idle_timeout: int, **kwargs):
+        self.idle_timeout = idle_timeout
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": MeteredHTTPConnectionPool,
+            "https": MeteredHTTPSConnectionPool,
+        }
+
+    def send(self, request, **kwargs):
+        self.evict_idle_pools()
+        return super().send(request, **kwargs)
+
+    def evict_idle_pools(self):
+        cutoff = time.monotonic() - self.idle_timeout
+        pools = self.poolmanager.pools
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is not None and getattr(pool, "last_used", cutoff) < cutoff:
+                # Removing the pool from the container closes its connections.
+                del pools[key]
+
+
+class RejectCookiesPolicy(CookiePolicy):
+    """Cookie policy that neither stores nor sends any cookie."""
+
+    netscape = True
+    rfc2965 = False
+    hide_cookie2 = False
+
+    def set_ok(self, cookie, request):
+        return False
+
+    def return_ok(self, cookie, request):
+        return False
+
+    def domain_return_ok(self, domain, request):
+        return False
+
+    def path_return_ok(self, path, request):
+        return False
+
+
+class PooledHTTPSession(requests_hardened.HTTPSession):
+    """Long-lived session sending requests over pooled connections.
+
+    The session is shared by requests to different apps, which can be served from
+    the same IP, so cookies set by responses are never stored.
+    """
+
+    def __init__(self, config: requests_hardened.Config, **kwargs):
+        super().__init__(config, **kwargs)
+        self.cookies.set_policy(RejectCookiesPolicy())
+        adapter = PooledHTTPAdapter(
+            idle_timeout=settings.HTTP_POOL_IDLE_TIMEOUT,
+            pool_connections=settings.HTTP_POOL_MAX_HOSTS,
+            pool_maxsize=settings.HTTP_POOL_MAX_SIZE,
+        )
+        self.mount("http://", adapter)
+        self.mount("https://", adapter)
+
+
+class PooledManager(requests_hardened.Manager):
+    """HTTP client reusing connections to the same host between requests.
+
+    Each thread gets its own long-lived session, as sessions are not thread-safe.
+    The pooled session is shared by all requests sent through `send_request`, e.g.
+    synchronous webhooks, async webhook workers and app requests. Pooling is
+    enabled by setting `HTTP_POOL_IDLE_TIMEOUT`.
+    """
+
+    __slots__ = ("_local",)
+
+    def __init__(self, config: requests_hardened.Config):
+        super().__init__(config)
+        self._local = threading.local()
+
+    def clone(self):
+        return PooledManager(config=copy(self.config))
+
+    def get_pooled_session(self) -> Optional[PooledHTTPSession]:
+        if not settings.HTTP_POOL_IDLE_TIMEOUT:
+            return None
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = PooledHTTPSession(self.config)
+            self._local.session = session
+        return session
+
+    @contextmanager
+    def get_batch_session(self):
+        """Return a session for sending many requests in a row.
+
+        The pooled session is used when pooling is enabled, otherwise a new session
+        is opened and closed after the batch.
+        """
+        if pooled_session := self.get_pooled_session():
+            yield pooled_session
+            return
+        with self.get_session() as session:
+            session.cookies.set_policy(RejectCookiesPolicy())
+            yield session
+
+    def send_request(self, method: str, url: str, **kwargs):
+        if session := self.get_pooled_session():
+            return session.request(method, url, **kwargs)
+        return super().send_request(method, url, **kwargs)
+
+
+HTTPClient = PooledManager(HTTPConfig)
@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+
+from ...partitioning import partition_event_tables
+
+
+class Command(BaseCommand):
+    help = (
+        "Convert EventPayload, EventDelivery and EventDeliveryAttempt tables into "
+        "tables partitioned daily by creation date. Expired data of partitioned "
+        "tables is removed by dropping whole partitions."
+    )
+
+    def handle(self, **options):
+        partition_event_tables()
+        self.stdout.write("Event tables are partitioned.")
@@ -1,5 +1,9 @@
 from django.core.management.base import BaseCommand
+from django.db.models import Q
 
+from ....product.models import Product
+from ....product.search import get_products_search_vector_shards
+from ....product.tasks import update_products_search_vector_shard_task
 from ...search_tasks import (
     set_order_search_document_values,
     set_product_search_document_values,
@@ -10,10 +14,31 @@ from ...search_tasks import (
 class Command(BaseCommand):
     help = "Populate search indexes."
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--product-shards",
+            type=int,
+            dest="product_shards",
+            default=0,
+            help=(
+                "Split not indexed and dirty products into the given number of "
+                "shards indexed in parallel."
+            ),
+        )
+
     def handle(self, *args, **options):
         # Update products
         self.stdout.write("Updating products")
-        set_product_search_document_values.delay()
+        if product_shards := options.get("product_shards"):
+            products = Product.objects.filter(
+                Q(search_vector=None) | Q(search_index_dirty=True)
+            )
+            shards = get_products_search_vector_shards(products, product_shards)
+            for start_id, end_id in shards:
+                update_products_search_vector_shard_task.delay(start_id, end_id)
+            self.stdout.write(f"Scheduled {len(shards)} product shards")
+        else:
+            set_product_search_document_values.delay()
 
         # Update orders
         self.stdout.write("Updating orders")
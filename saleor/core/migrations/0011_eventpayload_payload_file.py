@@ -0,0 +1,22 @@
+# Generated by Django 3.2.24 on 2026-10-17 10:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("core", "0010_drop_vatlayer_tables"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="eventpayload",
+            name="payload_file",
+            field=models.FileField(blank=True, null=True, upload_to="event-payloads"),
+        ),
+        migrations.AlterField(
+            model_name="eventpayload",
+            name="payload",
+            field=models.TextField(default=""),
+        ),
+    ]
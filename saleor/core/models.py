@@ -1,8 +1,12 @@
 import datetime
+import gzip
+import uuid
 from typing import Any, TypeVar
 
 import pytz
+from django.conf import settings
 from django.contrib.postgres.indexes import GinIndex
+from django.core.files.base import ContentFile
 from django.db import models, transaction
 from django.db.models import F, JSONField, Max, Q
 
@@ -143,10 +147,51 @@ class Job(models.Model):
         abstract = True
 
 
+class EventPayloadQuerySet(models.QuerySet["EventPayload"]):
+    def create_with_payload(self, payload: str) -> "EventPayload":
+        event_payload = self.model()
+        event_payload.set_payload(payload)
+        event_payload.save(using=self.db)
+        return event_payload
+
+    def get_payload_file_paths(self) -> list[str]:
+        paths = self.filter(payload_file__gt="").values_list("payload_file", flat=True)
+        return [path for path in paths if path]
+
+
+EventPayloadManager = models.Manager.from_queryset(EventPayloadQuerySet)
+
+
 class EventPayload(models.Model):
-    payload = models.TextField()
+    payload = models.TextField(default="")
+    payload_file = models.FileField(upload_to="event-payloads", blank=True, null=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    objects: Any = EventPayloadManager()
+
+    def set_payload(self, payload: str):
+        """Set the payload, offloading large ones to the file storage.
+
+        Payloads above `EVENT_PAYLOAD_FILE_THRESHOLD` bytes are compressed and saved
+        in the storage, and only the reference is kept in the database.
+        """
+        threshold = settings.EVENT_PAYLOAD_FILE_THRESHOLD
+        data = payload.encode("utf-8") if threshold else b""
+        if not threshold or len(data) <= threshold:
+            self.payload = payload
+            return
+        self.payload = ""
+        self.payload_file.save(
+            f"{uuid.uuid4()}.json.gz", ContentFile(gzip.compress(data)), save=False
+        )
+
+    def get_payload(self) -> str:
+        if not self.payload_file:
+            return self.payload
+        with self.payload_file.open("rb") as payload_file:
+            with gzip.GzipFile(fileobj=payload_file) as decompressed_file:
+                return decompressed_file.read().decode("utf-8")
+
 
 class EventDelivery(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
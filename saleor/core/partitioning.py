@@ -0,0 +1,443 @@
+"""Native PostgreSQL range partitioning of the webhook event tables.
+
+Event payloads, deliveries and delivery attempts grow quickly and are kept only
+for `EVENT_PAYLOAD_DELETE_PERIOD`. Partitioning them by `created_at` into daily
+partitions allows removing the expired data by dropping whole partitions instead
+of deleting rows in batches.
+
+Partitioning is optional. The tables are converted by the `partition_event_tables`
+management command. Once they are partitioned, `delete_event_payloads_task` drops
+expired partitions and creates the upcoming ones.
+"""
+
+import datetime
+import logging
+import re
+from typing import Optional
+
+from django.conf import settings
+from django.db import connections, transaction
+from django.db.models import ForeignKey, Model
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from .models import EventDelivery, EventDeliveryAttempt, EventPayload
+
+logger = logging.getLogger(__name__)
+
+EVENT_MODELS: tuple[type[Model], ...] = (
+    EventPayload,
+    EventDelivery,
+    EventDeliveryAttempt,
+)
+
+PARTITION_DATE_FORMAT = "%Y%m%d"
+PARTITION_UPPER_BOUND_RE = re.compile(r"TO \('([^']+)'\)")
+
+
+def _quote(name: str, using: str) -> str:
+    return connections[using].ops.quote_name(name)
+
+
+def _get_day_start(day: datetime.date) -> datetime.datetime:
+    return datetime.datetime.combine(
+        day, datetime.time.min, tzinfo=datetime.timezone.utc
+    )
+
+
+def get_partition_name(model: type[Model], day: datetime.date) -> str:
+    return f"{model._meta.db_table}_p{day.strftime(PARTITION_DATE_FORMAT)}"
+
+
+def get_default_partition_name(model: type[Model]) -> str:
+    return f"{model._meta.db_table}_default"
+
+
+def is_partitioned(
+    model: type[Model], using: str = settings.DATABASE_CONNECTION_DEFAULT_NAME
+) -> bool:
+    with connections[using].cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT EXISTS (
+                SELECT 1
+                FROM pg_partitioned_table
+                JOIN pg_class ON pg_class.oid = pg_partitioned_table.partrelid
+                WHERE pg_class.relname = %s
+            )
+            """,
+            [model._meta.db_table],
+        )
+        return cursor.fetchone()[0]
+
+
+def get_partitions(
+    model: type[Model], using: str = settings.DATABASE_CONNECTION_DEFAULT_NAME
+) -> dict[str, Optional[datetime.datetime]]:
+    """Return partitions of the model's table with their upper bounds.
+
+    The upper bound of the default partition is None.
+    """
+    with connections[using].cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT child.relname, pg_get_expr(child.relpartbound, child.oid)
+            FROM pg_inherits
+            JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+            JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+            WHERE parent.relname = %s
+            """,
+            [model._meta.db_table],
+        )
+        rows = cursor.fetchall()
+
+    partitions: dict[str, Optional[datetime.datetime]] = {}
+    for name, bound in rows:
+        match = PARTITION_UPPER_BOUND_RE.search(bound)
+        partitions[name] = parse_datetime(match.group(1)) if match else None
+    return partitions
+
+
+def get_partitioning_upper_bound() -> datetime.datetime:
+    """Return the upper bound of the partition made of the existing table.
+
+    Rows are inserted into the existing table until it's attached, so the bound
+    leaves at least a day for preparing and converting the table.
+    """
+    return _get_day_start(timezone.now().date() + datetime.timedelta(days=2))
+
+
+def _get_partition_check_name(model: type[Model]) -> str:
+    return f"{model._meta.db_table}_partition_check"
+
+
+def _get_partition_pkey_name(model: type[Model]) -> str:
+    return f"{model._meta.db_table}_partition_pkey"
+
+
+def prepare_table_for_partitioning(
+    model: type[Model],
+    upper_bound: datetime.datetime,
+    using: str = settings.DATABASE_CONNECTION_DEFAULT_NAME,
+):
+    """Validate the rows and build the primary key index of the future partition.
+
+    Run outside of a transaction, it doesn't block writes to the table. The check
+    constraint is validated without locking out writes and the index is built
+    concurrently, so attaching the table as a partition needs neither to scan it
+    nor to build the index.
+    """
+    table = _quote(model._meta.db_table, using)
+    check_name = _quote(_get_partition_check_name(model), using)
+    pkey_name = _quote(_get_partition_pkey_name(model), using)
+    pk_column = _quote(model._meta.pk.column, using)  # type: ignore[union-attr]
+    connection = connections[using]
+    concurrently = "" if connection.in_atomic_block else " CONCURRENTLY"
+    with connection.cursor() as cursor:
+        cursor.execute(f"ALTER TABLE {table} DROP CONSTRAINT IF EXISTS {check_name}")
+        cursor.execute(
+            f"ALTER TABLE {table} ADD CONSTRAINT {check_name} "
+            "CHECK (created_at IS NOT NULL AND created_at < %s) NOT VALID",
+            [upper_bound],
+        )
+        cursor.execute(f"ALTER TABLE {table} VALIDATE CONSTRAINT {check_name}")
+        # An index left invalid by an interrupted concurrent build is not reused.
+        cursor.execute(f"DROP INDEX{concurrently} IF EXISTS {pkey_name}")
+        cursor.execute(
+            f"CREATE UNIQUE INDEX{concurrently} {pkey_name} "
+            f"ON {table} ({pk_column}, created_at)"
+        )
+
+
+def partition_table(
+    model: type[Model],
+    upper_bound: datetime.datetime,
+    using: str = settings.DATABASE_CONNECTION_DEFAULT_NAME,
+):
+    """Convert the model's table into a table partitioned by `created_at`.
+
+    The existing table becomes the first partition holding all rows created
+    before the upper bound, so no data is copied. The table has to be prepared by
+    `prepare_table_for_partitioning` with the same bound first; otherwise
+    attaching it validates all its rows and builds the primary key index while
+    the table is locked.
+
+    PostgreSQL can't reference partitioned tables by `id` alone, so the foreign
+    keys between the event tables are dropped. Cascade deletion is still handled
+    by Django.
+    """
+    table = model._meta.db_table
+    legacy_table = f"{table}_legacy"
+    pk_column = model._meta.pk.column  # type: ignore[union-attr]
+    event_tables = [event_model._meta.db_table for event_model in EVENT_MODELS]
+
+    connection = connections[using]
+    with transaction.atomic(using=using), connection.cursor() as cursor:
+        # Rows inserted in the same transaction may have pending foreign key
+        # checks, which block altering the table.
+        cursor.execute("SET CONSTRAINTS ALL IMMEDIATE")
+        cursor.execute(
+            """
+            SELECT conrelid::regclass::text, conname
+            FROM pg_constraint
+            WHERE contype = 'f'
+            AND (conrelid = %s::regclass OR confrelid = %s::regclass)
+            AND conrelid::regclass::text = ANY(%s)
+            AND confrelid::regclass::text = ANY(%s)
+            """,
+            [table, table, event_tables, event_tables],
+        )
+        for constraint_table, constraint_name in cursor.fetchall():
+            cursor.execute(
+                f"ALTER TABLE {_quote(constraint_table, using)} "
+                f"DROP CONSTRAINT {_quote(constraint_name, using)}"
+            )
+        cursor.execute("SELECT pg_get_serial_sequence(%s, %s)", [table, pk_column])
+        sequence = cursor.fetchone()[0]
+        # The primary key of partitions has to include the partition key. It's
+        # replaced by the prebuilt index, which is attached to the primary key of
+        # the partitioned table instead of building a new one.
+        cursor.execute(
+            "SELECT conname FROM pg_constraint "
+            "WHERE contype = 'p' AND conrelid = %s::regclass",
+            [table],
+        )
+        for (constraint_name,) in cursor.fetchall():
+            cursor.execute(
+                f"ALTER TABLE {_quote(table, using)} "
+                f"DROP CONSTRAINT {_quote(constraint_name, using)}"
+            )
+        pkey_name = _quote(_get_partition_pkey_name(model), using)
+        cursor.execute(
+            f"ALTER TABLE {_quote(table, using)} "
+            f"ADD CONSTRAINT {pkey_name} PRIMARY KEY USING INDEX {pkey_name}"
+        )
+
+        cursor.execute(
+            f"ALTER TABLE {_quote(table, using)} RENAME TO {_quote(legacy_table, using)}"
+        )
+        cursor.execute(
+            f"CREATE TABLE {_quote(table, using)} "
+            f"(LIKE {_quote(legacy_table, using)} "
+            "INCLUDING DEFAULTS INCLUDING CONSTRAINTS) "
+            "PARTITION BY RANGE (created_at)"
+        )
+        # The bound check is needed only by the partition made of the legacy table.
+        cursor.execute(
+            f"ALTER TABLE {_quote(table, using)} DROP CONSTRAINT IF EXISTS "
+            f"{_quote(_get_partition_check_name(model), using)}"
+        )
+        cursor.execute(
+            f"ALTER TABLE {_quote(table, using)} "
+            f"ADD PRIMARY KEY ({_quote(pk_column, using)}, created_at)"
+        )
+        if sequence:
+            cursor.execute(
+                f"ALTER SEQUENCE {sequence} "
+                f"OWNED BY {_quote(table, using)}.{_quote(pk_column, using)}"
+            )
+        cursor.execute(
+            f"ALTER TABLE {_quote(table, using)} "
+            f"ATTACH PARTITION {_quote(legacy_table, using)} "
+            "FOR VALUES FROM (MINVALUE) TO (%s)",
+            [upper_bound],
+        )
+        # The partition bound is enforced from now on.
+        cursor.execute(
+            f"ALTER TABLE {_quote(legacy_table, using)} DROP CONSTRAINT IF EXISTS "
+            f"{_quote(_get_partition_check_name(model), using)}"
+        )
+        cursor.execute(
+            f"CREATE TABLE {_quote(get_default_partition_name(model), using)} "
+            f"PARTITION OF {_quote(table, using)} DEFAULT"
+        )
+
+        # Matching indexes and foreign keys of the legacy partition are attached
+        # instead of being created again.
+        for field in model._meta.fields:
+            if field.primary_key:
+                continue
+            if field.db_index:  # type: ignore[attr-defined]
+                cursor.execute(
+                    f"CREATE INDEX ON {_quote(table, using)} "
+                    f"({_quote(field.column, using)})"
+                )
+            if (
+                isinstance(field, ForeignKey)
+                and field.related_model not in EVENT_MODELS
+            ):
+                cursor.execute(
+                    f"ALTER TABLE {_quote(table, using)} "
+                    f"ADD FOREIGN KEY ({_quote(field.column, using)}) "
+                    f"REFERENCES {_quote(field.target_field.model._meta.db_table, using)} "
+                    f"({_quote(field.target_field.column, using)}) "
+                    "DEFERRABLE INITIALLY DEFERRED"
+                )
+
+
+def create_partitions(
+    model: type[Model],
+    until: datetime.date,
+    using: str = settings.DATABASE_CONNECTION_DEFAULT_NAME,
+) -> list[str]:
+    """Create daily partitions following the existing ones up to the given day.
+
+    Days with rows that landed in the default partition are skipped, as such
+    partition can't be created without moving the rows.
+    """
+    partitions = get_partitions(model, using)
+    upper_bounds = [bound for bound in partitions.values() if bound is not None]
+    start = max(upper_bounds).date() if upper_bounds else timezone.now().date()
+
+    table = model._meta.db_table
+    default_partition = get_default_partition_name(model)
+    created = []
+    with connections[using].cursor() as cursor:
+        if default_partition in partitions:
+            cursor.execute(
+                f"SELECT MAX(created_at) FROM {_quote(default_partition, using)}"
+            )
+            latest_default_row = cursor.fetchone()[0]
+            if latest_default_row and latest_default_row.date() >= start:
+                start = latest_default_row.date() + datetime.timedelta(days=1)
+
+        day = start
+        while day <= until:
+            name = get_partition_name(model, day)
+            cursor.execute(
+                f"CREATE TABLE {_quote(name, using)} "
+                f"PARTITION OF {_quote(table, using)} FOR VALUES FROM (%s) TO (%s)",
+                [_get_day_start(day), _get_day_start(day + datetime.timedelta(days=1))],
+            )
+            created.append(name)
+            day += datetime.timedelta(days=1)
+    return created
+
+
+def _fetch_payload_file_paths(cursor) -> list[str]:
+    return [path for (path,) in cursor.fetchall() if path]
+
+
+def _get_referencing_columns(model: type[Model]) -> list[tuple[str, str]]:
+    """Return tables and columns of the event tables referencing the model."""
+    return [
+        (event_model._meta.db_table, field.column)
+        for event_model in EVENT_MODELS
+        for field in event_model._meta.fields
+        if isinstance(field, ForeignKey) and field.related_model is model
+    ]
+
+
+def drop_expired_partitions(
+    model: type[Model],
+    expiration_date: datetime.datetime,
+    using: str = settings.DATABASE_CONNECTION_DEFAULT_NAME,
+) -> list[str]:
+    """Drop partitions containing only rows created before the expiration date.
+
+    Expired rows of the default partition are deleted. Partitions and rows still
+    referenced by rows of other event tables are kept until the referencing rows
+    are removed, as there are no foreign keys between the partitioned tables.
+    Payload files stored outside the database are deleted together with their
+    event payloads.
+    """
+    partitions = get_partitions(model, using)
+    has_payload_files = model is EventPayload
+    pk_column = _quote(model._meta.pk.column, using)  # type: ignore[union-attr]
+    referencing_columns = [
+        (_quote(table, using), _quote(column, using))
+        for table, column in _get_referencing_columns(model)
+    ]
+    dropped = []
+    payload_file_paths: list[str] = []
+    with connections[using].cursor() as cursor:
+        for name, upper_bound in sorted(partitions.items()):
+            partition = _quote(name, using)
+            if upper_bound is None:
+                not_referenced = "".join(
+                    f" AND NOT EXISTS (SELECT 1 FROM {table} "
+                    f"WHERE {table}.{column} = {partition}.{pk_column})"
+                    for table, column in referencing_columns
+                )
+                returning = " RETURNING payload_file" if has_payload_files else ""
+                cursor.execute(
+                    f"DELETE FROM {partition} "
+                    f"WHERE created_at < %s{not_referenced}{returning}",
+                    [expiration_date],
+                )
+                if has_payload_files:
+                    payload_file_paths.extend(_fetch_payload_file_paths(cursor))
+            elif upper_bound <= expiration_date:
+                if _is_partition_referenced(
+                    cursor, partition, pk_column, referencing_columns
+                ):
+                    continue
+                if has_payload_files:
+                    cursor.execute(f"SELECT payload_file FROM {partition}")
+                    payload_file_paths.extend(_fetch_payload_file_paths(cursor))
+                cursor.execute(f"DROP TABLE {partition}")
+                dropped.append(name)
+    if payload_file_paths:
+        from .tasks import delete_files_from_storage_task
+
+        transaction.on_commit(
+            lambda: delete_files_from_storage_task.delay(payload_file_paths),
+            using=using,
+        )
+    return dropped
+
+
+def _is_partition_referenced(
+    cursor, partition: str, pk_column: str, referencing_columns: list[tuple[str, str]]
+) -> bool:
+    for table, column in referencing_columns:
+        cursor.execute(
+            f"SELECT EXISTS (SELECT 1 FROM {table} "
+            f"WHERE {column} IN (SELECT {pk_column} FROM {partition}))"
+        )
+        if cursor.fetchone()[0]:
+            return True
+    return False
+
+
+def partition_event_tables(
+    using: str = settings.DATABASE_CONNECTION_DEFAULT_NAME,
+):
+    """Partition all event tables and create their upcoming partitions.
+
+    Each table is converted in a separate transaction, after it was prepared
+    outside of a transaction. Tables that are already partitioned are skipped, so
+    an interrupted conversion can be run again.
+    """
+    until = timezone.now().date() + datetime.timedelta(
+        days=settings.EVENT_PARTITIONS_PREMAKE_DAYS
+    )
+    upper_bound = get_partitioning_upper_bound()
+    for model in EVENT_MODELS:
+        if not is_partitioned(model, using):
+            prepare_table_for_partitioning(model, upper_bound, using)
+            partition_table(model, upper_bound, using)
+        with transaction.atomic(using=using):
+            create_partitions(model, until, using)
+
+
+def rotate_event_partitions(
+    expiration_date: datetime.datetime,
+    using: str = settings.DATABASE_CONNECTION_DEFAULT_NAME,
+) -> list[str]:
+    """Drop expired partitions of the event tables and create the upcoming ones.
+
+    Referencing tables are processed first, so their expired partitions are
+    dropped before the partitions of the tables they reference.
+    """
+    until = timezone.now().date() + datetime.timedelta(
+        days=settings.EVENT_PARTITIONS_PREMAKE_DAYS
+    )
+    dropped = []
+    for model in reversed(EVENT_MODELS):
+        with transaction.atomic(using=using):
+            dropped.extend(drop_expired_partitions(model, expiration_date, using))
+            create_partitions(model, until, using)
+    if dropped:
+        logger.info("Dropped expired event partitions: %s", ", ".join(dropped))
+    return dropped
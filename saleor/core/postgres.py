@@ -7,7 +7,7 @@ from django.contrib.postgres.search import (
     SearchVector,
     SearchVectorCombinable,
 )
-from django.db.models import Expression
+from django.db.models import BooleanField, Expression
 
 logger = logging.getLogger(__name__)
 
@@ -139,3 +139,59 @@ class FlatConcat(Expression):
 class FlatConcatSearchVector(FlatConcat):
     max_expression_count = settings.INDEX_MAXIMUM_EXPR_COUNT
     silent_drop_expression = True
+
+
+class RowValueComparison(Expression):
+    """Generate a SQL statement comparing two row values.
+
+    The result is a condition like ``(name, slug) > (%s, %s)``. Unlike the
+    equivalent chain of ``OR`` filters, PostgreSQL can evaluate it with a single
+    range scan of a composite index on the compared columns.
+    """
+
+    template = "(%(lhs)s) %(operator)s (%(rhs)s)"
+    arg_joiner = ", "
+    operators = {"gt": ">", "lt": "<"}
+
+    contains_aggregate = False
+    contains_over_clause = False
+
+    def __init__(self, lhs, rhs, lookup: str):
+        if len(lhs) != len(rhs):
+            raise ValueError("Compared row values must have the same length")
+        super().__init__(output_field=BooleanField())
+        self.lhs = self._parse_expressions(*lhs)  # type: ignore[attr-defined] # private method of BaseExpression # noqa: E501
+        self.rhs = self._parse_expressions(*rhs)  # type: ignore[attr-defined] # private method of BaseExpression # noqa: E501
+        self.operator = self.operators[lookup]
+
+    def get_source_expressions(self):
+        return [*self.lhs, *self.rhs]
+
+    def set_source_expressions(self, exprs):
+        self.lhs, self.rhs = exprs[: len(self.lhs)], exprs[len(self.lhs) :]
+
+    def resolve_expression(
+        self, query=None, allow_joins=True, reuse=None, summarize=False, for_save=False
+    ):
+        c = self.copy()
+        c.is_summary = summarize
+        c.set_source_expressions(
+            [
+                expr.resolve_expression(query, allow_joins, reuse, summarize, for_save)
+                for expr in c.get_source_expressions()
+            ]
+        )
+        return c
+
+    def as_sql(self, compiler, connection, **_extra_context):
+        connection.ops.check_expression_support(self)
+        data = {"operator": self.operator}
+        params: list = []
+        for side, expressions in (("lhs", self.lhs), ("rhs", self.rhs)):
+            sql_parts = []
+            for arg in expressions:
+                arg_sql, arg_params = compiler.compile(arg)
+                sql_parts.append(arg_sql)
+                params.extend(arg_params)
+            data[side] = self.arg_joiner.join(sql_parts)
+        return self.template % data, params
@@ -6,10 +6,7 @@ from ..celeryconf import app
 from ..order.models import Order
 from ..order.search import prepare_order_search_vector_value
 from ..product.models import Product
-from ..product.search import (
-    PRODUCT_FIELDS_TO_PREFETCH,
-    prepare_product_search_vector_value,
-)
+from ..product.search import update_products_search_vector_in_bulk
 from .postgres import FlatConcatSearchVector
 
 task_logger = get_task_logger(__name__)
@@ -82,29 +79,24 @@ def set_order_search_document_values(updated_count: int = 0) -> None:
 
 @app.task
 def set_product_search_document_values(updated_count: int = 0) -> None:
-    products = list(
+    product_ids = list(
         Product.objects.filter(search_vector=None)
-        .prefetch_related(*PRODUCT_FIELDS_TO_PREFETCH)
-        .order_by("-id")[:BATCH_SIZE]
+        .order_by("-id")
+        .values_list("id", flat=True)[:BATCH_SIZE]
     )
 
-    if not products:
+    if not product_ids:
         task_logger.info("No products to update.")
         return
 
-    updated_count += set_search_vector_values(
-        products,
-        prepare_product_search_vector_value,
-    )
+    updated_count += update_products_search_vector_in_bulk(product_ids)
 
     task_logger.info("Updated %d products", updated_count)
 
-    if len(products) < BATCH_SIZE:
+    if len(product_ids) < BATCH_SIZE:
         task_logger.info("Setting product search document values finished.")
         return
 
-    del products
-
     set_product_search_document_values.delay(updated_count)
 
 
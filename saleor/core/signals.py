@@ -0,0 +1,13 @@
+from functools import partial
+
+from django.db import transaction
+
+from .tasks import delete_from_storage_task
+
+
+def delete_event_payload_file(sender, instance, using, **kwargs):
+    if payload_file := instance.payload_file:
+        # The file is kept when the deletion is rolled back.
+        transaction.on_commit(
+            partial(delete_from_storage_task.delay, payload_file.name), using=using
+        )
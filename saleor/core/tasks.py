@@ -9,6 +9,7 @@ from django.utils import timezone
 
 from ..celeryconf import app
 from .models import EventDelivery, EventPayload
+from .partitioning import is_partitioned, rotate_event_partitions
 
 task_logger: logging.Logger = get_task_logger(__name__)
 
@@ -25,11 +26,16 @@ def delete_from_storage_task(path):
 
 @app.task
 def delete_event_payloads_task(expiration_date=None):
+    delete_period = timezone.now() - settings.EVENT_PAYLOAD_DELETE_PERIOD
+    if is_partitioned(EventPayload):
+        # Expired data of partitioned tables is removed by dropping partitions.
+        rotate_event_partitions(delete_period)
+        return
+
     expiration_date = (
         expiration_date
         or timezone.now() + settings.EVENT_PAYLOAD_DELETE_TASK_TIME_LIMIT
     )
-    delete_period = timezone.now() - settings.EVENT_PAYLOAD_DELETE_PERIOD
     valid_deliveries = EventDelivery.objects.filter(created_at__gt=delete_period)
     payloads_to_delete = EventPayload.objects.filter(
         ~Exists(valid_deliveries.filter(payload_id=OuterRef("id")))
@@ -1,8 +1,24 @@
+import io
+import threading
+from http.client import parse_headers
+from unittest import mock
+
+import pytest
 import requests_hardened
 from django.conf import settings
 from requests import Request
+from requests.adapters import HTTPAdapter
+from urllib3 import HTTPResponse
 
 from ... import user_agent_version
+from ..http_client import (
+    MeteredHTTPConnectionPool,
+    PooledHTTPAdapter,
+    PooledHTTPSession,
+    PooledManager,
+    get_connection_pool_stats,
+    reset_connection_pool_stats,
+)
 
 HTTPConfig = requests_hardened.Config(
     ip_filter_enable=settings.HTTP_IP_FILTER_ENABLED,
@@ -25,3 +41,136 @@ def test_user_agent_override():
 
     # then
     assert request.headers.get("User-Agent") == user_agent_version
+
+
+@pytest.fixture(autouse=True)
+def _reset_pool_stats():
+    reset_connection_pool_stats()
+    yield
+    reset_connection_pool_stats()
+
+
+def test_metered_connection_pool_reuses_connection():
+    # given
+    pool = MeteredHTTPConnectionPool("example.com", maxsize=1)
+    pool._put_conn(pool._get_conn())
+
+    # when
+    pool._get_conn()
+
+    # then
+    stats = get_connection_pool_stats()["example.com"]
+    assert stats.requests == 2
+    assert stats.new_connections == 1
+    assert stats.reuse_ratio == 0.5
+
+
+def test_pooled_http_adapter_evicts_idle_pools():
+    # given
+    adapter = PooledHTTPAdapter(idle_timeout=60)
+    pool = adapter.poolmanager.connection_from_url("http://example.com")
+    assert isinstance(pool, MeteredHTTPConnectionPool)
+    pool._put_conn(pool._get_conn())
+
+    # when
+    with mock.patch(
+        "saleor.core.http_client.time.monotonic",
+        return_value=pool.last_used + 61,
+    ):
+        adapter.evict_idle_pools()
+
+    # then
+    assert len(adapter.poolmanager.pools) == 0
+
+
+def test_pooled_http_adapter_keeps_recently_used_pools():
+    # given
+    adapter = PooledHTTPAdapter(idle_timeout=60)
+    pool = adapter.poolmanager.connection_from_url("http://example.com")
+    pool._put_conn(pool._get_conn())
+
+    # when
+    adapter.evict_idle_pools()
+
+    # then
+    assert len(adapter.poolmanager.pools) == 1
+
+
+def test_pooled_manager_reuses_session_per_thread(settings):
+    # given
+    settings.HTTP_POOL_IDLE_TIMEOUT = 60
+    manager = PooledManager(HTTPConfig)
+
+    # when
+    session = manager.get_pooled_session()
+
+    # then
+    assert isinstance(session, PooledHTTPSession)
+    assert manager.get_pooled_session() is session
+    assert isinstance(session.get_adapter("https://example.com"), PooledHTTPAdapter)
+    other_thread_sessions = []
+    thread = threading.Thread(
+        target=lambda: other_thread_sessions.append(manager.get_pooled_session())
+    )
+    thread.start()
+    thread.join()
+    assert other_thread_sessions[0] is not session
+
+
+@mock.patch.object(requests_hardened.HTTPSession, "request")
+def test_pooled_manager_pool_disabled(mocked_request, settings):
+    # given
+    settings.HTTP_POOL_IDLE_TIMEOUT = None
+    manager = PooledManager(HTTPConfig)
+
+    # when
+    manager.send_request("POST", "https://example.com", data="{}")
+
+    # then
+    assert manager.get_pooled_session() is None
+    mocked_request.assert_called_once_with("POST", "https://example.com", data="{}")
+
+
+class SetCookieAdapter(HTTPAdapter):
+    def send(self, request, **kwargs):
+        headers = parse_headers(io.BytesIO(b"Set-Cookie: token=secret; Path=/\r\n\r\n"))
+        raw = HTTPResponse(
+            body=io.BytesIO(b""),
+            headers=dict(headers),
+            status=200,
+            preload_content=False,
+            original_response=mock.Mock(msg=headers),
+        )
+        return self.build_response(request, raw)
+
+
+def test_pooled_session_does_not_store_cookies(settings):
+    # given
+    settings.HTTP_POOL_IDLE_TIMEOUT = 60
+    session = PooledManager(HTTPConfig).get_pooled_session()
+    session.mount("https://", SetCookieAdapter())
+
+    # when
+    response = session.send(Request("GET", "https://app.example.com/").prepare())
+    next_request = session.prepare_request(Request("GET", "https://app.example.com/"))
+
+    # then
+    assert response.cookies["token"] == "secret"
+    assert not session.cookies
+    assert "Cookie" not in next_request.headers
+
+
+@mock.patch.object(requests_hardened.HTTPSession, "close")
+def test_pooled_manager_batch_session_without_pool(mocked_close, settings):
+    # given
+    settings.HTTP_POOL_IDLE_TIMEOUT = None
+    manager = PooledManager(HTTPConfig)
+
+    # when
+    with manager.get_batch_session() as session:
+        pass
+
+    # then
+    assert isinstance(session, requests_hardened.HTTPSession)
+    assert not isinstance(session, PooledHTTPSession)
+    mocked_close.assert_called_once_with()
@@ -0,0 +1,88 @@
+import gzip
+
+from django.core.files.storage import default_storage
+from django.db import transaction
+
+from ..models import EventPayload
+
+PAYLOAD = '{"key": "data"}'
+
+
+def test_event_payload_set_payload_below_threshold(settings, media_root):
+    # given
+    settings.EVENT_PAYLOAD_FILE_THRESHOLD = len(PAYLOAD)
+
+    # when
+    event_payload = EventPayload.objects.create_with_payload(PAYLOAD)
+
+    # then
+    event_payload.refresh_from_db()
+    assert event_payload.payload == PAYLOAD
+    assert not event_payload.payload_file
+    assert event_payload.get_payload() == PAYLOAD
+
+
+def test_event_payload_set_payload_above_threshold(settings, media_root):
+    # given
+    settings.EVENT_PAYLOAD_FILE_THRESHOLD = len(PAYLOAD) - 1
+
+    # when
+    event_payload = EventPayload.objects.create_with_payload(PAYLOAD)
+
+    # then
+    event_payload.refresh_from_db()
+    assert event_payload.payload == ""
+    assert event_payload.payload_file.name.startswith("event-payloads/")
+    with default_storage.open(event_payload.payload_file.name, "rb") as payload_file:
+        assert gzip.decompress(payload_file.read()).decode() == PAYLOAD
+    assert event_payload.get_payload() == PAYLOAD
+
+
+def test_event_payload_set_payload_threshold_disabled(settings, media_root):
+    # given
+    settings.EVENT_PAYLOAD_FILE_THRESHOLD = 0
+
+    # when
+    event_payload = EventPayload.objects.create_with_payload(PAYLOAD)
+
+    # then
+    assert event_payload.payload == PAYLOAD
+    assert not event_payload.payload_file
+
+
+def test_event_payload_delete_removes_payload_file(
+    settings, media_root, django_capture_on_commit_callbacks
+):
+    # given
+    settings.EVENT_PAYLOAD_FILE_THRESHOLD = 1
+    event_payload = EventPayload.objects.create_with_payload(PAYLOAD)
+    path = event_payload.payload_file.name
+    assert default_storage.exists(path)
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        EventPayload.objects.filter(pk=event_payload.pk).delete()
+
+    # then
+    assert not EventPayload.objects.exists()
+    assert not default_storage.exists(path)
+
+
+def test_event_payload_delete_rolled_back_keeps_payload_file(
+    settings, media_root, django_capture_on_commit_callbacks
+):
+    # given
+    settings.EVENT_PAYLOAD_FILE_THRESHOLD = 1
+    event_payload = EventPayload.objects.create_with_payload(PAYLOAD)
+    path = event_payload.payload_file.name
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True) as callbacks:
+        with transaction.atomic():
+            EventPayload.objects.filter(pk=event_payload.pk).delete()
+            transaction.set_rollback(True)
+
+    # then
+    assert not callbacks
+    assert EventPayload.objects.filter(pk=event_payload.pk).exists()
+    assert default_storage.exists(path)
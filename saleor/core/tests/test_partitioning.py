@@ -0,0 +1,155 @@
+from datetime import timedelta
+
+from django.core.files.storage import default_storage
+from django.utils import timezone
+from freezegun import freeze_time
+
+from ...webhook.event_types import WebhookEventAsyncType
+from ..models import EventDelivery, EventDeliveryAttempt, EventPayload
+from ..partitioning import (
+    EVENT_MODELS,
+    get_partition_name,
+    get_partitioning_upper_bound,
+    get_partitions,
+    is_partitioned,
+    partition_event_tables,
+)
+from ..tasks import delete_event_payloads_task
+
+
+def _create_event_delivery(webhook):
+    payload = EventPayload.objects.create(payload='{"key": "data"}')
+    delivery = EventDelivery.objects.create(
+        event_type=WebhookEventAsyncType.ANY,
+        payload=payload,
+        webhook=webhook,
+    )
+    EventDeliveryAttempt.objects.create(delivery=delivery)
+    return delivery
+
+
+def test_partition_event_tables(webhook, settings):
+    # given
+    settings.EVENT_PARTITIONS_PREMAKE_DAYS = 2
+    delivery = _create_event_delivery(webhook)
+    today = timezone.now().date()
+
+    # when
+    partition_event_tables()
+
+    # then
+    for model in EVENT_MODELS:
+        assert is_partitioned(model)
+        partitions = get_partitions(model)
+        assert partitions[f"{model._meta.db_table}_legacy"] == (
+            get_partitioning_upper_bound()
+        )
+        assert f"{model._meta.db_table}_default" in partitions
+        assert get_partition_name(model, today + timedelta(days=2)) in partitions
+
+    assert EventDelivery.objects.get().payload == delivery.payload
+    assert EventDeliveryAttempt.objects.get().delivery == delivery
+    new_delivery = _create_event_delivery(webhook)
+    assert new_delivery.attempts.count() == 1
+    # rows created after the bound of the legacy partition are not rejected
+    with freeze_time(timezone.now() + timedelta(days=5)):
+        later_delivery = _create_event_delivery(webhook)
+    assert later_delivery.attempts.count() == 1
+
+
+def test_delete_event_payloads_task_drops_expired_partitions(webhook, settings):
+    # given
+    settings.EVENT_PARTITIONS_PREMAKE_DAYS = 1
+    start_time = timezone.now()
+    partition_event_tables()
+    with freeze_time(start_time + timedelta(days=1)):
+        _create_event_delivery(webhook)
+
+    # when
+    with freeze_time(
+        start_time + settings.EVENT_PAYLOAD_DELETE_PERIOD + timedelta(days=2)
+    ):
+        delete_event_payloads_task()
+
+    # then
+    assert not EventPayload.objects.exists()
+    assert not EventDelivery.objects.exists()
+    assert not EventDeliveryAttempt.objects.exists()
+    for model in EVENT_MODELS:
+        partitions = get_partitions(model)
+        assert f"{model._meta.db_table}_legacy" not in partitions
+        assert (
+            get_partition_name(model, start_time.date() + timedelta(days=1))
+            not in partitions
+        )
+        assert f"{model._meta.db_table}_default" in partitions
+
+
+def test_delete_event_payloads_task_keeps_partitions_referenced_by_other_tables(
+    webhook, settings
+):
+    # given
+    settings.EVENT_PARTITIONS_PREMAKE_DAYS = 1
+    start_time = timezone.now()
+    partition_event_tables()
+    payload = EventPayload.objects.create(payload='{"key": "data"}')
+    expiration_time = start_time + settings.EVENT_PAYLOAD_DELETE_PERIOD
+    with freeze_time(expiration_time + timedelta(days=2)):
+        delivery = EventDelivery.objects.create(
+            event_type=WebhookEventAsyncType.ANY, payload=payload, webhook=webhook
+        )
+
+    # when
+    with freeze_time(expiration_time + timedelta(days=3)):
+        delete_event_payloads_task()
+
+    # then
+    assert EventDelivery.objects.get() == delivery
+    assert EventPayload.objects.get() == payload
+    assert f"{EventPayload._meta.db_table}_legacy" in get_partitions(EventPayload)
+    assert f"{EventDelivery._meta.db_table}_legacy" not in get_partitions(EventDelivery)
+
+
+def test_delete_event_payloads_task_drops_expired_partitions_payload_files(
+    webhook, settings, media_root, django_capture_on_commit_callbacks
+):
+    # given
+    settings.EVENT_PARTITIONS_PREMAKE_DAYS = 1
+    settings.EVENT_PAYLOAD_FILE_THRESHOLD = 1
+    start_time = timezone.now()
+    partition_event_tables()
+    with freeze_time(start_time + timedelta(days=1)):
+        payload = EventPayload.objects.create_with_payload('{"key": "data"}')
+    path = payload.payload_file.name
+    assert default_storage.exists(path)
+
+    # when
+    with freeze_time(
+        start_time + settings.EVENT_PAYLOAD_DELETE_PERIOD + timedelta(days=2)
+    ), django_capture_on_commit_callbacks(execute=True):
+        delete_event_payloads_task()
+
+    # then
+    assert not EventPayload.objects.exists()
+    assert not default_storage.exists(path)
+
+
+def test_delete_event_payloads_task_creates_upcoming_partitions(webhook, settings):
+    # given
+    settings.EVENT_PARTITIONS_PREMAKE_DAYS = 1
+    start_time = timezone.now()
+    partition_event_tables()
+    later = start_time + timedelta(days=5)
+
+    # when
+    with freeze_time(later):
+        delete_event_payloads_task()
+        _create_event_delivery(webhook)
+
+    # then
+    for model in EVENT_MODELS:
+        partitions = get_partitions(model)
+        assert get_partition_name(model, later.date()) in partitions
+        assert get_partition_name(model, later.date() + timedelta(days=1)) in (
+            partitions
+        )
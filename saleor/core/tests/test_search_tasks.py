@@ -1,8 +1,10 @@
 from ...core.postgres import FlatConcatSearchVector
 from ...core.search_tasks import (
     set_order_search_document_values,
+    set_product_search_document_values,
     set_user_search_document_values,
 )
+from ...product.models import Product
 
 
 def test_set_user_search_document_values(customer_user, customer_user2):
@@ -48,3 +50,15 @@ def test_set_order_search_document_values_no_vector(order):
     # then
     order.refresh_from_db()
     assert order.user.email in order.search_vector
+
+
+def test_set_product_search_document_values_no_vector(product):
+    # given
+    Product.objects.filter(pk=product.pk).update(search_vector=None)
+
+    # when
+    set_product_search_document_values()
+
+    # then
+    product.refresh_from_db()
+    assert "'product'" in product.search_vector
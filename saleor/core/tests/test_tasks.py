@@ -59,6 +59,33 @@ def test_delete_event_payloads_task(webhook, settings):
     assert EventDeliveryAttempt.objects.count() == 1
 
 
+def test_delete_event_payloads_task_removes_payload_files(
+    webhook, settings, media_root, django_capture_on_commit_callbacks
+):
+    # given
+    settings.EVENT_PAYLOAD_FILE_THRESHOLD = 1
+    creation_time = (
+        timezone.now() - settings.EVENT_PAYLOAD_DELETE_PERIOD - timedelta(seconds=1)
+    )
+    with freeze_time(creation_time):
+        payload = EventPayload.objects.create_with_payload('{"key": "data"}')
+        EventDelivery.objects.create(
+            event_type=WebhookEventAsyncType.ANY,
+            payload=payload,
+            webhook=webhook,
+        )
+    path = payload.payload_file.name
+    assert default_storage.exists(path)
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        delete_event_payloads_task()
+
+    # then
+    assert not EventPayload.objects.exists()
+    assert not default_storage.exists(path)
+
+
 def test_delete_files_from_storage_task(
     product_with_image, variant_with_image, media_root
 ):
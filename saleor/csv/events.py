@@ -25,9 +25,30 @@ def export_success_event(
     export_file: "ExportFile",
     user: Optional["User"] = None,
     app: Optional["App"] = None,
+    parameters: Optional[dict] = None,
 ) -> None:
     ExportEvent.objects.create(
-        export_file=export_file, user=user, app=app, type=ExportEvents.EXPORT_SUCCESS
+        export_file=export_file,
+        user=user,
+        app=app,
+        type=ExportEvents.EXPORT_SUCCESS,
+        parameters=parameters or {},
+    )
+
+
+def export_shard_completed_event(
+    *,
+    export_file: "ExportFile",
+    user: Optional["User"] = None,
+    app: Optional["App"] = None,
+    parameters: dict,
+) -> None:
+    ExportEvent.objects.create(
+        export_file=export_file,
+        user=user,
+        app=app,
+        type=ExportEvents.EXPORT_SHARD_COMPLETED,
+        parameters=parameters,
     )
 
 
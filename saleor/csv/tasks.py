@@ -13,7 +13,16 @@ from ..core import JobStatus
 from . import events
 from .models import ExportEvent, ExportFile
 from .notifications import send_export_failed_info
-from .utils.export import export_gift_cards, export_products, export_voucher_codes
+from .utils.export import (
+    delete_product_export_shards,
+    export_gift_cards,
+    export_products,
+    export_products_shard,
+    export_voucher_codes,
+    get_product_export_shards,
+    get_product_export_shards_dir,
+    merge_product_export_shards,
+)
 
 task_logger = get_task_logger(__name__)
 
@@ -22,42 +31,87 @@ class ExportTask(celery.Task):
     # should be updated when new export task is added
     TASK_NAME_TO_DATA_TYPE_MAPPING = {
         "export-products": "products",
+        "export-products-in-shards": "products",
+        "export-products-shard": "products",
+        "merge-product-export-shards": "products",
         "export-gift-cards": "gift cards",
         "export-voucher-codes": "voucher codes",
     }
 
     def on_failure(self, exc, task_id, args, kwargs, einfo):
         export_file_id = args[0]
-        export_file = ExportFile.objects.get(pk=export_file_id)
+        data_type = ExportTask.TASK_NAME_TO_DATA_TYPE_MAPPING.get(self.name)
+        if not data_type:
+            data_type = "unknown data"
+        fail_export(export_file_id, exc, str(einfo.type), data_type)
 
-        export_file.content_file = None
-        export_file.status = JobStatus.FAILED
-        export_file.save(update_fields=["status", "updated_at", "content_file"])
+    def on_success(self, retval, task_id, args, kwargs):
+        export_file_id = args[0]
 
-        events.export_failed_event(
+        export_file = ExportFile.objects.get(pk=export_file_id)
+        export_file.status = JobStatus.SUCCESS
+        export_file.save(update_fields=["status", "updated_at"])
+        events.export_success_event(
             export_file=export_file,
             user=export_file.user,
             app=export_file.app,
-            message=str(exc),
-            error_type=str(einfo.type),
+            parameters=retval,
         )
 
-        data_type = ExportTask.TASK_NAME_TO_DATA_TYPE_MAPPING.get(self.name)
-        if not data_type:
-            data_type = "unknown data"
-        send_export_failed_info(export_file, data_type)
+
+class ExportInShardsTask(ExportTask):
+    def on_success(self, retval, task_id, args, kwargs):
+        # the export is completed by the task merging the shards
+        pass
+
+
+class ExportShardTask(ExportTask):
+    def on_failure(self, exc, task_id, args, kwargs, einfo):
+        # the export is failed once by the error callback of the chord
+        pass
 
     def on_success(self, retval, task_id, args, kwargs):
         export_file_id = args[0]
 
         export_file = ExportFile.objects.get(pk=export_file_id)
-        export_file.status = JobStatus.SUCCESS
-        export_file.save(update_fields=["status", "updated_at"])
-        events.export_success_event(
-            export_file=export_file, user=export_file.user, app=export_file.app
+        events.export_shard_completed_event(
+            export_file=export_file,
+            user=export_file.user,
+            app=export_file.app,
+            parameters=retval,
         )
 
 
+class MergeExportShardsTask(ExportTask):
+    def on_failure(self, exc, task_id, args, kwargs, einfo):
+        # the export is failed once by the error callback of the chord
+        pass
+
+
+def fail_export(export_file_id: int, exc: Exception, error_type: str, data_type: str):
+    export_file = ExportFile.objects.get(pk=export_file_id)
+
+    export_file.content_file = None
+    export_file.status = JobStatus.FAILED
+    export_file.save(update_fields=["status", "updated_at", "content_file"])
+
+    events.export_failed_event(
+        export_file=export_file,
+        user=export_file.user,
+        app=export_file.app,
+        message=str(exc),
+        error_type=error_type,
+    )
+    send_export_failed_info(export_file, data_type)
+
+
+def fail_export_in_shards(
+    export_file_id: int, shards_dir: str, shards_count: int, exc: Exception
+):
+    delete_product_export_shards(shards_dir, shards_count)
+    fail_export(export_file_id, exc, str(type(exc)), "products")
+
+
 @app.task(name="export-products", base=ExportTask)
 def export_products_task(
     export_file_id: int,
@@ -67,7 +121,97 @@ def export_products_task(
     delimiter: str = ",",
 ):
     export_file = ExportFile.objects.get(pk=export_file_id)
-    export_products(export_file, scope, export_info, file_type, delimiter)
+    return export_products(export_file, scope, export_info, file_type, delimiter)
+
+
+@app.task(name="export-products-in-shards", base=ExportInShardsTask)
+def export_products_in_shards_task(
+    export_file_id: int,
+    scope: dict[str, Union[str, dict]],
+    export_info: dict[str, list],
+    file_type: str,
+    delimiter: str = ",",
+):
+    """Export products in shards processed in parallel by separate workers.
+
+    Each shard is saved in the storage and, once all of them are completed,
+    the shards are merged into the export file. When any of the tasks fails,
+    the export is failed and all saved shards are deleted.
+    """
+    shards = get_product_export_shards(scope, settings.EXPORT_PRODUCTS_SHARD_SIZE)
+    shards_dir = get_product_export_shards_dir(export_file_id)
+    try:
+        celery.chord(
+            export_products_shard_task.si(
+                export_file_id,
+                scope,
+                export_info,
+                shards_dir,
+                shard_index,
+                start_pk,
+                end_pk,
+            )
+            for shard_index, (start_pk, end_pk) in enumerate(shards)
+        )(
+            merge_product_export_shards_task.si(
+                export_file_id,
+                export_info,
+                shards_dir,
+                len(shards),
+                file_type,
+                delimiter,
+            ).on_error(
+                export_products_in_shards_failed_task.s(
+                    export_file_id, shards_dir, len(shards)
+                )
+            )
+        )
+    except Exception as exc:
+        # errors of eagerly executed shards are raised here instead of being passed
+        # to the error callback
+        fail_export_in_shards(export_file_id, shards_dir, len(shards), exc)
+
+
+@app.task(name="export-products-shard", base=ExportShardTask)
+def export_products_shard_task(
+    export_file_id: int,
+    scope: dict[str, Union[str, dict]],
+    export_info: dict[str, list],
+    shards_dir: str,
+    shard_index: int,
+    start_pk: int,
+    end_pk: Optional[int],
+):
+    export_file = ExportFile.objects.get(pk=export_file_id)
+    return export_products_shard(
+        export_file, scope, export_info, shards_dir, shard_index, start_pk, end_pk
+    )
+
+
+@app.task(name="merge-product-export-shards", base=MergeExportShardsTask)
+def merge_product_export_shards_task(
+    export_file_id: int,
+    export_info: dict[str, list],
+    shards_dir: str,
+    shards_count: int,
+    file_type: str,
+    delimiter: str = ",",
+):
+    export_file = ExportFile.objects.get(pk=export_file_id)
+    return merge_product_export_shards(
+        export_file, export_info, shards_dir, shards_count, file_type, delimiter
+    )
+
+
+@app.task(name="export-products-in-shards-failed")
+def export_products_in_shards_failed_task(
+    request, exc, traceback, export_file_id: int, shards_dir: str, shards_count: int
+):
+    """Fail the export when any of its shards or merging them fails.
+
+    Called by Celery once for the whole chord with the request of the failed task.
+    """
+    fail_export_in_shards(export_file_id, shards_dir, shards_count, exc)
 
 
 @app.task(name="export-gift-cards", base=ExportTask)
@@ -78,7 +222,7 @@ def export_gift_cards_task(
     delimiter: str = ",",
 ):
     export_file = ExportFile.objects.get(pk=export_file_id)
-    export_gift_cards(export_file, scope, file_type, delimiter)
+    return export_gift_cards(export_file, scope, file_type, delimiter)
 
 
 @app.task(name="export-voucher-codes", base=ExportTask)
@@ -89,7 +233,7 @@ def export_voucher_codes_task(
     ids: list[int],
 ):
     export_file = ExportFile.objects.get(pk=export_file_id)
-    export_voucher_codes(export_file, file_type, voucher_id, ids)
+    return export_voucher_codes(export_file, file_type, voucher_id, ids)
 
 
 @app.task
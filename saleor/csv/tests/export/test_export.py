@@ -1,12 +1,11 @@
 import datetime
 import json
 import shutil
-from tempfile import NamedTemporaryFile
+import tracemalloc
 from unittest.mock import ANY, MagicMock, patch
 
 import graphene
 import openpyxl
-import petl as etl
 import pytest
 from django.core.files import File
 from freezegun import freeze_time
@@ -19,7 +18,7 @@ from ....graphql.product.filters import ProductFilter
 from ....product.models import Product, ProductChannelListing
 from ... import FileTypes
 from ...utils.export import (
-    append_to_file,
+    ExportFileWriter,
     create_file_with_headers,
     export_gift_cards,
     export_gift_cards_in_batches,
@@ -28,6 +27,7 @@ from ...utils.export import (
     export_voucher_codes,
     export_voucher_codes_in_batches,
     get_filename,
+    get_product_export_shards,
     get_queryset,
     parse_input,
     save_csv_file_in_export_file,
@@ -63,8 +63,8 @@ def test_export_products(
         "channels": [],
     }
 
-    mock_file = MagicMock(spec=File)
-    create_file_with_headers_mock.return_value = mock_file
+    mock_writer = MagicMock(spec=ExportFileWriter)
+    create_file_with_headers_mock.return_value = mock_writer
 
     product_list[0].variants.update(sku=None)
 
@@ -84,12 +84,12 @@ def test_export_products(
         export_info,
         {"id", "name", "variants__id", "variants__sku"},
         ["id", "name", "variants__id", "variants__sku"],
-        ",",
-        mock_file,
-        file_type,
+        mock_writer,
     )
     send_email_mock.assert_called_once_with(user_export_file, "products")
-    save_file_mock.assert_called_once_with(user_export_file, mock_file, ANY)
+    save_file_mock.assert_called_once_with(
+        user_export_file, mock_writer.finish.return_value, ANY
+    )
 
 
 @patch("saleor.csv.utils.export.create_file_with_headers")
@@ -112,8 +112,8 @@ def test_export_products_ids(
     assert user_export_file.status == JobStatus.PENDING
     assert not user_export_file.content_file
 
-    mock_file = MagicMock(spec=File)
-    create_file_with_headers_mock.return_value = mock_file
+    mock_writer = MagicMock(spec=ExportFileWriter)
+    create_file_with_headers_mock.return_value = mock_writer
 
     # when
     export_products(user_export_file, {"ids": pks}, export_info, file_type)
@@ -131,12 +131,12 @@ def test_export_products_ids(
         export_info,
         {"id"},
         ["id"],
-        ",",
-        mock_file,
-        file_type,
+        mock_writer,
     )
     send_email_mock.assert_called_once_with(user_export_file, "products")
-    save_file_mock.assert_called_once_with(user_export_file, mock_file, ANY)
+    save_file_mock.assert_called_once_with(
+        user_export_file, mock_writer.finish.return_value, ANY
+    )
 
 
 @patch("saleor.csv.utils.export.create_file_with_headers")
@@ -163,8 +163,8 @@ def test_export_products_filter_is_published(
     assert user_export_file.status == JobStatus.PENDING
     assert not user_export_file.content_file
 
-    mock_file = MagicMock(spec=File)
-    create_file_with_headers_mock.return_value = mock_file
+    mock_writer = MagicMock(spec=ExportFileWriter)
+    create_file_with_headers_mock.return_value = mock_writer
 
     # when
     export_products(
@@ -188,12 +188,12 @@ def test_export_products_filter_is_published(
         export_info,
         {"id"},
         ["id"],
-        ",",
-        mock_file,
-        file_type,
+        mock_writer,
     )
     send_email_mock.assert_called_once_with(user_export_file, "products")
-    save_file_mock.assert_called_once_with(user_export_file, mock_file, ANY)
+    save_file_mock.assert_called_once_with(
+        user_export_file, mock_writer.finish.return_value, ANY
+    )
 
 
 @patch("saleor.csv.utils.export.create_file_with_headers")
@@ -219,8 +219,8 @@ def test_export_products_filter_collections(
     assert user_export_file.status == JobStatus.PENDING
     assert not user_export_file.content_file
 
-    mock_file = MagicMock(spec=File)
-    create_file_with_headers_mock.return_value = mock_file
+    mock_writer = MagicMock(spec=ExportFileWriter)
+    create_file_with_headers_mock.return_value = mock_writer
 
     # when
     export_products(
@@ -240,9 +240,11 @@ def test_export_products_filter_collections(
     assert export_products_in_batches_mock.call_count == 1
     batch_args, _ = export_products_in_batches_mock.call_args
     assert set(batch_args[0].values_list("pk", flat=True)) == {product_list[-1].pk}
-    assert batch_args[1:] == (export_info, {"id"}, ["id"], ",", mock_file, file_type)
+    assert batch_args[1:] == (export_info, {"id"}, ["id"], mock_writer)
     send_email_mock.assert_called_once_with(user_export_file, "products")
-    save_file_mock.assert_called_once_with(user_export_file, mock_file, ANY)
+    save_file_mock.assert_called_once_with(
+        user_export_file, mock_writer.finish.return_value, ANY
+    )
 
 
 @patch("saleor.csv.utils.export.create_file_with_headers")
@@ -266,8 +268,8 @@ def test_export_products_by_app(
     }
     file_type = FileTypes.CSV
 
-    mock_file = MagicMock(spec=File)
-    create_file_with_headers_mock.return_value = mock_file
+    mock_writer = MagicMock(spec=ExportFileWriter)
+    create_file_with_headers_mock.return_value = mock_writer
 
     # when
     export_products(app_export_file, {"all": ""}, export_info, file_type)
@@ -286,14 +288,14 @@ def test_export_products_by_app(
         export_info,
         {"id", "name"},
         ["id", "name"],
-        ",",
-        mock_file,
-        file_type,
+        mock_writer,
     )
 
     send_email_mock.assert_called_once_with(app_export_file, "products")
 
-    save_file_mock.assert_called_once_with(app_export_file, mock_file, ANY)
+    save_file_mock.assert_called_once_with(
+        app_export_file, mock_writer.finish.return_value, ANY
+    )
 
 
 @patch("saleor.plugins.manager.PluginsManager.product_export_completed")
@@ -330,8 +332,8 @@ def test_export_gift_cards(
     # given
     file_type = FileTypes.CSV
 
-    mock_file = MagicMock(spec=File)
-    create_file_with_headers_mock.return_value = mock_file
+    mock_writer = MagicMock(spec=ExportFileWriter)
+    create_file_with_headers_mock.return_value = mock_writer
 
     # when
     export_gift_cards(user_export_file, {"all": ""}, file_type)
@@ -346,14 +348,14 @@ def test_export_gift_cards(
     )
     assert args[1:] == (
         ["code"],
-        ",",
-        mock_file,
-        file_type,
+        mock_writer,
     )
 
     send_email_mock.assert_called_once_with(user_export_file, "gift cards")
 
-    save_file_mock.assert_called_once_with(user_export_file, mock_file, ANY)
+    save_file_mock.assert_called_once_with(
+        user_export_file, mock_writer.finish.return_value, ANY
+    )
 
 
 @patch("saleor.csv.utils.export.create_file_with_headers")
@@ -372,8 +374,8 @@ def test_export_gift_cards_by_app(
 ):
     file_type = FileTypes.CSV
 
-    mock_file = MagicMock(spec=File)
-    create_file_with_headers_mock.return_value = mock_file
+    mock_writer = MagicMock(spec=ExportFileWriter)
+    create_file_with_headers_mock.return_value = mock_writer
 
     # when
     export_gift_cards(app_export_file, {"all": ""}, file_type)
@@ -388,14 +390,14 @@ def test_export_gift_cards_by_app(
     )
     assert args[1:] == (
         ["code"],
-        ",",
-        mock_file,
-        file_type,
+        mock_writer,
     )
 
     send_email_mock.assert_called_once_with(app_export_file, "gift cards")
 
-    save_file_mock.assert_called_once_with(app_export_file, mock_file, ANY)
+    save_file_mock.assert_called_once_with(
+        app_export_file, mock_writer.finish.return_value, ANY
+    )
 
 
 @patch("saleor.csv.utils.export.create_file_with_headers")
@@ -414,8 +416,8 @@ def test_export_gift_cards_ids(
 ):
     file_type = FileTypes.CSV
 
-    mock_file = MagicMock(spec=File)
-    create_file_with_headers_mock.return_value = mock_file
+    mock_writer = MagicMock(spec=ExportFileWriter)
+    create_file_with_headers_mock.return_value = mock_writer
     pks = [gift_card.pk]
 
     # when
@@ -429,14 +431,14 @@ def test_export_gift_cards_ids(
     assert set(args[0].values_list("pk", flat=True)) == set(pks)
     assert args[1:] == (
         ["code"],
-        ",",
-        mock_file,
-        file_type,
+        mock_writer,
     )
 
     send_email_mock.assert_called_once_with(user_export_file, "gift cards")
 
-    save_file_mock.assert_called_once_with(user_export_file, mock_file, ANY)
+    save_file_mock.assert_called_once_with(
+        user_export_file, mock_writer.finish.return_value, ANY
+    )
 
 
 @patch("saleor.csv.utils.export.create_file_with_headers")
@@ -456,8 +458,8 @@ def test_export_gift_cards_with_filter(
 ):
     file_type = FileTypes.CSV
 
-    mock_file = MagicMock(spec=File)
-    create_file_with_headers_mock.return_value = mock_file
+    mock_writer = MagicMock(spec=ExportFileWriter)
+    create_file_with_headers_mock.return_value = mock_writer
 
     gift_card_expiry_date.product = shippable_gift_card_product
     gift_card_used.product = shippable_gift_card_product
@@ -486,14 +488,14 @@ def test_export_gift_cards_with_filter(
     assert set(args[0].values_list("pk", flat=True)) == {gift_card_expiry_date.pk}
     assert args[1:] == (
         ["code"],
-        ",",
-        mock_file,
-        file_type,
+        mock_writer,
     )
 
     send_email_mock.assert_called_once_with(user_export_file, "gift cards")
 
-    save_file_mock.assert_called_once_with(user_export_file, mock_file, ANY)
+    save_file_mock.assert_called_once_with(
+        user_export_file, mock_writer.finish.return_value, ANY
+    )
 
 
 @patch("saleor.plugins.manager.PluginsManager.gift_card_export_completed")
@@ -544,6 +546,17 @@ def test_get_product_queryset_ids(product_list):
     assert queryset.count() == len(pks)
 
 
+def test_get_product_export_shards(product_list):
+    # given
+    pks = sorted(product.pk for product in product_list)
+
+    # when
+    shards = get_product_export_shards({"all": ""}, 2)
+
+    # then
+    assert shards == [(0, pks[1]), (pks[1], None)]
+
+
 def get_product_queryset_filter(product_list):
     product_not_published = product_list.first()
     product_not_published.is_published = False
@@ -561,10 +574,10 @@ def test_create_file_with_headers_csv(user_export_file, tmpdir, media_root):
     assert not user_export_file.content_file
 
     # when
-    csv_file = create_file_with_headers(file_headers, ",", FileTypes.CSV)
+    writer = create_file_with_headers(file_headers, ",", FileTypes.CSV)
 
     # then
-    assert csv_file
+    csv_file = writer.finish()
 
     file_content = csv_file.read().decode().split("\r\n")
 
@@ -580,10 +593,10 @@ def test_create_file_with_headers_xlsx(user_export_file, tmpdir, media_root):
     assert not user_export_file.content_file
 
     # when
-    xlsx_file = create_file_with_headers(file_headers, ",", FileTypes.XLSX)
+    writer = create_file_with_headers(file_headers, ",", FileTypes.XLSX)
 
     # then
-    assert xlsx_file
+    xlsx_file = writer.finish()
 
     wb_obj = openpyxl.load_workbook(xlsx_file)
 
@@ -611,73 +624,82 @@ def test_save_csv_file_in_export_file(user_export_file, tmpdir, media_root):
     shutil.rmtree(tmpdir)
 
 
-def test_append_to_file_for_csv(user_export_file, tmpdir, media_root):
+def test_export_file_writer_for_csv(tmpdir, media_root):
     # given
     export_data = [
         {"id": "123", "name": "test1", "collections": "coll1"},
         {"id": "345", "name": "test2"},
     ]
     headers = ["id", "name", "collections"]
-    delimiter = ","
-
-    table = etl.fromdicts([{"id": "1", "name": "A"}], header=headers, missing="")
-
-    temp_file = NamedTemporaryFile()
-    etl.tocsv(table, temp_file.name, delimiter=delimiter)
+    writer = ExportFileWriter(headers, ",", FileTypes.CSV)
 
     # when
-    append_to_file(export_data, headers, temp_file, FileTypes.CSV, delimiter)
+    writer.write(export_data[:1], headers)
+    writer.write(export_data[1:], headers)
+    temp_file = writer.finish()
 
     # then
-    user_export_file.refresh_from_db()
-
     file_content = temp_file.read().decode().split("\r\n")
-    assert ",".join(headers) in file_content
-    assert ",".join(export_data[0].values()) in file_content
-    assert (",".join(export_data[1].values()) + ",") in file_content
+    assert file_content[0] == ",".join(headers)
+    assert file_content[1] == ",".join(export_data[0].values())
+    assert file_content[2] == ",".join(export_data[1].values()) + ","
+    assert writer.get_stats()["rows_count"] == 2
 
-    temp_file.close()
+    writer.close()
     shutil.rmtree(tmpdir)
 
 
-def test_append_to_file_for_xlsx(user_export_file, tmpdir, media_root):
+def test_export_file_writer_for_xlsx(tmpdir, media_root):
     # given
     export_data = [
         {"id": "123", "name": "test1", "collections": "coll1"},
         {"id": "345", "name": "test2"},
     ]
     expected_headers = ["id", "name", "collections"]
-
-    table = etl.fromdicts(
-        [{"id": "1", "name": "A"}], header=expected_headers, missing=""
-    )
-
-    temp_file = NamedTemporaryFile(suffix=".xlsx")
-    etl.io.xlsx.toxlsx(table, temp_file.name)
+    writer = ExportFileWriter(expected_headers, ",", FileTypes.XLSX)
 
     # when
-    append_to_file(export_data, expected_headers, temp_file, FileTypes.XLSX, ",")
+    writer.write(export_data[:1], expected_headers)
+    writer.write(export_data[1:], expected_headers)
+    temp_file = writer.finish()
 
     # then
-    user_export_file.refresh_from_db()
-
     workbook = openpyxl.load_workbook(temp_file)
 
     sheet = workbook.worksheets[0]
     assert sheet.cell(1, 1).value == expected_headers[0]
     assert sheet.cell(1, 2).value == expected_headers[1]
     assert sheet.cell(1, 3).value == expected_headers[2]
-    assert sheet.cell(3, 1).value == export_data[0]["id"]
-    assert sheet.cell(3, 2).value == export_data[0]["name"]
-    assert sheet.cell(3, 3).value == export_data[0]["collections"]
-    assert sheet.cell(4, 1).value == export_data[1]["id"]
-    assert sheet.cell(4, 2).value == export_data[1]["name"]
-    assert sheet.cell(4, 3).value is None
-
-    temp_file.close()
+    assert sheet.cell(2, 1).value == export_data[0]["id"]
+    assert sheet.cell(2, 2).value == export_data[0]["name"]
+    assert sheet.cell(2, 3).value == export_data[0]["collections"]
+    assert sheet.cell(3, 1).value == export_data[1]["id"]
+    assert sheet.cell(3, 2).value == export_data[1]["name"]
+    assert sheet.cell(3, 3).value is None
+    assert writer.get_stats()["rows_count"] == 2
+
+    writer.close()
     shutil.rmtree(tmpdir)
 
 
+def test_export_file_writer_reports_peak_memory_of_export():
+    # given
+    allocated_before_export = [str(index) * 1000 for index in range(1000)]
+    writer = ExportFileWriter(["id"], ",", FileTypes.CSV)
+
+    # when
+    with writer:
+        export_data = [{"id": str(index) * 100} for index in range(1000)]
+        writer.write(export_data, ["id"])
+        del export_data
+        writer.finish()
+
+    # then
+    peak_memory = writer.get_stats()["peak_memory_bytes"]
+    assert 100 * 1000 < peak_memory < len(allocated_before_export) * 1000
+    assert not tracemalloc.is_tracing()
+
+
 @patch("saleor.csv.utils.export.BATCH_SIZE", 1)
 def test_export_products_in_batches_for_csv(
     product_list,
@@ -700,10 +722,7 @@ def test_export_products_in_batches_for_csv(
     export_fields = ["id", "name", "variants__sku"]
     expected_headers = ["id", "name", "variant sku"]
 
-    table = etl.wrap([expected_headers])
-
-    temp_file = NamedTemporaryFile()
-    etl.tocsv(table, temp_file.name, delimiter=",")
+    writer = ExportFileWriter(expected_headers, ",", FileTypes.CSV)
 
     # when
     export_products_in_batches(
@@ -711,12 +730,11 @@ def test_export_products_in_batches_for_csv(
         export_info,
         set(export_fields),
         export_fields,
-        ",",
-        temp_file,
-        FileTypes.CSV,
+        writer,
     )
 
     # then
+    temp_file = writer.finish()
 
     expected_data = []
     for product in qs.order_by("pk"):
@@ -770,10 +788,7 @@ def test_export_products_in_batches_for_xlsx(
     export_fields = ["id", "name", "description_as_str", "variants__sku"]
     expected_headers = ["id", "name", "description", "variant sku"]
 
-    table = etl.wrap([expected_headers])
-
-    temp_file = NamedTemporaryFile(suffix=".xlsx")
-    etl.io.xlsx.toxlsx(table, temp_file.name)
+    writer = ExportFileWriter(expected_headers, ",", FileTypes.XLSX)
 
     # when
     export_products_in_batches(
@@ -781,12 +796,11 @@ def test_export_products_in_batches_for_xlsx(
         export_info,
         set(export_fields),
         export_fields,
-        ",",
-        temp_file,
-        FileTypes.XLSX,
+        writer,
     )
 
     # then
+    temp_file = writer.finish()
     expected_data = []
     for product in qs:
         product_data = []
@@ -829,20 +843,17 @@ def test_export_gift_cards_in_batches_to_csv(
     # given
     gift_cards = GiftCard.objects.exclude(id=gift_card_used.id).order_by("pk")
 
-    table = etl.wrap([["code"]])
-    temp_file = NamedTemporaryFile()
-    etl.tocsv(table, temp_file.name, delimiter=",")
+    writer = ExportFileWriter(["code"], ",", FileTypes.CSV)
 
     # when
     export_gift_cards_in_batches(
         gift_cards,
         ["code"],
-        ",",
-        temp_file,
-        "csv",
+        writer,
     )
 
     # then
+    temp_file = writer.finish()
     file_content = temp_file.read().decode().split("\r\n")
 
     # ensure headers are in the file
@@ -864,20 +875,17 @@ def test_export_gift_cards_in_batches_to_xlsx(
     # given
     gift_cards = GiftCard.objects.exclude(id=gift_card_used.id).order_by("pk")
 
-    table = etl.wrap([["code"]])
-    temp_file = NamedTemporaryFile(suffix=".xlsx")
-    etl.io.xlsx.toxlsx(table, temp_file.name)
+    writer = ExportFileWriter(["code"], ",", FileTypes.XLSX)
 
     # when
     export_gift_cards_in_batches(
         gift_cards,
         ["code"],
-        ",",
-        temp_file,
-        "xlsx",
+        writer,
     )
 
     # then
+    temp_file = writer.finish()
     wb_obj = openpyxl.load_workbook(temp_file)
 
     sheet_obj = wb_obj.active
@@ -950,8 +958,8 @@ def test_export_voucher_codes_by_voucher_id(
     voucher_with_many_codes,
     voucher_percentage,
 ):
-    mock_file = MagicMock(spec=File)
-    create_file_with_headers_mock.return_value = mock_file
+    mock_writer = MagicMock(spec=ExportFileWriter)
+    create_file_with_headers_mock.return_value = mock_writer
     file_type = FileTypes.CSV
     voucher = voucher_with_many_codes
 
@@ -968,14 +976,14 @@ def test_export_voucher_codes_by_voucher_id(
     )
     assert args[1:] == (
         ["code"],
-        ",",
-        mock_file,
-        file_type,
+        mock_writer,
     )
 
     send_email_mock.assert_called_once_with(user_export_file, "voucher codes")
 
-    save_file_mock.assert_called_once_with(user_export_file, mock_file, ANY)
+    save_file_mock.assert_called_once_with(
+        user_export_file, mock_writer.finish.return_value, ANY
+    )
 
 
 @patch("saleor.csv.utils.export.create_file_with_headers")
@@ -991,8 +999,8 @@ def test_export_voucher_codes_by_ids(
     voucher_with_many_codes,
     voucher_percentage,
 ):
-    mock_file = MagicMock(spec=File)
-    create_file_with_headers_mock.return_value = mock_file
+    mock_writer = MagicMock(spec=ExportFileWriter)
+    create_file_with_headers_mock.return_value = mock_writer
     file_type = FileTypes.CSV
     voucher = voucher_with_many_codes
     code_ids = [code.id for code in voucher.codes.all()]
@@ -1010,14 +1018,14 @@ def test_export_voucher_codes_by_ids(
     )
     assert args[1:] == (
         ["code"],
-        ",",
-        mock_file,
-        file_type,
+        mock_writer,
     )
 
     send_email_mock.assert_called_once_with(user_export_file, "voucher codes")
 
-    save_file_mock.assert_called_once_with(user_export_file, mock_file, ANY)
+    save_file_mock.assert_called_once_with(
+        user_export_file, mock_writer.finish.return_value, ANY
+    )
 
 
 @patch("saleor.csv.utils.export.create_file_with_headers")
@@ -1032,8 +1040,8 @@ def test_export_voucher_codes_by_app(
     app_export_file,
     voucher_with_many_codes,
 ):
-    mock_file = MagicMock(spec=File)
-    create_file_with_headers_mock.return_value = mock_file
+    mock_writer = MagicMock(spec=ExportFileWriter)
+    create_file_with_headers_mock.return_value = mock_writer
     file_type = FileTypes.CSV
     voucher = voucher_with_many_codes
 
@@ -1050,14 +1058,14 @@ def test_export_voucher_codes_by_app(
     )
     assert args[1:] == (
         ["code"],
-        ",",
-        mock_file,
-        file_type,
+        mock_writer,
     )
 
     send_email_mock.assert_called_once_with(app_export_file, "voucher codes")
 
-    save_file_mock.assert_called_once_with(app_export_file, mock_file, ANY)
+    save_file_mock.assert_called_once_with(
+        app_export_file, mock_writer.finish.return_value, ANY
+    )
 
 
 @patch("saleor.plugins.manager.PluginsManager.voucher_code_export_completed")
@@ -1085,20 +1093,17 @@ def test_export_voucher_codes_in_batches_to_csv(
     # given
     voucher_codes = voucher_with_many_codes.codes.all()
 
-    table = etl.wrap([["code"]])
-    temp_file = NamedTemporaryFile()
-    etl.tocsv(table, temp_file.name, delimiter=",")
+    writer = ExportFileWriter(["code"], ",", FileTypes.CSV)
 
     # when
     export_voucher_codes_in_batches(
         voucher_codes,
         ["code"],
-        ",",
-        temp_file,
-        "csv",
+        writer,
     )
 
     # then
+    temp_file = writer.finish()
     file_content = temp_file.read().decode().split("\r\n")
 
     # ensure headers are in the file
@@ -1118,20 +1123,17 @@ def test_export_voucher_codes_in_batches_to_xlsx(
     # given
     voucher_codes = voucher_with_many_codes.codes.all()
 
-    table = etl.wrap([["code"]])
-    temp_file = NamedTemporaryFile(suffix=".xlsx")
-    etl.io.xlsx.toxlsx(table, temp_file.name)
+    writer = ExportFileWriter(["code"], ",", FileTypes.XLSX)
 
     # when
     export_voucher_codes_in_batches(
         voucher_codes,
         ["code"],
-        ",",
-        temp_file,
-        "xlsx",
+        writer,
     )
 
     # then
+    temp_file = writer.finish()
     wb_obj = openpyxl.load_workbook(temp_file)
 
     sheet_obj = wb_obj.active
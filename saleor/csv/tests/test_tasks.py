@@ -3,19 +3,25 @@ from unittest.mock import ANY, MagicMock, Mock, patch
 
 import pytz
 from django.core.files import File
+from django.core.files.storage import default_storage
 from django.test import override_settings
 from django.utils import timezone
 from freezegun import freeze_time
+from openpyxl import load_workbook
 
 from ...core import JobStatus
+from ...graphql.csv.enums import ProductFieldEnum
+from ...product.models import Product, ProductChannelListing, ProductVariant
 from .. import ExportEvents, FileTypes
 from ..models import ExportEvent, ExportFile
 from ..tasks import (
     ExportTask,
     delete_old_export_files,
     export_gift_cards_task,
+    export_products_in_shards_task,
     export_products_task,
 )
+from ..utils.export import export_products, export_products_shard
 
 
 @patch("saleor.csv.tasks.export_products")
@@ -58,6 +64,201 @@ def test_export_products_task_failed(
     send_export_failed_info_mock.assert_called_once_with(user_export_file, "products")
 
 
+@override_settings(EXPORT_PRODUCTS_SHARD_SIZE=2)
+@patch("saleor.csv.utils.export.send_export_download_link_notification")
+def test_export_products_in_shards_task(
+    send_notification_mock, product_list, user_export_file, media_root
+):
+    # given
+    export_info = {
+        "fields": [ProductFieldEnum.NAME.value],
+        "warehouses": [],
+        "attributes": [],
+        "channels": [],
+    }
+    products = Product.objects.order_by("pk")
+    shards_count = len(product_list) // 2 + 1
+
+    # when
+    export_products_in_shards_task.delay(
+        user_export_file.id, {"all": ""}, export_info, FileTypes.CSV
+    )
+
+    # then
+    user_export_file.refresh_from_db()
+    assert user_export_file.status == JobStatus.SUCCESS
+    file_content = user_export_file.content_file.read().decode().split("\r\n")
+    assert file_content[0] == "id,name"
+    assert [row.split(",")[1] for row in file_content[1:] if row] == [
+        product.name for product in products
+    ]
+
+    shard_events = ExportEvent.objects.filter(
+        export_file=user_export_file, type=ExportEvents.EXPORT_SHARD_COMPLETED
+    )
+    assert sorted(event.parameters["shard"] for event in shard_events) == list(
+        range(shards_count)
+    )
+    success_event = ExportEvent.objects.get(
+        export_file=user_export_file, type=ExportEvents.EXPORT_SUCCESS
+    )
+    assert success_event.parameters["shards_count"] == shards_count
+    assert success_event.parameters["rows_count"] == len(product_list)
+    shards_dirs, _ = default_storage.listdir("export_files/shards")
+    assert len(shards_dirs) == 1
+    assert shards_dirs[0].startswith(f"{user_export_file.id}-")
+    assert default_storage.listdir(f"export_files/shards/{shards_dirs[0]}")[1] == []
+    send_notification_mock.assert_called_once_with(user_export_file, "products")
+
+
+@override_settings(EXPORT_PRODUCTS_SHARD_SIZE=2)
+@patch("saleor.csv.utils.export.send_export_download_link_notification")
+def test_export_products_in_shards_task_with_channels_and_preorder_fields(
+    send_notification_mock, product_list, user_export_file, media_root, channel_USD
+):
+    # given
+    ProductVariant.objects.update(
+        is_preorder=True,
+        preorder_end_date=datetime.datetime(2030, 1, 1, 12, tzinfo=pytz.utc),
+    )
+    ProductChannelListing.objects.update(
+        published_at=datetime.datetime(2020, 1, 1, 12, tzinfo=pytz.utc),
+        available_for_purchase_at=datetime.datetime(2020, 1, 2, 12, tzinfo=pytz.utc),
+    )
+    export_info = {
+        "fields": [
+            ProductFieldEnum.NAME.value,
+            "variant is preorder",
+            "variant preorder end date",
+        ],
+        "warehouses": [],
+        "attributes": [],
+        "channels": [str(channel_USD.pk)],
+    }
+    not_sharded_export_file = ExportFile.objects.create(user=user_export_file.user)
+    export_products(not_sharded_export_file, {"all": ""}, export_info, FileTypes.CSV)
+
+    # when
+    export_products_in_shards_task.delay(
+        user_export_file.id, {"all": ""}, export_info, FileTypes.CSV
+    )
+
+    # then
+    user_export_file.refresh_from_db()
+    assert user_export_file.status == JobStatus.SUCCESS
+    file_content = user_export_file.content_file.read().decode()
+    assert "2030-01-01 12:00:00+00:00" in file_content
+    assert "2020-01-01 12:00:00+00:00" in file_content
+    assert file_content == not_sharded_export_file.content_file.read().decode()
+
+
+@override_settings(EXPORT_PRODUCTS_SHARD_SIZE=2)
+@patch("saleor.csv.utils.export.send_export_download_link_notification")
+def test_export_products_in_shards_task_xlsx_keeps_cell_types(
+    send_notification_mock, product_list, user_export_file, media_root, channel_USD
+):
+    # given
+    # Excel doesn't support datetimes with timezones
+    ProductChannelListing.objects.update(
+        published_at=None, available_for_purchase_at=None
+    )
+    export_info = {
+        "fields": [ProductFieldEnum.NAME.value],
+        "warehouses": [],
+        "attributes": [],
+        "channels": [str(channel_USD.pk)],
+    }
+    not_sharded_export_file = ExportFile.objects.create(user=user_export_file.user)
+    export_products(not_sharded_export_file, {"all": ""}, export_info, FileTypes.XLSX)
+
+    # when
+    export_products_in_shards_task.delay(
+        user_export_file.id, {"all": ""}, export_info, FileTypes.XLSX
+    )
+
+    # then
+    user_export_file.refresh_from_db()
+    assert user_export_file.status == JobStatus.SUCCESS
+    rows = list(load_workbook(user_export_file.content_file).active.values)
+    expected_rows = list(
+        load_workbook(not_sharded_export_file.content_file).active.values
+    )
+    assert rows == expected_rows
+    assert [[type(value) for value in row] for row in rows] == [
+        [type(value) for value in row] for row in expected_rows
+    ]
+    assert any(isinstance(value, (int, float)) for value in rows[1])
+
+
+@override_settings(EXPORT_PRODUCTS_SHARD_SIZE=2)
+@patch("saleor.csv.tasks.send_export_failed_info")
+@patch("saleor.csv.tasks.export_products_shard")
+def test_export_products_in_shards_task_shard_failed(
+    export_products_shard_mock,
+    send_export_failed_info_mock,
+    product_list,
+    user_export_file,
+    media_root,
+):
+    # given
+    def export_shard(export_file, scope, export_info, shards_dir, shard_index, *args):
+        if shard_index:
+            raise Exception("Test error")
+        return export_products_shard(
+            export_file, scope, export_info, shards_dir, shard_index, *args
+        )
+
+    export_products_shard_mock.side_effect = export_shard
+    export_info = {"fields": [ProductFieldEnum.NAME.value]}
+
+    # when
+    export_products_in_shards_task.delay(
+        user_export_file.id, {"all": ""}, export_info, FileTypes.CSV
+    )
+
+    # then
+    user_export_file.refresh_from_db()
+    assert user_export_file.status == JobStatus.FAILED
+    failed_event = ExportEvent.objects.get(
+        export_file=user_export_file, type=ExportEvents.EXPORT_FAILED
+    )
+    assert failed_event.parameters["message"] == "Test error"
+    send_export_failed_info_mock.assert_called_once_with(user_export_file, "products")
+    shards_dirs, _ = default_storage.listdir("export_files/shards")
+    assert default_storage.listdir(f"export_files/shards/{shards_dirs[0]}")[1] == []
+
+
+@override_settings(EXPORT_PRODUCTS_SHARD_SIZE=2)
+@patch("saleor.csv.tasks.send_export_failed_info")
+@patch("saleor.csv.tasks.merge_product_export_shards")
+def test_export_products_in_shards_task_merge_failed(
+    merge_product_export_shards_mock,
+    send_export_failed_info_mock,
+    product_list,
+    user_export_file,
+    media_root,
+):
+    # given
+    merge_product_export_shards_mock.side_effect = Exception("Test error")
+    export_info = {"fields": [ProductFieldEnum.NAME.value]}
+
+    # when
+    export_products_in_shards_task.delay(
+        user_export_file.id, {"all": ""}, export_info, FileTypes.CSV
+    )
+
+    # then
+    user_export_file.refresh_from_db()
+    assert user_export_file.status == JobStatus.FAILED
+    failed_event = ExportEvent.objects.get(
+        export_file=user_export_file, type=ExportEvents.EXPORT_FAILED
+    )
+    assert failed_event.parameters["message"] == "Test error"
+    send_export_failed_info_mock.assert_called_once_with(user_export_file, "products")
+    shards_dirs, _ = default_storage.listdir("export_files/shards")
+    assert default_storage.listdir(f"export_files/shards/{shards_dirs[0]}")[1] == []
+
+
 @patch("saleor.csv.tasks.export_gift_cards")
 def test_export_gift_cards_task(export_gift_cards_mock, user_export_file):
     # given
@@ -202,6 +403,22 @@ def test_on_task_success(user_export_file):
     )
 
 
+def test_on_task_success_saves_export_stats(user_export_file):
+    # given
+    task_id = "task_id"
+    args = [user_export_file.pk, {"filter": {}}]
+    stats = {"rows_count": 100, "duration": 1.5, "peak_memory_bytes": 1024}
+
+    # when
+    ExportTask().on_success(stats, task_id, args, {})
+
+    # then
+    event = ExportEvent.objects.get(
+        export_file=user_export_file, type=ExportEvents.EXPORT_SUCCESS
+    )
+    assert event.parameters == stats
+
+
 @override_settings(EXPORT_FILES_TIMEDELTA=datetime.timedelta(days=5))
 @patch("django.core.files.storage.default_storage.exists", lambda x: True)
 @patch("django.core.files.storage.default_storage.delete")
@@ -1,10 +1,18 @@
+import csv
+import io
+import json
+import time
+import tracemalloc
 import uuid
 from datetime import date, datetime
+from decimal import Decimal
 from tempfile import NamedTemporaryFile
-from typing import IO, TYPE_CHECKING, Any, Optional, Union
+from typing import IO, TYPE_CHECKING, Any, Callable, Optional, Union
 
-import petl as etl
+from django.core.files import File
+from django.core.files.storage import default_storage
 from django.utils import timezone
+from openpyxl import Workbook
 
 from ...discount.models import VoucherCode
 from ...giftcard.models import GiftCard
@@ -23,6 +31,148 @@ if TYPE_CHECKING:
 BATCH_SIZE = 10000
 
 
+class ExportFileWriter:
+    """Stream export data to a temporary file.
+
+    The file stays open for the whole export, so each batch is only appended to it.
+    CSV rows are written through a single file handle and XLSX rows to a write-only
+    workbook that keeps constant memory usage and is saved once the export is done.
+    Used as a context manager, the writer closes the file on exit and traces memory
+    allocated in the meantime to report the peak memory usage of the export.
+    """
+
+    def __init__(self, file_headers: list[str], delimiter: str, file_type: str):
+        self.file_type = file_type
+        self.rows_count = 0
+        self.started_at = time.monotonic()
+        self.peak_memory = 0
+        self._initial_memory = 0
+        self._tracing_memory = False
+        self._started_memory_tracing = False
+        self.temporary_file = NamedTemporaryFile("w+b", suffix=f".{file_type}")
+        self._csv_handle: Optional[io.TextIOWrapper] = None
+        self._workbook: Optional[Workbook] = None
+
+        if file_type == FileTypes.CSV:
+            self._csv_handle = io.TextIOWrapper(
+                self.temporary_file, encoding="utf-8", newline=""
+            )
+            self._csv_writer = csv.writer(self._csv_handle, delimiter=delimiter)
+            self._csv_writer.writerow(file_headers)
+        else:
+            self._workbook = Workbook(write_only=True)
+            self._worksheet = self._workbook.create_sheet()
+            self._worksheet.append(file_headers)
+
+    def __enter__(self):
+        self._tracing_memory = True
+        self._started_memory_tracing = not tracemalloc.is_tracing()
+        if self._started_memory_tracing:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        self._initial_memory, _ = tracemalloc.get_traced_memory()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def write(self, export_data: list[dict[str, Union[str, bool]]], headers: list[str]):
+        for data in export_data:
+            row = [data.get(header, "") for header in headers]
+            if self._csv_handle:
+                self._csv_writer.writerow(row)
+            else:
+                self._worksheet.append(row)
+        self.rows_count += len(export_data)
+
+    def finish(self) -> IO[bytes]:
+        """Flush the written data and return the file ready to be read."""
+        if self._csv_handle:
+            self._csv_handle.flush()
+            self._csv_handle.detach()
+            self._csv_handle = None
+        elif self._workbook:
+            self._workbook.save(self.temporary_file.name)
+            self._workbook = None
+        self.temporary_file.seek(0)
+        return self.temporary_file
+
+    def get_stats(self) -> dict[str, Union[int, float]]:
+        """Return the export statistics reported on the export success event."""
+        self._update_peak_memory()
+        return {
+            "rows_count": self.rows_count,
+            "duration": round(time.monotonic() - self.started_at, 3),
+            "peak_memory_bytes": self.peak_memory,
+        }
+
+    def close(self):
+        self.temporary_file.close()
+        self._update_peak_memory()
+        if self._started_memory_tracing:
+            tracemalloc.stop()
+        self._tracing_memory = False
+        self._started_memory_tracing = False
+
+    def _update_peak_memory(self):
+        if self._tracing_memory:
+            _, peak_memory = tracemalloc.get_traced_memory()
+            self.peak_memory = max(self.peak_memory, peak_memory - self._initial_memory)
+
+
+# Values that JSON can't represent are written as objects with a single key naming
+# their type, so shards are merged into the same cells as a not sharded export.
+SHARD_VALUE_DECODERS: dict[str, Callable[[str], Any]] = {
+    "__decimal__": Decimal,
+    "__datetime__": datetime.fromisoformat,
+    "__date__": date.fromisoformat,
+}
+
+
+def encode_shard_value(value: Any) -> dict[str, str]:
+    if isinstance(value, Decimal):
+        return {"__decimal__": str(value)}
+    if isinstance(value, datetime):
+        return {"__datetime__": value.isoformat()}
+    if isinstance(value, date):
+        return {"__date__": value.isoformat()}
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def decode_shard_value(value: dict[str, Any]) -> Any:
+    if len(value) == 1:
+        type_key, serialized_value = next(iter(value.items()))
+        if decoder := SHARD_VALUE_DECODERS.get(type_key):
+            return decoder(serialized_value)
+    return value
+
+
+class ExportShardWriter:
+    """Write rows of a single export shard as JSON lines.
+
+    Shards are merged into the final export file once all of them are completed.
+    """
+
+    def __init__(self):
+        self.rows_count = 0
+        self.temporary_file = NamedTemporaryFile("w+b", suffix=".jsonl")
+
+    def write(self, export_data: list[dict[str, Union[str, bool]]], headers: list[str]):
+        for data in export_data:
+            row = {header: data.get(header, "") for header in headers}
+            self.temporary_file.write(
+                json.dumps(row, default=encode_shard_value).encode() + b"\n"
+            )
+        self.rows_count += len(export_data)
+
+    def finish(self) -> IO[bytes]:
+        self.temporary_file.seek(0)
+        return self.temporary_file
+
+    def close(self):
+        self.temporary_file.close()
+
+
 def export_products(
     export_file: "ExportFile",
     scope: dict[str, Union[str, dict]],
@@ -41,22 +191,129 @@ def export_products(
         data_headers,
     ) = get_product_export_fields_and_headers_info(export_info)
 
-    temporary_file = create_file_with_headers(file_headers, delimiter, file_type)
+    writer = create_file_with_headers(file_headers, delimiter, file_type)
+    with writer:
+        export_products_in_batches(
+            queryset,
+            export_info,
+            set(export_fields),
+            data_headers,
+            writer,
+        )
+
+        save_csv_file_in_export_file(export_file, writer.finish(), file_name)
+
+    send_export_download_link_notification(export_file, "products")
+    return writer.get_stats()
+
+
+def get_product_export_shards(
+    scope: dict[str, Union[str, dict]], shard_size: int
+) -> list[tuple[int, Optional[int]]]:
+    """Split exported products into ranges of primary keys of the given size.
+
+    Each range is defined by the exclusive start and the inclusive end primary key;
+    the last range is open-ended.
+    """
+    from ...graphql.product.filters import ProductFilter
+
+    queryset = get_queryset(Product, ProductFilter, scope)
+    shards: list[tuple[int, Optional[int]]] = []
+    start_pk = 0
+    while True:
+        end_pks = list(
+            queryset.filter(pk__gt=start_pk).values_list("pk", flat=True)[
+                shard_size - 1 : shard_size
+            ]
+        )
+        if not end_pks:
+            break
+        shards.append((start_pk, end_pks[0]))
+        start_pk = end_pks[0]
+    shards.append((start_pk, None))
+    return shards
+
+
+def get_product_export_shards_dir(export_file_id: int) -> str:
+    # shards are saved in the public storage, so their paths can't be guessable
+    return f"export_files/shards/{export_file_id}-{uuid.uuid4().hex}"
+
+
+def get_product_export_shard_path(shards_dir: str, shard_index: int) -> str:
+    return f"{shards_dir}/{shard_index}.jsonl"
+
+
+def delete_product_export_shards(shards_dir: str, shards_count: int):
+    for shard_index in range(shards_count):
+        path = get_product_export_shard_path(shards_dir, shard_index)
+        if default_storage.exists(path):
+            default_storage.delete(path)
+
+
+def export_products_shard(
+    export_file: "ExportFile",
+    scope: dict[str, Union[str, dict]],
+    export_info: dict[str, list],
+    shards_dir: str,
+    shard_index: int,
+    start_pk: int,
+    end_pk: Optional[int],
+) -> dict[str, int]:
+    """Export products of a single shard to the shared storage."""
+    from ...graphql.product.filters import ProductFilter
+
+    queryset = get_queryset(Product, ProductFilter, scope).filter(pk__gt=start_pk)
+    if end_pk is not None:
+        queryset = queryset.filter(pk__lte=end_pk)
 
+    export_fields, _, data_headers = get_product_export_fields_and_headers_info(
+        export_info
+    )
+    writer = ExportShardWriter()
     export_products_in_batches(
-        queryset,
-        export_info,
-        set(export_fields),
-        data_headers,
-        delimiter,
-        temporary_file,
-        file_type,
+        queryset, export_info, set(export_fields), data_headers, writer
     )
 
-    save_csv_file_in_export_file(export_file, temporary_file, file_name)
-    temporary_file.close()
+    path = get_product_export_shard_path(shards_dir, shard_index)
+    # the shard might be already saved by a retried task
+    if default_storage.exists(path):
+        default_storage.delete(path)
+    default_storage.save(path, File(writer.finish()))
+    writer.close()
+    return {"shard": shard_index, "rows_count": writer.rows_count}
+
+
+def merge_product_export_shards(
+    export_file: "ExportFile",
+    export_info: dict[str, list],
+    shards_dir: str,
+    shards_count: int,
+    file_type: str,
+    delimiter: str = ",",
+):
+    """Merge all shards of the product export into the export file."""
+    file_name = get_filename("product", file_type)
+    _, file_headers, data_headers = get_product_export_fields_and_headers_info(
+        export_info
+    )
+    writer = create_file_with_headers(file_headers, delimiter, file_type)
+    with writer:
+        for shard_index in range(shards_count):
+            path = get_product_export_shard_path(shards_dir, shard_index)
+            with default_storage.open(path, "rb") as shard_file:
+                export_data = []
+                for line in shard_file:
+                    export_data.append(json.loads(line, object_hook=decode_shard_value))
+                    if len(export_data) == BATCH_SIZE:
+                        writer.write(export_data, data_headers)
+                        export_data = []
+                writer.write(export_data, data_headers)
+
+        save_csv_file_in_export_file(export_file, writer.finish(), file_name)
+    delete_product_export_shards(shards_dir, shards_count)
 
     send_export_download_link_notification(export_file, "products")
+    return {**writer.get_stats(), "shards_count": shards_count}
 
 
 def export_gift_cards(
@@ -74,20 +331,14 @@ def export_gift_cards(
     queryset = queryset.filter(used_by_email__isnull=True)
 
     export_fields = ["code"]
-    temporary_file = create_file_with_headers(export_fields, delimiter, file_type)
+    writer = create_file_with_headers(export_fields, delimiter, file_type)
+    with writer:
+        export_gift_cards_in_batches(queryset, export_fields, writer)
 
-    export_gift_cards_in_batches(
-        queryset,
-        export_fields,
-        delimiter,
-        temporary_file,
-        file_type,
-    )
-
-    save_csv_file_in_export_file(export_file, temporary_file, file_name)
-    temporary_file.close()
+        save_csv_file_in_export_file(export_file, writer.finish(), file_name)
 
     send_export_download_link_notification(export_file, "gift cards")
+    return writer.get_stats()
 
 
 def export_voucher_codes(
@@ -106,19 +357,13 @@ def export_voucher_codes(
         qs = VoucherCode.objects.filter(id__in=ids)
 
     export_fields = ["code"]
-    temporary_file = create_file_with_headers(export_fields, delimiter, file_type)
-
-    export_voucher_codes_in_batches(
-        qs,
-        export_fields,
-        delimiter,
-        temporary_file,
-        file_type,
-    )
+    writer = create_file_with_headers(export_fields, delimiter, file_type)
+    with writer:
+        export_voucher_codes_in_batches(qs, export_fields, writer)
 
-    save_csv_file_in_export_file(export_file, temporary_file, file_name)
-    temporary_file.close()
+        save_csv_file_in_export_file(export_file, writer.finish(), file_name)
     send_export_download_link_notification(export_file, "voucher codes")
+    return writer.get_stats()
 
 
 def get_filename(model_name: str, file_type: str) -> str:
@@ -169,17 +414,10 @@ def parse_input(data: Any) -> dict[str, Union[str, dict]]:
     return data
 
 
-def create_file_with_headers(file_headers: list[str], delimiter: str, file_type: str):
-    table = etl.wrap([file_headers])
-
-    if file_type == FileTypes.CSV:
-        temp_file = NamedTemporaryFile("ab+", suffix=".csv")
-        etl.tocsv(table, temp_file.name, delimiter=delimiter)
-    else:
-        temp_file = NamedTemporaryFile("ab+", suffix=".xlsx")
-        etl.io.xlsx.toxlsx(table, temp_file.name)
-
-    return temp_file
+def create_file_with_headers(
+    file_headers: list[str], delimiter: str, file_type: str
+) -> ExportFileWriter:
+    return ExportFileWriter(file_headers, delimiter, file_type)
 
 
 def export_products_in_batches(
@@ -187,9 +425,7 @@ def export_products_in_batches(
     export_info: dict[str, list],
     export_fields: set[str],
     headers: list[str],
-    delimiter: str,
-    temporary_file: Any,
-    file_type: str,
+    writer: Union[ExportFileWriter, ExportShardWriter],
 ):
     warehouses = export_info.get("warehouses")
     attributes = export_info.get("attributes")
@@ -209,37 +445,33 @@ def export_products_in_batches(
             product_batch, export_fields, attributes, warehouses, channels
         )
 
-        append_to_file(export_data, headers, temporary_file, file_type, delimiter)
+        writer.write(export_data, headers)
 
 
 def export_gift_cards_in_batches(
     queryset: "QuerySet",
     export_fields: list[str],
-    delimiter: str,
-    temporary_file: Any,
-    file_type: str,
+    writer: ExportFileWriter,
 ):
     for batch_pks in queryset_in_batches(queryset):
         gift_card_batch = GiftCard.objects.filter(pk__in=batch_pks)
 
         export_data = list(gift_card_batch.values(*export_fields))
 
-        append_to_file(export_data, export_fields, temporary_file, file_type, delimiter)
+        writer.write(export_data, export_fields)
 
 
 def export_voucher_codes_in_batches(
     queryset: "QuerySet",
     export_fields: list[str],
-    delimiter: str,
-    temporary_file: Any,
-    file_type: str,
+    writer: ExportFileWriter,
 ):
     for batch_pks in queryset_in_batches(queryset):
         voucher_codes_batch = VoucherCode.objects.filter(pk__in=batch_pks)
 
         export_data = list(voucher_codes_batch.values(*export_fields))
 
-        append_to_file(export_data, export_fields, temporary_file, file_type, delimiter)
+        writer.write(export_data, export_fields)
 
 
 def queryset_in_batches(queryset):
@@ -261,21 +493,6 @@ def queryset_in_batches(queryset):
         start_pk = pks[-1]
 
 
-def append_to_file(
-    export_data: list[dict[str, Union[str, bool]]],
-    headers: list[str],
-    temporary_file: Any,
-    file_type: str,
-    delimiter: str,
-):
-    table = etl.fromdicts(export_data, header=headers, missing="")
-
-    if file_type == FileTypes.CSV:
-        etl.io.csv.appendcsv(table, temporary_file.name, delimiter=delimiter)
-    else:
-        etl.io.xlsx.appendxlsx(table, temporary_file.name)
-
-
 def save_csv_file_in_export_file(
     export_file: "ExportFile", temporary_file: IO[bytes], file_name: str
 ):
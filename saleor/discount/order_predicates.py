@@ -0,0 +1,161 @@
+"""Evaluate promotion order predicates against loaded checkouts.
+
+Order predicates are stored as the `where` input of the `orderPredicate` field, e.g.
+    {
+        "discountedObjectPredicate": {
+            "OR": [
+                {"baseSubtotalPrice": {"range": {"gte": 100}}},
+                {"baseTotalPrice": {"range": {"lte": 50}}},
+            ]
+        }
+    }
+Instead of filtering checkouts in the database for each rule, the predicate is
+compiled once into a Python callable that checks the checkout's base prices.
+The semantics follow `filter_qs_by_predicate` used for order predicates.
+"""
+
+import json
+from decimal import Decimal
+from typing import TYPE_CHECKING, Any, Callable
+
+from ..core.utils.cache import CacheDict
+
+if TYPE_CHECKING:
+    from ..checkout.models import Checkout
+    from .models import PromotionRule
+
+OrderPredicate = Callable[["Checkout", str], bool]
+
+OPERATORS = ("AND", "OR", "NOT")
+
+PRICE_FIELD_TO_CHECKOUT_FIELD = {
+    "baseSubtotalPrice": "base_subtotal_amount",
+    "base_subtotal_price": "base_subtotal_amount",
+    "baseTotalPrice": "base_total_amount",
+    "base_total_price": "base_total_amount",
+}
+
+# Compiled predicates by rule id and predicate content, so any change of the rule's
+# predicate results in a new entry. The number of order rules is limited by
+# `ORDER_RULES_LIMIT`.
+_compiled_order_predicates: CacheDict = CacheDict(1000)
+
+
+def get_order_predicate(rule: "PromotionRule") -> OrderPredicate:
+    """Return the compiled order predicate of the rule."""
+    key = (rule.pk, json.dumps(rule.order_predicate, sort_keys=True))
+    try:
+        return _compiled_order_predicates[key]
+    except KeyError:
+        predicate = compile_order_predicate(rule.order_predicate)
+        _compiled_order_predicates[key] = predicate
+        return predicate
+
+
+def compile_order_predicate(predicate: dict[str, Any]) -> OrderPredicate:
+    """Compile the order predicate into a callable accepting checkout and currency."""
+    if not predicate:
+        return _never
+
+    conditions: list[OrderPredicate] = []
+    if and_data := predicate.get("AND"):
+        conditions.append(_all_of([_compile_operand(item, True) for item in and_data]))
+    if or_data := predicate.get("OR"):
+        conditions.append(_any_of([_compile_operand(item, False) for item in or_data]))
+    object_predicate = {
+        key: value for key, value in predicate.items() if key not in ("AND", "OR")
+    }
+    if object_predicate:
+        conditions.append(_compile_object_predicate(object_predicate, True))
+    return _all_of(conditions)
+
+
+def _compile_operand(predicate: dict[str, Any], default: bool) -> OrderPredicate:
+    if any(operator in predicate for operator in OPERATORS):
+        return compile_order_predicate(predicate)
+    return _compile_object_predicate(predicate, default)
+
+
+def _compile_object_predicate(
+    predicate: dict[str, Any], default: bool
+) -> OrderPredicate:
+    # Operands without the discounted object predicate don't narrow down the result:
+    # they match everything within `AND` and nothing within `OR`.
+    where = predicate.get("discountedObjectPredicate") or predicate.get(
+        "discounted_object_predicate"
+    )
+    if not where:
+        return _always if default else _never
+    return _compile_where(where)
+
+
+def _compile_where(where: dict[str, Any]) -> OrderPredicate:
+    conditions: list[OrderPredicate] = []
+    if and_data := where.get("AND"):
+        conditions.extend(_compile_where(item) for item in and_data)
+    if or_data := where.get("OR"):
+        conditions.append(_any_of([_compile_where(item) for item in or_data]))
+    for field, value in where.items():
+        checkout_field = PRICE_FIELD_TO_CHECKOUT_FIELD.get(field)
+        if checkout_field and value is not None:
+            conditions.append(_compile_price_condition(checkout_field, value))
+    return _all_of(conditions)
+
+
+def _compile_price_condition(field: str, value: dict[str, Any]) -> OrderPredicate:
+    matches_amount = _compile_numeric_condition(value)
+
+    def condition(checkout: "Checkout", currency: str) -> bool:
+        return checkout.currency == currency and matches_amount(
+            getattr(checkout, field)
+        )
+
+    return condition
+
+
+def _compile_numeric_condition(value: dict[str, Any]) -> Callable[[Any], bool]:
+    # Mirrors `filter_where_by_numeric_field`.
+    one_of = value.get("one_of")
+    range = value.get("range")
+
+    if "eq" in value:
+        eq = _to_decimal(value["eq"])
+        return lambda amount: eq is not None and amount == eq
+    if one_of:
+        values = {_to_decimal(item) for item in one_of}
+        return lambda amount: amount in values
+    if range and isinstance(range, dict):
+        lte = _to_decimal(range.get("lte"))
+        gte = _to_decimal(range.get("gte"))
+        if lte is None and gte is None:
+            return lambda amount: False
+        return lambda amount: (lte is None or amount <= lte) and (
+            gte is None or amount >= gte
+        )
+    return lambda amount: False
+
+
+def _to_decimal(value):
+    return Decimal(str(value)) if value is not None else None
+
+
+def _all_of(conditions: list[OrderPredicate]) -> OrderPredicate:
+    if len(conditions) == 1:
+        return conditions[0]
+    return lambda checkout, currency: all(
+        condition(checkout, currency) for condition in conditions
+    )
+
+
+def _any_of(conditions: list[OrderPredicate]) -> OrderPredicate:
+    return lambda checkout, currency: any(
+        condition(checkout, currency) for condition in conditions
+    )
+
+
+def _always(_checkout: "Checkout", _currency: str) -> bool:
+    return True
+
+
+def _never(_checkout: "Checkout", _currency: str) -> bool:
+    return False
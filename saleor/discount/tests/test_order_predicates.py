@@ -0,0 +1,155 @@
+from decimal import Decimal
+
+import pytest
+
+from ...checkout.models import Checkout
+from ...graphql.discount.utils import PredicateObjectType, filter_qs_by_predicate
+from ..order_predicates import compile_order_predicate, get_order_predicate
+
+
+@pytest.mark.parametrize(
+    ("order_predicate", "expected_result"),
+    [
+        ({}, False),
+        ({"discountedObjectPredicate": {"baseSubtotalPrice": {"eq": 50}}}, True),
+        ({"discountedObjectPredicate": {"baseSubtotalPrice": {"eq": 51}}}, False),
+        (
+            {"discountedObjectPredicate": {"baseTotalPrice": {"one_of": [10, 80.5]}}},
+            True,
+        ),
+        (
+            {"discountedObjectPredicate": {"baseTotalPrice": {"one_of": [10, 80]}}},
+            False,
+        ),
+        (
+            {
+                "discountedObjectPredicate": {
+                    "baseSubtotalPrice": {"range": {"gte": 20, "lte": 50}}
+                }
+            },
+            True,
+        ),
+        (
+            {"discountedObjectPredicate": {"baseSubtotalPrice": {"range": {}}}},
+            False,
+        ),
+        ({"discountedObjectPredicate": {"baseSubtotalPrice": {}}}, False),
+        (
+            {
+                "AND": [
+                    {
+                        "discountedObjectPredicate": {
+                            "baseSubtotalPrice": {"range": {"gte": 20}}
+                        }
+                    },
+                    {
+                        "discountedObjectPredicate": {
+                            "baseTotalPrice": {"range": {"lte": 80}}
+                        }
+                    },
+                ]
+            },
+            False,
+        ),
+        (
+            {
+                "OR": [
+                    {
+                        "discountedObjectPredicate": {
+                            "baseSubtotalPrice": {"range": {"gte": 60}}
+                        }
+                    },
+                    {
+                        "discountedObjectPredicate": {
+                            "baseTotalPrice": {"range": {"lte": 90}}
+                        }
+                    },
+                ]
+            },
+            True,
+        ),
+        (
+            {
+                "AND": [
+                    {
+                        "OR": [
+                            {
+                                "discountedObjectPredicate": {
+                                    "baseSubtotalPrice": {"eq": 10}
+                                }
+                            },
+                            {
+                                "discountedObjectPredicate": {
+                                    "baseTotalPrice": {"eq": 80.5}
+                                }
+                            },
+                        ]
+                    },
+                    {
+                        "discountedObjectPredicate": {
+                            "baseSubtotalPrice": {"range": {"lte": 50}}
+                        }
+                    },
+                ]
+            },
+            True,
+        ),
+    ],
+)
+def test_compile_order_predicate_matches_database_filtering(
+    order_predicate, expected_result, checkout
+):
+    # given
+    checkout.base_subtotal_amount = Decimal("50")
+    checkout.base_total_amount = Decimal("80.5")
+    checkout.save(update_fields=["base_subtotal_amount", "base_total_amount"])
+    currency = checkout.currency
+
+    # when
+    result = compile_order_predicate(order_predicate)(checkout, currency)
+
+    # then
+    assert result is expected_result
+    checkouts = filter_qs_by_predicate(
+        order_predicate,
+        Checkout.objects.filter(pk=checkout.pk),
+        PredicateObjectType.CHECKOUT,
+        currency,
+    )
+    assert checkouts.exists() is expected_result
+
+
+def test_compile_order_predicate_different_currency(checkout):
+    # given
+    checkout.base_subtotal_amount = Decimal("50")
+    order_predicate = {
+        "discountedObjectPredicate": {"baseSubtotalPrice": {"range": {"gte": 20}}}
+    }
+
+    # when
+    result = compile_order_predicate(order_predicate)(checkout, "JPY")
+
+    # then
+    assert result is False
+
+
+def test_get_order_predicate_recompiles_changed_predicate(
+    checkout, order_promotion_rule
+):
+    # given
+    checkout.base_subtotal_amount = Decimal("50")
+    rule = order_promotion_rule
+    predicate = get_order_predicate(rule)
+    assert get_order_predicate(rule) is predicate
+
+    rule.order_predicate = {
+        "discountedObjectPredicate": {"baseSubtotalPrice": {"range": {"gte": 60}}}
+    }
+
+    # when
+    changed_predicate = get_order_predicate(rule)
+
+    # then
+    assert changed_predicate is not predicate
+    assert predicate(checkout, checkout.currency) is True
+    assert changed_predicate(checkout, checkout.currency) is False
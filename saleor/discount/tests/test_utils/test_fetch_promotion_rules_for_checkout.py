@@ -82,3 +82,40 @@ def test_fetch_promotion_rules_for_checkout_relevant_channel_only(
     # then
     assert len(rules_per_promotion_id) == 1
     assert rules_per_promotion_id == [rule_2]
+
+
+def test_fetch_promotion_rules_for_checkout_evaluates_predicates_in_memory(
+    checkout, order_promotion_rule, django_assert_num_queries
+):
+    # given
+    promotion = order_promotion_rule.promotion
+    for index in range(5):
+        rule = PromotionRule.objects.create(
+            name=f"Promotion rule {index}",
+            promotion=promotion,
+            order_predicate={
+                "discountedObjectPredicate": {
+                    "baseSubtotalPrice": {"range": {"gte": index * 50}}
+                }
+            },
+            reward_value_type=RewardValueType.PERCENTAGE,
+            reward_value=Decimal("10"),
+            reward_type=RewardType.SUBTOTAL_DISCOUNT,
+        )
+        rule.channels.add(checkout.channel)
+
+    checkout.base_total_amount = 100
+    checkout.base_subtotal_amount = 100
+    checkout.save(update_fields=["base_total_amount", "base_subtotal_amount"])
+
+    # when
+    with django_assert_num_queries(1):
+        rules = fetch_promotion_rules_for_checkout(checkout)
+
+    # then
+    assert {rule.name for rule in rules} == {
+        order_promotion_rule.name,
+        "Promotion rule 0",
+        "Promotion rule 1",
+        "Promotion rule 2",
+    }
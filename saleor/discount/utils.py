@@ -42,6 +42,7 @@ from .models import (
     VoucherCode,
     VoucherCustomer,
 )
+from .order_predicates import get_order_predicate
 
 if TYPE_CHECKING:
     from ..account.models import User
@@ -980,8 +981,6 @@ def get_variants_to_promotion_rules_map(
 def fetch_promotion_rules_for_checkout(
     checkout: Checkout,
 ):
-    from ..graphql.discount.utils import PredicateObjectType, filter_qs_by_predicate
-
     applicable_rules = []
     promotions = Promotion.objects.active()
     checkout_channel_id = checkout.channel_id
@@ -993,16 +992,13 @@ def fetch_promotion_rules_for_checkout(
         Exists(PromotionRuleChannels.filter(promotionrule_id=OuterRef("id"))),
     ).exclude(order_predicate={})
 
+    # The checkout base prices are already up to date at this point, so the order
+    # predicates can be evaluated against the checkout instance instead of querying
+    # the database for each rule.
     currency = checkout.channel.currency_code
-    checkout_qs = Checkout.objects.filter(pk=checkout.pk)
     for rule in rules.iterator():
-        checkouts = filter_qs_by_predicate(
-            rule.order_predicate,
-            checkout_qs,
-            PredicateObjectType.CHECKOUT,
-            currency,
-        )
-        if checkouts.exists():
+        order_predicate = get_order_predicate(rule)
+        if order_predicate(checkout, currency):
             applicable_rules.append(rule)
 
     return applicable_rules
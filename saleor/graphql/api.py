@@ -1,6 +1,11 @@
+import hashlib
+from collections import Counter
 from functools import partial
+from typing import Optional
 
 import graphql
+from django.conf import settings
+from django.core.cache import cache
 from django.urls import reverse
 from django.utils.functional import SimpleLazyObject
 from graphql import (
@@ -15,6 +20,7 @@ from graphql import (
 from graphql.backend.base import GraphQLDocument
 from graphql.execution import ExecutionResult
 
+from .. import __version__ as saleor_version
 from ..core.utils.cache import CacheDict
 from ..graphql.notifications.schema import ExternalNotificationMutations
 from .account.schema import AccountMutations, AccountQueries
@@ -196,6 +202,17 @@ class SaleorGraphQLBackend(GraphQLCoreBackend):
         # validate eagerly so we can cache the result
         document_ast = parse(document_string)
         validation_errors = validate(schema, document_ast)
+        return self.document_from_ast(
+            schema, document_string, document_ast, validation_errors
+        )
+
+    def document_from_ast(
+        self,
+        schema: GraphQLSchema,
+        document_string: str,
+        document_ast,
+        validation_errors=None,
+    ) -> GraphQLDocument:
         if validation_errors:
             return GraphQLDocument(
                 schema=schema,
@@ -212,4 +229,92 @@ class SaleorGraphQLBackend(GraphQLCoreBackend):
         )
 
 
-backend = GraphQLCachedBackend(SaleorGraphQLBackend(), cache_map=CacheDict(1000))
+def get_query_hash(document_string: str) -> str:
+    return hashlib.sha256(document_string.encode("utf-8")).hexdigest()
+
+
+class SaleorGraphQLCachedBackend(GraphQLCachedBackend):
+    """Cache validated documents in two tiers.
+
+    The first tier is a per-process LRU keyed by the sha256 hash of the query.
+    When persisted queries are enabled, strings of valid documents are also stored
+    in the shared Django cache, so other workers only need to parse them, and
+    clients can refer to them by hash only.
+
+    The `stats` counter tracks `local_hits`, `shared_hits` and `misses`; only
+    misses pay for both parsing and validation.
+    """
+
+    backend: SaleorGraphQLBackend
+
+    def __init__(self, backend: SaleorGraphQLBackend, cache_map: CacheDict):
+        super().__init__(backend, cache_map=cache_map)
+        self.stats: Counter = Counter()
+
+    @staticmethod
+    def get_shared_cache_key(query_hash: str) -> str:
+        return f"{saleor_version}-graphql-document-{query_hash}"
+
+    def document_from_string(
+        self,
+        schema: GraphQLSchema,
+        request_string: str,
+    ) -> GraphQLDocument:
+        query_hash = get_query_hash(request_string)
+        return self._get_document(schema, query_hash, request_string)
+
+    def document_from_hash(
+        self, schema: GraphQLSchema, query_hash: str
+    ) -> Optional[GraphQLDocument]:
+        """Return a document persisted under the given hash, if any."""
+        key = self.get_key_for_schema_and_document_string(schema, query_hash)
+        if key in self.cache_map:
+            self.stats["local_hits"] += 1
+            return self.cache_map[key]
+        request_string = cache.get(self.get_shared_cache_key(query_hash))
+        if request_string is None:
+            return None
+        return self._get_document(schema, query_hash, request_string, is_shared=True)
+
+    def _get_document(
+        self,
+        schema: GraphQLSchema,
+        query_hash: str,
+        request_string: str,
+        is_shared: Optional[bool] = None,
+    ) -> GraphQLDocument:
+        key = self.get_key_for_schema_and_document_string(schema, query_hash)
+        if key in self.cache_map:
+            self.stats["local_hits"] += 1
+            return self.cache_map[key]
+
+        use_shared_cache = settings.GRAPHQL_PERSISTED_QUERIES_ENABLED
+        shared_key = self.get_shared_cache_key(query_hash)
+        if is_shared is None and use_shared_cache:
+            is_shared = cache.get(shared_key) == request_string
+
+        document_ast = parse(request_string)
+        if is_shared:
+            # only valid documents are shared, skip the validation
+            self.stats["shared_hits"] += 1
+            validation_errors = None
+        else:
+            self.stats["misses"] += 1
+            validation_errors = validate(schema, document_ast)
+            if not validation_errors and use_shared_cache:
+                cache.set(
+                    shared_key,
+                    request_string,
+                    timeout=settings.GRAPHQL_PERSISTED_QUERIES_TIMEOUT,
+                )
+
+        document = self.backend.document_from_ast(
+            schema, request_string, document_ast, validation_errors
+        )
+        self.cache_map[key] = document
+        return document
+
+
+backend = SaleorGraphQLCachedBackend(
+    SaleorGraphQLBackend(), cache_map=CacheDict(settings.GRAPHQL_DOCUMENT_CACHE_SIZE)
+)
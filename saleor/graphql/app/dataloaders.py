@@ -1,8 +1,12 @@
+import hashlib
+import hmac
 from collections import defaultdict
 from functools import partial, wraps
-from typing import Optional
+from typing import Optional, cast
 
+from django.conf import settings
 from django.contrib.auth.hashers import check_password
+from django.core.cache import cache
 from django.utils.functional import LazyObject
 from promise import Promise
 
@@ -76,34 +80,88 @@ class AppTokensByAppIdLoader(DataLoader):
         return [tokens_by_app_map.get(app_id, []) for app_id in keys]
 
 
+def get_app_token_cache_key(raw_token: str) -> str:
+    # Keyed HMAC, so raw tokens can't be recovered or brute-forced from the cache.
+    digest = hmac.new(
+        cast(str, settings.SECRET_KEY).encode(), raw_token.encode(), hashlib.sha256
+    ).hexdigest()
+    return f"app_token:{digest}"
+
+
 class AppByTokenLoader(DataLoader):
+    """Return active apps authenticated by the given raw tokens.
+
+    Verifying a token requires hashing it with the password hasher, which is
+    expensive by design. Ids of successfully verified tokens are cached for
+    `APP_TOKEN_CACHE_TIMEOUT` under a keyed HMAC of the raw token. Cached tokens
+    are always matched against the database, so a deleted token or a deactivated
+    app stops being authenticated immediately. Failed verifications are never
+    cached, so guessing tokens stays as expensive as before.
+    """
+
     context_key = "app_by_token"
 
     def batch_load(self, keys):
+        cache_keys = {
+            raw_token: get_app_token_cache_key(raw_token) for raw_token in keys
+        }
+        token_ids = {}
+        if settings.APP_TOKEN_CACHE_TIMEOUT:
+            cached_token_ids = cache.get_many(cache_keys.values())
+            for raw_token in keys:
+                if token_id := cached_token_ids.get(cache_keys[raw_token]):
+                    token_ids[raw_token] = token_id
+
+        apps_by_token_id = self.get_apps_by_token_id(token_ids.values())
+        raw_tokens_to_verify = [
+            raw_token
+            for raw_token in keys
+            if token_ids.get(raw_token) not in apps_by_token_id
+        ]
+        if raw_tokens_to_verify:
+            verified_token_ids = self.verify_tokens(raw_tokens_to_verify)
+            token_ids.update(verified_token_ids)
+            apps_by_token_id.update(
+                self.get_apps_by_token_id(verified_token_ids.values())
+            )
+            if settings.APP_TOKEN_CACHE_TIMEOUT:
+                cache.set_many(
+                    {
+                        cache_keys[raw_token]: token_id
+                        for raw_token, token_id in verified_token_ids.items()
+                        if token_id in apps_by_token_id
+                    },
+                    timeout=settings.APP_TOKEN_CACHE_TIMEOUT,
+                )
+
+        return [apps_by_token_id.get(token_ids.get(key)) for key in keys]
+
+    def verify_tokens(self, raw_tokens):
         last_4s_to_raw_token_map = defaultdict(list)
-        for raw_token in keys:
+        for raw_token in raw_tokens:
             last_4s_to_raw_token_map[raw_token[-4:]].append(raw_token)
 
         tokens = (
             AppToken.objects.using(self.database_connection_name)
             .filter(token_last_4__in=last_4s_to_raw_token_map.keys())
-            .values_list("auth_token", "token_last_4", "app_id")
+            .values_list("id", "auth_token", "token_last_4")
         )
-        authed_apps = {}
-        for auth_token, token_last_4, app_id in tokens:
+        token_ids = {}
+        for token_id, auth_token, token_last_4 in tokens:
             for raw_token in last_4s_to_raw_token_map[token_last_4]:
                 if check_password(raw_token, auth_token):
-                    authed_apps[raw_token] = app_id
+                    token_ids[raw_token] = token_id
+        return token_ids
 
-        apps = (
-            App.objects.using(self.database_connection_name)
-            .filter(
-                id__in=authed_apps.values(), is_active=True, removed_at__isnull=True
-            )
-            .in_bulk()
+    def get_apps_by_token_id(self, token_ids):
+        if not token_ids:
+            return {}
+        tokens = (
+            AppToken.objects.using(self.database_connection_name)
+            .filter(id__in=token_ids, app__is_active=True, app__removed_at__isnull=True)
+            .select_related("app")
         )
-
-        return [apps.get(authed_apps.get(key)) for key in keys]
+        return {token.id: token.app for token in tokens}
 
 
 class ThumbnailByAppIdSizeAndFormatLoader(BaseThumbnailBySizeAndFormatLoader):
@@ -3,6 +3,7 @@ import graphene
 from ....app import models
 from ....permission.enums import AppPermission, get_permissions
 from ....webhook.event_types import WebhookEventAsyncType
+from ....webhook.utils import invalidate_webhooks_routing_table
 from ...core.descriptions import ADDED_IN_319
 from ...core.doc_category import DOC_CATEGORY_APPS
 from ...core.enums import PermissionEnum
@@ -83,6 +84,7 @@ class AppCreate(ModelMutation):
         cls.clean_instance(info, instance)
         auth_token = cls.save(info, instance, cleaned_input)
         cls._save_m2m(info, instance, cleaned_input)
+        invalidate_webhooks_routing_table()
         response = cls.success_response(instance)
         response.auth_token = auth_token
         manager = get_plugin_manager_promise(info.context).get()
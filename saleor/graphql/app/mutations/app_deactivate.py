@@ -3,6 +3,7 @@ import graphene
 from ....app import models
 from ....permission.enums import AppPermission
 from ....webhook.event_types import WebhookEventAsyncType
+from ....webhook.utils import invalidate_webhooks_routing_table
 from ...core.mutations import ModelMutation
 from ...core.types import AppError
 from ...core.utils import WebhookEventInfo
@@ -38,6 +39,7 @@ class AppDeactivate(ModelMutation):
         )
         app.is_active = False
         cls.save(info, app, None)
+        invalidate_webhooks_routing_table()
         manager = get_plugin_manager_promise(info.context).get()
         cls.call_event(manager.app_status_changed, app)
         return cls.success_response(app)
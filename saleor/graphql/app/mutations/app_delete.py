@@ -6,6 +6,7 @@ from ....app import models
 from ....app.error_codes import AppErrorCode
 from ....permission.enums import AppPermission
 from ....webhook.event_types import WebhookEventAsyncType
+from ....webhook.utils import invalidate_webhooks_routing_table
 from ...account.utils import can_manage_app
 from ...core import ResolveInfo
 from ...core.mutations import ModelMutation
@@ -63,6 +64,7 @@ class AppDelete(ModelMutation):
         instance.removed_at = timezone.now()
         instance.is_active = False
         instance.save(update_fields=["removed_at", "is_active"])
+        invalidate_webhooks_routing_table()
 
         cls.post_save_action(info, instance, {})
         return cls.success_response(instance)
@@ -5,6 +5,7 @@ from ....app import models
 from ....app.error_codes import AppErrorCode
 from ....permission.enums import AppPermission, get_permissions
 from ....webhook.event_types import WebhookEventAsyncType
+from ....webhook.utils import invalidate_webhooks_routing_table
 from ...account.utils import can_manage_app
 from ...core import ResolveInfo
 from ...core.mutations import ModelMutation
@@ -65,5 +66,6 @@ class AppUpdate(ModelMutation):
 
     @classmethod
     def post_save_action(cls, info, instance, cleaned_input):
+        invalidate_webhooks_routing_table()
         manager = get_plugin_manager_promise(info.context).get()
         cls.call_event(manager.app_updated, instance)
@@ -0,0 +1,92 @@
+from unittest import mock
+
+from django.contrib.auth.hashers import check_password
+from django.core.cache import cache
+
+from ....app.models import AppToken
+from ...core import SaleorContext
+from ..dataloaders import AppByTokenLoader, get_app_token_cache_key
+
+
+def _load_app(raw_token):
+    return AppByTokenLoader(SaleorContext()).load(raw_token).get()
+
+
+@mock.patch("saleor.graphql.app.dataloaders.check_password", wraps=check_password)
+def test_app_by_token_loader_caches_verified_token(mocked_check_password, app):
+    # given
+    app_token, raw_token = AppToken.objects.create(app=app)
+    assert _load_app(raw_token) == app
+    mocked_check_password.reset_mock()
+
+    # when
+    loaded_app = _load_app(raw_token)
+
+    # then
+    assert loaded_app == app
+    mocked_check_password.assert_not_called()
+    assert cache.get(get_app_token_cache_key(raw_token)) == app_token.id
+
+
+def test_app_by_token_loader_deleted_token(app):
+    # given
+    app_token, raw_token = AppToken.objects.create(app=app)
+    assert _load_app(raw_token) == app
+
+    # when
+    app_token.delete()
+
+    # then
+    assert _load_app(raw_token) is None
+
+
+def test_app_by_token_loader_deactivated_app(app):
+    # given
+    _, raw_token = AppToken.objects.create(app=app)
+    assert _load_app(raw_token) == app
+
+    # when
+    app.is_active = False
+    app.save(update_fields=["is_active"])
+
+    # then
+    assert _load_app(raw_token) is None
+
+
+def test_app_by_token_loader_token_recreated_with_the_same_value(app):
+    # given
+    app_token, raw_token = AppToken.objects.create(app=app)
+    assert _load_app(raw_token) == app
+    app_token.delete()
+
+    # when
+    new_app_token, _ = AppToken.objects.create(app=app, auth_token=raw_token)
+
+    # then
+    assert _load_app(raw_token) == app
+    assert cache.get(get_app_token_cache_key(raw_token)) == new_app_token.id
+
+
+def test_app_by_token_loader_does_not_cache_invalid_token(app):
+    # given
+    raw_token = "x" * 30
+
+    # when
+    loaded_app = _load_app(raw_token)
+
+    # then
+    assert loaded_app is None
+    assert cache.get(get_app_token_cache_key(raw_token)) is None
+
+
+def test_app_by_token_loader_cache_disabled(app, settings):
+    # given
+    settings.APP_TOKEN_CACHE_TIMEOUT = 0
+    _, raw_token = AppToken.objects.create(app=app)
+
+    # when
+    loaded_app = _load_app(raw_token)
+
+    # then
+    assert loaded_app == app
+    assert cache.get(get_app_token_cache_key(raw_token)) is None
@@ -4,6 +4,7 @@ from django.utils.text import slugify
 from ....channel import models
 from ....core.tracing import traced_atomic_transaction
 from ....permission.enums import ChannelPermissions
+from ....plugins.manager import invalidate_plugins_registry
 from ....tax.models import TaxConfiguration
 from ....webhook.event_types import WebhookEventAsyncType
 from ...account.enums import CountryCodeEnum
@@ -285,5 +286,6 @@ class ChannelCreate(ModelMutation):
     @classmethod
     def post_save_action(cls, info: ResolveInfo, instance, cleaned_input):
         TaxConfiguration.objects.create(channel=instance)
+        invalidate_plugins_registry()
         manager = get_plugin_manager_promise(info.context).get()
         cls.call_event(manager.channel_created, instance)
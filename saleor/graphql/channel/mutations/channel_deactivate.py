@@ -3,6 +3,7 @@ from django.core.exceptions import ValidationError
 
 from ....channel.error_codes import ChannelErrorCode
 from ....permission.enums import ChannelPermissions
+from ....plugins.manager import invalidate_plugins_registry
 from ....webhook.event_types import WebhookEventAsyncType
 from ...core import ResolveInfo
 from ...core.doc_category import DOC_CATEGORY_CHANNELS
@@ -50,6 +51,7 @@ class ChannelDeactivate(BaseMutation):
         cls.clean_channel_availability(channel)
         channel.is_active = False
         channel.save(update_fields=["is_active"])
+        invalidate_plugins_registry()
         manager = get_plugin_manager_promise(info.context).get()
         cls.call_event(manager.channel_status_changed, channel)
         return ChannelDeactivate(channel=channel)
@@ -9,6 +9,7 @@ from ....checkout.models import Checkout
 from ....core.tracing import traced_atomic_transaction
 from ....order.models import Order
 from ....permission.enums import ChannelPermissions
+from ....plugins.manager import invalidate_plugins_registry
 from ....webhook.event_types import WebhookEventAsyncType
 from ...core import ResolveInfo
 from ...core.doc_category import DOC_CATEGORY_CHANNELS
@@ -116,6 +117,7 @@ class ChannelDelete(ModelDeleteMutation):
 
     @classmethod
     def post_save_action(cls, info: ResolveInfo, instance, cleaned_input):
+        invalidate_plugins_registry()
         manager = get_plugin_manager_promise(info.context).get()
         cls.call_event(manager.channel_deleted, instance)
 
@@ -7,6 +7,7 @@ from ....channel.error_codes import ChannelErrorCode
 from ....core.tracing import traced_atomic_transaction
 from ....permission.enums import ChannelPermissions
 from ...core import ResolveInfo
+from ...core.dataloaders import bump_reference_data_version
 from ...core.descriptions import ADDED_IN_37
 from ...core.doc_category import DOC_CATEGORY_CHANNELS
 from ...core.inputs import ReorderInput
@@ -54,6 +55,7 @@ class ChannelReorderWarehouses(BaseMutation):
 
         with traced_atomic_transaction():
             perform_reordering(warehouses_m2m, operations)
+            bump_reference_data_version()
 
         return ChannelReorderWarehouses(channel=channel)
 
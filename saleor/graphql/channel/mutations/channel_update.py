@@ -15,6 +15,8 @@ from ....permission.enums import (
     OrderPermissions,
     PaymentPermissions,
 )
+from ....plugins.manager import invalidate_plugins_registry
+from ....product.utils.pricing_snapshot import invalidate_all_product_pricing_snapshots
 from ....shipping.tasks import (
     drop_invalid_shipping_methods_relations_for_given_channels,
 )
@@ -240,6 +242,8 @@ class ChannelUpdate(ModelMutation):
 
     @classmethod
     def post_save_action(cls, info: ResolveInfo, instance, cleaned_input):
+        invalidate_plugins_registry()
+        invalidate_all_product_pricing_snapshots()
         manager = get_plugin_manager_promise(info.context).get()
         cls.call_event(manager.channel_updated, instance)
         if cleaned_input.get("metadata"):
@@ -800,3 +800,34 @@ def test_channel_create_set_allow_unpaid_orders(
     channel = Channel.objects.get()
     assert channel_data["orderSettings"]["allowUnpaidOrders"] == allowUnpaid
     assert channel.allow_unpaid_orders == allowUnpaid
+
+
+@mock.patch(
+    "saleor.graphql.channel.mutations.channel_create.invalidate_plugins_registry"
+)
+def test_channel_create_invalidates_plugins_registry(
+    mocked_invalidate_plugins_registry,
+    permission_manage_channels,
+    staff_api_client,
+):
+    # given
+    variables = {
+        "input": {
+            "name": "testName",
+            "slug": "test_slug",
+            "currencyCode": "USD",
+            "defaultCountry": "US",
+        }
+    }
+
+    # when
+    response = staff_api_client.post_graphql(
+        CHANNEL_CREATE_MUTATION,
+        variables=variables,
+        permissions=(permission_manage_channels,),
+    )
+
+    # then
+    content = get_graphql_content(response)
+    assert not content["data"]["channelCreate"]["errors"]
+    mocked_invalidate_plugins_registry.assert_called_once_with()
@@ -11,8 +11,10 @@ from typing import (
 
 import graphene
 from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db import connections
+from django.db.models import F, Field, Q, QuerySet, Value
 from django.db.models import Model as DjangoModel
-from django.db.models import Q, QuerySet
 from graphene.relay import Connection
 from graphql import GraphQLError
 from graphql.language.ast import FragmentSpread
@@ -21,8 +23,10 @@ from graphql_relay.connection.connectiontypes import Edge, PageInfo
 from graphql_relay.utils import base64, unbase64
 
 from ...channel.exceptions import ChannelNotDefined, NoDefaultChannel
+from ...core.postgres import RowValueComparison
 from ..channel import ChannelContext, ChannelQsContext
 from ..channel.utils import get_default_channel_slug_or_graphql_error
+from ..core.descriptions import ADDED_IN_320
 from ..core.enums import OrderDirection
 from ..core.types import BaseConnection, NonNullList
 from ..utils.sorting import sort_queryset_for_connection
@@ -147,6 +151,58 @@ def _prepare_filter(
     return filter_kwargs
 
 
+def _get_keyset_fields(qs: QuerySet, sorting_fields: list[str]) -> Optional[list]:
+    """Return model fields of the sorting fields, if the keyset filter can be used.
+
+    Row values comparison treats rows with NULL values as not matching, so the
+    keyset filter is used only when none of the sorting fields, nor the relations
+    leading to them, can be NULL.
+    """
+    fields = []
+    for sorting_field in sorting_fields:
+        if sorting_field in qs.query.annotations:
+            return None
+        model = qs.model
+        field = None
+        for name in sorting_field.split("__"):
+            if model is None:
+                return None
+            try:
+                field = model._meta.pk if name == "pk" else model._meta.get_field(name)
+            except FieldDoesNotExist:
+                return None
+            if not getattr(field, "concrete", False) or field.null:
+                return None
+            model = field.related_model if field.is_relation else None
+        if field is None or field.is_relation:
+            return None
+        fields.append(field)
+    return fields
+
+
+def _prepare_keyset_filter(
+    cursor: list[str],
+    sorting_fields: list[str],
+    keyset_fields: list[Field],
+    sorting_direction: str,
+) -> RowValueComparison:
+    """Create a row values comparison of the sorting fields and the cursor.
+
+    The result is equivalent to `_prepare_filter` for not nullable fields, e.g.
+    `(name, slug) > ('Apple', 'apple')`.
+    """
+    try:
+        values = [
+            Value(field.to_python(value), output_field=field)
+            for field, value in zip(keyset_fields, cursor)
+        ]
+    except (ValidationError, ValueError, TypeError):
+        raise GraphQLError("Received cursor is invalid.")
+    return RowValueComparison(
+        [F(field) for field in sorting_fields], values, sorting_direction
+    )
+
+
 def _validate_connection_args(args):
     first = args.get("first")
     last = args.get("last")
@@ -249,6 +305,53 @@ def _get_id_coercion(qs: QuerySet) -> Callable[[str], Any]:
     return qs.model.id.field.to_python if hasattr(qs.model, "id") else int
 
 
+def get_estimated_count(qs: QuerySet) -> int:
+    """Return the number of rows of the queryset estimated by the query planner."""
+    sql, params = qs.query.sql_with_params()
+    with connections[qs.db].cursor() as cursor:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+class QuerySetTotalCount:
+    """Count items of a connection queryset, only once and only when requested.
+
+    When `GRAPHQL_TOTAL_COUNT_LIMIT` is set, at most that many rows are counted.
+    Above the limit the count is an estimate: the planner row estimate, but never
+    less than the limit.
+    """
+
+    def __init__(self, qs: QuerySet):
+        self.qs = qs
+        self._count: Optional[int] = None
+        self._is_estimated = False
+
+    def _evaluate(self):
+        if self._count is not None:
+            return
+        limit = settings.GRAPHQL_TOTAL_COUNT_LIMIT
+        if not limit:
+            self._count = self.qs.count()
+            return
+        count = self.qs[: limit + 1].count()
+        if count <= limit:
+            self._count = count
+            return
+        self._count = max(get_estimated_count(self.qs), limit)
+        self._is_estimated = True
+
+    def get_count(self) -> int:
+        self._evaluate()
+        return self._count  # type: ignore[return-value]
+
+    def get_is_estimated(self) -> bool:
+        self._evaluate()
+        return self._is_estimated
+
+
 def connection_from_queryset_slice(
     qs: QuerySet,
     args: Optional[ConnectionArguments] = None,
@@ -278,16 +381,20 @@ def connection_from_queryset_slice(
     sorting_direction = _get_sorting_direction(sort_by, last)
     if cursor and len(cursor) != len(sorting_fields):
         raise GraphQLError("Received cursor is invalid.")
-    filter_kwargs = (
-        _prepare_filter(
-            cursor,
-            sorting_fields,
-            sorting_direction,
-            _get_id_coercion(qs),
-        )
-        if cursor
-        else Q()
-    )
+    filter_kwargs: Union[Q, RowValueComparison] = Q()
+    if cursor:
+        keyset_fields = _get_keyset_fields(qs, sorting_fields)
+        if keyset_fields:
+            filter_kwargs = _prepare_keyset_filter(
+                cursor, sorting_fields, keyset_fields, sorting_direction
+            )
+        else:
+            filter_kwargs = _prepare_filter(
+                cursor,
+                sorting_fields,
+                sorting_direction,
+                _get_id_coercion(qs),
+            )
     try:
         filtered_qs = qs.filter(filter_kwargs)
     except ValueError:
@@ -298,14 +405,12 @@ def connection_from_queryset_slice(
     )
 
     if "total_count" in connection_type._meta.fields:
-
-        def get_total_count():
-            return qs.count()
-
+        total_count = QuerySetTotalCount(qs)
         return connection_type(
             edges=edges,
             page_info=pageinfo_type(**page_info),
-            total_count=get_total_count,
+            total_count=total_count.get_count,
+            is_total_count_estimated=total_count.get_is_estimated,
         )
 
     return connection_type(
@@ -653,6 +758,14 @@ class CountableConnection(NonNullConnection):
         abstract = True
 
     total_count = graphene.Int(description="A total count of items in the collection.")
+    is_total_count_estimated = graphene.Boolean(
+        description=(
+            "Determine if the total count is an estimate. Large collections are "
+            "counted only up to a limit configured on the server, above which the "
+            "total count is estimated and is at least equal to the limit."
+            + ADDED_IN_320
+        )
+    )
 
     @staticmethod
     def resolve_total_count(root, _info):
@@ -668,3 +781,15 @@ class CountableConnection(NonNullConnection):
             return total_count()
 
         return total_count
+
+    @staticmethod
+    def resolve_is_total_count_estimated(root, _info):
+        if isinstance(root, dict):
+            is_estimated = root.get("is_total_count_estimated")
+        else:
+            is_estimated = getattr(root, "is_total_count_estimated", None)
+
+        if callable(is_estimated):
+            return is_estimated()
+
+        return bool(is_estimated)
@@ -1,12 +1,22 @@
-from collections import defaultdict
+import time
+import uuid
+from collections import Counter, defaultdict
 from collections.abc import Iterable
+from copy import deepcopy
 from typing import Generic, Optional, TypeVar, Union
 
 import opentracing
 import opentracing.tags
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections, transaction
+from django.db.models import Model
+from django.db.models.signals import m2m_changed, post_delete, post_save
 from promise import Promise
 from promise.dataloader import DataLoader as BaseLoader
 
+from ... import __version__ as saleor_version
+from ...core.utils.cache import CacheDict
 from ...thumbnail.models import Thumbnail
 from ...thumbnail.utils import get_thumbnail_format
 from . import SaleorContext
@@ -15,11 +25,57 @@ from .context import get_database_connection_name
 K = TypeVar("K")
 R = TypeVar("R")
 
+REFERENCE_DATA_VERSION_CACHE_KEY = f"{saleor_version}-reference-data-version"
+
+# Results of reference data loaders shared by all requests of the worker process,
+# keyed by the data version, so changed data is never served. Values are tuples of
+# the expiration time (`None` when the result does not expire) and the result.
+reference_data_cache = CacheDict(settings.DATALOADER_REFERENCE_DATA_CACHE_SIZE)
+# Number of database round trips avoided by each loader.
+reference_data_cache_stats: Counter = Counter()
+
+
+def get_reference_data_version() -> Optional[str]:
+    return cache.get_or_set(
+        REFERENCE_DATA_VERSION_CACHE_KEY, lambda: uuid.uuid4().hex, timeout=None
+    )
+
+
+def bump_reference_data_version(
+    using: str = settings.DATABASE_CONNECTION_DEFAULT_NAME,
+):
+    """Invalidate reference data cached by all worker processes.
+
+    Saving and deleting reference data models bumps the version automatically;
+    call it after bulk writes, which don't send model signals.
+    """
+    # A new random version is generated on the next read.
+    transaction.on_commit(
+        lambda: cache.delete(REFERENCE_DATA_VERSION_CACHE_KEY), using=using
+    )
+
+
+def _reference_data_changed(sender, using, **kwargs):
+    bump_reference_data_version(using)
+
 
 class DataLoader(BaseLoader, Generic[K, R]):
     context_key: str
     context: SaleorContext
     database_connection_name: str
+    # Models that the results depend on. When set, the results are cached between
+    # requests until any of the models is saved or deleted. Use only for small,
+    # rarely changing tables, as every change invalidates all cached results.
+    reference_data_models: tuple[type[Model], ...] = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        for model in cls.reference_data_models:
+            dispatch_uid = f"reference_data_changed_{model._meta.label_lower}"
+            for signal in (post_save, post_delete, m2m_changed):
+                signal.connect(
+                    _reference_data_changed, sender=model, dispatch_uid=dispatch_uid
+                )
 
     def __new__(cls, context: SaleorContext):
         key = cls.context_key
@@ -47,11 +103,75 @@ class DataLoader(BaseLoader, Generic[K, R]):
         ) as scope:
             span = scope.span
             span.set_tag(opentracing.tags.COMPONENT, "dataloaders")
-            results = self.batch_load(keys)
+            if self.use_reference_data_cache():
+                results = self.batch_load_reference_data(list(keys))
+            else:
+                results = self.batch_load(keys)
             if not isinstance(results, Promise):
                 return Promise.resolve(results)
             return results
 
+    def use_reference_data_cache(self) -> bool:
+        # Data read inside a transaction may include uncommitted writes.
+        return (
+            bool(self.reference_data_models)
+            and bool(settings.DATALOADER_REFERENCE_DATA_CACHE_SIZE)
+            and not connections[self.database_connection_name].in_atomic_block
+        )
+
+    def batch_load_reference_data(
+        self, keys: list[K]
+    ) -> Union[Promise[list[R]], list[R]]:
+        """Load results missing from the reference data cache and cache them.
+
+        Cached results are copied, so the shared instances are never modified.
+        """
+        loader_name = self.__class__.__name__
+        version = get_reference_data_version()
+        now = time.monotonic()
+
+        def get_cache_key(key):
+            return (loader_name, self.database_connection_name, version, key)
+
+        cached_results = {}
+        for key in keys:
+            cache_key = get_cache_key(key)
+            if cache_key in reference_data_cache:
+                cached_expires_at, result = reference_data_cache[cache_key]
+                if cached_expires_at is None or cached_expires_at > now:
+                    cached_results[key] = result
+        if len(cached_results) == len(keys):
+            reference_data_cache_stats[loader_name] += 1
+            return [deepcopy(cached_results[key]) for key in keys]
+
+        missing_keys = [key for key in keys if key not in cached_results]
+
+        # A replica may not have the changes yet when the version is bumped on
+        # commit, so results read from it expire after a short time.
+        expires_at: Optional[float] = None
+        if self.database_connection_name != settings.DATABASE_CONNECTION_DEFAULT_NAME:
+            expires_at = now + settings.DATALOADER_REFERENCE_DATA_REPLICA_CACHE_TIMEOUT
+
+        def cache_results(results):
+            loaded_results = dict(zip(missing_keys, results))
+            if expires_at is None or expires_at > now:
+                for key, result in loaded_results.items():
+                    reference_data_cache[get_cache_key(key)] = (
+                        expires_at,
+                        deepcopy(result),
+                    )
+            return [
+                loaded_results[key]
+                if key in loaded_results
+                else deepcopy(cached_results[key])
+                for key in keys
+            ]
+
+        results = self.batch_load(missing_keys)
+        if isinstance(results, Promise):
+            return results.then(cache_results)
+        return cache_results(results)
+
     def batch_load(self, keys: Iterable[K]) -> Union[Promise[list[R]], list[R]]:
         raise NotImplementedError()
 
@@ -0,0 +1,212 @@
+import timeit
+
+import pytest
+from graphql import validate
+
+from ....api import backend, schema
+from ....query_cost_map import COST_MAP
+from ...validators.query_cost import CostValidator, validate_query_cost
+
+REPEAT = 50
+
+PRODUCT_FRAGMENTS = """
+    fragment Price on TaxedMoney {
+      gross {
+        amount
+        currency
+      }
+    }
+
+    fragment ProductCard on Product {
+      id
+      name
+      slug
+      thumbnail(size: 510) {
+        url
+        alt
+      }
+      category {
+        id
+        name
+      }
+      pricing {
+        onSale
+        priceRange {
+          start {
+            ...Price
+          }
+          stop {
+            ...Price
+          }
+        }
+        priceRangeUndiscounted {
+          start {
+            ...Price
+          }
+          stop {
+            ...Price
+          }
+        }
+      }
+    }
+"""
+
+PRODUCT_LIST_QUERY = (
+    PRODUCT_FRAGMENTS
+    + """
+    query ProductList(
+      $first: Int, $after: String, $channel: String, $filter: ProductFilterInput
+    ) {
+      products(first: $first, after: $after, channel: $channel, filter: $filter) {
+        totalCount
+        pageInfo {
+          hasNextPage
+          endCursor
+        }
+        edges {
+          node {
+            ...ProductCard
+            variants {
+              id
+              name
+              quantityAvailable
+              pricing {
+                price {
+                  ...Price
+                }
+              }
+            }
+          }
+        }
+      }
+      categories(first: 20, level: 0) {
+        edges {
+          node {
+            id
+            name
+            children(first: $first) {
+              edges {
+                node {
+                  id
+                  name
+                  products(first: $first, channel: $channel) {
+                    edges {
+                      node {
+                        ...ProductCard
+                      }
+                    }
+                  }
+                }
+              }
+            }
+          }
+        }
+      }
+    }
+"""
+)
+
+PRODUCT_DETAILS_QUERY = (
+    PRODUCT_FRAGMENTS
+    + """
+    query ProductDetails($slug: String, $channel: String, $first: Int) {
+      product(slug: $slug, channel: $channel) {
+        ...ProductCard
+        description
+        seoTitle
+        seoDescription
+        isAvailable
+        media {
+          id
+          url
+          alt
+        }
+        attributes {
+          attribute {
+            id
+            name
+          }
+          values {
+            id
+            name
+          }
+        }
+        variants {
+          id
+          name
+          sku
+          quantityAvailable
+          attributes {
+            attribute {
+              id
+              name
+            }
+            values {
+              id
+              name
+            }
+          }
+          pricing {
+            price {
+              ...Price
+            }
+            priceUndiscounted {
+              ...Price
+            }
+          }
+        }
+        category {
+          products(first: $first, channel: $channel) {
+            edges {
+              node {
+                ...ProductCard
+              }
+            }
+          }
+        }
+      }
+    }
+"""
+)
+
+
+def _validate_query_cost_with_validator(document, variables):
+    validator = CostValidator(
+        maximum_cost=10**9, variables=variables, cost_map=COST_MAP
+    )
+    errors = validate(
+        schema,
+        document.document_ast,
+        [validator],  # type: ignore[list-item] # cost validator is an instance that pretends to be a class # noqa: E501
+    )
+    return validator.cost, errors
+
+
+@pytest.mark.parametrize(
+    ("query", "variables"),
+    [
+        (PRODUCT_LIST_QUERY, {"first": 100, "channel": "default-channel"}),
+        (PRODUCT_DETAILS_QUERY, {"slug": "product", "first": 4}),
+    ],
+)
+def test_query_cost_of_storefront_queries(query, variables):
+    # given
+    document = backend.document_from_string(schema, query)
+    validate_query_cost(schema, document, variables, COST_MAP, 10**9)
+
+    # when
+    validator_time = timeit.timeit(
+        lambda: _validate_query_cost_with_validator(document, variables),
+        number=REPEAT,
+    )
+    compiled_time = timeit.timeit(
+        lambda: validate_query_cost(schema, document, variables, COST_MAP, 10**9),
+        number=REPEAT,
+    )
+
+    # then
+    assert validate_query_cost(schema, document, variables, COST_MAP, 10**9) == (
+        _validate_query_cost_with_validator(document, variables)[0],
+        None,
+    )
+    assert compiled_time < validator_time
@@ -0,0 +1,162 @@
+import time
+from unittest import mock
+
+import pytest
+
+from ....channel.models import Channel
+from ...channel.dataloaders import ChannelBySlugLoader
+from .. import SaleorContext
+from ..dataloaders import (
+    DataLoader,
+    bump_reference_data_version,
+    reference_data_cache,
+    reference_data_cache_stats,
+)
+
+
+@pytest.fixture(autouse=True)
+def _enable_reference_data_cache(settings):
+    settings.DATALOADER_REFERENCE_DATA_CACHE_SIZE = 100
+    reference_data_cache.clear()
+    reference_data_cache_stats.clear()
+    with mock.patch.object(reference_data_cache, "capacity", 100):
+        yield
+    reference_data_cache.clear()
+    reference_data_cache_stats.clear()
+
+
+def _load_channel(slug):
+    return ChannelBySlugLoader(SaleorContext()).load(slug).get()
+
+
+@pytest.mark.django_db(transaction=True)
+def test_reference_data_loader_reuses_results_between_requests(
+    channel_USD, django_assert_num_queries
+):
+    # given
+    _load_channel(channel_USD.slug)
+
+    # when
+    with django_assert_num_queries(0):
+        channel = _load_channel(channel_USD.slug)
+
+    # then
+    assert channel == channel_USD
+    assert reference_data_cache_stats == {"ChannelBySlugLoader": 1}
+
+
+@pytest.mark.django_db(transaction=True)
+def test_reference_data_loader_returns_copies_of_cached_results(channel_USD):
+    # given
+    _load_channel(channel_USD.slug).name = "Changed"
+
+    # when
+    channel = _load_channel(channel_USD.slug)
+
+    # then
+    assert channel.name == channel_USD.name
+
+
+@pytest.mark.django_db(transaction=True)
+def test_reference_data_loader_cache_invalidated_on_save(channel_USD):
+    # given
+    _load_channel(channel_USD.slug)
+
+    # when
+    channel_USD.name = "New name"
+    channel_USD.save(update_fields=["name"])
+
+    # then
+    assert _load_channel(channel_USD.slug).name == "New name"
+    assert not reference_data_cache_stats
+
+
+@pytest.mark.django_db(transaction=True)
+def test_reference_data_loader_cache_invalidated_on_version_bump(channel_USD):
+    # given
+    _load_channel(channel_USD.slug)
+    Channel.objects.update(name="New name")
+
+    # when
+    bump_reference_data_version()
+
+    # then
+    assert _load_channel(channel_USD.slug).name == "New name"
+
+
+def test_reference_data_loader_not_cached_in_transaction(
+    channel_USD, django_assert_num_queries
+):
+    # given
+    _load_channel(channel_USD.slug)
+
+    # when
+    with django_assert_num_queries(1):
+        channel = _load_channel(channel_USD.slug)
+
+    # then
+    assert channel == channel_USD
+    assert not reference_data_cache
+
+
+@pytest.mark.django_db(transaction=True)
+def test_reference_data_loader_cache_disabled(
+    settings, channel_USD, django_assert_num_queries
+):
+    # given
+    settings.DATALOADER_REFERENCE_DATA_CACHE_SIZE = 0
+    _load_channel(channel_USD.slug)
+
+    # when
+    with django_assert_num_queries(1):
+        _load_channel(channel_USD.slug)
+
+    # then
+    assert not reference_data_cache
+
+
+class ChannelNameFromReplicaLoader(DataLoader[str, str]):
+    context_key = "test_channel_name_from_replica"
+    reference_data_models = (Channel,)
+    batch_load = mock.Mock(side_effect=lambda keys: [key.upper() for key in keys])
+
+
+def _load_from_replica(key):
+    loader = ChannelNameFromReplicaLoader(SaleorContext())
+    loader.database_connection_name = "replica"
+    return loader.load(key).get()
+
+
+def test_reference_data_loader_replica_results_expire(settings):
+    # given
+    settings.DATALOADER_REFERENCE_DATA_REPLICA_CACHE_TIMEOUT = 10
+    ChannelNameFromReplicaLoader.batch_load.reset_mock()
+    _load_from_replica("main")
+    now = time.monotonic()
+
+    # when
+    with mock.patch(
+        "saleor.graphql.core.dataloaders.time.monotonic", return_value=now + 5
+    ):
+        cached_result = _load_from_replica("main")
+    with mock.patch(
+        "saleor.graphql.core.dataloaders.time.monotonic", return_value=now + 11
+    ):
+        expired_result = _load_from_replica("main")
+
+    # then
+    assert cached_result == expired_result == "MAIN"
+    assert ChannelNameFromReplicaLoader.batch_load.call_count == 2
+    assert reference_data_cache_stats == {"ChannelNameFromReplicaLoader": 1}
+
+
+def test_reference_data_loader_replica_results_not_cached(settings):
+    # given
+    settings.DATALOADER_REFERENCE_DATA_REPLICA_CACHE_TIMEOUT = 0
+
+    # when
+    result = _load_from_replica("main")
+
+    # then
+    assert result == "MAIN"
+    assert not reference_data_cache
@@ -3,9 +3,11 @@ import math
 
 import graphene
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
 from ....tests.models import Book
-from ..connection import CountableConnection, create_connection_slice
+from ..connection import CountableConnection, create_connection_slice, to_global_cursor
 from ..fields import ConnectionField
 
 
@@ -251,6 +253,37 @@ def test_pagination_invalid_cursor_and_valid_base64(books):
     assert str(result.errors[0]) == "Received cursor is invalid."
 
 
+def test_pagination_invalid_cursor_value(books):
+    # given
+    cursor = to_global_cursor(["not-an-id"])
+    variables = {"first": 5, "after": cursor}
+
+    # when
+    result = schema.execute(QUERY_PAGINATION_TEST, variables=variables)
+
+    # then
+    assert len(result.errors) == 1
+    assert str(result.errors[0]) == "Received cursor is invalid."
+
+
+def test_pagination_uses_row_values_comparison(books):
+    # given
+    cursor = to_global_cursor([books[4].pk])
+    variables = {"first": 5, "after": cursor}
+
+    # when
+    with CaptureQueriesContext(connection) as queries:
+        result = schema.execute(QUERY_PAGINATION_TEST, variables=variables)
+
+    # then
+    assert not result.errors
+    assert [edge["node"]["name"] for edge in result.data["books"]["edges"]] == [
+        book.name for book in books[5:10]
+    ]
+    sql = queries.captured_queries[0]["sql"]
+    assert f'("tests_book"."id") > ({books[4].pk})' in sql
+
+
 QUERY_PAGINATION_WITH_FRAGMENTS = """
     fragment BookFragment on BookType {
         name
@@ -310,3 +343,51 @@ def test_query_with_pagination_and_fragments_no_first_or_last_raises_an_error(bo
         "the `books` connection."
     )
     assert str(result.errors[0]) == expected_err_msg
+
+
+QUERY_BOOKS_TOTAL_COUNT = """
+    query BooksTotalCount {
+        books(first: 1) {
+            totalCount
+            isTotalCountEstimated
+        }
+    }
+"""
+
+
+def test_pagination_total_count(books, django_assert_num_queries):
+    # when
+    with django_assert_num_queries(2):
+        result = schema.execute(QUERY_BOOKS_TOTAL_COUNT)
+
+    # then
+    assert not result.errors
+    assert result.data["books"]["totalCount"] == len(books)
+    assert result.data["books"]["isTotalCountEstimated"] is False
+
+
+def test_pagination_total_count_below_limit(books, settings):
+    # given
+    settings.GRAPHQL_TOTAL_COUNT_LIMIT = len(books)
+
+    # when
+    result = schema.execute(QUERY_BOOKS_TOTAL_COUNT)
+
+    # then
+    assert not result.errors
+    assert result.data["books"]["totalCount"] == len(books)
+    assert result.data["books"]["isTotalCountEstimated"] is False
+
+
+def test_pagination_total_count_above_limit(books, settings, django_assert_num_queries):
+    # given
+    settings.GRAPHQL_TOTAL_COUNT_LIMIT = 10
+
+    # when
+    with django_assert_num_queries(3):
+        result = schema.execute(QUERY_BOOKS_TOTAL_COUNT)
+
+    # then
+    assert not result.errors
+    assert result.data["books"]["totalCount"] >= 10
+    assert result.data["books"]["isTotalCountEstimated"] is True
@@ -1,6 +1,15 @@
 import graphene
 import pytest
 from django.test import override_settings
+from graphql import validate
+
+from ...api import backend, schema
+from ...query_cost_map import COST_MAP
+from ..validators.query_cost import (
+    CostValidator,
+    get_query_cost_plan,
+    validate_query_cost,
+)
 
 
 @override_settings(GRAPHQL_QUERY_MAX_COMPLEXITY=1)
@@ -241,3 +250,57 @@ def test_query_with_fragments_have_same_multiplied_complexity_cost(
     assert json_response["data"] == expected_data
     query_cost = json_response["extensions"]["cost"]["requestedQueryCost"]
     assert query_cost == 120
+
+
+@pytest.mark.parametrize("first", [None, 1, 10, 100])
+def test_query_cost_plan_matches_cost_validator(first):
+    # given
+    document = backend.document_from_string(schema, PRODUCTS_QUERY_WITH_FRAGMENT)
+    variables = {"first": first}
+    validator = CostValidator(100000, variables=variables, cost_map=COST_MAP)
+    validate(schema, document.document_ast, [validator])  # type: ignore[list-item]
+
+    # when
+    cost, errors = validate_query_cost(schema, document, variables, COST_MAP, 100000)
+
+    # then
+    assert errors is None
+    assert cost == validator.cost
+
+
+def test_query_cost_plan_compiled_once_per_document():
+    # given
+    document = backend.document_from_string(schema, PRODUCTS_QUERY)
+
+    # when
+    first_cost, _ = validate_query_cost(
+        schema, document, {"first": 1}, COST_MAP, 100000
+    )
+    plan = get_query_cost_plan(schema, document, COST_MAP)
+    second_cost, _ = validate_query_cost(
+        schema, document, {"first": 10}, COST_MAP, 100000
+    )
+
+    # then
+    assert get_query_cost_plan(schema, document, COST_MAP) is plan
+    assert first_cost < second_cost
+
+
+def test_query_cost_plan_reports_missing_required_variable():
+    # given
+    query = """
+        query giftCardQueryCost($id: ID!) {
+            giftCard(id: $id) { id }
+        }
+    """
+    document = backend.document_from_string(schema, query)
+
+    # when
+    cost, errors = validate_query_cost(schema, document, {}, COST_MAP, 100000)
+
+    # then
+    assert cost == 1
+    assert errors[0].message == (
+        'Argument "id" of required type ID!" provided the variable "$id" '
+        "which was not provided"
+    )
@@ -0,0 +1,203 @@
+from unittest.mock import patch
+
+import graphene
+import pytest
+from django.core.cache import cache
+
+from ....plugins.manager import get_plugins_manager
+from ...response_cache import RESPONSE_CACHE_STATUS_HEADER, get_response_cache_timeout
+from ...tests.utils import get_graphql_content
+
+QUERY_PRODUCTS = """
+    query Products($channel: String) {
+        products(first: 10, channel: $channel) {
+            edges {
+                node {
+                    name
+                    category {
+                        name
+                    }
+                }
+            }
+        }
+    }
+"""
+
+QUERY_CATEGORY = """
+    query Category($id: ID) {
+        category(id: $id) {
+            name
+        }
+    }
+"""
+
+
+@pytest.fixture(autouse=True)
+def _enable_response_cache(settings):
+    settings.GRAPHQL_RESPONSE_CACHE_TIMEOUT = 60
+    settings.PLUGINS = ["saleor.plugins.response_cache.plugin.ResponseCachePlugin"]
+    cache.clear()
+    yield
+    cache.clear()
+
+
+def test_anonymous_query_response_is_cached(
+    api_client, product, channel_USD, django_assert_num_queries
+):
+    # given
+    variables = {"channel": channel_USD.slug}
+    response = api_client.post_graphql(QUERY_PRODUCTS, variables)
+    assert response[RESPONSE_CACHE_STATUS_HEADER] == "MISS"
+    content = get_graphql_content(response)
+
+    # when
+    with django_assert_num_queries(0):
+        cached_response = api_client.post_graphql(QUERY_PRODUCTS, variables)
+
+    # then
+    assert cached_response[RESPONSE_CACHE_STATUS_HEADER] == "HIT"
+    assert get_graphql_content(cached_response) == content
+    assert content["data"]["products"]["edges"][0]["node"]["name"] == product.name
+
+
+def test_response_cache_key_includes_variables(api_client, product, channel_USD):
+    # given
+    api_client.post_graphql(QUERY_PRODUCTS, {"channel": channel_USD.slug})
+
+    # when
+    response = api_client.post_graphql(QUERY_PRODUCTS, {"channel": "other-channel"})
+
+    # then
+    assert response[RESPONSE_CACHE_STATUS_HEADER] == "MISS"
+
+
+def test_authenticated_query_response_is_not_cached(
+    user_api_client, product, channel_USD
+):
+    # given
+    variables = {"channel": channel_USD.slug}
+    user_api_client.post_graphql(QUERY_PRODUCTS, variables)
+
+    # when
+    response = user_api_client.post_graphql(QUERY_PRODUCTS, variables)
+
+    # then
+    assert response[RESPONSE_CACHE_STATUS_HEADER] == "BYPASS"
+    get_graphql_content(response)
+
+
+def test_query_with_not_cacheable_field_response_is_not_cached(api_client):
+    # given
+    query = "{ shop { description } }"
+    api_client.post_graphql(query)
+
+    # when
+    response = api_client.post_graphql(query)
+
+    # then
+    assert response[RESPONSE_CACHE_STATUS_HEADER] == "BYPASS"
+
+
+def test_response_cache_disabled(api_client, product, channel_USD, settings):
+    # given
+    settings.GRAPHQL_RESPONSE_CACHE_TIMEOUT = 0
+    variables = {"channel": channel_USD.slug}
+    api_client.post_graphql(QUERY_PRODUCTS, variables)
+
+    # when
+    response = api_client.post_graphql(QUERY_PRODUCTS, variables)
+
+    # then
+    assert RESPONSE_CACHE_STATUS_HEADER not in response
+    get_graphql_content(response)
+
+
+@pytest.mark.parametrize(
+    ("connection_name", "expected_timeout"),
+    [("default", 60), ("replica", 10)],
+)
+def test_response_cache_timeout_for_replica(
+    connection_name, expected_timeout, settings
+):
+    # given
+    settings.GRAPHQL_RESPONSE_CACHE_REPLICA_TIMEOUT = 10
+
+    # when
+    timeout = get_response_cache_timeout(connection_name)
+
+    # then
+    assert timeout == expected_timeout
+
+
+@patch(
+    "saleor.graphql.views.get_database_connection_name",
+    return_value="replica",
+)
+def test_response_read_from_replica_not_cached_when_replica_timeout_disabled(
+    _mocked_get_database_connection_name,
+    api_client,
+    product,
+    channel_USD,
+    settings,
+):
+    # given
+    settings.GRAPHQL_RESPONSE_CACHE_REPLICA_TIMEOUT = 0
+    variables = {"channel": channel_USD.slug}
+    api_client.post_graphql(QUERY_PRODUCTS, variables)
+
+    # when
+    response = api_client.post_graphql(QUERY_PRODUCTS, variables)
+
+    # then
+    assert response[RESPONSE_CACHE_STATUS_HEADER] == "MISS"
+    get_graphql_content(response)
+
+
+def test_cached_response_invalidated_by_product_update(
+    api_client, product, channel_USD
+):
+    # given
+    variables = {"channel": channel_USD.slug}
+    api_client.post_graphql(QUERY_PRODUCTS, variables)
+    product.name = "New name"
+    product.save(update_fields=["name"])
+
+    # when
+    get_plugins_manager(allow_replica=False).product_updated(product)
+    response = api_client.post_graphql(QUERY_PRODUCTS, variables)
+
+    # then
+    assert response[RESPONSE_CACHE_STATUS_HEADER] == "MISS"
+    content = get_graphql_content(response)
+    assert content["data"]["products"]["edges"][0]["node"]["name"] == "New name"
+
+
+def test_cached_response_invalidated_by_update_of_resolved_instance(
+    api_client, product, channel_USD
+):
+    # given
+    variables = {"channel": channel_USD.slug}
+    api_client.post_graphql(QUERY_PRODUCTS, variables)
+
+    # when
+    get_plugins_manager(allow_replica=False).category_updated(product.category)
+    response = api_client.post_graphql(QUERY_PRODUCTS, variables)
+
+    # then
+    assert response[RESPONSE_CACHE_STATUS_HEADER] == "MISS"
+
+
+def test_cached_response_not_invalidated_by_update_of_other_instance(
+    api_client, categories
+):
+    # given
+    category, other_category = categories
+    variables = {"id": graphene.Node.to_global_id("Category", category.pk)}
+    api_client.post_graphql(QUERY_CATEGORY, variables)
+
+    # when
+    get_plugins_manager(allow_replica=False).category_updated(other_category)
+    response = api_client.post_graphql(QUERY_CATEGORY, variables)
+
+    # then
+    assert response[RESPONSE_CACHE_STATUS_HEADER] == "HIT"
@@ -2,11 +2,20 @@ from unittest import mock
 
 import graphene
 import pytest
+from django.core.cache import cache
 from django.test import override_settings
 from graphql.execution.base import ExecutionResult
 
 from .... import __version__ as saleor_version
+from ....core.utils.cache import CacheDict
 from ....graphql.utils import INTERNAL_ERROR_MESSAGE
+from ...api import (
+    SaleorGraphQLBackend,
+    SaleorGraphQLCachedBackend,
+    backend,
+    get_query_hash,
+    schema,
+)
 from ...tests.fixtures import API_PATH
 from ...tests.utils import get_graphql_content, get_graphql_content_from_response
 from ...views import generate_cache_key
@@ -325,3 +334,122 @@ def test_introspection_query_is_not_cached_in_debug_mode(
 def test_generate_cache_key_use_saleor_version():
     cache_key = generate_cache_key(INTROSPECTION_QUERY)
     assert saleor_version in cache_key
+
+
+PERSISTED_QUERY = "{ shop { name } }"
+
+
+def _persisted_query_data(query_hash, query=None):
+    data = {"extensions": {"persistedQuery": {"version": 1, "sha256Hash": query_hash}}}
+    if query is not None:
+        data["query"] = query
+    return data
+
+
+def test_persisted_query_not_supported(api_client, settings):
+    settings.GRAPHQL_PERSISTED_QUERIES_ENABLED = False
+    response = api_client.post(_persisted_query_data(get_query_hash(PERSISTED_QUERY)))
+    content = get_graphql_content_from_response(response)
+    assert content["errors"][0]["message"] == "PersistedQueryNotSupported"
+
+
+def test_persisted_query_extension_ignored_when_not_supported(
+    api_client, site_settings, settings
+):
+    # given
+    settings.GRAPHQL_PERSISTED_QUERIES_ENABLED = False
+    query = "{ shop { name domain { host } } }"
+
+    # when
+    response = api_client.post(_persisted_query_data("0" * 64, query))
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"]["shop"]["name"] == site_settings.site.name
+
+
+def test_persisted_query_not_found(api_client, settings):
+    settings.GRAPHQL_PERSISTED_QUERIES_ENABLED = True
+    response = api_client.post(_persisted_query_data("0" * 64))
+    content = get_graphql_content_from_response(response)
+    assert content["errors"][0]["message"] == "PersistedQueryNotFound"
+    assert content["errors"][0]["extensions"]["code"] == "PERSISTED_QUERY_NOT_FOUND"
+
+
+def test_persisted_query_hash_mismatch(api_client, settings):
+    settings.GRAPHQL_PERSISTED_QUERIES_ENABLED = True
+    response = api_client.post(_persisted_query_data("0" * 64, PERSISTED_QUERY))
+    assert response.status_code == 400
+    content = get_graphql_content_from_response(response)
+    assert content["errors"][0]["extensions"]["code"] == "PERSISTED_QUERY_HASH_MISMATCH"
+
+
+def test_persisted_query_registered_and_executed_by_hash(
+    api_client, site_settings, settings
+):
+    # given
+    settings.GRAPHQL_PERSISTED_QUERIES_ENABLED = True
+    query_hash = get_query_hash(PERSISTED_QUERY)
+    api_client.post(_persisted_query_data(query_hash, PERSISTED_QUERY))
+    backend.cache_map.clear()
+
+    # when
+    response = api_client.post(_persisted_query_data(query_hash))
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"]["shop"]["name"] == site_settings.site.name
+
+
+def test_document_cache_stats(settings):
+    # given
+    settings.GRAPHQL_PERSISTED_QUERIES_ENABLED = True
+    cached_backend = SaleorGraphQLCachedBackend(
+        SaleorGraphQLBackend(), cache_map=CacheDict(10)
+    )
+    query = "{ shop { description } }"
+
+    # when
+    cached_backend.document_from_string(schema, query)
+    cached_backend.document_from_string(schema, query)
+    cached_backend.cache_map.clear()
+    cached_backend.document_from_string(schema, query)
+
+    # then
+    assert cached_backend.stats == {"misses": 1, "local_hits": 1, "shared_hits": 1}
+
+
+@mock.patch("saleor.graphql.api.validate")
+def test_document_cache_skips_validation_of_shared_documents(validate_mock, settings):
+    # given
+    settings.GRAPHQL_PERSISTED_QUERIES_ENABLED = True
+    query = "{ shop { defaultMailSenderName } }"
+    cache.set(
+        SaleorGraphQLCachedBackend.get_shared_cache_key(get_query_hash(query)), query
+    )
+    cached_backend = SaleorGraphQLCachedBackend(
+        SaleorGraphQLBackend(), cache_map=CacheDict(10)
+    )
+
+    # when
+    document = cached_backend.document_from_string(schema, query)
+
+    # then
+    validate_mock.assert_not_called()
+    assert document.document_string == query
+
+
+def test_document_cache_does_not_share_invalid_documents(settings):
+    # given
+    settings.GRAPHQL_PERSISTED_QUERIES_ENABLED = True
+    query = "{ shop { invalidField } }"
+    cached_backend = SaleorGraphQLCachedBackend(
+        SaleorGraphQLBackend(), cache_map=CacheDict(10)
+    )
+
+    # when
+    cached_backend.document_from_string(schema, query)
+
+    # then
+    shared_key = cached_backend.get_shared_cache_key(get_query_hash(query))
+    assert cache.get(shared_key) is None
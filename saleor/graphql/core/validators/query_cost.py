@@ -1,8 +1,10 @@
+import weakref
 from functools import reduce
 from operator import add, mul
-from typing import Any, Optional, Union, cast
+from typing import Any, NamedTuple, Optional, Union, cast
 
 from graphql import (
+    GraphQLDocument,
     GraphQLError,
     GraphQLInterfaceType,
     GraphQLObjectType,
@@ -11,14 +13,16 @@ from graphql import (
 )
 from graphql.execution.values import get_argument_values
 from graphql.language.ast import (
+    Document,
     Field,
     FragmentDefinition,
     FragmentSpread,
     InlineFragment,
+    Node,
     OperationDefinition,
+    Variable,
 )
 from graphql.type import GraphQLField
-from graphql.validation import validate
 from graphql.validation.rules.base import ValidationRule
 from graphql.validation.validation import ValidationContext
 
@@ -177,32 +181,10 @@ class CostValidator(ValidationRule):
         return cost_args
 
     def get_multipliers_from_string(self, multipliers: list[str], field_args):
-        accessors = [s.split(".") for s in multipliers]
-        multipliers: Any = []
-        for accessor in accessors:
-            val = field_args
-            for key in accessor:
-                val = val.get(key)
-            try:
-                multipliers.append(int(val))
-            except (ValueError, TypeError):
-                pass
-        multipliers = [
-            len(multiplier) if isinstance(multiplier, (list, tuple)) else multiplier
-            for multiplier in multipliers
-        ]
-        return [m for m in multipliers if m > 0]
+        return get_multipliers_from_string(multipliers, field_args)
 
     def get_cost_exceeded_error(self) -> "QueryCostError":
-        return QueryCostError(
-            cost_analysis_message(self.maximum_cost, self.cost),
-            extensions={
-                "cost": {
-                    "requestedQueryCost": self.cost,
-                    "maximumAvailable": self.maximum_cost,
-                }
-            },
-        )
+        return get_cost_exceeded_error(self.maximum_cost, self.cost)
 
     def enter(
         self,
@@ -252,6 +234,36 @@ def validate_cost_map(cost_map: dict[str, dict[str, Any]], schema: GraphQLSchema
                 )
 
 
+def get_multipliers_from_string(multipliers: list[str], field_args: dict) -> list:
+    accessors = [s.split(".") for s in multipliers]
+    values: Any = []
+    for accessor in accessors:
+        val: Any = field_args
+        for key in accessor:
+            val = val.get(key)
+        try:
+            values.append(int(val))
+        except (ValueError, TypeError):
+            pass
+    values = [
+        len(multiplier) if isinstance(multiplier, (list, tuple)) else multiplier
+        for multiplier in values
+    ]
+    return [m for m in values if m > 0]
+
+
+def get_cost_exceeded_error(maximum_cost: int, cost: int) -> "QueryCostError":
+    return QueryCostError(
+        cost_analysis_message(maximum_cost, cost),
+        extensions={
+            "cost": {
+                "requestedQueryCost": cost,
+                "maximumAvailable": maximum_cost,
+            }
+        },
+    )
+
+
 def report_error(context: ValidationContext, error: Exception):
     context.report_error(GraphQLError(str(error)))
 
@@ -283,6 +295,257 @@ def cost_validator(
     )
 
 
+class VariableArguments(NamedTuple):
+    """Arguments of a field that refer to variables."""
+
+    arg_defs: dict
+    arg_asts: Optional[list]
+    multipliers: Optional[list[str]]
+    use_multipliers: bool
+
+
+class OperationCost(NamedTuple):
+    # Static errors and indexes of variable arguments, in the order of fields.
+    checks: list[Union[GraphQLError, int]]
+    # Coefficients of cost terms by the indexes of their variable multipliers.
+    terms: dict[tuple[int, ...], int]
+
+
+def _get_cost_options(multipliers=None, use_multipliers=True, complexity=None):
+    return complexity, use_multipliers
+
+
+def _has_variables(node: Any) -> bool:
+    if isinstance(node, Variable):
+        return True
+    if isinstance(node, list):
+        return any(_has_variables(item) for item in node)
+    if isinstance(node, Node):
+        slots: tuple[str, ...] = node.__slots__
+        return any(_has_variables(getattr(node, slot)) for slot in slots)
+    return False
+
+
+class QueryCostPlan:
+    """Cost analysis of a document precompiled into a function of its variables.
+
+    It computes the same cost and errors as `CostValidator`. Costs of fields with
+    literal arguments are multiplied out while compiling; only arguments referring
+    to variables are evaluated for each request.
+    """
+
+    def __init__(
+        self,
+        schema: GraphQLSchema,
+        document_ast: Document,
+        cost_map: Optional[dict[str, dict[str, Any]]],
+        default_complexity: int = 1,
+    ):
+        self.schema = schema
+        self.cost_map = cost_map
+        self.default_complexity = default_complexity
+        self.variable_arguments: list[VariableArguments] = []
+        self.operations: list[OperationCost] = []
+        self.fragments = {
+            definition.name.value: definition
+            for definition in document_ast.definitions
+            if isinstance(definition, FragmentDefinition)
+        }
+        cost_map_error = None
+        if cost_map:
+            try:
+                validate_cost_map(cost_map, schema)
+            except GraphQLError as error:
+                cost_map_error = error
+        for definition in document_ast.definitions:
+            if not isinstance(definition, OperationDefinition):
+                continue
+            operation = OperationCost(checks=[], terms={})
+            self.operations.append(operation)
+            if cost_map_error:
+                operation.checks.append(cost_map_error)
+                continue
+            root_type = {
+                "query": schema.get_query_type(),
+                "mutation": schema.get_mutation_type(),
+                "subscription": schema.get_subscription_type(),
+            }.get(definition.operation)
+            if root_type:
+                self.compile_node(operation, definition, root_type, (1, ()), set())
+
+    def compile_node(
+        self,
+        operation: OperationCost,
+        node: CostAwareNode,
+        type_def,
+        multiplier: tuple[int, tuple[int, ...]],
+        fragment_names: set[str],
+    ):
+        if isinstance(node, FragmentSpread) or not node.selection_set:
+            return
+        fields: GraphQLFieldMap = {}
+        if isinstance(type_def, (GraphQLObjectType, GraphQLInterfaceType)):
+            fields = type_def.fields
+        for child_node in node.selection_set.selections:
+            if isinstance(child_node, Field):
+                field = fields.get(child_node.name.value)
+                if not field:
+                    continue
+                if not self.cost_map:
+                    return
+                child_multiplier = self.compile_field(
+                    operation, child_node, field, type_def, multiplier
+                )
+                self.compile_node(
+                    operation,
+                    child_node,
+                    get_named_type(field.type),
+                    child_multiplier,
+                    fragment_names,
+                )
+            if isinstance(child_node, FragmentSpread):
+                name = child_node.name.value
+                fragment = self.fragments.get(name)
+                # documents with fragment cycles are invalid
+                if fragment and fragment.type_condition and name not in fragment_names:
+                    fragment_type = self.schema.get_type(
+                        fragment.type_condition.name.value
+                    )
+                    self.compile_node(
+                        operation,
+                        fragment,
+                        fragment_type,
+                        multiplier,
+                        fragment_names | {name},
+                    )
+            if isinstance(child_node, InlineFragment):
+                inline_fragment_type = type_def
+                if child_node.type_condition and child_node.type_condition.name:
+                    inline_fragment_type = self.schema.get_type(
+                        child_node.type_condition.name.value
+                    )
+                self.compile_node(
+                    operation,
+                    child_node,
+                    inline_fragment_type,
+                    multiplier,
+                    fragment_names,
+                )
+
+    def compile_field(
+        self,
+        operation: OperationCost,
+        node: Field,
+        field: GraphQLField,
+        type_def,
+        multiplier: tuple[int, tuple[int, ...]],
+    ) -> tuple[int, tuple[int, ...]]:
+        """Add the cost of the field and return the multiplier of its children."""
+        cost_args = None
+        if type_def and type_def.name and type_def.name in self.cost_map:  # type: ignore[operator] # noqa: E501
+            cost_args = self.cost_map[type_def.name].get(node.name.value)  # type: ignore[index] # noqa: E501
+        multipliers = cost_args.get("multipliers") if cost_args else None
+        constant, variable_indexes = multiplier
+
+        if _has_variables(node.arguments):
+            index = len(self.variable_arguments)
+            operation.checks.append(index)
+            try:
+                complexity, use_multipliers = _get_cost_options(**(cost_args or {}))
+            except TypeError as e:
+                operation.checks.append(GraphQLError(str(e)))
+                cost_args = None
+                use_multipliers = False
+            self.variable_arguments.append(
+                VariableArguments(
+                    field.args, node.arguments, multipliers, use_multipliers
+                )
+            )
+            if not cost_args:
+                return multiplier
+            if use_multipliers and multipliers is not None:
+                variable_indexes = variable_indexes + (index,)
+        else:
+            try:
+                field_args = get_argument_values(field.args, node.arguments)
+            except Exception as e:
+                operation.checks.append(GraphQLError(str(e)))
+                field_args = {}
+            if not cost_args:
+                return multiplier
+            if multipliers is not None:
+                multipliers = get_multipliers_from_string(multipliers, field_args)
+            try:
+                complexity, use_multipliers = _get_cost_options(**cost_args)
+            except TypeError as e:
+                operation.checks.append(GraphQLError(str(e)))
+                return multiplier
+            if use_multipliers and multipliers:
+                constant *= reduce(add, multipliers, 0)
+
+        if complexity is None:
+            complexity = self.default_complexity
+        if use_multipliers:
+            self.add_term(operation, complexity * constant, variable_indexes)
+            return constant, variable_indexes
+        self.add_term(operation, complexity, ())
+        return multiplier
+
+    @staticmethod
+    def add_term(operation: OperationCost, coefficient: int, indexes: tuple):
+        if coefficient:
+            operation.terms[indexes] = operation.terms.get(indexes, 0) + coefficient
+
+    def evaluate(
+        self, variables: Optional[dict], maximum_cost: int
+    ) -> tuple[int, list[GraphQLError]]:
+        errors: list[GraphQLError] = []
+        factors = [1] * len(self.variable_arguments)
+        cost = 0
+        for operation in self.operations:
+            for check in operation.checks:
+                if isinstance(check, GraphQLError):
+                    errors.append(check)
+                    continue
+                arguments = self.variable_arguments[check]
+                try:
+                    field_args = get_argument_values(
+                        arguments.arg_defs, arguments.arg_asts, variables
+                    )
+                except Exception as e:
+                    errors.append(GraphQLError(str(e)))
+                    field_args = {}
+                if arguments.multipliers is not None:
+                    multipliers = get_multipliers_from_string(
+                        arguments.multipliers, field_args
+                    )
+                    if arguments.use_multipliers and multipliers:
+                        factors[check] = reduce(add, multipliers, 0)
+            for indexes, coefficient in operation.terms.items():
+                for index in indexes:
+                    coefficient *= factors[index]
+                cost += coefficient
+            if cost > maximum_cost:
+                errors.append(get_cost_exceeded_error(maximum_cost, cost))
+        return cost, errors
+
+
+# Plans of documents cached by the GraphQL backend, dropped together with them.
+query_cost_plans: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def get_query_cost_plan(
+    schema: GraphQLSchema,
+    document: GraphQLDocument,
+    cost_map: Optional[dict[str, dict[str, Any]]],
+) -> QueryCostPlan:
+    plan = query_cost_plans.get(document)
+    if plan is None or plan.schema is not schema or plan.cost_map is not cost_map:
+        plan = QueryCostPlan(schema, document.document_ast, cost_map)
+        query_cost_plans[document] = plan
+    return plan
+
+
 def validate_query_cost(
     schema,
     query,
@@ -290,16 +553,8 @@ def validate_query_cost(
     cost_map,
     maximum_cost,
 ):
-    validator = cost_validator(
-        maximum_cost,
-        variables=variables,
-        cost_map=cost_map,
-    )
-    error = validate(
-        schema,
-        query.document_ast,
-        [validator],  # type: ignore[list-item] # cost validator is an instance that pretends to be a class # noqa: E501
-    )
-    if error:
-        return validator.cost, error
-    return validator.cost, None
+    plan = get_query_cost_plan(schema, query, cost_map)
+    cost, errors = plan.evaluate(variables, maximum_cost)
+    if errors:
+        return cost, errors
+    return cost, None
@@ -1,8 +1,9 @@
 import graphene
+from django.conf import settings
 
 from ....csv import models as csv_models
 from ....csv.events import export_started_event
-from ....csv.tasks import export_products_task
+from ....csv.tasks import export_products_in_shards_task, export_products_task
 from ....permission.enums import ProductPermissions
 from ....webhook.event_types import WebhookEventAsyncType
 from ...app.dataloaders import get_app_promise
@@ -100,7 +101,12 @@ class ExportProducts(BaseExportMutation):
             app=app, user=info.context.user
         )
         export_started_event(export_file=export_file, app=app, user=info.context.user)
-        export_products_task.delay(export_file.pk, scope, export_info, file_type)
+        if settings.EXPORT_PRODUCTS_SHARD_SIZE:
+            export_products_in_shards_task.delay(
+                export_file.pk, scope, export_info, file_type
+            )
+        else:
+            export_products_task.delay(export_file.pk, scope, export_info, file_type)
 
         export_file.refresh_from_db()
         return cls(export_file=export_file)
@@ -123,6 +123,45 @@ def test_export_products_mutation(
     ).exists()
 
 
+@patch(
+    "saleor.graphql.csv.mutations.export_products."
+    "export_products_in_shards_task.delay"
+)
+@patch("saleor.graphql.csv.mutations.export_products.export_products_task.delay")
+def test_export_products_mutation_in_shards(
+    export_products_mock,
+    export_products_in_shards_mock,
+    staff_api_client,
+    product_list,
+    permission_manage_products,
+    settings,
+):
+    # given
+    settings.EXPORT_PRODUCTS_SHARD_SIZE = 1000
+    variables = {
+        "input": {
+            "scope": ExportScope.ALL.name,
+            "exportInfo": {},
+            "fileType": FileTypeEnum.XLSX.name,
+        }
+    }
+
+    # when
+    response = staff_api_client.post_graphql(
+        EXPORT_PRODUCTS_MUTATION,
+        variables=variables,
+        permissions=[permission_manage_products],
+    )
+    content = get_graphql_content(response)
+
+    # then
+    assert not content["data"]["exportProducts"]["errors"]
+    export_products_in_shards_mock.assert_called_once_with(
+        ANY, {"all": ""}, {}, FileTypeEnum.XLSX.value
+    )
+    export_products_mock.assert_not_called()
+
+
 @patch("saleor.graphql.csv.mutations.export_products.export_products_task.delay")
 def test_export_products_mutation_by_app(
     export_products_mock,
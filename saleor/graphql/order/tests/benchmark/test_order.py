@@ -1,6 +1,7 @@
 import graphene
 import pytest
 
+from .....order.models import Order
 from ....checkout.tests.benchmark.test_checkout_mutations import (
     FRAGMENT_ADDRESS,
     FRAGMENT_PRODUCT_VARIANT,
@@ -239,6 +240,48 @@ def test_staff_multiple_orders(
     assert content["data"]["orders"] is not None
 
 
+ORDERS_PAGE_QUERY = """
+    query orders($after: String) {
+      orders(first: 1, sortBy: {field: CREATED_AT, direction: ASC}, after: $after) {
+        edges {
+          node {
+            id
+          }
+        }
+        pageInfo {
+          endCursor
+          hasNextPage
+        }
+      }
+    }
+"""
+
+
+@pytest.mark.django_db
+@pytest.mark.count_queries(autouse=False)
+def test_staff_orders_deep_page_sorted_by_created_at(
+    staff_api_client,
+    permission_group_manage_orders,
+    orders_for_benchmarks,
+    count_queries,
+):
+    permission_group_manage_orders.user_set.add(staff_api_client.user)
+    variables = {"after": None}
+    order_ids = []
+    has_next_page = True
+    while has_next_page:
+        content = get_graphql_content(
+            staff_api_client.post_graphql(ORDERS_PAGE_QUERY, variables)
+        )
+        data = content["data"]["orders"]
+        order_ids.extend(edge["node"]["id"] for edge in data["edges"])
+        has_next_page = data["pageInfo"]["hasNextPage"]
+        variables["after"] = data["pageInfo"]["endCursor"]
+
+    assert len(order_ids) == Order.objects.non_draft().count()
+    assert len(set(order_ids)) == len(order_ids)
+
+
 MULTIPLE_DRAFT_ORDER_DETAILS_QUERY = (
     FRAGMENT_STAFF_ORDER_DETAILS
     + """
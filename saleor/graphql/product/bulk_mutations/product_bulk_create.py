@@ -869,24 +869,34 @@ class ProductBulkCreate(BaseMutation):
     @classmethod
     def post_save_actions(cls, info, products, variants, channels):
         manager = get_plugin_manager_promise(info.context).get()
-        product_ids = []
-        webhooks = get_webhooks_for_event(WebhookEventAsyncType.PRODUCT_CREATED)
-        for product in products:
-            cls.call_event(manager.product_created, product.node, webhooks=webhooks)
-            product_ids.append(product.node.id)
-
-        webhooks = get_webhooks_for_event(WebhookEventAsyncType.PRODUCT_VARIANT_CREATED)
-        for variant in variants:
-            cls.call_event(manager.product_variant_created, variant, webhooks=webhooks)
-
-        webhooks = get_webhooks_for_event(WebhookEventAsyncType.CHANNEL_UPDATED)
-        for channel in channels:
-            cls.call_event(manager.channel_updated, channel, webhooks=webhooks)
-
+        product_ids = [product.node.id for product in products]
+        cls.call_event(cls.trigger_events, manager, products, variants, channels)
         cls.call_event(
             update_products_discounted_prices_for_promotion_task.delay, product_ids
         )
 
+    @classmethod
+    def trigger_events(cls, manager, products, variants, channels):
+        from ....webhook.transport.asynchronous.transport import (
+            webhook_deliveries_batch,
+        )
+
+        # Webhook deliveries of all created objects are sent in batched tasks.
+        with webhook_deliveries_batch():
+            webhooks = get_webhooks_for_event(WebhookEventAsyncType.PRODUCT_CREATED)
+            for product in products:
+                manager.product_created(product.node, webhooks=webhooks)
+
+            webhooks = get_webhooks_for_event(
+                WebhookEventAsyncType.PRODUCT_VARIANT_CREATED
+            )
+            for variant in variants:
+                manager.product_variant_created(variant, webhooks=webhooks)
+
+            webhooks = get_webhooks_for_event(WebhookEventAsyncType.CHANNEL_UPDATED)
+            for channel in channels:
+                manager.channel_updated(channel, webhooks=webhooks)
+
     @classmethod
     @traced_atomic_transaction()
     def perform_mutation(cls, root, info, **data):
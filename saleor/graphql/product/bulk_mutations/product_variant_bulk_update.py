@@ -13,6 +13,7 @@ from ....product import models
 from ....product.error_codes import ProductErrorCode, ProductVariantBulkErrorCode
 from ....product.tasks import update_products_discounted_prices_for_promotion_task
 from ....warehouse import models as warehouse_models
+from ....warehouse.available_quantity import invalidate_available_quantities
 from ....webhook.event_types import WebhookEventAsyncType
 from ....webhook.utils import get_webhooks_for_event
 from ...attribute.utils import AttributeAssignmentMixin
@@ -688,6 +689,9 @@ class ProductVariantBulkUpdate(BaseMutation):
         )
         warehouse_models.Stock.objects.bulk_create(stocks_to_create)
         warehouse_models.Stock.objects.bulk_update(stocks_to_update, ["quantity"])
+        invalidate_available_quantities(
+            stock.product_variant_id for stock in stocks_to_create + stocks_to_update
+        )
         models.ProductVariantChannelListing.objects.bulk_create(listings_to_create)
         models.ProductVariantChannelListing.objects.bulk_update(
             listings_to_update,
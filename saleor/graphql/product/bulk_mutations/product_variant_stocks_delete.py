@@ -5,6 +5,7 @@ from ....core.tracing import traced_atomic_transaction
 from ....permission.enums import ProductPermissions
 from ....product import models
 from ....warehouse import models as warehouse_models
+from ....warehouse.available_quantity import invalidate_available_quantities
 from ....webhook.event_types import WebhookEventAsyncType
 from ....webhook.utils import get_webhooks_for_event
 from ...channel import ChannelContext
@@ -84,6 +85,7 @@ class ProductVariantStocksDelete(BaseMutation):
             )
 
         stocks_to_delete.delete()
+        invalidate_available_quantities([variant.pk])
 
         StocksWithAvailableQuantityByProductVariantIdCountryCodeAndChannelLoader(
             info.context
@@ -7,6 +7,7 @@ from ....core.tracing import traced_atomic_transaction
 from ....permission.enums import ProductPermissions
 from ....product import models
 from ....warehouse import models as warehouse_models
+from ....warehouse.available_quantity import invalidate_available_quantities
 from ....webhook.event_types import WebhookEventAsyncType
 from ....webhook.utils import get_webhooks_for_event
 from ...channel import ChannelContext
@@ -134,3 +135,4 @@ class ProductVariantStocksUpdate(ProductVariantStocksCreate):
             )
 
         warehouse_models.Stock.objects.bulk_update(stocks, ["quantity"])
+        invalidate_available_quantities([variant.pk])
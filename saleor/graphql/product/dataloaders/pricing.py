@@ -0,0 +1,228 @@
+from collections import defaultdict
+from dataclasses import asdict
+from decimal import Decimal
+from typing import Any, Optional
+
+from django.conf import settings
+from promise import Promise
+
+from ....product.utils.availability import get_product_availability
+from ....product.utils.pricing_snapshot import (
+    get_product_pricing_snapshots,
+    get_product_pricing_tokens,
+    is_product_pricing_snapshot_enabled,
+    set_product_pricing_snapshots,
+)
+from ....tax.utils import (
+    get_display_gross_prices,
+    get_tax_calculation_strategy,
+    get_tax_rate_for_tax_class,
+)
+from ...channel.dataloaders import ChannelBySlugLoader
+from ...core.dataloaders import DataLoader
+from ...tax.dataloaders import (
+    TaxClassByProductIdLoader,
+    TaxClassCountryRateByTaxClassIDLoader,
+    TaxClassDefaultRateByCountryLoader,
+    TaxConfigurationByChannelId,
+    TaxConfigurationPerCountryByTaxConfigurationIDLoader,
+)
+from .products import (
+    ProductChannelListingByProductIdAndChannelSlugLoader,
+    VariantsChannelListingByProductIdAndChannelSlugLoader,
+)
+
+ProductIdChannelSlugAndCountryCode = tuple[int, str, str]
+
+
+class ProductPricingByProductIdChannelSlugAndCountryCodeLoader(
+    DataLoader[ProductIdChannelSlugAndCountryCode, Optional[dict[str, Any]]]
+):
+    """Load tax-adjusted pricing of products for the given channel and country.
+
+    When `PRODUCT_PRICING_SNAPSHOT_TIMEOUT` is set, pricing is read from cached
+    per-product snapshots, and only the missing entries are calculated, in a single
+    batch, and stored in the snapshots.
+    """
+
+    context_key = "product_pricing_by_product_id_channel_slug_and_country_code"
+
+    def batch_load(self, keys):
+        if not is_product_pricing_snapshot_enabled():
+            return self.calculate_pricing(keys)
+
+        # Tokens are read before the pricing is calculated, so the pricing isn't
+        # stored for the products invalidated in the meantime.
+        tokens = get_product_pricing_tokens({product_id for product_id, _, _ in keys})
+        snapshots = get_product_pricing_snapshots(tokens, keys)
+        missing_keys = [key for key in keys if key not in snapshots]
+        if not missing_keys:
+            return [snapshots[key] for key in keys]
+
+        def with_pricing(pricing_list):
+            pricing = dict(zip(missing_keys, pricing_list))
+            if timeout := self.get_snapshot_timeout():
+                set_product_pricing_snapshots(tokens, pricing, timeout)
+            return [
+                snapshots[key] if key in snapshots else pricing[key] for key in keys
+            ]
+
+        return self.calculate_pricing(missing_keys).then(with_pricing)
+
+    def get_snapshot_timeout(self) -> int:
+        timeout = settings.PRODUCT_PRICING_SNAPSHOT_TIMEOUT
+        # A replica may not have the changes yet when the snapshots are invalidated
+        # on commit, so pricing calculated from it is cached only for a short time.
+        if self.database_connection_name != settings.DATABASE_CONNECTION_DEFAULT_NAME:
+            timeout = min(timeout, settings.PRODUCT_PRICING_SNAPSHOT_REPLICA_TIMEOUT)
+        return timeout
+
+    def calculate_pricing(self, keys: list[ProductIdChannelSlugAndCountryCode]):
+        product_channel_keys = [
+            (product_id, channel_slug) for product_id, channel_slug, _ in keys
+        ]
+        channels = ChannelBySlugLoader(self.context).load_many(
+            [channel_slug for _, channel_slug, _ in keys]
+        )
+        product_channel_listings = ProductChannelListingByProductIdAndChannelSlugLoader(
+            self.context
+        ).load_many(product_channel_keys)
+        variants_channel_listings = (
+            VariantsChannelListingByProductIdAndChannelSlugLoader(
+                self.context
+            ).load_many(product_channel_keys)
+        )
+        tax_classes = TaxClassByProductIdLoader(self.context).load_many(
+            [product_id for product_id, _, _ in keys]
+        )
+
+        def load_tax_data(data):
+            channels, _, _, tax_classes = data
+            tax_class_ids = list(
+                {tax_class.pk for tax_class in tax_classes if tax_class}
+            )
+            tax_configs = TaxConfigurationByChannelId(self.context).load_many(
+                [channel.id for channel in channels]
+            )
+            country_rates = TaxClassCountryRateByTaxClassIDLoader(
+                self.context
+            ).load_many(tax_class_ids)
+            default_rates = TaxClassDefaultRateByCountryLoader(self.context).load_many(
+                [country_code for _, _, country_code in keys]
+            )
+
+            def load_tax_configs_per_country(tax_configs):
+                return (
+                    TaxConfigurationPerCountryByTaxConfigurationIDLoader(self.context)
+                    .load_many([tax_config.id for tax_config in tax_configs])
+                    .then(lambda per_country: (tax_configs, per_country))
+                )
+
+            return Promise.all(
+                [
+                    tax_configs.then(load_tax_configs_per_country),
+                    country_rates,
+                    default_rates,
+                ]
+            ).then(lambda tax_data: (data, tax_class_ids, tax_data))
+
+        def calculate(results):
+            data, tax_class_ids, tax_data = results
+            (
+                channels,
+                product_channel_listings,
+                variants_channel_listings,
+                tax_classes,
+            ) = data
+            (
+                (tax_configs, tax_configs_per_country),
+                country_rates,
+                default_rates,
+            ) = tax_data
+            country_rates_map: dict[int, list] = defaultdict(
+                list, zip(tax_class_ids, country_rates)
+            )
+            return [
+                _calculate_product_pricing(
+                    country_code=country_code,
+                    product_channel_listing=product_channel_listing,
+                    variants_channel_listing=variants_channel_listing,
+                    tax_class=tax_class,
+                    tax_config=tax_config,
+                    tax_configs_per_country=per_country,
+                    country_rates=(
+                        country_rates_map[tax_class.pk] if tax_class else []
+                    ),
+                    default_country_rate_obj=default_rate,
+                )
+                for (
+                    (_, _, country_code),
+                    product_channel_listing,
+                    variants_channel_listing,
+                    tax_class,
+                    tax_config,
+                    per_country,
+                    default_rate,
+                ) in zip(
+                    keys,
+                    product_channel_listings,
+                    variants_channel_listings,
+                    tax_classes,
+                    tax_configs,
+                    tax_configs_per_country,
+                    default_rates,
+                )
+            ]
+
+        return (
+            Promise.all(
+                [
+                    channels,
+                    product_channel_listings,
+                    variants_channel_listings,
+                    tax_classes,
+                ]
+            )
+            .then(load_tax_data)
+            .then(calculate)
+        )
+
+
+def _calculate_product_pricing(
+    *,
+    country_code,
+    product_channel_listing,
+    variants_channel_listing,
+    tax_class,
+    tax_config,
+    tax_configs_per_country,
+    country_rates,
+    default_country_rate_obj,
+) -> Optional[dict[str, Any]]:
+    if not variants_channel_listing:
+        return None
+
+    tax_config_country = next(
+        (tc for tc in tax_configs_per_country if tc.country.code == country_code),
+        None,
+    )
+    display_gross_prices = get_display_gross_prices(tax_config, tax_config_country)
+    tax_calculation_strategy = get_tax_calculation_strategy(
+        tax_config, tax_config_country
+    )
+    default_tax_rate = (
+        default_country_rate_obj.rate if default_country_rate_obj else Decimal(0)
+    )
+    tax_rate = get_tax_rate_for_tax_class(
+        tax_class, country_rates, default_tax_rate, country_code
+    )
+    availability = get_product_availability(
+        product_channel_listing=product_channel_listing,
+        variants_channel_listing=variants_channel_listing,
+        prices_entered_with_tax=tax_config.prices_entered_with_tax,
+        tax_calculation_strategy=tax_calculation_strategy,
+        tax_rate=tax_rate,
+    )
+    pricing_info = asdict(availability)
+    pricing_info["display_gross_prices"] = display_gross_prices
+    return pricing_info
@@ -20,6 +20,7 @@ from ....product.models import (
 from ....product.models import Product as ProductModel
 from ....product.models import ProductVariant as ProductVariantModel
 from ....product.tasks import update_discounted_prices_task
+from ....product.utils.pricing_snapshot import invalidate_product_pricing_snapshots
 from ...channel import ChannelContext
 from ...channel.mutations import BaseChannelListingMutation
 from ...channel.types import Channel
@@ -357,6 +358,7 @@ class ProductChannelListingUpdate(BaseChannelListingMutation):
             cls.remove_channels(product, cleaned_input.get("remove_channels", []))
             product = ProductModel.objects.prefetched_for_webhook().get(pk=product.pk)
             update_discounted_prices_task.delay([product.id])
+            invalidate_product_pricing_snapshots([product.id])
             manager = get_plugin_manager_promise(info.context).get()
             cls.call_event(manager.product_updated, product)
 
@@ -542,6 +544,7 @@ class ProductVariantChannelListingUpdate(BaseMutation):
                     defaults=defaults,
                 )
             update_discounted_prices_task.delay([variant.product_id])
+            invalidate_product_pricing_snapshots([variant.product_id])
             manager = get_plugin_manager_promise(info.context).get()
             cls.call_event(manager.product_variant_updated, variant)
 
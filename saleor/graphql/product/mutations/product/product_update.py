@@ -4,6 +4,7 @@ from .....attribute import models as attribute_models
 from .....permission.enums import ProductPermissions
 from .....product import models
 from .....product.tasks import update_products_discounted_prices_for_promotion_task
+from .....product.utils.pricing_snapshot import invalidate_product_pricing_snapshots
 from ....attribute.utils import AttrValuesInput, ProductAttributeAssignmentMixin
 from ....core import ResolveInfo
 from ....core.descriptions import ADDED_IN_310
@@ -52,6 +53,8 @@ class ProductUpdate(ProductCreate, ModelWithExtRefMutation):
         product = models.Product.objects.prefetched_for_webhook().get(pk=instance.pk)
         if "category" in cleaned_input or "collections" in cleaned_input:
             update_products_discounted_prices_for_promotion_task.delay([instance.id])
+        if "tax_class" in cleaned_input:
+            invalidate_product_pricing_snapshots([instance.id])
         manager = get_plugin_manager_promise(info.context).get()
         cls.call_event(manager.product_updated, product)
 
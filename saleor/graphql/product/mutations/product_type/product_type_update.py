@@ -3,6 +3,7 @@ import graphene
 from .....permission.enums import ProductTypePermissions
 from .....product import models
 from .....product.tasks import update_variants_names
+from .....product.utils.pricing_snapshot import invalidate_all_product_pricing_snapshots
 from ....core import ResolveInfo
 from ....core.types import ProductError
 from ...types import ProductType
@@ -46,3 +47,5 @@ class ProductTypeUpdate(ProductTypeCreate):
             models.Product.objects.filter(product_type=instance).update(
                 search_index_dirty=True
             )
+        if "tax_class" in cleaned_input:
+            invalidate_all_product_pricing_snapshots()
@@ -246,6 +246,48 @@ def test_retrieve_product_media(product_list, api_client, count_queries, channel
     get_graphql_content(api_client.post_graphql(query, variables))
 
 
+PRODUCTS_PAGE_QUERY = """
+    query($sortBy: ProductOrder, $channel: String, $after: String) {
+      products(first: 1, sortBy: $sortBy, channel: $channel, after: $after) {
+        edges {
+          node {
+            id
+            name
+          }
+        }
+        pageInfo {
+          endCursor
+          hasNextPage
+        }
+      }
+    }
+"""
+
+
+@pytest.mark.django_db
+@pytest.mark.count_queries(autouse=False)
+def test_retrieve_products_deep_page_sorted_by_name(
+    product_list, api_client, count_queries, channel_USD
+):
+    variables = {
+        "channel": channel_USD.slug,
+        "sortBy": {"field": "NAME", "direction": "ASC"},
+        "after": None,
+    }
+    names = []
+    has_next_page = True
+    while has_next_page:
+        content = get_graphql_content(
+            api_client.post_graphql(PRODUCTS_PAGE_QUERY, variables)
+        )
+        data = content["data"]["products"]
+        names.extend(edge["node"]["name"] for edge in data["edges"])
+        has_next_page = data["pageInfo"]["hasNextPage"]
+        variables["after"] = data["pageInfo"]["endCursor"]
+
+    assert names == sorted(product.name for product in product_list)
+
+
 @pytest.mark.django_db
 @pytest.mark.count_queries(autouse=False)
 def test_retrieve_channel_listings(
@@ -1,11 +1,24 @@
 from decimal import Decimal
+from unittest.mock import patch
 
 import graphene
 import pytest
+from django.core.cache import cache
 
+from ....product.models import ProductVariantChannelListing
+from ....product.utils.pricing_snapshot import (
+    PRICING_SNAPSHOT_VERSION_KEY,
+    invalidate_all_product_pricing_snapshots,
+    invalidate_product_pricing_snapshots,
+)
 from ....tax import TaxCalculationStrategy
 from ....tax.models import TaxClassCountryRate, TaxConfigurationPerCountry
+from ....tests.utils import flush_post_commit_hooks
+from ...core import SaleorContext
 from ...tests.utils import get_graphql_content
+from ..dataloaders.pricing import (
+    ProductPricingByProductIdChannelSlugAndCountryCodeLoader,
+)
 
 TAX_RATE_DE = 19
 TAX_RATE_PL = 23
@@ -288,3 +301,147 @@ def test_product_pricing_no_flat_rates_in_one_country(
     assert price_range_undiscounted_DE["start"]["gross"]["amount"] == gross_de
     assert price_range_undiscounted_DE["stop"]["net"]["amount"] == net_de
     assert price_range_undiscounted_DE["stop"]["gross"]["amount"] == gross_de
+
+
+@pytest.fixture
+def _pricing_snapshot_enabled(settings):
+    settings.PRODUCT_PRICING_SNAPSHOT_TIMEOUT = 60
+    yield
+    cache.delete(PRICING_SNAPSHOT_VERSION_KEY)
+
+
+@pytest.mark.usefixtures("_pricing_snapshot_enabled")
+def test_product_pricing_resolved_from_snapshot(
+    product_available_in_many_channels,
+    channel_PLN,
+    user_api_client,
+    django_capture_on_commit_callbacks,
+):
+    # given
+    product = product_available_in_many_channels
+    _enable_flat_rates(channel_PLN, False)
+    _configure_tax_rates(product)
+    variables = {
+        "id": graphene.Node.to_global_id("Product", product.id),
+        "channel": channel_PLN.slug,
+    }
+    user_api_client.post_graphql(QUERY_PRODUCT_PRICING, variables)
+    product.tax_class.country_rates.filter(country="PL").update(rate=10)
+
+    # when
+    response = user_api_client.post_graphql(QUERY_PRODUCT_PRICING, variables)
+
+    # then
+    content = get_graphql_content(response)
+    price_range_PL = content["data"]["product"]["pricingPL"]["priceRange"]
+    assert price_range_PL["start"]["gross"]["amount"] == 61.50
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        invalidate_all_product_pricing_snapshots()
+    response = user_api_client.post_graphql(QUERY_PRODUCT_PRICING, variables)
+
+    # then
+    content = get_graphql_content(response)
+    price_range_PL = content["data"]["product"]["pricingPL"]["priceRange"]
+    assert price_range_PL["start"]["gross"]["amount"] == 55.00
+
+
+@pytest.mark.usefixtures("_pricing_snapshot_enabled")
+def test_product_pricing_snapshot_invalidated_for_product(
+    product_available_in_many_channels,
+    channel_PLN,
+    user_api_client,
+    django_capture_on_commit_callbacks,
+):
+    # given
+    product = product_available_in_many_channels
+    _enable_flat_rates(channel_PLN, False)
+    _configure_tax_rates(product)
+    variables = {
+        "id": graphene.Node.to_global_id("Product", product.id),
+        "channel": channel_PLN.slug,
+    }
+    user_api_client.post_graphql(QUERY_PRODUCT_PRICING, variables)
+    ProductVariantChannelListing.objects.filter(
+        variant__product=product, channel=channel_PLN
+    ).update(price_amount=Decimal(20), discounted_price_amount=Decimal(20))
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        invalidate_product_pricing_snapshots([product.id])
+    response = user_api_client.post_graphql(QUERY_PRODUCT_PRICING, variables)
+
+    # then
+    content = get_graphql_content(response)
+    price_range_PL = content["data"]["product"]["pricingPL"]["priceRange"]
+    assert price_range_PL["start"]["net"]["amount"] == 20.00
+    assert price_range_PL["start"]["gross"]["amount"] == 24.60
+
+
+@pytest.mark.usefixtures("_pricing_snapshot_enabled")
+def test_product_pricing_snapshot_not_stored_when_invalidated_during_calculation(
+    product_available_in_many_channels,
+    channel_PLN,
+    user_api_client,
+):
+    # given
+    product = product_available_in_many_channels
+    _enable_flat_rates(channel_PLN, False)
+    _configure_tax_rates(product)
+    variables = {
+        "id": graphene.Node.to_global_id("Product", product.id),
+        "channel": channel_PLN.slug,
+    }
+    calculate_pricing = (
+        ProductPricingByProductIdChannelSlugAndCountryCodeLoader.calculate_pricing
+    )
+
+    prices_updated = []
+
+    def update_prices(pricing):
+        # prices are updated once they were read, but before they are stored
+        if prices_updated:
+            return pricing
+        prices_updated.append(True)
+        ProductVariantChannelListing.objects.filter(
+            variant__product=product, channel=channel_PLN
+        ).update(price_amount=Decimal(20), discounted_price_amount=Decimal(20))
+        invalidate_product_pricing_snapshots([product.id])
+        flush_post_commit_hooks()
+        return pricing
+
+    with patch.object(
+        ProductPricingByProductIdChannelSlugAndCountryCodeLoader,
+        "calculate_pricing",
+        lambda loader, keys: calculate_pricing(loader, keys).then(update_prices),
+    ):
+        user_api_client.post_graphql(QUERY_PRODUCT_PRICING, variables)
+
+    # when
+    response = user_api_client.post_graphql(QUERY_PRODUCT_PRICING, variables)
+
+    # then
+    content = get_graphql_content(response)
+    price_range_PL = content["data"]["product"]["pricingPL"]["priceRange"]
+    assert price_range_PL["start"]["net"]["amount"] == 20.00
+
+
+@pytest.mark.parametrize(
+    ("connection_name", "expected_timeout"),
+    [("default", 60), ("replica", 10)],
+)
+def test_product_pricing_snapshot_timeout_for_replica(
+    connection_name, expected_timeout, settings
+):
+    # given
+    settings.PRODUCT_PRICING_SNAPSHOT_TIMEOUT = 60
+    settings.PRODUCT_PRICING_SNAPSHOT_REPLICA_TIMEOUT = 10
+    loader = ProductPricingByProductIdChannelSlugAndCountryCodeLoader(SaleorContext())
+    loader.database_connection_name = connection_name
+
+    # when
+    timeout = loader.get_snapshot_timeout()
+
+    # then
+    assert timeout == expected_timeout
@@ -1,16 +1,27 @@
 import warnings
 from datetime import timedelta
+from unittest.mock import patch
 
 import graphene
 import pytest
+from django.core.cache import cache
 from django.utils import timezone
 from django_countries import countries
 
 from ....channel.utils import DEPRECATION_WARNING_MESSAGE
 from ....shipping.models import ShippingZone
+from ....tests.utils import flush_post_commit_hooks
 from ....warehouse import WarehouseClickAndCollectOption
+from ....warehouse.available_quantity import (
+    AVAILABLE_QUANTITY_VERSION_KEY,
+    invalidate_available_quantities,
+)
 from ....warehouse.models import PreorderReservation, Reservation, Stock, Warehouse
+from ...core import SaleorContext
 from ...tests.utils import get_graphql_content
+from ...warehouse.dataloaders import (
+    AvailableQuantityByProductVariantIdCountryCodeAndChannelSlugLoader,
+)
 
 COUNTRY_CODE = "US"
 
@@ -946,3 +957,117 @@ def test_variant_quantity_available_preorder_without_channel(
     response = api_client.post_graphql(QUERY_VARIANT_AVAILABILITY, variables)
     content = get_graphql_content(response)
     assert not content["data"]["productVariant"]
+
+
+@pytest.fixture
+def _available_quantity_cache_enabled(settings):
+    settings.AVAILABLE_QUANTITY_CACHE_TIMEOUT = 60
+    yield
+    cache.delete(AVAILABLE_QUANTITY_VERSION_KEY)
+
+
+@pytest.mark.usefixtures("_available_quantity_cache_enabled")
+def test_variant_quantity_available_resolved_from_cache(
+    api_client,
+    variant_with_many_stocks,
+    channel_USD,
+    django_capture_on_commit_callbacks,
+):
+    # given
+    variables = {
+        "id": graphene.Node.to_global_id("ProductVariant", variant_with_many_stocks.pk),
+        "channel": channel_USD.slug,
+    }
+    api_client.post_graphql(QUERY_QUANTITY_AVAILABLE, variables)
+    variant_with_many_stocks.stocks.update(quantity=1)
+
+    # when
+    response = api_client.post_graphql(QUERY_QUANTITY_AVAILABLE, variables)
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"]["productVariant"]["quantityAvailable"] == 7
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        invalidate_available_quantities([variant_with_many_stocks.pk])
+    response = api_client.post_graphql(QUERY_QUANTITY_AVAILABLE, variables)
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"]["productVariant"]["quantityAvailable"] == 2
+
+
+@pytest.mark.usefixtures("_available_quantity_cache_enabled")
+def test_variant_quantity_available_from_cache_capped_by_limit_per_checkout(
+    api_client, variant_with_many_stocks, channel_USD, site_settings
+):
+    # given
+    variables = {
+        "id": graphene.Node.to_global_id("ProductVariant", variant_with_many_stocks.pk),
+        "channel": channel_USD.slug,
+    }
+    api_client.post_graphql(QUERY_QUANTITY_AVAILABLE, variables)
+    site_settings.limit_quantity_per_checkout = 5
+    site_settings.save(update_fields=["limit_quantity_per_checkout"])
+
+    # when
+    response = api_client.post_graphql(QUERY_QUANTITY_AVAILABLE, variables)
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"]["productVariant"]["quantityAvailable"] == 5
+
+
+@pytest.mark.usefixtures("_available_quantity_cache_enabled")
+def test_variant_quantity_available_not_cached_when_invalidated_during_calculation(
+    api_client, variant_with_many_stocks, channel_USD
+):
+    # given
+    variant = variant_with_many_stocks
+    variables = {
+        "id": graphene.Node.to_global_id("ProductVariant", variant.pk),
+        "channel": channel_USD.slug,
+    }
+    loader_class = AvailableQuantityByProductVariantIdCountryCodeAndChannelSlugLoader
+    batch_load_quantities_by_country = loader_class.batch_load_quantities_by_country
+
+    def update_stocks(loader, *args):
+        # stocks are updated once they were read, but before quantities are stored
+        quantities = batch_load_quantities_by_country(loader, *args)
+        variant.stocks.update(quantity=1)
+        invalidate_available_quantities([variant.pk])
+        flush_post_commit_hooks()
+        return quantities
+
+    with patch.object(loader_class, "batch_load_quantities_by_country", update_stocks):
+        api_client.post_graphql(QUERY_QUANTITY_AVAILABLE, variables)
+
+    # when
+    response = api_client.post_graphql(QUERY_QUANTITY_AVAILABLE, variables)
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"]["productVariant"]["quantityAvailable"] == 2
+
+
+@pytest.mark.parametrize(
+    ("connection_name", "expected_timeout"),
+    [("default", 60), ("replica", 10)],
+)
+def test_variant_quantity_available_cache_timeout_for_replica(
+    connection_name, expected_timeout, settings
+):
+    # given
+    settings.AVAILABLE_QUANTITY_CACHE_TIMEOUT = 60
+    settings.AVAILABLE_QUANTITY_CACHE_REPLICA_TIMEOUT = 10
+    loader = AvailableQuantityByProductVariantIdCountryCodeAndChannelSlugLoader(
+        SaleorContext()
+    )
+    loader.database_connection_name = connection_name
+
+    # when
+    timeout = loader.get_cache_timeout()
+
+    # then
+    assert timeout == expected_timeout
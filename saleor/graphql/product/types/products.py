@@ -19,12 +19,10 @@ from ....product import models
 from ....product.models import ALL_PRODUCTS_PERMISSIONS
 from ....product.utils import calculate_revenue_for_variant
 from ....product.utils.availability import (
-    get_product_availability,
     get_variant_availability,
 )
 from ....product.utils.variants import get_variant_selection_attributes
 from ....tax.utils import (
-    get_display_gross_prices,
     get_tax_calculation_strategy,
     get_tax_rate_for_tax_class,
 )
@@ -93,6 +91,9 @@ from ...order.dataloaders import (
     OrderLinesByVariantIdAndChannelIdLoader,
 )
 from ...plugins.dataloaders import get_plugin_manager_promise
+from ...product.dataloaders.pricing import (
+    ProductPricingByProductIdChannelSlugAndCountryCodeLoader,
+)
 from ...product.dataloaders.products import (
     AvailableProductVariantsByProductIdAndChannel,
     ProductVariantsByProductIdAndChannel,
@@ -101,7 +102,6 @@ from ...site.dataloaders import load_site_callback
 from ...tax.dataloaders import (
     ProductChargeTaxesByTaxClassIdLoader,
     TaxClassByIdLoader,
-    TaxClassByProductIdLoader,
     TaxClassByVariantIdLoader,
     TaxClassCountryRateByTaxClassIDLoader,
     TaxClassDefaultRateByCountryLoader,
@@ -143,7 +143,6 @@ from ..dataloaders import (
     VariantAttributesVisibleInStorefrontByProductTypeIdLoader,
     VariantChannelListingByVariantIdAndChannelSlugLoader,
     VariantChannelListingByVariantIdLoader,
-    VariantsChannelListingByProductIdAndChannelSlugLoader,
 )
 from ..enums import ProductMediaType, ProductTypeKindEnum, VariantAttributeScope
 from ..resolvers import resolve_product_variants, resolve_products
@@ -1113,104 +1112,23 @@ class Product(ChannelContextTypeWithMetadata[models.Product]):
         channel_slug = str(root.channel_slug)
         context = info.context
 
-        channel = ChannelBySlugLoader(context).load(channel_slug)
-        product_channel_listing = ProductChannelListingByProductIdAndChannelSlugLoader(
-            context
-        ).load((root.node.id, channel_slug))
-        variants_channel_listing = (
-            VariantsChannelListingByProductIdAndChannelSlugLoader(context).load(
-                (root.node.id, channel_slug)
-            )
-        )
-        tax_class = TaxClassByProductIdLoader(context).load(root.node.id)
-
-        def load_tax_configuration(data):
-            (
-                channel,
-                product_channel_listing,
-                variants_channel_listing,
-                tax_class,
-            ) = data
-
-            if not variants_channel_listing:
-                return None
+        def load_pricing(channel):
             country_code = get_active_country(channel, address_data=address)
+            return ProductPricingByProductIdChannelSlugAndCountryCodeLoader(
+                context
+            ).load((root.node.id, channel_slug, country_code))
 
-            def load_tax_country_exceptions(tax_config):
-                def load_default_tax_rate(tax_configs_per_country):
-                    def calculate_pricing_info(data):
-                        country_rates, default_country_rate_obj = data
-                        tax_config_country = next(
-                            (
-                                tc
-                                for tc in tax_configs_per_country
-                                if tc.country.code == country_code
-                            ),
-                            None,
-                        )
-                        display_gross_prices = get_display_gross_prices(
-                            tax_config,
-                            tax_config_country,
-                        )
-                        tax_calculation_strategy = get_tax_calculation_strategy(
-                            tax_config, tax_config_country
-                        )
-
-                        default_tax_rate = (
-                            default_country_rate_obj.rate
-                            if default_country_rate_obj
-                            else Decimal(0)
-                        )
-                        tax_rate = get_tax_rate_for_tax_class(
-                            tax_class, country_rates, default_tax_rate, country_code
-                        )
-
-                        availability = get_product_availability(
-                            product_channel_listing=product_channel_listing,
-                            variants_channel_listing=variants_channel_listing,
-                            prices_entered_with_tax=tax_config.prices_entered_with_tax,
-                            tax_calculation_strategy=tax_calculation_strategy,
-                            tax_rate=tax_rate,
-                        )
-
-                        pricing_info = asdict(availability)
-                        pricing_info["display_gross_prices"] = display_gross_prices
-                        return ProductPricingInfo(**pricing_info)
-
-                    country_rates = (
-                        TaxClassCountryRateByTaxClassIDLoader(context).load(
-                            tax_class.pk
-                        )
-                        if tax_class
-                        else []
-                    )
-                    default_rate = TaxClassDefaultRateByCountryLoader(context).load(
-                        country_code
-                    )
-                    return Promise.all([country_rates, default_rate]).then(
-                        calculate_pricing_info
-                    )
-
-                return (
-                    TaxConfigurationPerCountryByTaxConfigurationIDLoader(context)
-                    .load(tax_config.id)
-                    .then(load_default_tax_rate)
-                )
-
-            return (
-                TaxConfigurationByChannelId(context)
-                .load(channel.id)
-                .then(load_tax_country_exceptions)
-            )
+        def to_pricing_info(pricing_info):
+            if pricing_info is None:
+                return None
+            return ProductPricingInfo(**pricing_info)
 
-        return Promise.all(
-            [
-                channel,
-                product_channel_listing,
-                variants_channel_listing,
-                tax_class,
-            ]
-        ).then(load_tax_configuration)
+        return (
+            ChannelBySlugLoader(context)
+            .load(channel_slug)
+            .then(load_pricing)
+            .then(to_pricing_info)
+        )
 
     @staticmethod
     @traced_resolver
@@ -11,6 +11,7 @@ from graphql import GraphQLError
 from ...core.tracing import traced_atomic_transaction
 from ...order import OrderStatus
 from ...order import models as order_models
+from ...warehouse.available_quantity import invalidate_available_quantities
 from ...warehouse.models import Stock
 from ..core.enums import ProductErrorCode
 from .sorters import ProductOrderField
@@ -94,6 +95,7 @@ def create_stocks(
     except IntegrityError:
         msg = "Stock for one of warehouses already exists for this product variant."
         raise ValidationError(msg)
+    invalidate_available_quantities([variant.pk])
     return new_stocks
 
 
@@ -0,0 +1,150 @@
+"""Cache of GraphQL responses to anonymous storefront queries.
+
+Responses are stored in the shared cache for `GRAPHQL_RESPONSE_CACHE_TIMEOUT`
+seconds, or `GRAPHQL_RESPONSE_CACHE_REPLICA_TIMEOUT` seconds when read from the
+replica database, keyed by the document, variables and operation name. Channel and language
+are passed as arguments, so they are part of the key as well.
+
+Each response is tagged with the model types and instances resolved while executing
+it. Writes reported through plugin events invalidate tags by storing the time of
+the invalidation; responses cached before that time are not served anymore.
+"""
+
+import hashlib
+import json
+import time
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Model
+from graphql import GraphQLDocument
+from graphql.language.ast import Field
+from graphql.utils.get_operation_ast import get_operation_ast
+
+from .. import __version__ as saleor_version
+from ..core.auth import get_token_from_request
+from .channel import ChannelContext
+
+if TYPE_CHECKING:
+    from django.http import HttpRequest
+
+RESPONSE_CACHE_STATUS_HEADER = "X-Saleor-Response-Cache"
+RESPONSE_CACHE_HIT = "HIT"
+RESPONSE_CACHE_MISS = "MISS"
+RESPONSE_CACHE_BYPASS = "BYPASS"
+
+# Root fields of the storefront queries whose responses can be cached.
+CACHEABLE_FIELDS = frozenset(
+    {
+        "__typename",
+        "categories",
+        "category",
+        "collection",
+        "collections",
+        "menu",
+        "menuItem",
+        "menuItems",
+        "menus",
+        "product",
+        "products",
+        "productVariant",
+        "productVariants",
+    }
+)
+
+
+def is_response_cacheable(
+    request: "HttpRequest", document: GraphQLDocument, operation_name: Optional[str]
+) -> bool:
+    """Return True if the response can be shared by all anonymous clients."""
+    if get_token_from_request(request):
+        return False
+    operation = get_operation_ast(document.document_ast, operation_name)
+    if operation is None or operation.operation != "query":
+        return False
+    return all(
+        isinstance(selection, Field) and selection.name.value in CACHEABLE_FIELDS
+        for selection in operation.selection_set.selections
+    )
+
+
+def get_response_cache_key(
+    document: GraphQLDocument,
+    variables: Optional[dict[str, Any]],
+    operation_name: Optional[str],
+) -> str:
+    request_data = json.dumps(
+        [document.document_string, variables, operation_name],
+        sort_keys=True,
+        default=str,
+    )
+    request_hash = hashlib.sha256(request_data.encode("utf-8")).hexdigest()
+    return f"{saleor_version}-graphql-response-{request_hash}"
+
+
+def get_model_tag(model: type[Model]) -> str:
+    return model._meta.label_lower
+
+
+def get_instance_tag(model: type[Model], pk: Any) -> str:
+    return f"{get_model_tag(model)}:{pk}"
+
+
+def _get_tag_cache_key(tag: str) -> str:
+    return f"graphql-response-tag-{tag}"
+
+
+class ResponseCacheTagsMiddleware:
+    """Collect tags of model instances resolved while executing a query."""
+
+    def __init__(self):
+        self.tags: set[str] = set()
+
+    def resolve(self, next_, root, info, **kwargs):
+        node = root.node if isinstance(root, ChannelContext) else root
+        if isinstance(node, Model):
+            self.tags.add(get_model_tag(type(node)))
+            self.tags.add(get_instance_tag(type(node), node.pk))
+        return next_(root, info, **kwargs)
+
+
+def get_cached_response(key: str) -> Optional[dict[str, Any]]:
+    """Return response data cached under the key unless any of its tags changed."""
+    entry = cache.get(key)
+    if entry is None:
+        return None
+    tag_keys = [_get_tag_cache_key(tag) for tag in entry["tags"]]
+    invalidated_at = cache.get_many(tag_keys).values()
+    if any(timestamp >= entry["created_at"] for timestamp in invalidated_at):
+        return None
+    return entry["data"]
+
+
+def get_response_cache_timeout(database_connection_name: str) -> int:
+    timeout = settings.GRAPHQL_RESPONSE_CACHE_TIMEOUT
+    # A replica may not have the changes yet when the tags are invalidated, so
+    # responses read from it are cached only for a short time.
+    if database_connection_name != settings.DATABASE_CONNECTION_DEFAULT_NAME:
+        timeout = min(timeout, settings.GRAPHQL_RESPONSE_CACHE_REPLICA_TIMEOUT)
+    return timeout
+
+
+def cache_response(
+    key: str, data: dict[str, Any], tags: set[str], created_at: float, timeout: int
+):
+    """Cache response data computed from the database state at `created_at`."""
+    entry = {"data": data, "tags": sorted(tags), "created_at": created_at}
+    cache.set(key, entry, timeout=timeout)
+
+
+def invalidate_response_cache(tags: Iterable[str]):
+    """Invalidate cached responses with any of the given tags."""
+    if not settings.GRAPHQL_RESPONSE_CACHE_TIMEOUT:
+        return
+    # Responses cached before the invalidation expire before the tag does.
+    cache.set_many(
+        {_get_tag_cache_key(tag): time.time() for tag in tags},
+        timeout=settings.GRAPHQL_RESPONSE_CACHE_TIMEOUT,
+    )
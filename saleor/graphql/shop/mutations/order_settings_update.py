@@ -3,9 +3,11 @@ from django.core.exceptions import ValidationError
 
 from ....channel import models as channel_models
 from ....permission.enums import OrderPermissions
+from ....plugins.manager import invalidate_plugins_registry
 from ....site.error_codes import OrderSettingsErrorCode
 from ...channel.types import OrderSettings
 from ...core import ResolveInfo
+from ...core.dataloaders import bump_reference_data_version
 from ...core.doc_category import DOC_CATEGORY_ORDERS
 from ...core.mutations import BaseMutation
 from ...core.types import BaseInputObjectType, OrderSettingsError
@@ -74,6 +76,8 @@ class OrderSettingsUpdate(BaseMutation):
 
         if update_fields:
             channel_models.Channel.objects.update(**update_fields)
+            bump_reference_data_version()
+            invalidate_plugins_registry()
 
         channel.refresh_from_db()
 
@@ -13,6 +13,7 @@ from ..core.dataloaders import DataLoader
 
 class SiteByIdLoader(DataLoader[int, Site]):
     context_key = "site_by_id"
+    reference_data_models = (Site,)
 
     def batch_load(self, keys):
         sites_mapped = Site.objects.using(self.database_connection_name).in_bulk(keys)
@@ -21,6 +22,7 @@ class SiteByIdLoader(DataLoader[int, Site]):
 
 class SiteByHostLoader(DataLoader):
     context_key = "site_by_host"
+    reference_data_models = (Site,)
 
     def batch_load(self, keys):
         # simulate non existing `domain__iexact__in`
@@ -3,6 +3,7 @@ import graphene
 from ....permission.enums import CheckoutPermissions
 from ....tax import error_codes, models
 from ...account.enums import CountryCodeEnum
+from ...core.dataloaders import bump_reference_data_version
 from ...core.descriptions import ADDED_IN_39
 from ...core.doc_category import DOC_CATEGORY_TAXES
 from ...core.mutations import ModelMutation
@@ -74,6 +75,7 @@ class TaxClassCreate(ModelMutation):
             for item in country_rates
         ]
         models.TaxClassCountryRate.objects.bulk_create(to_create)
+        bump_reference_data_version()
 
     @classmethod
     def save(cls, _info, instance, cleaned_input):
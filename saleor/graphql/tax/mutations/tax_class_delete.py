@@ -1,7 +1,9 @@
 import graphene
 
 from ....permission.enums import CheckoutPermissions
+from ....product.utils.pricing_snapshot import invalidate_all_product_pricing_snapshots
 from ....tax import error_codes, models
+from ...core import ResolveInfo
 from ...core.descriptions import ADDED_IN_39
 from ...core.doc_category import DOC_CATEGORY_TAXES
 from ...core.mutations import ModelDeleteMutation
@@ -33,3 +35,7 @@ class TaxClassDelete(ModelDeleteMutation):
         model = models.TaxClass
         object_type = TaxClass
         permissions = (CheckoutPermissions.MANAGE_TAXES,)
+
+    @classmethod
+    def post_save_action(cls, _info: ResolveInfo, _instance, _cleaned_input):
+        invalidate_all_product_pricing_snapshots()
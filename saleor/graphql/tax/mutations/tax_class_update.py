@@ -2,9 +2,11 @@ import graphene
 from django.core.exceptions import ValidationError
 
 from ....permission.enums import CheckoutPermissions
+from ....product.utils.pricing_snapshot import invalidate_all_product_pricing_snapshots
 from ....tax import error_codes, models
 from ...account.enums import CountryCodeEnum
 from ...core import ResolveInfo
+from ...core.dataloaders import bump_reference_data_version
 from ...core.descriptions import ADDED_IN_39
 from ...core.doc_category import DOC_CATEGORY_TAXES
 from ...core.mutations import ModelMutation
@@ -145,3 +147,5 @@ class TaxClassUpdate(ModelMutation):
         remove_country_rates = cleaned_input.get("remove_country_rates", [])
         cls.update_country_rates(instance, update_country_rates)
         cls.remove_country_rates(remove_country_rates)
+        bump_reference_data_version()
+        invalidate_all_product_pricing_snapshots()
@@ -4,9 +4,11 @@ from django.core.exceptions import ValidationError
 from ....app.utils import get_active_tax_apps
 from ....permission.enums import CheckoutPermissions
 from ....plugins import PLUGIN_IDENTIFIER_PREFIX
+from ....product.utils.pricing_snapshot import invalidate_all_product_pricing_snapshots
 from ....tax import error_codes, models
 from ...account.enums import CountryCodeEnum
 from ...core import ResolveInfo
+from ...core.dataloaders import bump_reference_data_version
 from ...core.descriptions import ADDED_IN_39, ADDED_IN_319
 from ...core.doc_category import DOC_CATEGORY_TAXES
 from ...core.mutations import ModelMutation
@@ -273,3 +275,5 @@ class TaxConfigurationUpdate(ModelMutation):
         )
         cls.update_countries_configuration(instance, update_countries_configuration)
         cls.remove_countries_configuration(remove_countries_configuration)
+        bump_reference_data_version()
+        invalidate_all_product_pricing_snapshots()
@@ -2,6 +2,7 @@ import graphene
 from django_countries.fields import Country
 
 from ....permission.enums import CheckoutPermissions
+from ....product.utils.pricing_snapshot import invalidate_all_product_pricing_snapshots
 from ....tax import error_codes, models
 from ...account.enums import CountryCodeEnum
 from ...core import ResolveInfo
@@ -48,6 +49,7 @@ class TaxCountryConfigurationDelete(BaseMutation):
         country_code = data["country_code"]
         rates = models.TaxClassCountryRate.objects.filter(country=country_code)
         rates.delete()
+        invalidate_all_product_pricing_snapshots()
         country_config = TaxCountryConfiguration(
             country=Country(country_code), tax_class_country_rates=[]
         )
@@ -7,9 +7,11 @@ from django_countries.fields import Country
 from graphql import GraphQLError
 
 from ....permission.enums import CheckoutPermissions
+from ....product.utils.pricing_snapshot import invalidate_all_product_pricing_snapshots
 from ....tax import error_codes, models
 from ...account.enums import CountryCodeEnum
 from ...core import ResolveInfo
+from ...core.dataloaders import bump_reference_data_version
 from ...core.descriptions import ADDED_IN_39
 from ...core.doc_category import DOC_CATEGORY_TAXES
 from ...core.mutations import BaseMutation
@@ -230,6 +232,8 @@ class TaxCountryConfigurationUpdate(BaseMutation):
         cleaned_data = cls.clean_input(**data)
         cls.update_default_rate(country_code, cleaned_data)
         cls.update_and_create_country_rates(country_code, cleaned_data)
+        bump_reference_data_version()
+        invalidate_all_product_pricing_snapshots()
 
         tax_classes_lookup = Q(tax_class_id__in=cleaned_data.keys())
         if None in cleaned_data:
@@ -1,6 +1,7 @@
 import hashlib
 import importlib
 import json
+import time
 from inspect import isclass
 from typing import Any, Optional, Union
 
@@ -23,10 +24,23 @@ from .. import __version__ as saleor_version
 from ..core.exceptions import PermissionDenied
 from ..core.utils import is_valid_ipv4, is_valid_ipv6
 from ..webhook import observability
-from .api import API_PATH, schema
+from .api import API_PATH, get_query_hash, schema
 from .context import get_context_value
+from .core.context import get_database_connection_name
 from .core.validators.query_cost import validate_query_cost
 from .query_cost_map import COST_MAP
+from .response_cache import (
+    RESPONSE_CACHE_BYPASS,
+    RESPONSE_CACHE_HIT,
+    RESPONSE_CACHE_MISS,
+    RESPONSE_CACHE_STATUS_HEADER,
+    ResponseCacheTagsMiddleware,
+    cache_response,
+    get_cached_response,
+    get_response_cache_key,
+    get_response_cache_timeout,
+    is_response_cacheable,
+)
 from .utils import format_error, query_fingerprint, query_identifier
 
 INT_ERROR_MSG = "Int cannot represent non 32-bit signed integer value"
@@ -90,6 +104,7 @@ class GraphQLView(View):
         self.executor = executor
         self.root_value = root_value
         self.backend = backend
+        self.response_cache_statuses: list[str] = []
 
     @staticmethod
     def import_middleware(middleware_name):
@@ -143,7 +158,12 @@ class GraphQLView(View):
             status_code = max((code for response, code in responses), default=200)
         else:
             result, status_code = self.get_response(request, data)
-        return JsonResponse(data=result, status=status_code, safe=False)
+        response = JsonResponse(data=result, status=status_code, safe=False)
+        if self.response_cache_statuses:
+            response[RESPONSE_CACHE_STATUS_HEADER] = ", ".join(
+                self.response_cache_statuses
+            )
+        return response
 
     def handle_query(self, request: HttpRequest) -> JsonResponse:
         tracer = opentracing.global_tracer()
@@ -250,6 +270,40 @@ class GraphQLView(View):
         except (ValueError, GraphQLSyntaxError) as e:
             return None, ExecutionResult(errors=[e], invalid=True)
 
+    def parse_persisted_query(
+        self, query: Optional[str], query_hash: str
+    ) -> tuple[Optional[GraphQLDocument], Optional[ExecutionResult]]:
+        """Resolve an Automatic Persisted Query to a gql document object.
+
+        When only the hash is given, the document is looked up in the cache and
+        the `PersistedQueryNotFound` error is returned on a miss, so the client
+        can retry with the full query. When the query is given as well, it is
+        parsed as usual and registered under its hash. With persisted queries
+        disabled, the hash is ignored for requests sending the full query.
+        """
+        document_from_hash = getattr(self.backend, "document_from_hash", None)
+        if not settings.GRAPHQL_PERSISTED_QUERIES_ENABLED or not document_from_hash:
+            if query is not None:
+                return self.parse_query(query)
+            return None, persisted_query_error(
+                "PersistedQueryNotSupported", "PERSISTED_QUERY_NOT_SUPPORTED"
+            )
+
+        if query is None:
+            document = document_from_hash(self.schema, query_hash)
+            if document is None:
+                return None, persisted_query_error(
+                    "PersistedQueryNotFound", "PERSISTED_QUERY_NOT_FOUND"
+                )
+            return document, None
+
+        if isinstance(query, str) and get_query_hash(query) != query_hash:
+            return None, persisted_query_error(
+                "Provided sha256Hash does not match the query.",
+                "PERSISTED_QUERY_HASH_MISMATCH",
+            )
+        return self.parse_query(query)
+
     def check_if_query_contains_only_schema(self, document: GraphQLDocument):
         query_with_schema = False
         for definition in document.document_ast.definitions:
@@ -274,8 +328,14 @@ class GraphQLView(View):
             )
 
             query, variables, operation_name = self.get_graphql_params(request, data)
+            persisted_query_hash = self.get_persisted_query_hash(request, data)
 
-            document, error = self.parse_query(query)
+            if persisted_query_hash is not None:
+                document, error = self.parse_persisted_query(
+                    query, persisted_query_hash
+                )
+            else:
+                document, error = self.parse_query(query)
             with observability.report_gql_operation() as operation:
                 operation.query = document
                 operation.name = operation_name
@@ -329,13 +389,13 @@ class GraphQLView(View):
                         response = cache.get(key)
 
                     if not response:
-                        response = document.execute(
-                            root=self.get_root_value(),
-                            variables=variables,
-                            operation_name=operation_name,
-                            context=context,
-                            middleware=self.middleware,
-                            **extra_options,
+                        response = self.execute_document(
+                            request,
+                            document,
+                            variables,
+                            operation_name,
+                            context,
+                            extra_options,
                         )
                         if should_use_cache_for_scheme:
                             cache.set(key, response)
@@ -351,6 +411,50 @@ class GraphQLView(View):
                     e = GraphQLError(str(e))
                 return ExecutionResult(errors=[e], invalid=True)
 
+    def execute_document(
+        self,
+        request: HttpRequest,
+        document: GraphQLDocument,
+        variables: Optional[dict[str, Any]],
+        operation_name: Optional[str],
+        context,
+        extra_options: dict[str, Optional[Any]],
+    ) -> ExecutionResult:
+        """Execute the document, serving anonymous storefront queries from cache."""
+
+        def execute(middleware):
+            return document.execute(
+                root=self.get_root_value(),
+                variables=variables,
+                operation_name=operation_name,
+                context=context,
+                middleware=middleware,
+                **extra_options,
+            )
+
+        if not settings.GRAPHQL_RESPONSE_CACHE_TIMEOUT:
+            return execute(self.middleware)
+        if not is_response_cacheable(request, document, operation_name):
+            self.response_cache_statuses.append(RESPONSE_CACHE_BYPASS)
+            return execute(self.middleware)
+
+        key = get_response_cache_key(document, variables, operation_name)
+        data = get_cached_response(key)
+        if data is not None:
+            self.response_cache_statuses.append(RESPONSE_CACHE_HIT)
+            return ExecutionResult(data=data)
+
+        self.response_cache_statuses.append(RESPONSE_CACHE_MISS)
+        tags_middleware = ResponseCacheTagsMiddleware()
+        created_at = time.time()
+        response = execute([*(self.middleware or []), tags_middleware])
+        timeout = get_response_cache_timeout(get_database_connection_name(context))
+        if timeout and response.data is not None and not response.errors:
+            cache_response(
+                key, response.data, tags_middleware.tags, created_at, timeout
+            )
+        return response
+
     @staticmethod
     def parse_body(request: HttpRequest):
         content_type = request.content_type
@@ -383,6 +487,19 @@ class GraphQLView(View):
             variables = operations.get("variables")
         return query, variables, operation_name
 
+    @staticmethod
+    def get_persisted_query_hash(request: HttpRequest, data: dict) -> Optional[str]:
+        extensions = data.get("extensions")
+        if request.content_type == "multipart/form-data":
+            extensions = json.loads(data.get("operations", "{}")).get("extensions")
+        if not isinstance(extensions, dict):
+            return None
+        persisted_query = extensions.get("persistedQuery")
+        if not isinstance(persisted_query, dict):
+            return None
+        query_hash = persisted_query.get("sha256Hash")
+        return query_hash if isinstance(query_hash, str) else None
+
     @classmethod
     def format_error(cls, error):
         return format_error(error, cls.HANDLED_EXCEPTIONS)
@@ -446,6 +563,11 @@ def generate_cache_key(raw_query: str) -> str:
     return f"{saleor_version}-{hashed_query}"
 
 
+def persisted_query_error(message: str, code: str) -> ExecutionResult:
+    error = GraphQLError(message, extensions={"code": code})
+    return ExecutionResult(errors=[error], invalid=True)
+
+
 def set_query_cost_on_result(execution_result: ExecutionResult, query_cost):
     if settings.GRAPHQL_QUERY_MAX_COMPLEXITY:
         execution_result.extensions.update(
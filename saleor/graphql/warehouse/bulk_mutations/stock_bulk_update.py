@@ -7,6 +7,7 @@ from django.db.models import F, Q
 from ....core.tracing import traced_atomic_transaction
 from ....permission.enums import ProductPermissions
 from ....warehouse import models
+from ....warehouse.available_quantity import invalidate_available_quantities
 from ....warehouse.error_codes import StockBulkUpdateErrorCode
 from ....webhook.event_types import WebhookEventAsyncType
 from ....webhook.utils import get_webhooks_for_event
@@ -380,6 +381,9 @@ class StockBulkUpdate(BaseMutation):
         ]
 
         models.Stock.objects.bulk_update(stocks_to_update, fields=["quantity"])
+        invalidate_available_quantities(
+            stock.product_variant_id for stock in stocks_to_update
+        )
 
         return stocks_to_update
 
@@ -9,7 +9,7 @@ from typing import (
 )
 from uuid import UUID
 
-from django.contrib.sites.models import Site
+from django.conf import settings
 from django.db.models import Exists, OuterRef, Q, QuerySet
 from django.db.models.aggregates import Sum
 from django.db.models.functions import Coalesce
@@ -19,6 +19,12 @@ from django_stubs_ext import WithAnnotations
 from ...channel.models import Channel
 from ...product.models import ProductVariantChannelListing
 from ...warehouse import WarehouseClickAndCollectOption
+from ...warehouse.available_quantity import (
+    get_available_quantities,
+    get_available_quantity_tokens,
+    is_available_quantity_cache_enabled,
+    set_available_quantities,
+)
 from ...warehouse.models import (
     ChannelWarehouse,
     PreorderReservation,
@@ -54,48 +60,85 @@ class AvailableQuantityByProductVariantIdCountryCodeAndChannelSlugLoader(
     For each country code, for each shipping zone supporting that country,
     calculate the maximum available quantity, then return either that number
     or the maximum allowed checkout quantity, whichever is lower.
+
+    When `AVAILABLE_QUANTITY_CACHE_TIMEOUT` is set, the quantities are read from
+    the cache and only the missing ones are calculated and stored.
     """
 
     context_key = "available_quantity_by_productvariant_and_country"
 
     def batch_load(self, keys: Iterable[VariantIdCountryCodeChannelSlug]) -> list[int]:
+        tokens: dict[int, str] = {}
+        quantities: dict[VariantIdCountryCodeChannelSlug, int] = {}
+        if keys and is_available_quantity_cache_enabled():
+            # Tokens are read before the quantities are calculated, so the quantities
+            # aren't stored for the variants invalidated in the meantime.
+            tokens = get_available_quantity_tokens(
+                {variant_id for variant_id, _, _ in keys}
+            )
+            quantities = get_available_quantities(tokens, keys)
+
         # Split the list of keys by country first. A typical query will only touch
         # a handful of unique countries but may access thousands of product variants,
         # so it's cheaper to execute one query per country.
         variants_by_country_and_channel: defaultdict[
             tuple[CountryCode, str], list[int]
         ] = defaultdict(list)
-        for variant_id, country_code, channel_slug in keys:
+        for key in keys:
+            if key in quantities:
+                continue
+            variant_id, country_code, channel_slug = key
             variants_by_country_and_channel[(country_code, channel_slug)].append(
                 variant_id
             )
 
         # For each country code execute a single query for all product variants.
-        quantity_by_variant_and_country: defaultdict[
-            VariantIdCountryCodeChannelSlug, int
-        ] = defaultdict(int)
-
-        site = None
-        if variants_by_country_and_channel:
-            site = get_site_promise(self.context).get()
-            for key, variant_ids in variants_by_country_and_channel.items():
-                country_code, channel_slug = key
-                quantities = self.batch_load_quantities_by_country(
-                    country_code, channel_slug, variant_ids, site
-                )
-                for variant_id, quantity in quantities:
-                    quantity_by_variant_and_country[
-                        (variant_id, country_code, channel_slug)
-                    ] = max(0, quantity)
+        calculated_quantities: dict[VariantIdCountryCodeChannelSlug, int] = {}
+        for key, variant_ids in variants_by_country_and_channel.items():
+            country_code, channel_slug = key
+            for variant_id, quantity in self.batch_load_quantities_by_country(
+                country_code, channel_slug, variant_ids
+            ):
+                calculated_quantities[
+                    (variant_id, country_code, channel_slug)
+                ] = quantity
+
+        if calculated_quantities and tokens:
+            if timeout := self.get_cache_timeout():
+                set_available_quantities(tokens, calculated_quantities, timeout)
+        quantities.update(calculated_quantities)
+
+        if not keys:
+            return []
+
+        # Return the quantities after capping them at the maximum quantity allowed in
+        # checkout. This prevent users from tracking the store's precise stock levels.
+        site = get_site_promise(self.context).get()
+        global_quantity_limit = site.settings.limit_quantity_per_checkout
+        return [
+            max(
+                0,
+                min(
+                    quantities[key],
+                    global_quantity_limit or sys.maxsize,
+                ),
+            )
+            for key in keys
+        ]
 
-        return [quantity_by_variant_and_country[key] for key in keys]
+    def get_cache_timeout(self) -> int:
+        timeout = settings.AVAILABLE_QUANTITY_CACHE_TIMEOUT
+        # A replica may not have the changes yet when the quantities are invalidated
+        # on commit, so quantities calculated from it are cached only for a short time.
+        if self.database_connection_name != settings.DATABASE_CONNECTION_DEFAULT_NAME:
+            timeout = min(timeout, settings.AVAILABLE_QUANTITY_CACHE_REPLICA_TIMEOUT)
+        return timeout
 
     def batch_load_quantities_by_country(
         self,
         country_code: Optional[CountryCode],
         channel_slug: Optional[str],
         variant_ids: Iterable[int],
-        site: Site,
     ) -> Iterable[tuple[int, int]]:
         # get stocks only for warehouses assigned to the shipping zones
         # that are available in the given channel
@@ -145,17 +188,7 @@ class AvailableQuantityByProductVariantIdCountryCodeAndChannelSlugLoader(
             variants_with_global_cc_warehouses,
             available_quantity_by_warehouse_id_and_variant_id,
         )
-
-        # Return the quantities after capping them at the maximum quantity allowed in
-        # checkout. This prevent users from tracking the store's precise stock levels.
-        global_quantity_limit = site.settings.limit_quantity_per_checkout
-        return [
-            (
-                variant_id,
-                min(quantity_map[variant_id], global_quantity_limit or sys.maxsize),
-            )
-            for variant_id in variant_ids
-        ]
+        return [(variant_id, quantity_map[variant_id]) for variant_id in variant_ids]
 
     def get_warehouse_shipping_zones(self, country_code, channel_slug):
         """Get the WarehouseShippingZone instances for a given channel and country."""
@@ -546,6 +579,7 @@ class PreorderQuantityReservedByVariantChannelListingIdLoader(DataLoader[int, in
 
 class WarehouseByIdLoader(DataLoader):
     context_key = "warehouse_by_id"
+    reference_data_models = (Warehouse,)
 
     def batch_load(self, keys: Iterable[UUID]) -> list[Optional[Warehouse]]:
         warehouses = (
@@ -564,6 +598,7 @@ class StockByIdLoader(DataLoader):
 
 class WarehousesByChannelIdLoader(DataLoader):
     context_key = "warehouse_by_channel"
+    reference_data_models = (ChannelWarehouse, Warehouse)
 
     def batch_load(self, keys):
         warehouse_and_channel_in_pairs = (
@@ -594,6 +629,7 @@ class WarehousesByChannelIdLoader(DataLoader):
 
 class WarehousesByShippingZoneIdLoader(DataLoader):
     context_key = "warehouses_by_shipping_zone_id"
+    reference_data_models = (ShippingZone.warehouses.through, Warehouse)
 
     def batch_load(self, keys):
         warehouse_and_shipping_zone_in_pairs = (
@@ -14,7 +14,7 @@ class PayloadByIdLoader(DataLoader[str, str]):
         )
 
         return [
-            payload[payload_id].payload if payload.get(payload_id) else None
+            payload[payload_id].get_payload() if payload.get(payload_id) else None
             for payload_id in keys
         ]
 
@@ -10,6 +10,7 @@ from ..core.descriptions import (
     ADDED_IN_315,
     ADDED_IN_316,
     ADDED_IN_318,
+    ADDED_IN_320,
     DEPRECATED_IN_3X_ENUM_VALUE,
     PREVIEW_FEATURE,
 )
@@ -267,6 +268,9 @@ WEBHOOK_EVENT_DESCRIPTION = {
     WebhookEventSyncType.ORDER_CALCULATE_TAXES: (
         "Event called for order tax calculation." + ADDED_IN_36
     ),
+    WebhookEventSyncType.ORDER_CALCULATE_TAXES_BULK: (
+        "Event called for tax calculation of many orders at once." + ADDED_IN_320
+    ),
     WebhookEventSyncType.TRANSACTION_CHARGE_REQUESTED: (
         "Event called when charge has been requested for transaction."
         + ADDED_IN_313
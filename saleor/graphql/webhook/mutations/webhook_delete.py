@@ -8,6 +8,7 @@ from ....permission.auth_filters import AuthorizationFilters
 from ....permission.enums import AppPermission
 from ....webhook import models
 from ....webhook.error_codes import WebhookErrorCode
+from ....webhook.utils import invalidate_webhooks_routing_table
 from ...app.dataloaders import get_app_promise
 from ...core import ResolveInfo
 from ...core.mutations import ModelDeleteMutation
@@ -60,6 +61,7 @@ class WebhookDelete(ModelDeleteMutation):
             )
         webhook.is_active = False
         webhook.save(update_fields=["is_active"])
+        invalidate_webhooks_routing_table()
 
         try:
             response = super().perform_mutation(_root, info, **data)
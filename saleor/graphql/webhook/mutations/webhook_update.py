@@ -5,6 +5,7 @@ from ....app.models import App
 from ....permission.auth_filters import AuthorizationFilters
 from ....permission.enums import AppPermission
 from ....webhook import models
+from ....webhook.utils import invalidate_webhooks_routing_table
 from ....webhook.validators import HEADERS_LENGTH_LIMIT, HEADERS_NUMBER_LIMIT
 from ...app.dataloaders import get_app_promise
 from ...core import ResolveInfo
@@ -109,6 +110,7 @@ class WebhookUpdate(WebhookCreate, NotifyUserEventValidationMixin):
                     for event in events
                 ]
             )
+        invalidate_webhooks_routing_table()
 
     @classmethod
     def get_instance(cls, info: ResolveInfo, **data):
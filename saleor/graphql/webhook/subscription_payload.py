@@ -7,7 +7,7 @@ from django.conf import settings
 from django.db import models
 from django.utils import timezone
 from django.utils.functional import SimpleLazyObject
-from graphql import get_default_backend, parse
+from graphql import GraphQLDocument
 from graphql.error import GraphQLError
 from promise import Promise
 
@@ -15,6 +15,7 @@ from ...account.models import User
 from ...app.models import App
 from ...core.exceptions import PermissionDenied
 from ...core.utils import get_domain
+from ...core.utils.cache import CacheDict
 from ...webhook.models import Webhook
 from ..core import SaleorContext
 from ..core.dataloaders import DataLoader
@@ -22,6 +23,13 @@ from ..utils import format_error
 
 logger = get_task_logger(__name__)
 
+# Validated subscription documents keyed by the hash of the subscription query.
+# Updating `Webhook.subscription_query` changes the key, so the stale document is
+# never used again and eventually gets evicted.
+subscription_documents_cache = CacheDict(
+    settings.WEBHOOK_SUBSCRIPTION_DOCUMENT_CACHE_SIZE
+)
+
 
 def initialize_request(
     requestor=None,
@@ -65,6 +73,18 @@ def get_event_payload(event):
     return event
 
 
+def get_subscription_document(subscription_query: str) -> GraphQLDocument:
+    """Return the parsed and validated document for the subscription query."""
+    from ..api import SaleorGraphQLBackend, get_query_hash, schema
+
+    key = get_query_hash(subscription_query)
+    if key not in subscription_documents_cache:
+        subscription_documents_cache[key] = SaleorGraphQLBackend().document_from_string(
+            schema, subscription_query
+        )
+    return subscription_documents_cache[key]
+
+
 def generate_payload_from_subscription(
     event_type: str,
     subscribable_object,
@@ -88,15 +108,9 @@ def generate_payload_from_subscription(
     return: A payload ready to send via webhook. None if the function was not able to
     generate a payload
     """
-    from ..api import schema
     from ..context import get_context_value
 
-    graphql_backend = get_default_backend()
-    ast = parse(subscription_query)
-    document = graphql_backend.document_from_string(
-        schema,
-        ast,
-    )
+    document = get_subscription_document(subscription_query)
     app_id = app.pk if app else None
     request.app = app
     results = document.execute(
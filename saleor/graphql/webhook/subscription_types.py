@@ -58,6 +58,7 @@ from ..core.descriptions import (
     ADDED_IN_317,
     ADDED_IN_318,
     ADDED_IN_319,
+    ADDED_IN_320,
     DEPRECATED_IN_3X_EVENT,
     PREVIEW_FEATURE,
 )
@@ -2598,6 +2599,32 @@ class CalculateTaxes(SubscriptionObjectType):
         return tax_base
 
 
+class CalculateTaxesBulk(SubscriptionObjectType):
+    tax_bases = NonNullList(
+        "saleor.graphql.core.types.taxes.TaxableObject",
+        required=True,
+        description=(
+            "Orders to calculate taxes for. The response should be a list of tax "
+            "data, one for each tax base, in the same order."
+        ),
+    )
+
+    class Meta:
+        root_type = None
+        enable_dry_run = False
+        interfaces = (Event,)
+        description = (
+            "Synchronous webhook for calculating taxes of many orders at once."
+            + ADDED_IN_320
+        )
+        doc_category = DOC_CATEGORY_TAXES
+
+    @staticmethod
+    def resolve_tax_bases(root, _info: ResolveInfo):
+        _, tax_bases = root
+        return tax_bases
+
+
 class CheckoutFilterShippingMethods(SubscriptionObjectType, CheckoutBase):
     shipping_methods = NonNullList(
         ShippingMethod,
@@ -2911,6 +2938,7 @@ WEBHOOK_TYPES_MAP = {
     ),
     WebhookEventSyncType.CHECKOUT_CALCULATE_TAXES: CalculateTaxes,
     WebhookEventSyncType.ORDER_CALCULATE_TAXES: CalculateTaxes,
+    WebhookEventSyncType.ORDER_CALCULATE_TAXES_BULK: CalculateTaxesBulk,
     WebhookEventSyncType.PAYMENT_GATEWAY_INITIALIZE_SESSION: (
         PaymentGatewayInitializeSession
     ),
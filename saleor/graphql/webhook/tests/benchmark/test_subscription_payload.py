@@ -0,0 +1,75 @@
+from unittest import mock
+
+import pytest
+from graphql import validate
+
+from .....webhook.event_types import WebhookEventAsyncType
+from .....webhook.models import Webhook, WebhookEvent
+from .....webhook.transport.asynchronous.transport import (
+    create_deliveries_for_subscriptions,
+)
+from ...subscription_payload import subscription_documents_cache
+
+NUMBER_OF_WEBHOOKS = 20
+
+PRODUCT_UPDATED_SUBSCRIPTION = """
+    subscription {
+      event {
+        ... on ProductUpdated {
+          product {
+            id
+            name
+          }
+        }
+      }
+    }
+"""
+
+
+@pytest.fixture
+def product_updated_webhooks(webhook_app):
+    webhooks = Webhook.objects.bulk_create(
+        [
+            Webhook(
+                name=f"Webhook_{index}",
+                app=webhook_app,
+                target_url=f"http://localhost/test_{index}",
+                subscription_query=PRODUCT_UPDATED_SUBSCRIPTION,
+            )
+            for index in range(NUMBER_OF_WEBHOOKS)
+        ]
+    )
+    WebhookEvent.objects.bulk_create(
+        [
+            WebhookEvent(
+                webhook=webhook, event_type=WebhookEventAsyncType.PRODUCT_UPDATED
+            )
+            for webhook in webhooks
+        ]
+    )
+    return webhooks
+
+
+@pytest.mark.django_db
+@pytest.mark.count_queries(autouse=False)
+@mock.patch("saleor.graphql.api.validate", wraps=validate)
+def test_product_updated_subscription_payloads(
+    validate_mock, product_list, product_updated_webhooks, count_queries
+):
+    # given
+    subscription_documents_cache.clear()
+
+    # when
+    deliveries = []
+    for product in product_list:
+        deliveries.extend(
+            create_deliveries_for_subscriptions(
+                WebhookEventAsyncType.PRODUCT_UPDATED,
+                product,
+                product_updated_webhooks,
+            )
+        )
+
+    # then
+    assert len(deliveries) == len(product_list) * NUMBER_OF_WEBHOOKS
+    validate_mock.assert_called_once()
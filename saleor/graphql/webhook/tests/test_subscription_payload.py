@@ -4,8 +4,10 @@ from django.utils import timezone
 from ....webhook.event_types import WebhookEventAsyncType
 from ....webhook.models import Webhook
 from ..subscription_payload import (
+    generate_payload_from_subscription,
     generate_pre_save_payloads,
     get_pre_save_payload_key,
+    get_subscription_document,
     initialize_request,
 )
 
@@ -117,3 +119,40 @@ def test_generate_pre_save_payloads(webhook_app, variant):
     key = get_pre_save_payload_key(webhook, variant)
     assert key in pre_save_payloads
     assert pre_save_payloads[key]
+
+
+def test_get_subscription_document_is_cached():
+    # when
+    document = get_subscription_document(SUBSCRIPTION_QUERY)
+
+    # then
+    assert get_subscription_document(SUBSCRIPTION_QUERY) is document
+
+
+def test_get_subscription_document_after_subscription_query_change(
+    webhook_app, variant
+):
+    # given
+    webhook = Webhook.objects.create(
+        name="Webhook",
+        app=webhook_app,
+        subscription_query=SUBSCRIPTION_QUERY,
+    )
+    document = get_subscription_document(webhook.subscription_query)
+
+    # when
+    webhook.subscription_query = SUBSCRIPTION_QUERY.replace("name", "sku")
+    webhook.save(update_fields=["subscription_query"])
+
+    # then
+    new_document = get_subscription_document(webhook.subscription_query)
+    assert new_document is not document
+    assert new_document.document_string == webhook.subscription_query
+    payload = generate_payload_from_subscription(
+        event_type=WebhookEventAsyncType.PRODUCT_VARIANT_UPDATED,
+        subscribable_object=variant,
+        subscription_query=webhook.subscription_query,
+        request=initialize_request(),
+        app=webhook_app,
+    )
+    assert payload == {"productVariant": {"sku": variant.sku}}
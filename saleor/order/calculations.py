@@ -1,9 +1,10 @@
+from collections import defaultdict
 from collections.abc import Iterable
 from decimal import Decimal
-from typing import Optional
+from typing import Any, Optional
 
 from django.db import transaction
-from django.db.models import prefetch_related_objects
+from django.db.models import Prefetch, prefetch_related_objects
 from prices import Money, TaxedMoney
 
 from ..core.prices import quantize_price
@@ -55,7 +56,91 @@ def fetch_order_prices_if_expired(
 
     _update_order_discount_for_voucher(order)
     _recalculate_prices(order, manager, lines)
+    _save_order_prices(order, lines)
 
+    return order, lines
+
+
+def fetch_orders_prices_if_expired(
+    orders: Iterable[Order],
+    manager: PluginsManager,
+    force_update: bool = False,
+) -> list[Order]:
+    """Fetch prices with taxes of many orders.
+
+    Works like `fetch_order_prices_if_expired`, but lines and tax configurations
+    are fetched for all orders at once and the tax app of the orders is resolved
+    once. Orders with prices that are still valid are skipped. Return the orders
+    with refreshed prices.
+    """
+    orders = [
+        order
+        for order in orders
+        if order.status in ORDER_EDITABLE_STATUS
+        and (force_update or order.should_refresh_prices)
+    ]
+    if not orders:
+        return []
+
+    prefetch_related_objects(
+        orders,
+        "channel__tax_configuration",
+        Prefetch(
+            "lines",
+            queryset=OrderLine.objects.select_related("variant__product__product_type"),
+        ),
+    )
+    lines_by_order = {order.pk: list(order.lines.all()) for order in orders}
+
+    # Discounts have to be applied before the taxes are requested, as the tax
+    # payloads contain the discounted prices.
+    for order in orders:
+        order.should_refresh_prices = False
+        _update_order_discount_for_voucher(order)
+        apply_order_discounts(order, lines_by_order[order.pk], assign_prices=True)
+
+    tax_data_by_order = _get_tax_app_data_for_orders(orders, manager)
+    for order in orders:
+        lines = lines_by_order[order.pk]
+        _recalculate_taxes(order, manager, lines, tax_data_by_order)
+        _save_order_prices(order, lines)
+    return orders
+
+
+def _get_tax_app_data_for_orders(
+    orders: list[Order], manager: PluginsManager
+) -> dict[Any, Optional[TaxData]]:
+    """Return tax data of the orders which taxes are calculated by a tax app."""
+    orders_by_app_identifier: defaultdict[str, list[Order]] = defaultdict(list)
+    for order in orders:
+        if (
+            get_tax_calculation_strategy_for_order(order)
+            != TaxCalculationStrategy.TAX_APP
+        ):
+            continue
+        tax_app_identifier = get_tax_app_identifier_for_order(order)
+        if not tax_app_identifier or tax_app_identifier.startswith(
+            PLUGIN_IDENTIFIER_PREFIX
+        ):
+            continue
+        prices_entered_with_tax = (
+            order.channel.tax_configuration.prices_entered_with_tax
+        )
+        should_charge_tax = (
+            get_charge_taxes_for_order(order) and not order.tax_exemption
+        )
+        if prices_entered_with_tax or should_charge_tax:
+            orders_by_app_identifier[tax_app_identifier].append(order)
+
+    tax_data_by_order: dict[Any, Optional[TaxData]] = {}
+    for tax_app_identifier, app_orders in orders_by_app_identifier.items():
+        tax_data_by_order.update(
+            manager.get_taxes_for_orders(app_orders, tax_app_identifier)
+        )
+    return tax_data_by_order
+
+
+def _save_order_prices(order: Order, lines: Iterable[OrderLine]):
     order.subtotal = get_subtotal(lines, order.currency)
     with transaction.atomic(savepoint=False):
         order.save(
@@ -88,8 +173,6 @@ def fetch_order_prices_if_expired(
             ],
         )
 
-        return order, lines
-
 
 def _update_order_discount_for_voucher(order: Order):
     """Create or delete OrderDiscount instances."""
@@ -130,6 +213,21 @@ def _recalculate_prices(
     lines: Iterable[OrderLine],
 ):
     """Calculate prices after handling order level discounts and taxes."""
+    # propagate the order level discount on the prices without taxes.
+    apply_order_discounts(order, lines, assign_prices=True)
+    _recalculate_taxes(order, manager, lines)
+
+
+def _recalculate_taxes(
+    order: Order,
+    manager: PluginsManager,
+    lines: Iterable[OrderLine],
+    tax_data_by_order: Optional[dict[Any, Optional[TaxData]]] = None,
+):
+    """Calculate taxes of the prices with applied order level discounts.
+
+    `tax_data_by_order` contains tax data already fetched from tax apps.
+    """
     tax_configuration = order.channel.tax_configuration
     tax_calculation_strategy = get_tax_calculation_strategy_for_order(order)
     prices_entered_with_tax = tax_configuration.prices_entered_with_tax
@@ -139,8 +237,6 @@ def _recalculate_prices(
 
     order.tax_error = None
 
-    # propagate the order level discount on the prices without taxes.
-    apply_order_discounts(order, lines, assign_prices=True)
     if prices_entered_with_tax:
         # If prices are entered with tax, we need to always calculate it anyway, to
         # display the tax rate to the user.
@@ -152,6 +248,7 @@ def _recalculate_prices(
                 lines,
                 manager,
                 prices_entered_with_tax,
+                tax_data_by_order,
             )
         except TaxEmptyData as e:
             order.tax_error = str(e)
@@ -174,6 +271,7 @@ def _recalculate_prices(
                     lines,
                     manager,
                     prices_entered_with_tax,
+                    tax_data_by_order,
                 )
             except TaxEmptyData as e:
                 order.tax_error = str(e)
@@ -188,6 +286,7 @@ def _calculate_and_add_tax(
     lines: Iterable["OrderLine"],
     manager: "PluginsManager",
     prices_entered_with_tax: bool,
+    tax_data_by_order: Optional[dict[Any, Optional[TaxData]]] = None,
 ):
     if tax_calculation_strategy == TaxCalculationStrategy.TAX_APP:
         # If taxAppId is not configured run all active plugins and tax apps.
@@ -206,6 +305,7 @@ def _calculate_and_add_tax(
                 lines,
                 manager,
                 prices_entered_with_tax,
+                tax_data_by_order,
             )
     else:
         # Get taxes calculated with flat rates and apply to order.
@@ -218,6 +318,7 @@ def _call_plugin_or_tax_app(
     lines: Iterable["OrderLine"],
     manager: "PluginsManager",
     prices_entered_with_tax: bool,
+    tax_data_by_order: Optional[dict[Any, Optional[TaxData]]] = None,
 ):
     if tax_app_identifier.startswith(PLUGIN_IDENTIFIER_PREFIX):
         plugin_ids = [tax_app_identifier.replace(PLUGIN_IDENTIFIER_PREFIX, "")]
@@ -236,7 +337,10 @@ def _call_plugin_or_tax_app(
         if order.tax_error:
             raise TaxEmptyData("Empty tax data.")
     else:
-        tax_data = manager.get_taxes_for_order(order, tax_app_identifier)
+        if tax_data_by_order is not None and order.pk in tax_data_by_order:
+            tax_data = tax_data_by_order[order.pk]
+        else:
+            tax_data = manager.get_taxes_for_order(order, tax_app_identifier)
         if tax_data is None:
             raise TaxEmptyData("Empty tax data.")
         _apply_tax_data(order, lines, tax_data)
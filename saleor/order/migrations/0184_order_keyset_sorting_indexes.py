@@ -0,0 +1,30 @@
+# Generated by Django 3.2.24 on 2026-10-17 10:00
+
+from django.contrib.postgres.indexes import BTreeIndex
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("order", "0183_order_tax_error"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="order",
+            index=BTreeIndex(
+                fields=["created_at", "status", "id"],
+                name="order_created_at_status_idx",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="order",
+            index=BTreeIndex(
+                fields=["updated_at", "status", "id"],
+                name="order_updated_at_status_idx",
+            ),
+        ),
+    ]
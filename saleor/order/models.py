@@ -367,6 +367,15 @@ class Order(ModelWithMetadata, ModelWithExternalReference):
                 opclasses=["gin_trgm_ops"],
             ),
             models.Index(fields=["created_at"], name="idx_order_created_at"),
+            # composite indexes matching the sorting fields used by keyset pagination
+            BTreeIndex(
+                fields=["created_at", "status", "id"],
+                name="order_created_at_status_idx",
+            ),
+            BTreeIndex(
+                fields=["updated_at", "status", "id"],
+                name="order_updated_at_status_idx",
+            ),
             GinIndex(fields=["voucher_code"], name="order_voucher_code_idx"),
             GinIndex(
                 fields=["user_email", "user_id"],
@@ -13,6 +13,7 @@ from ..payment.models import Payment, TransactionItem
 from ..plugins.manager import get_plugins_manager
 from ..warehouse.management import deallocate_stock_for_orders
 from . import OrderEvents, OrderStatus
+from .calculations import fetch_orders_prices_if_expired
 from .models import Order, OrderEvent
 from .utils import invalidate_order_prices
 
@@ -21,6 +22,11 @@ logger = logging.getLogger(__name__)
 # Batch size of 100 is about ~1MB of memory usage in task
 EXPIRE_ORDER_BATCH_SIZE = 100
 
+# Taxes of each order are requested from the tax app in a separate request, so the
+# batches are kept small to finish within the time limit (in seconds)
+RECALCULATE_DRAFT_ORDERS_BATCH_SIZE = 20
+RECALCULATE_DRAFT_ORDERS_TIME_LIMIT = 300
+
 # Batch size of 5000 is about ~5MB of memory usage in task
 # It takes +/- 8 secs to delete 5000 orders
 DELETE_EXPIRED_ORDER_BATCH_SIZE = 5000
@@ -28,13 +34,35 @@ DELETE_EXPIRED_ORDER_BATCH_SIZE = 5000
 
 @app.task
 def recalculate_orders_task(order_ids: list[int]):
-    orders = Order.objects.filter(id__in=order_ids)
+    orders = list(Order.objects.filter(id__in=order_ids))
 
     for order in orders:
         invalidate_order_prices(order)
 
     Order.objects.bulk_update(orders, ["should_refresh_prices"])
 
+    # Draft orders are recalculated in the background in separate tasks, so their
+    # prices are ready when the orders are fetched. Orders not recalculated by
+    # these tasks are recalculated on the next fetch as before.
+    draft_order_ids = [
+        order.id for order in orders if order.status == OrderStatus.DRAFT
+    ]
+    for index in range(0, len(draft_order_ids), RECALCULATE_DRAFT_ORDERS_BATCH_SIZE):
+        recalculate_draft_orders_prices_task.delay(
+            draft_order_ids[index : index + RECALCULATE_DRAFT_ORDERS_BATCH_SIZE]
+        )
+
+
+@app.task(soft_time_limit=RECALCULATE_DRAFT_ORDERS_TIME_LIMIT)
+def recalculate_draft_orders_prices_task(order_ids: list[int]):
+    orders = Order.objects.filter(id__in=order_ids, status=OrderStatus.DRAFT)
+    manager = get_plugins_manager(allow_replica=False)
+    try:
+        fetch_orders_prices_if_expired(orders, manager)
+    except Exception:
+        # The prices of the orders not saved yet stay invalidated.
+        logger.exception("Failed to recalculate prices of draft orders %s.", order_ids)
+
 
 @app.task
 def send_order_updated(order_ids):
@@ -16,6 +16,7 @@ from ...tax import TaxCalculationStrategy
 from ...tax.calculations.order import update_order_prices_with_flat_rates
 from .. import OrderStatus, calculations
 from ..interface import OrderTaxedPricesData
+from ..models import Order
 
 
 @pytest.fixture
@@ -1215,6 +1216,45 @@ def test_fetch_order_data_calls_tax_app(
     mock_calculate_order_total.assert_not_called()
 
 
+@patch("saleor.plugins.manager.PluginsManager.get_taxes_for_order")
+@patch("saleor.plugins.manager.PluginsManager.get_taxes_for_orders")
+@patch("saleor.order.calculations._apply_tax_data")
+def test_fetch_orders_prices_if_expired_requests_tax_app_in_bulk(
+    mock_apply_tax_data,
+    mock_get_taxes_for_orders,
+    mock_get_taxes_for_order,
+    order_list,
+):
+    # given
+    for order in order_list:
+        order.status = OrderStatus.DRAFT
+        order.should_refresh_prices = True
+    order_list[-1].should_refresh_prices = False
+    Order.objects.bulk_update(order_list, ["status", "should_refresh_prices"])
+    expired_orders = order_list[:-1]
+
+    tax_configuration = order_list[0].channel.tax_configuration
+    tax_configuration.tax_app_id = "test.app"
+    tax_configuration.save(update_fields=["tax_app_id"])
+
+    mock_get_taxes_for_orders.return_value = {
+        order.pk: sentinel.TAX_DATA for order in expired_orders
+    }
+    manager = get_plugins_manager(allow_replica=False)
+
+    # when
+    orders = calculations.fetch_orders_prices_if_expired(order_list, manager)
+
+    # then
+    assert orders == expired_orders
+    mock_get_taxes_for_orders.assert_called_once_with(expired_orders, "test.app")
+    mock_get_taxes_for_order.assert_not_called()
+    assert mock_apply_tax_data.call_count == len(expired_orders)
+    for order in expired_orders:
+        order.refresh_from_db()
+        assert order.should_refresh_prices is False
+
+
 def test_fetch_order_data_calls_inactive_plugin(
     order_with_lines,
     order_lines,
@@ -10,7 +10,12 @@ from ...discount.models import VoucherCustomer
 from ...warehouse.models import Allocation
 from .. import OrderEvents, OrderStatus
 from ..models import Order, OrderEvent, get_order_number
-from ..tasks import delete_expired_orders_task, expire_orders_task
+from ..tasks import (
+    delete_expired_orders_task,
+    expire_orders_task,
+    recalculate_draft_orders_prices_task,
+    recalculate_orders_task,
+)
 
 
 def test_expire_orders_task_check_voucher(
@@ -611,3 +616,49 @@ def test_delete_expired_orders_task_schedule_itself(
     # then
     mocked_delay.assert_called_once_with()
     assert Order.objects.count() == 2
+
+
+@patch("saleor.order.tasks.recalculate_draft_orders_prices_task.delay")
+def test_recalculate_orders_task_schedules_draft_orders_recalculation(
+    mocked_recalculate_draft_orders_prices, order_list
+):
+    # given
+    draft_order = order_list[0]
+    draft_order.status = OrderStatus.DRAFT
+    draft_order.save(update_fields=["status"])
+    order_ids = [order.id for order in order_list]
+
+    # when
+    recalculate_orders_task(order_ids)
+
+    # then
+    assert all(
+        Order.objects.filter(id__in=order_ids).values_list(
+            "should_refresh_prices", flat=True
+        )
+    )
+    mocked_recalculate_draft_orders_prices.assert_called_once_with([draft_order.id])
+
+
+@patch("saleor.order.tasks.fetch_orders_prices_if_expired")
+def test_recalculate_draft_orders_prices_task(mock_fetch_orders_prices, draft_order):
+    # when
+    recalculate_draft_orders_prices_task([draft_order.id])
+
+    # then
+    mock_fetch_orders_prices.assert_called_once()
+    assert list(mock_fetch_orders_prices.call_args.args[0]) == [draft_order]
+
+
+@patch("saleor.order.tasks.fetch_orders_prices_if_expired")
+def test_recalculate_draft_orders_prices_task_failed(
+    mock_fetch_orders_prices, draft_order, caplog
+):
+    # given
+    mock_fetch_orders_prices.side_effect = Exception("Tax app error")
+
+    # when
+    recalculate_draft_orders_prices_task([draft_order.id])
+
+    # then
+    assert "Failed to recalculate prices of draft orders" in caplog.text
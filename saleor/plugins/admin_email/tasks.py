@@ -1,7 +1,7 @@
 from ...celeryconf import app
 from ...csv.events import export_failed_info_sent_event, export_file_sent_event
 from ...graphql.core.utils import from_global_id_or_none
-from ..email_common import EmailConfig, send_email
+from ..email_common import EmailConfig, send_email, send_email_batch
 
 
 @app.task(compression="zlib")
@@ -56,15 +56,17 @@ def send_export_failed_email_task(
 
 @app.task(compression="zlib")
 def send_staff_order_confirmation_email_task(
-    recipient_list: str, payload: dict, config: dict, subject, template
+    recipient_list: list[str], payload: dict, config: dict, subject, template
 ):
+    # each staff member gets a separate email; all are sent over one connection
     email_config = EmailConfig(**config)
-    send_email(
+    send_email_batch(
         config=email_config,
-        recipient_list=recipient_list,
+        recipients_with_context=[
+            ([recipient], payload) for recipient in recipient_list
+        ],
         subject=subject,
         template_str=template,
-        context=payload,
     )
 
 
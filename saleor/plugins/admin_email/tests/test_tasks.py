@@ -292,35 +292,39 @@ def test_send_export_failed_email_task_custom_template(
     )
 
 
-@mock.patch("saleor.plugins.email_common.send_mail")
+@mock.patch("saleor.plugins.email_common.EmailBackend.send_messages")
 def test_send_staff_order_confirmation_email_task_default_template(
-    mocked_send_mail, email_dict_config, order_with_lines
+    mocked_send_messages, email_dict_config, order_with_lines
 ):
-    recipient_email = "user@example.com"
+    recipient_list = ["user@example.com", "staff@example.com"]
     payload = {
         "order": get_default_order_payload(
             order_with_lines, "http://localhost:8000/redirect"
         ),
-        "recipient_list": [recipient_email],
+        "recipient_list": recipient_list,
         "site_name": "Saleor",
         "domain": "localhost:8000",
     }
 
     send_staff_order_confirmation_email_task(
-        [recipient_email],
+        recipient_list,
         payload,
         email_dict_config,
         "subject",
         "template",
     )
 
-    # confirm that mail has correct structure and email was sent
-    assert mocked_send_mail.called
+    # confirm that a separate email was sent to each recipient over one connection
+    mocked_send_messages.assert_called_once()
+    messages = mocked_send_messages.call_args.args[0]
+    assert [message.to for message in messages] == [
+        [recipient] for recipient in recipient_list
+    ]
 
 
-@mock.patch("saleor.plugins.admin_email.tasks.send_email")
+@mock.patch("saleor.plugins.admin_email.tasks.send_email_batch")
 def test_send_staff_order_confirmation_email_task_custom_template(
-    mocked_send_email, order_with_lines, email_dict_config, admin_email_plugin
+    mocked_send_email_batch, order_with_lines, email_dict_config, admin_email_plugin
 ):
     expected_template_str = "<html><body>Template body</body></html>"
     expected_subject = "Test Email Subject"
@@ -347,10 +351,9 @@ def test_send_staff_order_confirmation_email_task_custom_template(
     )
 
     email_config = EmailConfig(**email_dict_config)
-    mocked_send_email.assert_called_with(
+    mocked_send_email_batch.assert_called_once_with(
         config=email_config,
-        recipient_list=[recipient_email],
-        context=payload,
+        recipients_with_context=[([recipient_email], payload)],
         subject=expected_subject,
         template_str=expected_template_str,
     )
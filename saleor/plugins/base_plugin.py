@@ -607,6 +607,15 @@ class BasePlugin:
 
     get_taxes_for_order: Callable[["Order", str, Any], Optional["TaxData"]]
 
+    # Calculate taxes of many orders at once.
+    #
+    # Return tax data by order id, or the previous value if the plugin doesn't
+    # support bulk calculation, then the orders are processed one by one with
+    # `get_taxes_for_order`.
+    get_taxes_for_orders: Callable[
+        [Iterable["Order"], str, Any], Optional[dict[Any, Optional["TaxData"]]]
+    ]
+
     get_client_token: Callable[[Any, Any], Any]
 
     get_order_line_tax_rate: Callable[
@@ -1,7 +1,9 @@
+import hashlib
 import logging
 import operator
 import os
 import re
+from collections.abc import Iterable
 from dataclasses import asdict, dataclass
 from decimal import Decimal, InvalidOperation
 from email.headerregistry import Address
@@ -12,12 +14,14 @@ import html2text
 import i18naddress
 import pybars
 from babel.numbers import format_currency
+from django.conf import settings
 from django.core.exceptions import ValidationError
-from django.core.mail import send_mail
+from django.core.mail import EmailMultiAlternatives, send_mail
 from django.core.mail.backends.smtp import EmailBackend
 from django.core.validators import EmailValidator
 from django_prices.utils.locale import get_locale_data
 
+from ..core.utils.cache import CacheDict
 from ..thumbnail.utils import get_thumbnail_size
 from .base_plugin import ConfigurationTypeField
 from .error_codes import PluginErrorCode
@@ -39,6 +43,11 @@ DEFAULT_SUBJECT_HELP_TEXT = "An email subject built with Handlebars template lan
 DEFAULT_EMAIL_VALUE = "DEFAULT"
 DEFAULT_EMAIL_TIMEOUT = 5
 
+# Compiled Handlebars templates keyed by the hash of the template source. Changing
+# a template in the plugin configuration changes the key, so the stale template is
+# never used again and eventually gets evicted.
+compiled_templates_cache = CacheDict(settings.EMAIL_TEMPLATE_CACHE_SIZE)
+
 
 @dataclass
 class EmailConfig:
@@ -183,15 +192,31 @@ def price(this, net_amount, gross_amount, currency, display_gross=False):
     return pybars.strlist([formatted_price])
 
 
-def send_email(
-    config: EmailConfig, recipient_list, context, subject="", template_str=""
-):
-    sender_name = config.sender_name or ""
-    sender_address = config.sender_address
+TEMPLATE_HELPERS = {
+    "format_address": format_address,
+    "price": price,
+    "format_datetime": format_datetime,
+    "get_product_image_thumbnail": get_product_image_thumbnail,
+    "compare": compare,
+}
 
-    from_email = str(Address(sender_name, addr_spec=sender_address))
 
-    email_backend = EmailBackend(
+def compile_template(template_str: str) -> Callable[..., str]:
+    """Return the compiled template, compiling it only on the first use.
+
+    Raises `pybars.PybarsError` when the template has an incorrect structure.
+    """
+    key = hashlib.sha256(template_str.encode()).hexdigest()
+    try:
+        return compiled_templates_cache[key]
+    except KeyError:
+        template = pybars.Compiler().compile(template_str)
+        compiled_templates_cache[key] = template
+        return template
+
+
+def get_email_backend(config: EmailConfig) -> EmailBackend:
+    return EmailBackend(
         host=config.host,
         port=config.port,
         username=config.username,
@@ -200,18 +225,22 @@ def send_email(
         use_tls=config.use_tls,
         timeout=DEFAULT_EMAIL_TIMEOUT,
     )
-    compiler = pybars.Compiler()
-    template = compiler.compile(template_str)
-    subject_template = compiler.compile(subject)
-    helpers = {
-        "format_address": format_address,
-        "price": price,
-        "format_datetime": format_datetime,
-        "get_product_image_thumbnail": get_product_image_thumbnail,
-        "compare": compare,
-    }
-    message = template(context, helpers=helpers)
-    subject_message = subject_template(context, helpers)
+
+
+def get_from_email(config: EmailConfig) -> str:
+    sender_name = config.sender_name or ""
+    return str(Address(sender_name, addr_spec=config.sender_address))
+
+
+def send_email(
+    config: EmailConfig, recipient_list, context, subject="", template_str=""
+):
+    from_email = get_from_email(config)
+    email_backend = get_email_backend(config)
+    template = compile_template(template_str)
+    subject_template = compile_template(subject)
+    message = template(context, helpers=TEMPLATE_HELPERS)
+    subject_message = subject_template(context, TEMPLATE_HELPERS)
     send_mail(
         subject_message,
         html2text.html2text(message),
@@ -222,6 +251,36 @@ def send_email(
     )
 
 
+def send_email_batch(
+    config: EmailConfig,
+    recipients_with_context: Iterable[tuple[list[str], dict]],
+    subject="",
+    template_str="",
+) -> int:
+    """Send the template rendered separately for each recipient list and context.
+
+    All emails are sent over a single SMTP connection. Return the number of emails
+    that were sent.
+    """
+    from_email = get_from_email(config)
+    template = compile_template(template_str)
+    subject_template = compile_template(subject)
+    messages = []
+    for recipient_list, context in recipients_with_context:
+        message = template(context, helpers=TEMPLATE_HELPERS)
+        email = EmailMultiAlternatives(
+            subject_template(context, TEMPLATE_HELPERS),
+            html2text.html2text(message),
+            from_email,
+            recipient_list,
+        )
+        email.attach_alternative(message, "text/html")
+        messages.append(email)
+    if not messages:
+        return 0
+    return get_email_backend(config).send_messages(messages)
+
+
 def validate_email_config(config: EmailConfig):
     email_backend = EmailBackend(
         host=config.host,
@@ -322,7 +381,6 @@ def validate_format_of_provided_templates(
 
     if not plugin_configuration.active:
         return
-    compiler = pybars.Compiler()
     errors: dict[str, ValidationError] = {}
     for email_data in email_templates_data:
         field: str = email_data["name"]
@@ -330,7 +388,7 @@ def validate_format_of_provided_templates(
         if not template_str or template_str == DEFAULT_EMAIL_VALUE:
             continue
         try:
-            compiler.compile(template_str)
+            compile_template(template_str)
         except pybars.PybarsError:
             errors[field] = ValidationError(
                 "The provided template has an inccorect structure.",
@@ -1,10 +1,14 @@
 from collections import defaultdict
 from collections.abc import Iterable
+from dataclasses import dataclass
 from decimal import Decimal
 from typing import TYPE_CHECKING, Any, Callable, Optional, Union
+from uuid import uuid4
 
 import opentracing
 from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
 from django.http import HttpResponse, HttpResponseNotFound
 from django.utils.module_loading import import_string
 from graphene import Mutation
@@ -88,6 +92,42 @@ if TYPE_CHECKING:
 
 NotifyEventTypeChoice = str
 
+PLUGINS_REGISTRY_VERSION_CACHE_KEY = "plugins_registry_version"
+
+
+@dataclass(frozen=True)
+class PluginsRegistry:
+    """Channels and plugin configurations shared by managers of a single process."""
+
+    version: Optional[str]
+    channel_map: dict[int, "Channel"]
+    global_db_configs: dict[str, PluginConfiguration]
+    channel_db_configs: dict["Channel", dict[str, PluginConfiguration]]
+
+
+_plugins_registry: Optional[PluginsRegistry] = None
+
+
+def get_plugins_registry_version() -> str:
+    version = cache.get(PLUGINS_REGISTRY_VERSION_CACHE_KEY)
+    if version is None:
+        cache.add(PLUGINS_REGISTRY_VERSION_CACHE_KEY, uuid4().hex, timeout=None)
+        version = cache.get(PLUGINS_REGISTRY_VERSION_CACHE_KEY)
+    return version
+
+
+def invalidate_plugins_registry():
+    """Make all processes reload channels and plugin configurations.
+
+    The version is bumped once the current transaction is committed, so other
+    processes can't cache the state from before the change under the new version.
+    """
+
+    def bump_version():
+        cache.set(PLUGINS_REGISTRY_VERSION_CACHE_KEY, uuid4().hex, timeout=None)
+
+    transaction.on_commit(bump_version)
+
 
 class PluginsManager(PaymentInterface):
     """Base manager for handling plugins logic."""
@@ -138,10 +178,10 @@ class PluginsManager(PaymentInterface):
             self.global_plugins = []
             self.plugins_per_channel = defaultdict(list)
 
-            channel_map = self._get_channel_map()
-            global_db_configs, channel_db_configs = self._get_db_plugin_configs(
-                channel_map
-            )
+            registry = self._get_registry()
+            channel_map = registry.channel_map
+            global_db_configs = registry.global_db_configs
+            channel_db_configs = registry.channel_db_configs
 
             for plugin_path in plugins:
                 with opentracing.global_tracer().start_active_span(f"{plugin_path}"):
@@ -171,11 +211,39 @@ class PluginsManager(PaymentInterface):
             for channel in channel_map.values():
                 self.plugins_per_channel[channel.slug].extend(self.global_plugins)
 
-    def _get_db_plugin_configs(self, channel_map):
+    def _get_registry(self) -> PluginsRegistry:
+        """Return channels and plugin configurations used to load the plugins.
+
+        When `PLUGINS_MANAGER_CACHE_ENABLED` is set, the data is loaded once per
+        registry version and reused by all managers created in the process.
+        """
+        global _plugins_registry
+
+        if not settings.PLUGINS_MANAGER_CACHE_ENABLED:
+            channel_map = self._get_channel_map()
+            return PluginsRegistry(
+                None, channel_map, *self._get_db_plugin_configs(channel_map)
+            )
+
+        version = get_plugins_registry_version()
+        registry = _plugins_registry
+        if registry is None or registry.version != version:
+            # The registry is shared with all requests, so it's always loaded from
+            # the default database to not cache replication lag.
+            database = settings.DATABASE_CONNECTION_DEFAULT_NAME
+            channel_map = self._get_channel_map(database)
+            registry = PluginsRegistry(
+                version,
+                channel_map,
+                *self._get_db_plugin_configs(channel_map, database),
+            )
+            _plugins_registry = registry
+        return registry
+
+    def _get_db_plugin_configs(self, channel_map, database: Optional[str] = None):
+        database = database or self.database
         with opentracing.global_tracer().start_active_span("_get_db_plugin_configs"):
-            plugin_manager_configs = PluginConfiguration.objects.using(
-                self.database
-            ).all()
+            plugin_manager_configs = PluginConfiguration.objects.using(database).all()
             channel_configs: defaultdict[Channel, dict] = defaultdict(dict)
             global_configs = {}
             for db_plugin_config in plugin_manager_configs.iterator():
@@ -639,6 +707,44 @@ class PluginsManager(PaymentInterface):
             channel_slug=order.channel.slug,
         )
 
+    def get_taxes_for_orders(
+        self, orders: Iterable["Order"], app_identifier
+    ) -> dict[Any, Optional[TaxData]]:
+        """Return tax data of the orders by order id.
+
+        Like `get_taxes_for_order`, the first plugin that returns tax data for an
+        order wins. Plugins without bulk calculation support process the orders
+        one by one.
+        """
+        orders_by_channel: defaultdict[str, list["Order"]] = defaultdict(list)
+        for order in orders:
+            orders_by_channel[order.channel.slug].append(order)
+
+        taxes: dict[Any, Optional[TaxData]] = {}
+        for channel_slug, channel_orders in orders_by_channel.items():
+            for plugin in self.get_plugins(channel_slug=channel_slug):
+                if not channel_orders:
+                    break
+                plugin_taxes = self.__run_method_on_single_plugin(
+                    plugin, "get_taxes_for_orders", None, channel_orders, app_identifier
+                )
+                if plugin_taxes is None:
+                    plugin_taxes = {
+                        order.pk: self.__run_method_on_single_plugin(
+                            plugin, "get_taxes_for_order", None, order, app_identifier
+                        )
+                        for order in channel_orders
+                    }
+                for order_pk, tax_data in plugin_taxes.items():
+                    if tax_data is not None:
+                        taxes[order_pk] = tax_data
+                channel_orders = [
+                    order for order in channel_orders if order.pk not in taxes
+                ]
+            for order in channel_orders:
+                taxes[order.pk] = None
+        return taxes
+
     def preprocess_order_creation(
         self,
         checkout_info: "CheckoutInfo",
@@ -2015,6 +2121,7 @@ class PluginsManager(PaymentInterface):
                 configuration.description = plugin.PLUGIN_DESCRIPTION
                 plugin.active = configuration.active
                 plugin.configuration = configuration.configuration
+                invalidate_plugins_registry()
                 return configuration
 
     def get_plugin(
@@ -2206,10 +2313,11 @@ class PluginsManager(PaymentInterface):
         only_active_plugins = [plugin for plugin in plugins if plugin.active]
         return any([plugin.is_event_active(event) for plugin in only_active_plugins])
 
-    def _get_channel_map(self):
+    def _get_channel_map(self, database: Optional[str] = None):
+        database = database or self.database
         return {
             channel.pk: channel
-            for channel in Channel.objects.using(self.database).all().iterator()
+            for channel in Channel.objects.using(database).all().iterator()
         }
 
 
@@ -0,0 +1,243 @@
+from typing import TYPE_CHECKING, Any
+
+from django.db.models import ForeignKey
+
+from ...graphql.response_cache import (
+    get_instance_tag,
+    get_model_tag,
+    invalidate_response_cache,
+)
+from ...menu.models import Menu, MenuItem
+from ...product.models import Category, Collection, Product, ProductVariant
+from ..base_plugin import BasePlugin
+
+if TYPE_CHECKING:
+    from ...core.utils.translations import Translation
+    from ...discount.models import Promotion
+    from ...product.models import ProductMedia
+    from ...warehouse.models import Stock
+
+# Products and variants are filtered and sorted by most of their fields, so their
+# changes invalidate all cached responses with products instead of the changed ones.
+PRODUCT_TAGS = [get_model_tag(Product), get_model_tag(ProductVariant)]
+
+
+class ResponseCachePlugin(BasePlugin):
+    """Invalidate cached responses to anonymous storefront queries.
+
+    Responses are cached only when `GRAPHQL_RESPONSE_CACHE_TIMEOUT` is set.
+    """
+
+    PLUGIN_NAME = "Response cache"
+    PLUGIN_ID = "saleor.response_cache"
+    DEFAULT_ACTIVE = True
+    PLUGIN_DESCRIPTION = (
+        "Invalidate cached responses to anonymous storefront queries when products, "
+        "categories, collections, menus or translations change."
+    )
+    CONFIGURATION_PER_CHANNEL = False
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.active = True
+
+    def _invalidate_products(self):
+        invalidate_response_cache(PRODUCT_TAGS)
+
+    def product_created(
+        self, product: "Product", previous_value: Any, webhooks=None
+    ) -> Any:
+        self._invalidate_products()
+        return previous_value
+
+    def product_updated(
+        self, product: "Product", previous_value: Any, webhooks=None
+    ) -> Any:
+        self._invalidate_products()
+        return previous_value
+
+    def product_deleted(
+        self,
+        product: "Product",
+        variants: list[int],
+        previous_value: Any,
+        webhooks=None,
+    ) -> Any:
+        self._invalidate_products()
+        return previous_value
+
+    def product_metadata_updated(self, product: "Product", previous_value: Any) -> Any:
+        invalidate_response_cache([get_instance_tag(Product, product.pk)])
+        return previous_value
+
+    def product_media_created(self, media: "ProductMedia", previous_value: Any) -> Any:
+        invalidate_response_cache([get_instance_tag(Product, media.product_id)])
+        return previous_value
+
+    def product_media_updated(self, media: "ProductMedia", previous_value: Any) -> Any:
+        invalidate_response_cache([get_instance_tag(Product, media.product_id)])
+        return previous_value
+
+    def product_media_deleted(self, media: "ProductMedia", previous_value: Any) -> Any:
+        invalidate_response_cache([get_instance_tag(Product, media.product_id)])
+        return previous_value
+
+    def product_variant_created(
+        self, product_variant: "ProductVariant", previous_value: Any, webhooks=None
+    ) -> Any:
+        self._invalidate_products()
+        return previous_value
+
+    def product_variant_updated(
+        self,
+        product_variant: "ProductVariant",
+        previous_value: Any,
+        webhooks=None,
+        **kwargs,
+    ) -> Any:
+        self._invalidate_products()
+        return previous_value
+
+    def product_variant_deleted(
+        self, product_variant: "ProductVariant", previous_value: Any, webhooks=None
+    ) -> Any:
+        self._invalidate_products()
+        return previous_value
+
+    def product_variant_metadata_updated(
+        self, product_variant: "ProductVariant", previous_value: Any
+    ) -> Any:
+        invalidate_response_cache(
+            [get_instance_tag(ProductVariant, product_variant.pk)]
+        )
+        return previous_value
+
+    def _invalidate_stock(self, stock: "Stock"):
+        variant = stock.product_variant
+        invalidate_response_cache(
+            [
+                get_instance_tag(ProductVariant, variant.pk),
+                get_instance_tag(Product, variant.product_id),
+            ]
+        )
+
+    def product_variant_out_of_stock(
+        self, stock: "Stock", previous_value: Any, webhooks=None
+    ) -> Any:
+        self._invalidate_stock(stock)
+        return previous_value
+
+    def product_variant_back_in_stock(
+        self, stock: "Stock", previous_value: Any, webhooks=None
+    ) -> Any:
+        self._invalidate_stock(stock)
+        return previous_value
+
+    def promotion_created(self, promotion: "Promotion", previous_value: Any):
+        self._invalidate_products()
+        return previous_value
+
+    def promotion_updated(self, promotion: "Promotion", previous_value: Any):
+        self._invalidate_products()
+        return previous_value
+
+    def promotion_deleted(
+        self, promotion: "Promotion", previous_value: Any, webhooks=None
+    ):
+        self._invalidate_products()
+        return previous_value
+
+    def promotion_started(
+        self, promotion: "Promotion", previous_value: Any, webhooks=None
+    ):
+        self._invalidate_products()
+        return previous_value
+
+    def promotion_ended(
+        self, promotion: "Promotion", previous_value: Any, webhooks=None
+    ):
+        self._invalidate_products()
+        return previous_value
+
+    def category_created(self, category: "Category", previous_value: None) -> None:
+        invalidate_response_cache([get_model_tag(Category)])
+        return previous_value
+
+    def category_updated(self, category: "Category", previous_value: None) -> None:
+        invalidate_response_cache([get_instance_tag(Category, category.pk)])
+        return previous_value
+
+    def category_deleted(
+        self, category: "Category", previous_value: None, webhooks=None
+    ) -> None:
+        invalidate_response_cache([get_model_tag(Category)])
+        return previous_value
+
+    def collection_created(self, collection: "Collection", previous_value: Any) -> Any:
+        invalidate_response_cache([get_model_tag(Collection)])
+        return previous_value
+
+    def collection_updated(self, collection: "Collection", previous_value: Any) -> Any:
+        invalidate_response_cache([get_instance_tag(Collection, collection.pk)])
+        return previous_value
+
+    def collection_deleted(
+        self, collection: "Collection", previous_value: Any, webhooks=None
+    ) -> Any:
+        invalidate_response_cache([get_model_tag(Collection)])
+        return previous_value
+
+    def collection_metadata_updated(
+        self, collection: "Collection", previous_value: Any
+    ) -> Any:
+        invalidate_response_cache([get_instance_tag(Collection, collection.pk)])
+        return previous_value
+
+    def menu_created(self, menu: "Menu", previous_value: None) -> None:
+        invalidate_response_cache([get_model_tag(Menu)])
+        return previous_value
+
+    def menu_updated(self, menu: "Menu", previous_value: None) -> None:
+        invalidate_response_cache([get_instance_tag(Menu, menu.pk)])
+        return previous_value
+
+    def menu_deleted(self, menu: "Menu", previous_value: None, webhooks=None) -> None:
+        invalidate_response_cache([get_model_tag(Menu)])
+        return previous_value
+
+    def _invalidate_menu_items(self, menu_item: "MenuItem"):
+        # Responses with menus without items are tagged with the menu only.
+        invalidate_response_cache(
+            [get_model_tag(MenuItem), get_instance_tag(Menu, menu_item.menu_id)]
+        )
+
+    def menu_item_created(self, menu_item: "MenuItem", previous_value: None) -> None:
+        self._invalidate_menu_items(menu_item)
+        return previous_value
+
+    def menu_item_updated(self, menu_item: "MenuItem", previous_value: None) -> None:
+        invalidate_response_cache([get_instance_tag(MenuItem, menu_item.pk)])
+        return previous_value
+
+    def menu_item_deleted(
+        self, menu_item: "MenuItem", previous_value: None, webhooks=None
+    ) -> None:
+        self._invalidate_menu_items(menu_item)
+        return previous_value
+
+    def _invalidate_translation(self, translation: "Translation"):
+        # Responses without the translation are tagged with the translated object.
+        tags = [get_instance_tag(type(translation), translation.pk)]
+        for field in translation._meta.fields:
+            if isinstance(field, ForeignKey):
+                object_id = getattr(translation, field.attname)
+                tags.append(get_instance_tag(field.target_field.model, object_id))
+        invalidate_response_cache(tags)
+
+    def translation_created(self, translation: "Translation", previous_value: Any):
+        self._invalidate_translation(translation)
+        return previous_value
+
+    def translation_updated(self, translation: "Translation", previous_value: Any):
+        self._invalidate_translation(translation)
+        return previous_value
@@ -0,0 +1,137 @@
+import time
+
+import pytest
+from django.core.cache import cache
+
+from ....graphql.response_cache import (
+    cache_response,
+    get_cached_response,
+    get_instance_tag,
+    get_model_tag,
+)
+from ....menu.models import Menu, MenuItem
+from ....product.models import Category, Product, ProductTranslation, ProductVariant
+from ...manager import get_plugins_manager
+
+CACHE_KEY = "response"
+DATA = {"data": "value"}
+
+
+@pytest.fixture(autouse=True)
+def _enable_response_cache(settings):
+    settings.GRAPHQL_RESPONSE_CACHE_TIMEOUT = 60
+    settings.PLUGINS = ["saleor.plugins.response_cache.plugin.ResponseCachePlugin"]
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def manager():
+    return get_plugins_manager(allow_replica=False)
+
+
+def _cache_response(*tags):
+    cache_response(CACHE_KEY, DATA, set(tags), time.time(), timeout=60)
+    assert get_cached_response(CACHE_KEY) == DATA
+
+
+def test_product_updated_invalidates_all_product_responses(manager, product):
+    # given
+    _cache_response(get_model_tag(Product))
+
+    # when
+    manager.product_updated(product)
+
+    # then
+    assert get_cached_response(CACHE_KEY) is None
+
+
+def test_category_updated_invalidates_category_responses(manager, categories):
+    # given
+    category, other_category = categories
+    _cache_response(get_model_tag(Category), get_instance_tag(Category, category.pk))
+
+    # when
+    manager.category_updated(other_category)
+
+    # then
+    assert get_cached_response(CACHE_KEY) == DATA
+
+    # when
+    manager.category_updated(category)
+
+    # then
+    assert get_cached_response(CACHE_KEY) is None
+
+
+def test_translation_created_invalidates_translated_object_responses(
+    manager, product_translation_fr
+):
+    # given
+    _cache_response(get_instance_tag(Product, product_translation_fr.product_id))
+
+    # when
+    manager.translation_created(product_translation_fr)
+
+    # then
+    assert get_cached_response(CACHE_KEY) is None
+
+
+def test_translation_updated_invalidates_translation_responses(
+    manager, product_translation_fr
+):
+    # given
+    _cache_response(get_instance_tag(ProductTranslation, product_translation_fr.pk))
+
+    # when
+    manager.translation_updated(product_translation_fr)
+
+    # then
+    assert get_cached_response(CACHE_KEY) is None
+
+
+def test_menu_item_created_invalidates_menu_responses(manager, menu_item):
+    # given
+    _cache_response(get_model_tag(Menu), get_instance_tag(Menu, menu_item.menu_id))
+
+    # when
+    manager.menu_item_created(menu_item)
+
+    # then
+    assert get_cached_response(CACHE_KEY) is None
+
+
+def test_menu_item_updated_invalidates_menu_item_responses(manager, menu_item):
+    # given
+    _cache_response(get_instance_tag(MenuItem, menu_item.pk))
+
+    # when
+    manager.menu_item_updated(menu_item)
+
+    # then
+    assert get_cached_response(CACHE_KEY) is None
+
+
+def test_product_variant_out_of_stock_invalidates_variant_responses(manager, stock):
+    # given
+    _cache_response(get_instance_tag(ProductVariant, stock.product_variant_id))
+
+    # when
+    manager.product_variant_out_of_stock(stock)
+
+    # then
+    assert get_cached_response(CACHE_KEY) is None
+
+
+def test_response_cache_not_invalidated_when_disabled(manager, product, settings):
+    # given
+    _cache_response(get_model_tag(Product))
+    settings.GRAPHQL_RESPONSE_CACHE_TIMEOUT = 0
+
+    # when
+    manager.product_updated(product)
+
+    # then
+    settings.GRAPHQL_RESPONSE_CACHE_TIMEOUT = 60
+    assert get_cached_response(CACHE_KEY) == DATA
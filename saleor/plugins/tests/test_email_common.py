@@ -1,13 +1,17 @@
 import json
 from unittest.mock import patch
 
+import pybars
 import pytest
 from django.core.exceptions import ValidationError
 
 from ...order.notifications import get_image_payload
 from ..email_common import (
     DEFAULT_EMAIL_CONFIGURATION,
+    EmailConfig,
+    compile_template,
     get_product_image_thumbnail,
+    send_email_batch,
     validate_default_email_configuration,
 )
 from ..error_codes import PluginErrorCode
@@ -84,3 +88,61 @@ def test_get_product_image_thumbnail_simulate_json_dump_and_load(product_with_im
 
     # then
     assert thumbnail == image_data["original"]["128"]
+
+
+@patch("saleor.plugins.email_common.pybars.Compiler", wraps=pybars.Compiler)
+def test_compile_template_compiles_template_once(mocked_compiler):
+    # given
+    template_str = "<p>Hello {{ user.first_name }} compile once</p>"
+
+    # when
+    template = compile_template(template_str)
+    cached_template = compile_template(template_str)
+
+    # then
+    assert cached_template is template
+    assert mocked_compiler.call_count == 1
+    assert template({"user": {"first_name": "John"}}) == (
+        "<p>Hello John compile once</p>"
+    )
+
+
+def test_compile_template_incorrect_structure():
+    # when & then
+    with pytest.raises(pybars.PybarsError):
+        compile_template("{{#each}}{{/if}}")
+
+
+@patch("saleor.plugins.email_common.EmailBackend.send_messages")
+def test_send_email_batch(mocked_send_messages):
+    # given
+    mocked_send_messages.return_value = 2
+    config = EmailConfig(
+        host="localhost",
+        port="1025",
+        sender_name="Saleor",
+        sender_address="noreply@example.com",
+    )
+
+    # when
+    sent = send_email_batch(
+        config,
+        [
+            (["john@example.com"], {"name": "John"}),
+            (["jane@example.com"], {"name": "Jane"}),
+        ],
+        subject="Hi {{ name }}",
+        template_str="<p>Hello {{ name }}</p>",
+    )
+
+    # then
+    assert sent == 2
+    mocked_send_messages.assert_called_once()
+    john_email, jane_email = mocked_send_messages.call_args.args[0]
+    assert john_email.to == ["john@example.com"]
+    assert john_email.subject == "Hi John"
+    assert john_email.from_email == "Saleor <noreply@example.com>"
+    assert john_email.alternatives == [("<p>Hello John</p>", "text/html")]
+    assert jane_email.to == ["jane@example.com"]
+    assert jane_email.subject == "Hi Jane"
+    assert jane_email.alternatives == [("<p>Hello Jane</p>", "text/html")]
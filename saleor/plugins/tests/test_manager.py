@@ -5,6 +5,7 @@ from unittest import mock
 from unittest.mock import patch
 
 import pytest
+from django.core.cache import cache
 from django.http import HttpResponseNotFound, JsonResponse
 from django.test import override_settings
 from prices import Money, TaxedMoney
@@ -35,7 +36,12 @@ from ...payment.interface import (
 )
 from ...product.models import Product
 from ..base_plugin import ExternalAccessTokens
-from ..manager import PluginsManager, get_plugins_manager
+from ..manager import (
+    PLUGINS_REGISTRY_VERSION_CACHE_KEY,
+    PluginsManager,
+    get_plugins_manager,
+    invalidate_plugins_registry,
+)
 from ..models import PluginConfiguration
 from ..tests.sample_plugins import (
     ACTIVE_PLUGINS,
@@ -106,6 +112,44 @@ def test_manager_with_channel_plugins(
     assert len(manager.all_plugins) == 2
 
 
+def test_manager_reuses_cached_registry(
+    settings, channel_USD, channel_PLN, django_assert_num_queries
+):
+    # given
+    settings.PLUGINS = ["saleor.plugins.tests.sample_plugins.ChannelPluginSample"]
+    settings.PLUGINS_MANAGER_CACHE_ENABLED = True
+    cache.delete(PLUGINS_REGISTRY_VERSION_CACHE_KEY)
+    get_plugins_manager(allow_replica=False)
+
+    # when
+    with django_assert_num_queries(0):
+        manager = get_plugins_manager(allow_replica=False)
+
+    # then
+    assert {channel_PLN.slug, channel_USD.slug} == set(
+        manager.plugins_per_channel.keys()
+    )
+
+
+def test_manager_reloads_registry_after_invalidation(
+    settings, channel_USD, channel_PLN, django_capture_on_commit_callbacks
+):
+    # given
+    settings.PLUGINS = ["saleor.plugins.tests.sample_plugins.ChannelPluginSample"]
+    settings.PLUGINS_MANAGER_CACHE_ENABLED = True
+    cache.delete(PLUGINS_REGISTRY_VERSION_CACHE_KEY)
+    get_plugins_manager(allow_replica=False)
+    channel_PLN.delete()
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        invalidate_plugins_registry()
+    manager = get_plugins_manager(allow_replica=False)
+
+    # then
+    assert set(manager.plugins_per_channel.keys()) == {channel_USD.slug}
+
+
 def test_manager_get_plugins_with_channel_slug(
     settings, channel_USD, plugin_configuration, inactive_plugin_configuration
 ):
@@ -586,6 +630,26 @@ def test_manager_get_taxes_for_order(
     ) == expected_tax_data(order)
 
 
+@pytest.mark.parametrize(
+    ("plugins", "expected_tax_data"),
+    [
+        ([], sample_none_data),
+        (["saleor.plugins.tests.sample_plugins.PluginSample"], sample_tax_data),
+    ],
+)
+def test_manager_get_taxes_for_orders(order_list, plugins, expected_tax_data):
+    # given
+    app_identifier = None
+
+    # when
+    taxes = PluginsManager(plugins=plugins).get_taxes_for_orders(
+        order_list, app_identifier
+    )
+
+    # then
+    assert taxes == {order.pk: expected_tax_data(order) for order in order_list}
+
+
 def test_manager_sale_created(promotion_converted_from_sale):
     plugins = ["saleor.plugins.tests.sample_plugins.PluginSample"]
 
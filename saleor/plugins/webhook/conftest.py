@@ -61,6 +61,17 @@ def tax_order_webhook(tax_app):
     return webhook
 
 
+@pytest.fixture
+def tax_order_bulk_webhook(tax_app):
+    webhook = Webhook.objects.create(
+        name="Tax order bulk webhook",
+        app=tax_app,
+        target_url="https://www.example.com/tax-order-bulk",
+    )
+    webhook.events.create(event_type=WebhookEventSyncType.ORDER_CALCULATE_TAXES_BULK)
+    return webhook
+
+
 @pytest.fixture
 def tax_app_with_webhooks(tax_app, tax_checkout_webhook, tax_order_webhook):
     return tax_app
@@ -72,6 +72,7 @@ from ...webhook.payloads import (
     generate_metadata_updated_payload,
     generate_order_payload,
     generate_order_payload_for_tax_calculation,
+    generate_orders_payload_for_tax_calculation,
     generate_page_payload,
     generate_payment_payload,
     generate_product_deleted_payload,
@@ -119,6 +120,7 @@ from ...webhook.transport.utils import (
     parse_list_payment_gateways_response,
     parse_payment_action_response,
     parse_tax_data,
+    parse_tax_data_bulk,
     trigger_transaction_request,
 )
 from ...webhook.utils import get_webhooks_for_event
@@ -3001,13 +3003,7 @@ class WebhookPlugin(BasePlugin):
             **kwargs,
         )
 
-    def __run_tax_webhook(
-        self,
-        event_type: str,
-        app_identifier: str,
-        payload_gen: Callable,
-        subscriptable_object=None,
-    ):
+    def __get_tax_app(self, app_identifier: str):
         app = (
             App.objects.filter(
                 identifier=app_identifier,
@@ -3018,13 +3014,33 @@ class WebhookPlugin(BasePlugin):
         )
         if app is None:
             logger.warning("Configured tax app doesn't exists.")
+        return app
+
+    def __get_tax_webhook(self, event_type: str, app_identifier: str):
+        app = self.__get_tax_app(app_identifier)
+        if app is None:
             return None
+        return self.__get_tax_app_webhook(event_type, app)
+
+    def __get_tax_app_webhook(self, event_type: str, app: App):
         webhook = get_webhooks_for_event(event_type, apps_ids=[app.id]).first()
         if webhook is None:
             logger.warning(
                 "Configured tax app's webhook for checkout taxes doesn't exists."
             )
             return None
+        return webhook
+
+    def __run_tax_webhook(
+        self,
+        event_type: str,
+        app_identifier: str,
+        payload_gen: Callable,
+        subscriptable_object=None,
+    ):
+        webhook = self.__get_tax_webhook(event_type, app_identifier)
+        if webhook is None:
+            return None
 
         request_context = initialize_request(
             self.requestor,
@@ -3087,6 +3103,89 @@ class WebhookPlugin(BasePlugin):
                 self.requestor,
             )
 
+    def get_taxes_for_orders(
+        self, orders: Iterable["Order"], app_identifier, previous_value
+    ) -> Optional[dict[Any, Optional["TaxData"]]]:
+        """Calculate taxes of many orders with the configured tax app.
+
+        When the tax app subscribes to ORDER_CALCULATE_TAXES_BULK, taxes of all
+        orders are requested with a single webhook. Otherwise, the tax app and its
+        webhook are resolved once for all orders, while taxes of each order are
+        requested with a separate ORDER_CALCULATE_TAXES webhook. Without the tax app
+        identifier, the orders are processed one by one by `get_taxes_for_order`.
+        """
+        if not app_identifier:
+            return previous_value
+        orders = list(orders)
+        app = self.__get_tax_app(app_identifier)
+        if app is None:
+            return {order.pk: None for order in orders}
+
+        bulk_webhook = get_webhooks_for_event(
+            WebhookEventSyncType.ORDER_CALCULATE_TAXES_BULK, apps_ids=[app.id]
+        ).first()
+        if bulk_webhook is not None:
+            return self.__get_taxes_for_orders_in_bulk(orders, bulk_webhook)
+
+        event_type = WebhookEventSyncType.ORDER_CALCULATE_TAXES
+        webhook = self.__get_tax_app_webhook(event_type, app)
+        if webhook is None:
+            return {order.pk: None for order in orders}
+
+        request_context = initialize_request(
+            self.requestor,
+            True,
+            allow_replica=False,
+            event_type=event_type,
+        )
+        taxes = {}
+        for order in orders:
+            # the payload of subscription webhooks is generated from the order
+            payload = (
+                ""
+                if webhook.subscription_query
+                else generate_order_payload_for_tax_calculation(order)
+            )
+            response = trigger_webhook_sync(
+                event_type=event_type,
+                webhook=webhook,
+                payload=payload,
+                allow_replica=False,
+                subscribable_object=order,
+                request=request_context,
+            )
+            taxes[order.pk] = parse_tax_data(response)
+        return taxes
+
+    def __get_taxes_for_orders_in_bulk(
+        self, orders: list["Order"], webhook: "Webhook"
+    ) -> dict[Any, Optional["TaxData"]]:
+        event_type = WebhookEventSyncType.ORDER_CALCULATE_TAXES_BULK
+        request_context = initialize_request(
+            self.requestor,
+            True,
+            allow_replica=False,
+            event_type=event_type,
+        )
+        # the payload of subscription webhooks is generated from the orders
+        payload = (
+            ""
+            if webhook.subscription_query
+            else generate_orders_payload_for_tax_calculation(orders)
+        )
+        response = trigger_webhook_sync(
+            event_type=event_type,
+            webhook=webhook,
+            payload=payload,
+            allow_replica=False,
+            subscribable_object=orders,
+            request=request_context,
+        )
+        taxes = parse_tax_data_bulk(response, len(orders))
+        if taxes is None:
+            return {order.pk: None for order in orders}
+        return {order.pk: tax_data for order, tax_data in zip(orders, taxes)}
+
     def get_shipping_methods_for_checkout(
         self, checkout: "Checkout", previous_value: Any
     ) -> list["ShippingMethodData"]:
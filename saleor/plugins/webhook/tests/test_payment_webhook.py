@@ -279,6 +279,164 @@ def test_send_webhook_request_sync_invalid_scheme(webhook, app):
         send_webhook_request_sync(delivery)
 
 
+@mock.patch("saleor.webhook.observability.report_event_delivery_attempt")
+@mock.patch.object(HTTPSession, "request")
+def test_trigger_webhook_sync_not_persistent_successful_attempt(
+    mock_post, mock_observability, payment_app, settings
+):
+    # given
+    settings.WEBHOOK_SYNC_DELIVERIES_PERSISTENT = False
+    mock_post().ok = True
+    mock_post().text = '{"key": "response_text"}'
+    mock_post().headers = {"header_key": "header_val"}
+    mock_post().status_code = 200
+    mock_post().elapsed = datetime.timedelta(seconds=2)
+
+    # when
+    response_data = trigger_webhook_sync(
+        WebhookEventSyncType.PAYMENT_CAPTURE,
+        '{"key": "value"}',
+        payment_app.webhooks.first(),
+        False,
+    )
+
+    # then
+    assert response_data == {"key": "response_text"}
+    assert not EventPayload.objects.exists()
+    assert not EventDelivery.objects.exists()
+    assert not EventDeliveryAttempt.objects.exists()
+    attempt = mock_observability.call_args.args[0]
+    assert attempt.status == EventDeliveryStatus.SUCCESS
+    assert attempt.delivery.status == EventDeliveryStatus.SUCCESS
+
+
+@mock.patch("saleor.webhook.observability.utils.put_event")
+@mock.patch("saleor.webhook.observability.utils.get_webhooks")
+@mock.patch.object(HTTPSession, "request")
+def test_trigger_webhook_sync_not_persistent_successful_attempt_observability(
+    mock_post, mock_get_webhooks, mock_put_event, payment_app, settings
+):
+    # given
+    settings.OBSERVABILITY_ACTIVE = True
+    settings.WEBHOOK_SYNC_DELIVERIES_PERSISTENT = False
+    mock_get_webhooks.return_value = [mock.Mock()]
+    mock_post().ok = True
+    mock_post().text = '{"key": "response_text"}'
+    mock_post().headers = {"header_key": "header_val"}
+    mock_post().status_code = 200
+    mock_post().elapsed = datetime.timedelta(seconds=2)
+
+    # when
+    trigger_webhook_sync(
+        WebhookEventSyncType.PAYMENT_CAPTURE,
+        '{"key": "value"}',
+        payment_app.webhooks.first(),
+        False,
+    )
+
+    # then
+    generate_payload = mock_put_event.call_args.args[0]
+    payload = json.loads(generate_payload())
+    assert payload["id"] is None
+    assert payload["status"] == EventDeliveryStatus.SUCCESS
+    assert payload["eventDelivery"]["id"] is None
+    assert payload["eventDelivery"]["eventType"] == (
+        WebhookEventSyncType.PAYMENT_CAPTURE
+    )
+
+
+@mock.patch("saleor.webhook.observability.report_event_delivery_attempt")
+@mock.patch.object(HTTPSession, "request")
+def test_trigger_webhook_sync_not_persistent_sampled_successful_attempt(
+    mock_post, mock_observability, payment_app, settings
+):
+    # given
+    settings.WEBHOOK_SYNC_DELIVERIES_PERSISTENT = False
+    settings.WEBHOOK_SYNC_DELIVERIES_SAMPLE_RATE = 1
+    mock_post().ok = True
+    mock_post().text = '{"key": "response_text"}'
+    mock_post().headers = {"header_key": "header_val"}
+    mock_post().status_code = 200
+    mock_post().elapsed = datetime.timedelta(seconds=2)
+
+    # when
+    trigger_webhook_sync(
+        WebhookEventSyncType.PAYMENT_CAPTURE,
+        '{"key": "value"}',
+        payment_app.webhooks.first(),
+        False,
+    )
+
+    # then
+    delivery = EventDelivery.objects.get()
+    assert delivery.status == EventDeliveryStatus.SUCCESS
+    assert delivery.payload.payload == '{"key": "value"}'
+    assert delivery.attempts.get().status == EventDeliveryStatus.SUCCESS
+
+
+@mock.patch("saleor.webhook.observability.report_event_delivery_attempt")
+@mock.patch.object(HTTPSession, "request")
+def test_trigger_webhook_sync_not_persistent_failed_attempt(
+    mock_post, mock_observability, payment_app, settings
+):
+    # given
+    settings.WEBHOOK_SYNC_DELIVERIES_PERSISTENT = False
+    mock_post().ok = False
+    mock_post().text = '{"key": "response_text"}'
+    mock_post().headers = {"header_key": "header_val"}
+    mock_post().status_code = 500
+    mock_post().elapsed = datetime.timedelta(seconds=2)
+
+    # when
+    response_data = trigger_webhook_sync(
+        WebhookEventSyncType.PAYMENT_CAPTURE,
+        '{"key": "value"}',
+        payment_app.webhooks.first(),
+        False,
+    )
+
+    # then
+    assert response_data is None
+    delivery = EventDelivery.objects.get()
+    assert delivery.status == EventDeliveryStatus.FAILED
+    assert delivery.payload.payload == '{"key": "value"}'
+    attempt = delivery.attempts.get()
+    assert attempt.status == EventDeliveryStatus.FAILED
+    assert attempt.response_status_code == 500
+    mock_observability.assert_called_once_with(attempt)
+
+
+@mock.patch("saleor.webhook.observability.report_event_delivery_attempt")
+@mock.patch.object(HTTPSession, "request")
+def test_trigger_webhook_sync_not_persistent_failed_attempt_offloads_payload(
+    mock_post, mock_observability, payment_app, settings, media_root
+):
+    # given
+    settings.WEBHOOK_SYNC_DELIVERIES_PERSISTENT = False
+    settings.EVENT_PAYLOAD_FILE_THRESHOLD = 10
+    payload = '{"key": "value", "other_key": "other_value"}'
+    mock_post().ok = False
+    mock_post().text = '{"key": "response_text"}'
+    mock_post().headers = {"header_key": "header_val"}
+    mock_post().status_code = 500
+    mock_post().elapsed = datetime.timedelta(seconds=2)
+
+    # when
+    trigger_webhook_sync(
+        WebhookEventSyncType.PAYMENT_CAPTURE,
+        payload,
+        payment_app.webhooks.first(),
+        False,
+    )
+
+    # then
+    event_payload = EventDelivery.objects.get().payload
+    assert event_payload.payload == ""
+    assert event_payload.payload_file
+    assert event_payload.get_payload() == payload
+    assert json.loads(mock_post.call_args.kwargs["data"]) == json.loads(payload)
+
+
 @mock.patch("saleor.webhook.transport.synchronous.transport.send_webhook_request_sync")
 def test_get_payment_gateways(
     mock_send_request, payment_app, permission_manage_payments, webhook_plugin
@@ -11,7 +11,10 @@ from ....core.models import EventDelivery, EventPayload
 from ....core.taxes import TaxType
 from ....webhook.event_types import WebhookEventSyncType
 from ....webhook.models import Webhook
-from ....webhook.payloads import generate_order_payload_for_tax_calculation
+from ....webhook.payloads import (
+    generate_order_payload_for_tax_calculation,
+    generate_orders_payload_for_tax_calculation,
+)
 from ....webhook.transport.utils import (
     DEFAULT_TAX_CODE,
     DEFAULT_TAX_DESCRIPTION,
@@ -92,6 +95,160 @@ def test_get_taxes_for_order_no_permission(
     assert tax_data is None
 
 
+@mock.patch("saleor.webhook.transport.synchronous.transport.send_webhook_request_sync")
+def test_get_taxes_for_orders(
+    mock_request,
+    webhook_plugin,
+    tax_order_webhook,
+    tax_data_response,
+    order_list,
+):
+    # given
+    mock_request.return_value = tax_data_response
+    tax_app = tax_order_webhook.app
+    tax_app.identifier = "test.tax.app"
+    tax_app.save(update_fields=["identifier"])
+    plugin = webhook_plugin()
+
+    # when
+    taxes = plugin.get_taxes_for_orders(order_list, tax_app.identifier, None)
+
+    # then
+    assert taxes == {
+        order.pk: parse_tax_data(tax_data_response) for order in order_list
+    }
+    assert mock_request.call_count == len(order_list)
+    deliveries = EventDelivery.objects.all()
+    assert len(deliveries) == len(order_list)
+    assert {delivery.webhook for delivery in deliveries} == {tax_order_webhook}
+
+
+@mock.patch("saleor.webhook.transport.synchronous.transport.send_webhook_request_sync")
+def test_get_taxes_for_orders_in_bulk(
+    mock_request,
+    webhook_plugin,
+    tax_order_webhook,
+    tax_order_bulk_webhook,
+    tax_data_response,
+    order_list,
+):
+    # given
+    mock_request.return_value = [tax_data_response] * len(order_list)
+    tax_app = tax_order_bulk_webhook.app
+    tax_app.identifier = "test.tax.app"
+    tax_app.save(update_fields=["identifier"])
+    plugin = webhook_plugin()
+
+    # when
+    taxes = plugin.get_taxes_for_orders(order_list, tax_app.identifier, None)
+
+    # then
+    assert taxes == {
+        order.pk: parse_tax_data(tax_data_response) for order in order_list
+    }
+    delivery = EventDelivery.objects.get()
+    assert delivery.event_type == WebhookEventSyncType.ORDER_CALCULATE_TAXES_BULK
+    assert delivery.webhook == tax_order_bulk_webhook
+    assert delivery.payload.payload == generate_orders_payload_for_tax_calculation(
+        order_list
+    )
+    mock_request.assert_called_once_with(delivery)
+
+
+@mock.patch("saleor.webhook.transport.synchronous.transport.send_webhook_request_sync")
+def test_get_taxes_for_orders_in_bulk_with_sync_subscription(
+    mock_request,
+    webhook_plugin,
+    tax_data_response,
+    order_list,
+    tax_app,
+):
+    # given
+    mock_request.return_value = [tax_data_response] * len(order_list)
+    tax_app.identifier = "test.tax.app"
+    tax_app.save(update_fields=["identifier"])
+    plugin = webhook_plugin()
+    webhook = Webhook.objects.create(
+        name="Tax order bulk webhook",
+        app=tax_app,
+        target_url="https://localhost:8888/tax-order-bulk",
+        subscription_query=(
+            "subscription{event{... on CalculateTaxesBulk{taxBases{currency}}}}"
+        ),
+    )
+    webhook.events.create(event_type=WebhookEventSyncType.ORDER_CALCULATE_TAXES_BULK)
+
+    # when
+    taxes = plugin.get_taxes_for_orders(order_list, tax_app.identifier, None)
+
+    # then
+    payload = EventPayload.objects.get()
+    assert json.loads(payload.payload) == {
+        "taxBases": [{"currency": order.currency} for order in order_list]
+    }
+    delivery = EventDelivery.objects.get()
+    assert delivery.event_type == WebhookEventSyncType.ORDER_CALCULATE_TAXES_BULK
+    assert delivery.webhook == webhook
+    mock_request.assert_called_once_with(delivery)
+    assert taxes == {
+        order.pk: parse_tax_data(tax_data_response) for order in order_list
+    }
+
+
+@mock.patch("saleor.webhook.transport.synchronous.transport.send_webhook_request_sync")
+def test_get_taxes_for_orders_in_bulk_invalid_response(
+    mock_request,
+    webhook_plugin,
+    tax_order_bulk_webhook,
+    tax_data_response,
+    order_list,
+):
+    # given
+    mock_request.return_value = [tax_data_response]
+    tax_app = tax_order_bulk_webhook.app
+    tax_app.identifier = "test.tax.app"
+    tax_app.save(update_fields=["identifier"])
+    plugin = webhook_plugin()
+
+    # when
+    taxes = plugin.get_taxes_for_orders(order_list, tax_app.identifier, None)
+
+    # then
+    assert taxes == {order.pk: None for order in order_list}
+    mock_request.assert_called_once()
+
+
+@mock.patch("saleor.webhook.transport.synchronous.transport.send_webhook_request_sync")
+def test_get_taxes_for_orders_no_app_identifier(
+    mock_request, webhook_plugin, order_list
+):
+    # given
+    plugin = webhook_plugin()
+    previous_value = sentinel.PREVIOUS_VALUE
+
+    # when
+    taxes = plugin.get_taxes_for_orders(order_list, None, previous_value)
+
+    # then
+    assert taxes == previous_value
+    mock_request.assert_not_called()
+
+
+@mock.patch("saleor.webhook.transport.synchronous.transport.send_webhook_request_sync")
+def test_get_taxes_for_orders_app_does_not_exist(
+    mock_request, webhook_plugin, order_list
+):
+    # given
+    plugin = webhook_plugin()
+
+    # when
+    taxes = plugin.get_taxes_for_orders(order_list, "missing.app", None)
+
+    # then
+    assert taxes == {order.pk: None for order in order_list}
+    mock_request.assert_not_called()
+
+
 @pytest.fixture
 def tax_type():
     return TaxType(
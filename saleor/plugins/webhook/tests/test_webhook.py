@@ -50,7 +50,9 @@ from ....webhook.payloads import (
 from ....webhook.transport import signature_for_payload
 from ....webhook.transport.asynchronous.transport import (
     send_webhook_request_async,
+    send_webhook_request_batch_async,
     trigger_webhooks_async,
+    webhook_deliveries_batch,
 )
 from ....webhook.utils import get_webhooks_for_event
 from ...manager import get_plugins_manager
@@ -1935,6 +1937,44 @@ def test_send_webhook_request_async(
     mocked_observability.assert_called_once_with(attempt)
 
 
+@mock.patch(
+    "saleor.webhook.transport.asynchronous.transport.observability.report_event_delivery_attempt"
+)
+@mock.patch("saleor.webhook.transport.asynchronous.transport.clear_successful_delivery")
+@mock.patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhook_using_scheme_method"
+)
+def test_send_webhook_request_async_payload_in_file(
+    mocked_send_response,
+    mocked_clear_delivery,
+    mocked_observability,
+    event_delivery,
+    webhook_response,
+    settings,
+    media_root,
+):
+    # given
+    settings.EVENT_PAYLOAD_FILE_THRESHOLD = 1
+    payload = event_delivery.payload.payload
+    event_delivery.payload = EventPayload.objects.create_with_payload(payload)
+    event_delivery.save(update_fields=["payload"])
+    assert event_delivery.payload.payload_file
+    mocked_send_response.return_value = webhook_response
+
+    # when
+    send_webhook_request_async(event_delivery.pk)
+
+    # then
+    mocked_send_response.assert_called_once_with(
+        event_delivery.webhook.target_url,
+        "mirumee.com",
+        event_delivery.webhook.secret_key,
+        event_delivery.event_type,
+        payload,
+        event_delivery.webhook.custom_headers,
+    )
+
+
 @mock.patch(
     "saleor.webhook.transport.asynchronous.transport.send_webhook_using_scheme_method"
 )
@@ -2297,6 +2337,149 @@ def test_send_webhook_request_async_with_request_exception(
     mocked_observability.assert_called_once_with(attempt, None)
 
 
+@mock.patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhook_request_batch_async.delay"
+)
+@mock.patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhook_request_async.delay"
+)
+def test_trigger_webhooks_async_in_batch(
+    mocked_send_request, mocked_send_batch, webhook, settings
+):
+    # given
+    settings.WEBHOOK_ASYNC_BATCH_SIZE = 2
+    data = '{"key": "value"}'
+
+    # when
+    with webhook_deliveries_batch():
+        for _ in range(3):
+            trigger_webhooks_async(data, WebhookEventAsyncType.ORDER_CREATED, [webhook])
+
+    # then
+    mocked_send_request.assert_not_called()
+    delivery_ids = list(
+        EventDelivery.objects.order_by("id").values_list("id", flat=True)
+    )
+    assert mocked_send_batch.mock_calls == [
+        mock.call(delivery_ids[:2]),
+        mock.call(delivery_ids[2:]),
+    ]
+
+
+@mock.patch(
+    "saleor.webhook.transport.asynchronous.transport.observability.report_event_delivery_attempt"
+)
+@mock.patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhook_using_scheme_method"
+)
+def test_send_webhook_request_batch_async(
+    mocked_send_response,
+    mocked_observability,
+    event_payload,
+    webhook,
+    webhook_response,
+    django_assert_max_num_queries,
+):
+    # given
+    mocked_send_response.return_value = webhook_response
+    deliveries = EventDelivery.objects.bulk_create(
+        [
+            EventDelivery(
+                event_type=WebhookEventAsyncType.ANY,
+                payload=event_payload,
+                webhook=webhook,
+            )
+            for _ in range(3)
+        ]
+    )
+
+    # when
+    with django_assert_max_num_queries(12):
+        send_webhook_request_batch_async([delivery.id for delivery in deliveries])
+
+    # then
+    assert mocked_send_response.call_count == 3
+    session = mocked_send_response.call_args.kwargs["session"]
+    assert all(
+        call.kwargs["session"] is session
+        for call in mocked_send_response.call_args_list
+    )
+    assert mocked_observability.call_count == 3
+    attempt = mocked_observability.call_args.args[0]
+    assert attempt.status == EventDeliveryStatus.SUCCESS
+    assert attempt.response == webhook_response.content
+    assert not EventDelivery.objects.exists()
+    assert not EventPayload.objects.exists()
+
+
+@mock.patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhook_request_async.apply_async"
+)
+@mock.patch(
+    "saleor.webhook.transport.asynchronous.transport.observability.report_event_delivery_attempt"
+)
+@mock.patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhook_using_scheme_method"
+)
+def test_send_webhook_request_batch_async_when_delivery_attempt_failed(
+    mocked_send_response,
+    mocked_observability,
+    mocked_retry,
+    event_delivery,
+    webhook_response_failed,
+):
+    # given
+    mocked_send_response.return_value = webhook_response_failed
+
+    # when
+    send_webhook_request_batch_async([event_delivery.pk])
+
+    # then
+    attempt = EventDeliveryAttempt.objects.get(delivery=event_delivery)
+    delivery = EventDelivery.objects.get(id=event_delivery.pk)
+    assert attempt.status == EventDeliveryStatus.FAILED
+    assert attempt.response_status_code == webhook_response_failed.response_status_code
+    assert delivery.status == EventDeliveryStatus.PENDING
+    mocked_retry.assert_called_once_with((event_delivery.pk,), countdown=10, retries=1)
+    mocked_observability.assert_called_once_with(attempt, ANY)
+
+
+@mock.patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhook_request_async.apply_async"
+)
+@mock.patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhook_using_scheme_method"
+)
+def test_send_webhook_request_batch_async_client_error_not_retried(
+    mocked_send_response, mocked_retry, event_delivery, webhook_response_failed
+):
+    # given
+    webhook_response_failed.response_status_code = 404
+    mocked_send_response.return_value = webhook_response_failed
+
+    # when
+    send_webhook_request_batch_async([event_delivery.pk])
+
+    # then
+    event_delivery.refresh_from_db()
+    assert event_delivery.status == EventDeliveryStatus.FAILED
+    mocked_retry.assert_not_called()
+
+
+def test_send_webhook_request_batch_async_when_webhook_is_disabled(event_delivery):
+    # given
+    event_delivery.webhook.is_active = False
+    event_delivery.webhook.save(update_fields=["is_active"])
+
+    # when
+    send_webhook_request_batch_async([event_delivery.pk])
+
+    # then
+    event_delivery.refresh_from_db()
+    assert event_delivery.status == EventDeliveryStatus.FAILED
+    assert not event_delivery.attempts.exists()
+
+
 @mock.patch(
     "saleor.webhook.transport.asynchronous.transport.send_webhook_request_async.retry"
 )
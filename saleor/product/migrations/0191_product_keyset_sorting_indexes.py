@@ -0,0 +1,27 @@
+# Generated by Django 3.2.24 on 2026-10-17 10:00
+
+from django.contrib.postgres.indexes import BTreeIndex
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("product", "0190_merge_20231221_1356"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="product",
+            index=BTreeIndex(fields=["name", "slug"], name="product_name_slug_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="product",
+            index=BTreeIndex(
+                fields=["updated_at", "name", "slug"],
+                name="product_updated_at_name_slug_idx",
+            ),
+        ),
+    ]
@@ -231,6 +231,12 @@ class Product(SeoModel, ModelWithMetadata, ModelWithExternalReference):
                 fields=["name", "slug"],
                 opclasses=["gin_trgm_ops"] * 2,
             ),
+            # composite indexes matching the sorting fields used by keyset pagination
+            BTreeIndex(fields=["name", "slug"], name="product_name_slug_idx"),
+            BTreeIndex(
+                fields=["updated_at", "name", "slug"],
+                name="product_updated_at_name_slug_idx",
+            ),
         ]
         indexes.extend(ModelWithMetadata.Meta.indexes)
 
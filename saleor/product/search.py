@@ -1,24 +1,32 @@
+import logging
+import math
+import time
 from collections import defaultdict
+from collections.abc import Iterable
 from typing import TYPE_CHECKING, Union
 
 from django.conf import settings
 from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db import connection
 from django.db.models import F, Q, Value, prefetch_related_objects
 from django.db.models.expressions import Exists, OuterRef
 
 from ..attribute import AttributeInputType
 from ..attribute.models import (
     AssignedProductAttributeValue,
+    AssignedVariantAttribute,
     Attribute,
     AttributeProduct,
 )
-from ..core.postgres import FlatConcatSearchVector, NoValidationSearchVector
+from ..core.postgres import NoValidationSearchVector
 from ..core.utils.editorjs import clean_editor_js
-from .models import Product
+from .models import Product, ProductVariant
 
 if TYPE_CHECKING:
     from django.db.models import QuerySet
 
+logger = logging.getLogger(__name__)
+
 PRODUCT_SEARCH_FIELDS = ["name", "description_plaintext"]
 PRODUCT_FIELDS_TO_PREFETCH = [
     "variants__attributes__values",
@@ -27,37 +35,194 @@ PRODUCT_FIELDS_TO_PREFETCH = [
     "product_type__attributeproduct__attribute",
 ]
 
-PRODUCTS_BATCH_SIZE = 300
-# Setting threshold to 300 results in about 350MB of memory usage
-# when testing locally. Should be adjusted after some time by running
-# update task on a large dataset and measuring the total time, memory usage
-# and time of a single SQL statement.
-
-
-def _prep_product_search_vector_index(products):
-    prefetch_related_objects(products, *PRODUCT_FIELDS_TO_PREFETCH)
-    for product in products:
-        product.search_vector = FlatConcatSearchVector(
-            *prepare_product_search_vector_value(product, already_prefetched=True)
-        )
-        product.search_index_dirty = False
+PRODUCTS_BATCH_SIZE = 2000
+# Only the texts of the products are loaded into memory and the search vectors are
+# computed by the database in a single statement per batch. Should be adjusted after
+# some time by running update task on a large dataset and measuring the total time,
+# memory usage and time of a single SQL statement.
 
-    Product.objects.bulk_update(
-        products, ["search_vector", "updated_at", "search_index_dirty"]
-    )
+SEARCH_VECTOR_WEIGHTS = ("A", "B", "C")
 
 
-def update_products_search_vector(products: "QuerySet", use_batches=True):
+def update_products_search_vector(products: "QuerySet", use_batches=True) -> int:
+    """Update search vectors of the given products and return their number."""
+    start = time.monotonic()
+    updated_count = 0
     if use_batches:
         last_id = 0
         while True:
-            products_batch = list(products.filter(id__gt=last_id)[:PRODUCTS_BATCH_SIZE])
-            if not products_batch:
+            product_ids = list(
+                products.filter(id__gt=last_id)
+                .order_by("id")
+                .values_list("id", flat=True)[:PRODUCTS_BATCH_SIZE]
+            )
+            if not product_ids:
                 break
-            last_id = products_batch[-1].id
-            _prep_product_search_vector_index(products_batch)
+            last_id = product_ids[-1]
+            updated_count += update_products_search_vector_in_bulk(product_ids)
     else:
-        _prep_product_search_vector_index(products)
+        product_ids = list(products.values_list("id", flat=True))
+        updated_count = update_products_search_vector_in_bulk(product_ids)
+
+    duration = time.monotonic() - start
+    logger.info(
+        "Updated search vectors of %d products in %.2fs (%.1f products/s).",
+        updated_count,
+        duration,
+        updated_count / duration if duration else 0,
+    )
+    return updated_count
+
+
+def get_products_search_vector_shards(
+    products: "QuerySet", shards_count: int
+) -> list[tuple[int, int]]:
+    """Split the products into id ranges of similar size, inclusive on both ends."""
+    product_ids = list(products.order_by("id").values_list("id", flat=True))
+    if not product_ids:
+        return []
+    shard_size = math.ceil(len(product_ids) / max(shards_count, 1))
+    return [
+        (shard_ids[0], shard_ids[-1])
+        for shard_ids in (
+            product_ids[index : index + shard_size]
+            for index in range(0, len(product_ids), shard_size)
+        )
+    ]
+
+
+def update_products_search_vector_in_bulk(product_ids: Iterable[int]) -> int:
+    """Compute search vectors of the products in a single `UPDATE` statement.
+
+    Texts of the products are gathered with a few set-based queries, grouped by
+    the search weight and passed as `VALUES` rows, so the database computes all
+    vectors at once.
+    """
+    texts = prepare_products_search_texts(product_ids)
+    if not texts:
+        return 0
+
+    meta = Product._meta
+    vector = " || ".join(
+        f"setweight(to_tsvector('simple', data.weight_{weight.lower()}), '{weight}')"
+        for weight in SEARCH_VECTOR_WEIGHTS
+    )
+    columns = ", ".join(f"weight_{weight.lower()}" for weight in SEARCH_VECTOR_WEIGHTS)
+    row = "(" + ", ".join(["%s"] * (len(SEARCH_VECTOR_WEIGHTS) + 1)) + ")"
+    params: list[Union[int, str]] = []
+    for product_id, product_texts in texts.items():
+        params.append(product_id)
+        params.extend(product_texts[weight] for weight in SEARCH_VECTOR_WEIGHTS)
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            UPDATE {meta.db_table} AS product
+            SET
+                {meta.get_field("search_vector").column} = {vector},
+                {meta.get_field("search_index_dirty").column} = false
+            FROM (VALUES {", ".join([row] * len(texts))}) AS data (id, {columns})
+            WHERE product.id = data.id
+            """,
+            params,
+        )
+        return cursor.rowcount
+
+
+def prepare_products_search_texts(
+    product_ids: Iterable[int],
+) -> dict[int, dict[str, str]]:
+    """Return searchable texts of the products grouped by the search weight.
+
+    The texts match the values of `prepare_product_search_vector_value`.
+    """
+    products = list(
+        Product.objects.filter(id__in=product_ids)
+        .order_by("id")
+        .values_list("id", "name", "description_plaintext", "product_type_id")
+    )
+    if not products:
+        return {}
+
+    product_ids = [product_id for product_id, _, _, _ in products]
+    attributes_by_product_type: dict[int, list[Attribute]] = defaultdict(list)
+    for attribute_product in AttributeProduct.objects.filter(
+        product_type_id__in={product[3] for product in products}
+    ).select_related("attribute"):
+        attributes_by_product_type[attribute_product.product_type_id].append(
+            attribute_product.attribute
+        )
+
+    values_by_product_and_attribute: dict[tuple[int, int], list] = defaultdict(list)
+    for assigned_value in AssignedProductAttributeValue.objects.filter(
+        product_id__in=product_ids
+    ).select_related("value"):
+        value = assigned_value.value
+        values_by_product_and_attribute[
+            (assigned_value.product_id, value.attribute_id)
+        ].append(value)
+
+    variants_by_product: dict[int, list[ProductVariant]] = defaultdict(list)
+    for variant in ProductVariant.objects.filter(product_id__in=product_ids).only(
+        "id", "product_id", "sku", "name"
+    ):
+        variants_by_product[variant.product_id].append(variant)
+    variant_ids = [
+        variant.id
+        for variants in variants_by_product.values()
+        for variant in variants[: settings.PRODUCT_MAX_INDEXED_VARIANTS]
+    ]
+
+    assigned_attributes_by_variant: dict[int, list] = defaultdict(list)
+    for assigned_attribute in (
+        AssignedVariantAttribute.objects.filter(variant_id__in=variant_ids)
+        .select_related("assignment__attribute")
+        .prefetch_related("values")
+    ):
+        assigned_attributes_by_variant[assigned_attribute.variant_id].append(
+            assigned_attribute
+        )
+
+    texts = {}
+    for product_id, name, description_plaintext, product_type_id in products:
+        product_texts: dict[str, list[str]] = {
+            weight: [] for weight in SEARCH_VECTOR_WEIGHTS
+        }
+        product_texts["A"].append(name)
+        product_texts["C"].append(description_plaintext)
+        for attribute in attributes_by_product_type[product_type_id][
+            : settings.PRODUCT_MAX_INDEXED_ATTRIBUTES
+        ]:
+            values = values_by_product_and_attribute[(product_id, attribute.pk)]
+            product_texts["B"] += get_search_texts_for_values(
+                attribute, values[: settings.PRODUCT_MAX_INDEXED_ATTRIBUTE_VALUES]
+            )
+
+        variants = variants_by_product[product_id][
+            : settings.PRODUCT_MAX_INDEXED_VARIANTS
+        ]
+        variant_texts = [
+            " ".join(text for text in (variant.sku, variant.name) if text)
+            for variant in variants
+            if variant.sku or variant.name
+        ]
+        if variant_texts:
+            product_texts["A"] += variant_texts
+            for variant in variants:
+                for assigned_attribute in assigned_attributes_by_variant[variant.id][
+                    : settings.PRODUCT_MAX_INDEXED_ATTRIBUTES
+                ]:
+                    values = list(assigned_attribute.values.all())
+                    product_texts["B"] += get_search_texts_for_values(
+                        assigned_attribute.assignment.attribute,
+                        values[: settings.PRODUCT_MAX_INDEXED_ATTRIBUTE_VALUES],
+                    )
+
+        texts[product_id] = {
+            weight: " ".join(text for text in weight_texts if text)
+            for weight, weight_texts in product_texts.items()
+        }
+    return texts
 
 
 def prepare_product_search_vector_value(
@@ -158,50 +323,28 @@ def generate_attributes_search_vector_value_with_assignment(
 def get_search_vectors_for_values(
     attribute: Attribute, values: Union[list, "QuerySet"]
 ) -> list[NoValidationSearchVector]:
-    search_vectors = []
+    return [
+        NoValidationSearchVector(Value(text), config="simple", weight="B")
+        for text in get_search_texts_for_values(attribute, values)
+    ]
+
 
+def get_search_texts_for_values(
+    attribute: Attribute, values: Union[list, "QuerySet"]
+) -> list[str]:
     input_type = attribute.input_type
     if input_type in [AttributeInputType.DROPDOWN, AttributeInputType.MULTISELECT]:
-        search_vectors += [
-            NoValidationSearchVector(Value(value.name), config="simple", weight="B")
-            for value in values
-        ]
-    elif input_type == AttributeInputType.RICH_TEXT:
-        search_vectors += [
-            NoValidationSearchVector(
-                Value(clean_editor_js(value.rich_text, to_string=True)),
-                config="simple",
-                weight="B",
-            )
-            for value in values
-        ]
-    elif input_type == AttributeInputType.PLAIN_TEXT:
-        search_vectors += [
-            NoValidationSearchVector(
-                Value(value.plain_text), config="simple", weight="B"
-            )
-            for value in values
-        ]
-    elif input_type == AttributeInputType.NUMERIC:
+        return [value.name for value in values]
+    if input_type == AttributeInputType.RICH_TEXT:
+        return [clean_editor_js(value.rich_text, to_string=True) for value in values]
+    if input_type == AttributeInputType.PLAIN_TEXT:
+        return [value.plain_text for value in values]
+    if input_type == AttributeInputType.NUMERIC:
         unit = attribute.unit
-        search_vectors += [
-            NoValidationSearchVector(
-                Value(value.name + " " + unit if unit else value.name),
-                config="simple",
-                weight="B",
-            )
-            for value in values
-        ]
-    elif input_type in [AttributeInputType.DATE, AttributeInputType.DATE_TIME]:
-        search_vectors += [
-            NoValidationSearchVector(
-                Value(value.date_time.strftime("%Y-%m-%d %H:%M:%S")),
-                config="simple",
-                weight="B",
-            )
-            for value in values
-        ]
-    return search_vectors
+        return [value.name + " " + unit if unit else value.name for value in values]
+    if input_type in [AttributeInputType.DATE, AttributeInputType.DATE_TIME]:
+        return [value.date_time.strftime("%Y-%m-%d %H:%M:%S") for value in values]
+    return []
 
 
 def search_products(qs, value):
@@ -182,6 +182,23 @@ def update_products_search_vector_task():
     update_products_search_vector(products, use_batches=False)
 
 
+@app.task(queue=settings.UPDATE_SEARCH_VECTOR_INDEX_QUEUE_NAME)
+def update_products_search_vector_shard_task(start_id: int, end_id: int):
+    """Update search vectors of not indexed or dirty products within the id range."""
+    products = Product.objects.filter(
+        Q(search_vector=None) | Q(search_index_dirty=True),
+        id__gte=start_id,
+        id__lte=end_id,
+    )
+    updated_count = update_products_search_vector(products)
+    task_logger.info(
+        "Updated search vectors of %d products with ids from %d to %d.",
+        updated_count,
+        start_id,
+        end_id,
+    )
+
+
 @app.task(queue=settings.COLLECTION_PRODUCT_UPDATED_QUEUE_NAME)
 def collection_product_updated_task(product_ids):
     manager = get_plugins_manager(allow_replica=True)
@@ -1,5 +1,24 @@
+import pytest
+from django.db import connection
+
+from ...core.postgres import FlatConcatSearchVector
 from ..models import Product
-from ..search import update_products_search_vector
+from ..search import (
+    get_products_search_vector_shards,
+    prepare_product_search_vector_value,
+    update_products_search_vector,
+    update_products_search_vector_in_bulk,
+)
+
+
+def _get_search_vector_lexemes(product):
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT lexeme, weights FROM unnest("
+            "(SELECT search_vector FROM product_product WHERE id = %s))",
+            [product.pk],
+        )
+        return {lexeme: set(weights) for lexeme, weights in cursor.fetchall()}
 
 
 def test_update_products_search_vector(product_list):
@@ -15,3 +34,68 @@ def test_update_products_search_vector(product_list):
     for product in product_list:
         product.refresh_from_db()
         assert product.search_vector
+
+
+@pytest.mark.parametrize(
+    "product_fixture",
+    [
+        "product",
+        "product_with_multiple_values_attributes",
+        "product_with_variant_with_two_attributes",
+        "product_with_two_variants",
+    ],
+)
+def test_update_products_search_vector_in_bulk_matches_product_search_vector(
+    product_fixture, request
+):
+    # given
+    product = request.getfixturevalue(product_fixture)
+    product.search_vector = FlatConcatSearchVector(
+        *prepare_product_search_vector_value(product)
+    )
+    product.save(update_fields=["search_vector"])
+    expected_lexemes = _get_search_vector_lexemes(product)
+    Product.objects.update(search_vector=None, search_index_dirty=True)
+
+    # when
+    updated_count = update_products_search_vector_in_bulk([product.pk])
+
+    # then
+    assert updated_count == 1
+    product.refresh_from_db()
+    assert product.search_index_dirty is False
+    assert _get_search_vector_lexemes(product) == expected_lexemes
+
+
+def test_update_products_search_vector_in_bulk_number_of_queries(
+    product_list, django_assert_max_num_queries
+):
+    # given
+    product_ids = [product.pk for product in product_list]
+
+    # when
+    with django_assert_max_num_queries(7):
+        updated_count = update_products_search_vector_in_bulk(product_ids)
+
+    # then
+    assert updated_count == len(product_list)
+
+
+def test_update_products_search_vector_in_bulk_no_products():
+    assert update_products_search_vector_in_bulk([]) == 0
+
+
+@pytest.mark.parametrize(("shards_count", "expected_sizes"), [(1, [3]), (2, [2, 1])])
+def test_get_products_search_vector_shards(product_list, shards_count, expected_sizes):
+    # given
+    product_ids = sorted(product.pk for product in product_list)
+
+    # when
+    shards = get_products_search_vector_shards(Product.objects.all(), shards_count)
+
+    # then
+    assert [
+        len([pk for pk in product_ids if start <= pk <= end]) for start, end in shards
+    ] == expected_sizes
+    assert shards[0][0] == product_ids[0]
+    assert shards[-1][1] == product_ids[-1]
@@ -10,12 +10,13 @@ from django.utils import timezone
 
 from ...discount import RewardValueType
 from ...discount.models import Promotion, PromotionRule
-from ..models import ProductChannelListing, ProductVariantChannelListing
+from ..models import Product, ProductChannelListing, ProductVariantChannelListing
 from ..tasks import (
     _get_preorder_variants_to_clean,
     update_discounted_prices_task,
     update_products_discounted_prices_for_promotion_task,
     update_products_discounted_prices_of_promotion_task,
+    update_products_search_vector_shard_task,
     update_products_search_vector_task,
     update_variants_names,
 )
@@ -275,6 +276,25 @@ def test_update_products_search_vector_task(product):
     assert product.search_index_dirty is False
 
 
+def test_update_products_search_vector_shard_task(product_list):
+    # given
+    first_product, second_product, third_product = sorted(
+        product_list, key=lambda product: product.pk
+    )
+    Product.objects.update(search_vector=None, search_index_dirty=True)
+
+    # when
+    update_products_search_vector_shard_task(first_product.pk, second_product.pk)
+
+    # then
+    for product in product_list:
+        product.refresh_from_db()
+    assert first_product.search_vector
+    assert second_product.search_vector
+    assert third_product.search_vector is None
+    assert third_product.search_index_dirty is True
+
+
 @pytest.mark.slow
 @pytest.mark.limit_memory("50 MB")
 def test_mem_usage_update_products_discounted_prices(lots_of_products_with_variants):
@@ -0,0 +1,121 @@
+from collections.abc import Iterable
+from typing import Any, Optional
+from uuid import uuid4
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+PRICING_SNAPSHOT_VERSION_KEY = "product_pricing_snapshot_version"
+
+# Product ID, channel slug and country code of a single pricing snapshot entry.
+ProductPricingKey = tuple[int, str, str]
+
+
+def is_product_pricing_snapshot_enabled() -> bool:
+    return bool(settings.PRODUCT_PRICING_SNAPSHOT_TIMEOUT)
+
+
+def _get_snapshot_version() -> str:
+    version = cache.get(PRICING_SNAPSHOT_VERSION_KEY)
+    if version is None:
+        cache.add(PRICING_SNAPSHOT_VERSION_KEY, uuid4().hex, timeout=None)
+        version = cache.get(PRICING_SNAPSHOT_VERSION_KEY)
+    return version
+
+
+def get_product_pricing_token_key(version: str, product_id: int) -> str:
+    return f"product_pricing_snapshot_token:{version}:{product_id}"
+
+
+def get_product_pricing_snapshot_key(
+    token: str, product_id: int, channel_slug: str, country_code: str
+) -> str:
+    return (
+        f"product_pricing_snapshot:{token}:{product_id}:{channel_slug}:{country_code}"
+    )
+
+
+def get_product_pricing_tokens(product_ids: Iterable[int]) -> dict[int, str]:
+    """Return the current snapshot tokens of the given products.
+
+    Snapshots are stored under the token of the product, which is dropped when the
+    product's pricing is invalidated. Snapshots calculated from data read before
+    the invalidation are stored under the old token, so they are never read.
+    """
+    version = _get_snapshot_version()
+    keys = {
+        get_product_pricing_token_key(version, product_id): product_id
+        for product_id in product_ids
+    }
+    tokens = cache.get_many(keys.keys())
+    missing_keys = [key for key in keys if key not in tokens]
+    for key in missing_keys:
+        cache.add(key, uuid4().hex, timeout=settings.PRODUCT_PRICING_SNAPSHOT_TIMEOUT)
+    if missing_keys:
+        tokens.update(cache.get_many(missing_keys))
+    return {keys[key]: token for key, token in tokens.items()}
+
+
+def get_product_pricing_snapshots(
+    tokens: dict[int, str], keys: Iterable[ProductPricingKey]
+) -> dict[ProductPricingKey, Optional[dict[str, Any]]]:
+    """Return cached pricing of the given products, channels and countries."""
+    cache_keys = {
+        get_product_pricing_snapshot_key(tokens[key[0]], *key): key
+        for key in keys
+        if key[0] in tokens
+    }
+    snapshots = cache.get_many(cache_keys.keys())
+    return {cache_keys[key]: snapshot for key, snapshot in snapshots.items()}
+
+
+def set_product_pricing_snapshots(
+    tokens: dict[int, str],
+    snapshots: dict[ProductPricingKey, Optional[dict[str, Any]]],
+    timeout: int,
+):
+    """Store pricing under the tokens read before it was calculated."""
+    cache.set_many(
+        {
+            get_product_pricing_snapshot_key(tokens[key[0]], *key): snapshot
+            for key, snapshot in snapshots.items()
+            if key[0] in tokens
+        },
+        timeout=timeout,
+    )
+
+
+def invalidate_product_pricing_snapshots(product_ids: Iterable[int]):
+    """Drop pricing snapshots of the given products once the transaction commits.
+
+    Should be called whenever prices, discounted prices or the visibility of the
+    products' channel listings change.
+    """
+    if not is_product_pricing_snapshot_enabled():
+        return
+    product_ids = list(product_ids)
+
+    def delete_snapshots():
+        version = _get_snapshot_version()
+        cache.delete_many(
+            [
+                get_product_pricing_token_key(version, product_id)
+                for product_id in product_ids
+            ]
+        )
+
+    transaction.on_commit(delete_snapshots)
+
+
+def invalidate_all_product_pricing_snapshots():
+    """Drop pricing snapshots of all products once the transaction commits.
+
+    Should be called when a change affects prices of many products at once, e.g.
+    tax configuration or tax rates updates.
+    """
+    if not is_product_pricing_snapshot_enabled():
+        return
+    transaction.on_commit(
+        lambda: cache.set(PRICING_SNAPSHOT_VERSION_KEY, uuid4().hex, timeout=None)
+    )
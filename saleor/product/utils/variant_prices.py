@@ -21,6 +21,7 @@ from ..models import (
     ProductVariantChannelListing,
     VariantChannelListingPromotionRule,
 )
+from .pricing_snapshot import invalidate_product_pricing_snapshots
 
 
 def update_discounted_prices_for_promotion(products: ProductsQueryset):
@@ -48,12 +49,14 @@ def update_discounted_prices_for_promotion(products: ProductsQueryset):
 
     changed_variant_listing_promotion_rule_to_create = []
     changed_variant_listing_promotion_rule_to_update = []
+    product_ids = set()
 
     product_channel_listings = ProductChannelListing.objects.filter(
         Exists(products.filter(id=OuterRef("product_id")))
     )
     for product_channel_listing in product_channel_listings:
         product_id = product_channel_listing.product_id
+        product_ids.add(product_id)
         channel_id = product_channel_listing.channel_id
         variant_listings = product_to_variant_listings_per_channel_map[product_id][
             channel_id
@@ -94,6 +97,7 @@ def update_discounted_prices_for_promotion(products: ProductsQueryset):
         changed_variant_listing_promotion_rule_to_create,
         changed_variant_listing_promotion_rule_to_update,
     )
+    invalidate_product_pricing_snapshots(product_ids)
 
 
 def _update_or_create_listings(
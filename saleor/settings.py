@@ -164,6 +164,9 @@ DEFAULT_FROM_EMAIL: str = os.environ.get(
     "DEFAULT_FROM_EMAIL", EMAIL_HOST_USER or "noreply@example.com"
 )
 
+# Max number of compiled email templates cached by each process
+EMAIL_TEMPLATE_CACHE_SIZE = int(os.environ.get("EMAIL_TEMPLATE_CACHE_SIZE", 500))
+
 MEDIA_ROOT: str = os.path.join(PROJECT_ROOT, "media")
 MEDIA_URL: str = os.environ.get("MEDIA_URL", "/media/")
 
@@ -527,6 +530,11 @@ EXPORT_FILES_TIMEDELTA = timedelta(
     seconds=parse(os.environ.get("EXPORT_FILES_TIMEDELTA", "30 days"))
 )
 
+# Number of products exported by a single worker. When set, product exports are split
+# into shards processed in parallel by a Celery chord, which requires a configured
+# result backend. Exports run in a single task when set to 0.
+EXPORT_PRODUCTS_SHARD_SIZE = int(os.environ.get("EXPORT_PRODUCTS_SHARD_SIZE", 0))
+
 # CELERY SETTINGS
 CELERY_TIMEZONE = TIME_ZONE
 CELERY_BROKER_URL = (
@@ -597,6 +605,10 @@ CELERY_BEAT_SCHEDULE = {
         "task": "saleor.warehouse.tasks.update_stocks_quantity_allocated_task",
         "schedule": crontab(hour=0, minute=0),
     },
+    "reconcile-available-quantities": {
+        "task": "saleor.warehouse.tasks.reconcile_available_quantities_task",
+        "schedule": timedelta(minutes=5),
+    },
     "delete-old-export-files": {
         "task": "saleor.csv.tasks.delete_old_export_files",
         "schedule": crontab(hour=1, minute=0),
@@ -640,6 +652,17 @@ EVENT_PAYLOAD_DELETE_PERIOD = timedelta(
 EVENT_PAYLOAD_DELETE_TASK_TIME_LIMIT = timedelta(
     seconds=parse(os.environ.get("EVENT_PAYLOAD_DELETE_TASK_TIME_LIMIT", "1 hour"))
 )
+# Size in bytes above which webhook payloads are compressed and saved in the file
+# storage instead of the database. Payloads are always kept in the database when
+# it's set to 0. Payloads contain customer personal data and are saved in the
+# default storage, which also stores media files; make sure the storage location
+# of the offloaded payloads is not publicly served.
+EVENT_PAYLOAD_FILE_THRESHOLD: int = int(
+    os.environ.get("EVENT_PAYLOAD_FILE_THRESHOLD", 0)
+)
+# Number of days ahead for which daily partitions of the event tables are created,
+# when the tables are partitioned with the `partition_event_tables` command.
+EVENT_PARTITIONS_PREMAKE_DAYS = int(os.environ.get("EVENT_PARTITIONS_PREMAKE_DAYS", 7))
 # Time between marking app "to remove" and removing the app from the database.
 # App is not visible for the user after removing, but it still exists in the database.
 # Saleor needs time to process sending `APP_DELETED` webhook and possible retrying,
@@ -721,6 +744,57 @@ GRAPHQL_QUERY_MAX_COMPLEXITY = int(
     os.environ.get("GRAPHQL_QUERY_MAX_COMPLEXITY", 50000)
 )
 
+# Max number of parsed and validated GraphQL documents cached by each worker process
+GRAPHQL_DOCUMENT_CACHE_SIZE = int(os.environ.get("GRAPHQL_DOCUMENT_CACHE_SIZE", 1000))
+
+# Max number of results of reference data loaders, like channels or tax
+# configurations, cached between requests by each worker process. Disabled by
+# default, they are loaded from the database in every request.
+DATALOADER_REFERENCE_DATA_CACHE_SIZE = int(
+    os.environ.get("DATALOADER_REFERENCE_DATA_CACHE_SIZE", 0)
+)
+# How long (in seconds) results of reference data loaders read from the replica
+# database are cached. A replica lagging behind may return data older than the
+# current data version, which is then served at most for this time. Set to 0 to
+# cache only the results read from the default database.
+DATALOADER_REFERENCE_DATA_REPLICA_CACHE_TIMEOUT = int(
+    os.environ.get("DATALOADER_REFERENCE_DATA_REPLICA_CACHE_TIMEOUT", 10)
+)
+
+# Enable Automatic Persisted Queries. Validated documents are stored in the shared
+# cache under their sha256 hash, so clients can send only the hash and other worker
+# processes can skip the validation of already known documents.
+GRAPHQL_PERSISTED_QUERIES_ENABLED = get_bool_from_env(
+    "GRAPHQL_PERSISTED_QUERIES_ENABLED", False
+)
+GRAPHQL_PERSISTED_QUERIES_TIMEOUT = parse(
+    os.environ.get("GRAPHQL_PERSISTED_QUERIES_TIMEOUT", "7 days")
+)
+
+# Max number of validated webhook subscription documents cached by each process
+WEBHOOK_SUBSCRIPTION_DOCUMENT_CACHE_SIZE = int(
+    os.environ.get("WEBHOOK_SUBSCRIPTION_DOCUMENT_CACHE_SIZE", 1000)
+)
+
+# Cache responses to anonymous storefront queries for the given number of seconds.
+# Cached responses are invalidated by product, category, collection, menu and
+# translation changes. Requires a cache shared by all processes (e.g. Redis).
+# Responses are not cached when set to 0.
+GRAPHQL_RESPONSE_CACHE_TIMEOUT = int(
+    os.environ.get("GRAPHQL_RESPONSE_CACHE_TIMEOUT", 0)
+)
+# How long (in seconds) responses read from the replica database are cached, as the
+# replica may lag behind the invalidation. Set to 0 to cache only responses read
+# from the default database.
+GRAPHQL_RESPONSE_CACHE_REPLICA_TIMEOUT = int(
+    os.environ.get("GRAPHQL_RESPONSE_CACHE_REPLICA_TIMEOUT", 10)
+)
+
+# Max number of items counted for the `totalCount` of connections. Larger totals
+# are estimated with the query planner and flagged with `isTotalCountEstimated`.
+# All items are counted when set to 0.
+GRAPHQL_TOTAL_COUNT_LIMIT = int(os.environ.get("GRAPHQL_TOTAL_COUNT_LIMIT", 0))
+
 # Max number entities that can be requested in single query by Apollo Federation
 # Federation protocol implements no securities on its own part - malicious actor
 # may build a query that requests for potentially few thousands of entities.
@@ -744,6 +818,7 @@ BUILTIN_PLUGINS = [
     "saleor.plugins.admin_email.plugin.AdminEmailPlugin",
     "saleor.plugins.sendgrid.plugin.SendgridEmailPlugin",
     "saleor.plugins.openid_connect.plugin.OpenIDConnectPlugin",
+    "saleor.plugins.response_cache.plugin.ResponseCachePlugin",
 ]
 
 # Plugin discovery
@@ -758,6 +833,13 @@ for entry_point in installed_plugins:
 
 PLUGINS = BUILTIN_PLUGINS + EXTERNAL_PLUGINS
 
+# Cache channels and plugin configurations used by plugins managers within each
+# process. The cache is invalidated through a version stored in the cache backend,
+# so it requires a cache shared by all processes (e.g. Redis).
+PLUGINS_MANAGER_CACHE_ENABLED = get_bool_from_env(
+    "PLUGINS_MANAGER_CACHE_ENABLED", False
+)
+
 # When `True`, HTTP requests made from arbitrary URLs will be rejected (e.g., webhooks).
 # if they try to access private IP address ranges, and loopback ranges (unless
 # `HTTP_IP_FILTER_ALLOW_LOOPBACK_IPS=False`).
@@ -769,6 +851,15 @@ HTTP_IP_FILTER_ALLOW_LOOPBACK_IPS: bool = get_bool_from_env(
     "HTTP_IP_FILTER_ALLOW_LOOPBACK_IPS", False
 )
 
+# Connections of external HTTP requests (e.g. webhooks) can be kept alive and reused
+# within a thread, in per-host pools. `HTTP_POOL_MAX_HOSTS` is the number of hosts
+# with a pool and `HTTP_POOL_MAX_SIZE` the number of connections kept per host.
+# Pools unused for `HTTP_POOL_IDLE_TIMEOUT` are closed. Disabled by default, a new
+# connection is opened for each request.
+HTTP_POOL_MAX_HOSTS = int(os.environ.get("HTTP_POOL_MAX_HOSTS", 10))
+HTTP_POOL_MAX_SIZE = int(os.environ.get("HTTP_POOL_MAX_SIZE", 10))
+HTTP_POOL_IDLE_TIMEOUT = parse(os.environ.get("HTTP_POOL_IDLE_TIMEOUT", "0"))
+
 # Since we split checkout complete logic into two separate transactions, in order to
 # mimic stock lock, we apply short reservation for the stocks. The value represents
 # time of the reservation in seconds.
@@ -812,6 +903,10 @@ JWT_TTL_APP_ACCESS = timedelta(
 )
 JWT_TTL_REFRESH = timedelta(seconds=parse(os.environ.get("JWT_TTL_REFRESH", "30 days")))
 
+# How long (in seconds) successfully verified app tokens are cached to skip hashing
+# them on each request. Set APP_TOKEN_CACHE_TIMEOUT=0 in env to disable.
+APP_TOKEN_CACHE_TIMEOUT = parse(os.environ.get("APP_TOKEN_CACHE_TIMEOUT", "5 minutes"))
+
 
 JWT_TTL_REQUEST_EMAIL_CHANGE = timedelta(
     seconds=parse(os.environ.get("JWT_TTL_REQUEST_EMAIL_CHANGE", "1 hour")),
@@ -847,6 +942,32 @@ PRODUCT_MAX_INDEXED_ATTRIBUTES = 1000
 PRODUCT_MAX_INDEXED_ATTRIBUTE_VALUES = 100
 PRODUCT_MAX_INDEXED_VARIANTS = 1000
 
+# How long (in seconds) per-channel pricing snapshots of products are cached. Prices
+# of products are resolved from the snapshot instead of being recalculated from
+# channel listings and tax configuration on each request. Disabled by default.
+PRODUCT_PRICING_SNAPSHOT_TIMEOUT = parse(
+    os.environ.get("PRODUCT_PRICING_SNAPSHOT_TIMEOUT", "0")
+)
+# How long (in seconds) pricing snapshots calculated from the read replica are cached,
+# as the replica may lag behind the invalidation. Set to 0 to cache only snapshots
+# calculated from the default database.
+PRODUCT_PRICING_SNAPSHOT_REPLICA_TIMEOUT = parse(
+    os.environ.get("PRODUCT_PRICING_SNAPSHOT_REPLICA_TIMEOUT", "10")
+)
+
+# How long (in seconds) available quantities of variants per channel and country are
+# cached. The cache is invalidated by the stock, allocation and reservation changes
+# and reconciled periodically by a Celery beat task. Disabled by default.
+AVAILABLE_QUANTITY_CACHE_TIMEOUT = parse(
+    os.environ.get("AVAILABLE_QUANTITY_CACHE_TIMEOUT", "0")
+)
+# How long (in seconds) available quantities calculated from the read replica are
+# cached, as the replica may lag behind the invalidation. Set to 0 to cache only
+# quantities calculated from the default database.
+AVAILABLE_QUANTITY_CACHE_REPLICA_TIMEOUT = parse(
+    os.environ.get("AVAILABLE_QUANTITY_CACHE_REPLICA_TIMEOUT", "10")
+)
+
 
 # Patch SubscriberExecutionContext class from `graphql-core-legacy` package
 # to fix bug causing not returning errors for subscription queries.
@@ -863,6 +984,10 @@ UPDATE_SEARCH_VECTOR_INDEX_QUEUE_NAME = os.environ.get(
 # Queue name for "async webhook" events
 WEBHOOK_CELERY_QUEUE_NAME = os.environ.get("WEBHOOK_CELERY_QUEUE_NAME", None)
 
+# Number of async webhook deliveries sent by a single Celery task. Deliveries are
+# sent one per task when set to 1.
+WEBHOOK_ASYNC_BATCH_SIZE = int(os.environ.get("WEBHOOK_ASYNC_BATCH_SIZE", 1))
+
 # Queue name for execution of collection product_updated events
 COLLECTION_PRODUCT_UPDATED_QUEUE_NAME = os.environ.get(
     "COLLECTION_PRODUCT_UPDATED_QUEUE_NAME", None
@@ -878,6 +1003,15 @@ CONFIRMATION_EMAIL_LOCK_TIME = parse(
     os.environ.get("CONFIRMATION_EMAIL_LOCK_TIME", "15 minutes")
 )
 
+# When `True`, thumbnails are generated by a Celery task, and the thumbnail view
+# redirects to a smaller thumbnail or to the original image until it's ready.
+THUMBNAIL_ASYNC_GENERATION = get_bool_from_env("THUMBNAIL_ASYNC_GENERATION", False)
+
+# Time after which a lock taken to generate a thumbnail expires.
+THUMBNAIL_GENERATION_LOCK_TIMEOUT = parse(
+    os.environ.get("THUMBNAIL_GENERATION_LOCK_TIMEOUT", "2 minutes")
+)
+
 # Time threshold to update user last_login when performing requests with OAUTH token.
 OAUTH_UPDATE_LAST_LOGIN_THRESHOLD = parse(
     os.environ.get("OAUTH_UPDATE_LAST_LOGIN_THRESHOLD", "15 minutes")
@@ -893,6 +1027,24 @@ COMMON_REQUESTS_TIMEOUT = (REQUESTS_CONN_EST_TIMEOUT, 18)
 WEBHOOK_TIMEOUT = (REQUESTS_CONN_EST_TIMEOUT, 18)
 WEBHOOK_SYNC_TIMEOUT = (REQUESTS_CONN_EST_TIMEOUT, 18)
 
+# Whether synchronous webhook deliveries are written to the database before being
+# sent. When disabled, deliveries are kept in memory and only failed ones, plus
+# a sampled share of successful ones, are saved.
+WEBHOOK_SYNC_DELIVERIES_PERSISTENT = get_bool_from_env(
+    "WEBHOOK_SYNC_DELIVERIES_PERSISTENT", True
+)
+WEBHOOK_SYNC_DELIVERIES_SAMPLE_RATE = float(
+    os.environ.get("WEBHOOK_SYNC_DELIVERIES_SAMPLE_RATE", 0)
+)
+
+# Keep active webhooks, their events and app permissions in a routing table within
+# each process instead of querying them for every event. The table is invalidated
+# through a version stored in the cache backend, so it requires a cache shared by
+# all processes (e.g. Redis).
+WEBHOOK_ROUTING_TABLE_ENABLED = get_bool_from_env(
+    "WEBHOOK_ROUTING_TABLE_ENABLED", False
+)
+
 # The max number of rules with order_predicate defined
 ORDER_RULES_LIMIT = os.environ.get("ORDER_RULES_LIMIT", 100)
 
@@ -0,0 +1,51 @@
+from django.core.management.base import BaseCommand
+
+from ....product.models import ProductMedia
+from ... import ALLOWED_THUMBNAIL_FORMATS, THUMBNAIL_SIZES, ThumbnailFormat
+from ...tasks import create_product_media_thumbnails
+
+
+class Command(BaseCommand):
+    help = "Create missing thumbnails of product media images."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--size",
+            type=int,
+            action="append",
+            choices=THUMBNAIL_SIZES,
+            help="Thumbnail size to create, all sizes are created by default.",
+        )
+        parser.add_argument(
+            "--format",
+            action="append",
+            choices=sorted([ThumbnailFormat.ORIGINAL, *ALLOWED_THUMBNAIL_FORMATS]),
+            help="Thumbnail format to create, the original format by default.",
+        )
+        parser.add_argument(
+            "--product",
+            type=int,
+            action="append",
+            help="Create thumbnails only for media of the product with given ID.",
+        )
+        parser.add_argument(
+            "--queue",
+            action="store_true",
+            help="Create thumbnails in Celery tasks instead of this process.",
+        )
+
+    def handle(self, *args, **options):
+        sizes = options["size"] or THUMBNAIL_SIZES
+        formats = [
+            None if format == ThumbnailFormat.ORIGINAL else format
+            for format in options["format"] or [ThumbnailFormat.ORIGINAL]
+        ]
+        media_qs = ProductMedia.objects.all()
+        if options["product"]:
+            media_qs = media_qs.filter(product_id__in=options["product"])
+
+        count = create_product_media_thumbnails(
+            media_qs, sizes, formats, queue=options["queue"]
+        )
+        action = "Queued" if options["queue"] else "Created"
+        self.stdout.write(f"{action} {count} thumbnails.")
@@ -1,3 +1,5 @@
+from collections import namedtuple
+
 from django.core.exceptions import ValidationError
 from django.db import models
 
@@ -55,3 +57,21 @@ class Thumbnail(models.Model):
         on_delete=models.CASCADE,
         related_name="thumbnails",
     )
+
+
+ModelData = namedtuple("ModelData", ["model", "image_field", "thumbnail_field"])
+
+ICON_TYPE_TO_MODEL_DATA_MAPPING = {
+    "App": ModelData(App, "brand_logo_default", "app"),
+    "AppInstallation": ModelData(
+        AppInstallation, "brand_logo_default", "app_installation"
+    ),
+}
+TYPE_TO_MODEL_DATA_MAPPING = {
+    "User": ModelData(User, "avatar", "user"),
+    "Category": ModelData(Category, "background_image", "category"),
+    "Collection": ModelData(Collection, "background_image", "collection"),
+    "ProductMedia": ModelData(ProductMedia, "image", "product_media"),
+    **ICON_TYPE_TO_MODEL_DATA_MAPPING,
+}
+UUID_IDENTIFIABLE_TYPES = ["User", "App", "AppInstallation"]
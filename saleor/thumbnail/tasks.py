@@ -0,0 +1,143 @@
+import logging
+from collections.abc import Iterable
+from typing import Optional
+
+from django.core.exceptions import ObjectDoesNotExist
+from django.db.models import QuerySet
+
+from ..celeryconf import app
+from ..core.utils.events import call_event
+from ..plugins.manager import get_plugins_manager
+from .models import (
+    ICON_TYPE_TO_MODEL_DATA_MAPPING,
+    TYPE_TO_MODEL_DATA_MAPPING,
+    UUID_IDENTIFIABLE_TYPES,
+    Thumbnail,
+)
+from .utils import (
+    ProcessedIconImage,
+    ProcessedImage,
+    acquire_thumbnail_lock,
+    prepare_thumbnail_file_name,
+    release_thumbnail_lock,
+)
+
+logger = logging.getLogger(__name__)
+
+PRODUCT_MEDIA_THUMBNAILS_BATCH_SIZE = 100
+
+
+def create_thumbnail(
+    object_type: str, instance, size: int, format: Optional[str]
+) -> Thumbnail:
+    """Create the thumbnail of the instance image in the given size and format.
+
+    Raise ValueError when the image cannot be processed.
+    """
+    model_data = TYPE_TO_MODEL_DATA_MAPPING[object_type]
+    image = getattr(instance, model_data.image_field)
+    if object_type in ICON_TYPE_TO_MODEL_DATA_MAPPING:
+        processed_image: ProcessedImage = ProcessedIconImage(image.name, size, format)
+    else:
+        processed_image = ProcessedImage(image.name, size, format)
+    thumbnail_file, _ = processed_image.create_thumbnail()
+
+    thumbnail_file_name = prepare_thumbnail_file_name(image.name, size, format)
+
+    # save image thumbnail
+    thumbnail = Thumbnail(
+        size=size, format=format, **{model_data.thumbnail_field: instance}
+    )
+    thumbnail.image.save(thumbnail_file_name, thumbnail_file)
+    thumbnail.save()
+
+    # set additional `instance` attribute, to easily get instance data
+    # for ThumbnailCreated subscription type
+    setattr(thumbnail, "instance", instance)
+    manager = get_plugins_manager(allow_replica=False)
+    call_event(manager.thumbnail_created, thumbnail)
+    return thumbnail
+
+
+@app.task
+def create_thumbnail_task(object_type: str, pk: str, size: int, format=None):
+    """Create a thumbnail requested through the thumbnail view.
+
+    The view locks generation of the thumbnail before queueing the task, the lock
+    is released once the task is done.
+    """
+    model_data = TYPE_TO_MODEL_DATA_MAPPING[object_type]
+    lookup = "uuid" if object_type in UUID_IDENTIFIABLE_TYPES else "id"
+    try:
+        thumbnail_exists = Thumbnail.objects.filter(
+            format=format, size=size, **{f"{model_data.thumbnail_field}__{lookup}": pk}
+        ).exists()
+        if thumbnail_exists:
+            return
+        try:
+            instance = model_data.model.objects.get(**{lookup: pk})
+        except ObjectDoesNotExist:
+            logger.warning("%s with id %r does not exist.", object_type, pk)
+            return
+        if not getattr(instance, model_data.image_field):
+            return
+        try:
+            create_thumbnail(object_type, instance, size, format)
+        except ValueError as error:
+            logger.info(str(error))
+    finally:
+        release_thumbnail_lock(object_type, pk, size, format)
+
+
+def create_product_media_thumbnails(
+    media_qs: QuerySet,
+    sizes: Iterable[int],
+    formats: Iterable[Optional[str]],
+    queue: bool = False,
+) -> int:
+    """Create missing thumbnails of product media in the given sizes and formats.
+
+    Thumbnails are created in the current process, or by Celery tasks when `queue`
+    is set. Return the number of created or queued thumbnails.
+    """
+    sizes = list(sizes)
+    formats = list(formats)
+    media_qs = media_qs.exclude(image="").exclude(image__isnull=True).order_by("pk")
+    count = 0
+    last_pk = 0
+    while True:
+        media_batch = list(
+            media_qs.filter(pk__gt=last_pk)[:PRODUCT_MEDIA_THUMBNAILS_BATCH_SIZE]
+        )
+        if not media_batch:
+            break
+        last_pk = media_batch[-1].pk
+        existing_thumbnails = set(
+            Thumbnail.objects.filter(
+                product_media__in=media_batch, size__in=sizes
+            ).values_list("product_media_id", "size", "format")
+        )
+        for media in media_batch:
+            for size in sizes:
+                for format in formats:
+                    if (media.pk, size, format) in existing_thumbnails:
+                        continue
+                    if queue:
+                        pk = str(media.pk)
+                        if acquire_thumbnail_lock("ProductMedia", pk, size, format):
+                            create_thumbnail_task.delay(
+                                "ProductMedia", pk, size, format
+                            )
+                            count += 1
+                        continue
+                    try:
+                        create_thumbnail("ProductMedia", media, size, format)
+                    except ValueError as error:
+                        logger.info(
+                            "Cannot create thumbnail of product media %r: %s",
+                            media.pk,
+                            error,
+                        )
+                    else:
+                        count += 1
+    return count
@@ -0,0 +1,78 @@
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import call_command
+
+from ...product.models import ProductMedia
+from .. import THUMBNAIL_SIZES
+from ..models import Thumbnail
+from ..tasks import create_thumbnail_task
+from ..utils import acquire_thumbnail_lock, release_thumbnail_lock
+
+
+def test_create_thumbnail_task(product_with_image):
+    # given
+    product_media = product_with_image.media.first()
+    pk = str(product_media.id)
+    assert acquire_thumbnail_lock("ProductMedia", pk, 256, "webp")
+
+    # when
+    create_thumbnail_task("ProductMedia", pk, 256, "webp")
+
+    # then
+    thumbnail = Thumbnail.objects.get(product_media=product_media)
+    assert thumbnail.size == 256
+    assert thumbnail.format == "webp"
+    assert acquire_thumbnail_lock("ProductMedia", pk, 256, "webp")
+    release_thumbnail_lock("ProductMedia", pk, 256, "webp")
+
+
+def test_create_thumbnail_task_thumbnail_already_exists(
+    product_with_image, image, media_root
+):
+    # given
+    product_media = product_with_image.media.first()
+    Thumbnail.objects.create(product_media=product_media, size=256, image=image)
+
+    # when
+    create_thumbnail_task("ProductMedia", str(product_media.id), 256)
+
+    # then
+    assert Thumbnail.objects.filter(product_media=product_media).count() == 1
+
+
+def test_create_product_media_thumbnails_command(product_with_image, image, media_root):
+    # given
+    product_media = product_with_image.media.first()
+    Thumbnail.objects.create(product_media=product_media, size=32, image=image)
+    ProductMedia.objects.create(product=product_with_image, alt="No image")
+    out = StringIO()
+
+    # when
+    call_command(
+        "create_product_media_thumbnails", "--size=32", "--size=64", stdout=out
+    )
+
+    # then
+    assert out.getvalue().strip() == "Created 1 thumbnails."
+    assert sorted(
+        Thumbnail.objects.filter(product_media=product_media).values_list(
+            "size", flat=True
+        )
+    ) == [32, 64]
+
+
+@patch("saleor.thumbnail.tasks.create_thumbnail_task.delay")
+def test_create_product_media_thumbnails_command_queue(mocked_task, product_with_image):
+    # given
+    product_media = product_with_image.media.first()
+    pk = str(product_media.id)
+
+    # when
+    call_command("create_product_media_thumbnails", "--queue", stdout=StringIO())
+
+    # then
+    assert mocked_task.call_count == len(THUMBNAIL_SIZES)
+    for size in THUMBNAIL_SIZES:
+        mocked_task.assert_any_call("ProductMedia", pk, size, None)
+        release_thumbnail_lock("ProductMedia", pk, size, None)
@@ -1,10 +1,12 @@
 from unittest.mock import patch
 
 import graphene
+from django.core.cache import cache
 from PIL import Image
 
 from .. import IconThumbnailFormat, ThumbnailFormat
 from ..models import Thumbnail
+from ..utils import acquire_thumbnail_lock, get_thumbnail_lock_key
 
 
 def test_handle_thumbnail_view_with_format(client, category_with_image, settings):
@@ -112,6 +114,103 @@ def test_handle_thumbnail_view_for_product_media(
     assert Thumbnail.objects.count() == thumbnail_count + 1
 
 
+@patch("saleor.thumbnail.views.create_thumbnail_task.delay")
+def test_handle_thumbnail_view_async_generation(
+    mocked_create_thumbnail_task, client, product_with_image, settings
+):
+    # given
+    settings.THUMBNAIL_ASYNC_GENERATION = True
+    product_media = product_with_image.media.first()
+    product_media_id = graphene.Node.to_global_id("ProductMedia", product_media.id)
+    lock_key = get_thumbnail_lock_key("ProductMedia", str(product_media.id), 512, None)
+
+    # when
+    response = client.get(f"/thumbnail/{product_media_id}/500/")
+
+    # then
+    assert response.status_code == 302
+    assert response.url == product_media.image.url
+    assert response["Cache-Control"] == "no-store"
+    assert not Thumbnail.objects.exists()
+    mocked_create_thumbnail_task.assert_called_once_with(
+        "ProductMedia", str(product_media.id), 512, None
+    )
+    assert cache.get(lock_key)
+    cache.delete(lock_key)
+
+
+@patch("saleor.thumbnail.views.create_thumbnail")
+def test_handle_thumbnail_view_generation_in_progress(
+    mocked_create_thumbnail, client, product_with_image, image, media_root
+):
+    # given
+    product_media = product_with_image.media.first()
+    smaller_thumbnail = Thumbnail.objects.create(
+        product_media=product_media, size=128, image=image
+    )
+    Thumbnail.objects.create(product_media=product_media, size=64, image=image)
+    pk = str(product_media.id)
+    assert acquire_thumbnail_lock("ProductMedia", pk, 512, None)
+    product_media_id = graphene.Node.to_global_id("ProductMedia", product_media.id)
+
+    # when
+    response = client.get(f"/thumbnail/{product_media_id}/500/")
+
+    # then
+    assert response.status_code == 302
+    assert response.url == smaller_thumbnail.image.url
+    mocked_create_thumbnail.assert_not_called()
+    cache.delete(get_thumbnail_lock_key("ProductMedia", pk, 512, None))
+
+
+@patch("saleor.thumbnail.views.create_thumbnail")
+@patch("saleor.thumbnail.views.acquire_thumbnail_lock")
+def test_handle_thumbnail_view_thumbnail_generated_by_another_worker(
+    mocked_acquire_thumbnail_lock,
+    mocked_create_thumbnail,
+    client,
+    product_with_image,
+    image,
+    media_root,
+):
+    # given
+    product_media = product_with_image.media.first()
+    pk = str(product_media.id)
+
+    def generate_thumbnail_and_acquire_lock(*args):
+        # the thumbnail is generated by another worker after the first check
+        Thumbnail.objects.create(product_media=product_media, size=512, image=image)
+        return acquire_thumbnail_lock(*args)
+
+    mocked_acquire_thumbnail_lock.side_effect = generate_thumbnail_and_acquire_lock
+    product_media_id = graphene.Node.to_global_id("ProductMedia", product_media.id)
+
+    # when
+    response = client.get(f"/thumbnail/{product_media_id}/500/")
+
+    # then
+    assert response.status_code == 302
+    assert response.url == Thumbnail.objects.get(size=512).image.url
+    mocked_create_thumbnail.assert_not_called()
+    assert acquire_thumbnail_lock("ProductMedia", pk, 512, None)
+    cache.delete(get_thumbnail_lock_key("ProductMedia", pk, 512, None))
+
+
+def test_handle_thumbnail_view_releases_lock(client, category_with_image):
+    # given
+    category_id = graphene.Node.to_global_id("Category", category_with_image.id)
+
+    # when
+    response = client.get(f"/thumbnail/{category_id}/60/")
+
+    # then
+    assert response.status_code == 302
+    assert acquire_thumbnail_lock("Category", str(category_with_image.id), 64, None)
+    cache.delete(
+        get_thumbnail_lock_key("Category", str(category_with_image.id), 64, None)
+    )
+
+
 def test_handle_thumbnail_view_for_category_thumbnail_already_exist(
     client, category, settings, image, media_root
 ):
@@ -5,6 +5,8 @@ from typing import TYPE_CHECKING, Optional, Union
 
 import graphene
 import magic
+from django.conf import settings
+from django.core.cache import cache
 from django.core.files import File
 from django.core.files.storage import default_storage
 from django.urls import reverse
@@ -79,6 +81,31 @@ def get_icon_thumbnail_format(format: Optional[str]) -> Optional[str]:
     return format
 
 
+def get_thumbnail_lock_key(
+    object_type: str, pk: str, size: int, format: Optional[str]
+) -> str:
+    return f"thumbnail-lock:{object_type}:{pk}:{size}:{format or ''}"
+
+
+def acquire_thumbnail_lock(
+    object_type: str, pk: str, size: int, format: Optional[str]
+) -> bool:
+    """Lock generation of the thumbnail, return False if it's already locked.
+
+    The lock expires after `THUMBNAIL_GENERATION_LOCK_TIMEOUT`, so a thumbnail can be
+    generated again if the worker holding the lock died.
+    """
+    return cache.add(
+        get_thumbnail_lock_key(object_type, pk, size, format),
+        True,
+        timeout=settings.THUMBNAIL_GENERATION_LOCK_TIMEOUT,
+    )
+
+
+def release_thumbnail_lock(object_type: str, pk: str, size: int, format: Optional[str]):
+    cache.delete(get_thumbnail_lock_key(object_type, pk, size, format))
+
+
 def prepare_thumbnail_file_name(
     file_name: str, size: int, format: Optional[str]
 ) -> str:
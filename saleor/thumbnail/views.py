@@ -1,7 +1,7 @@
 import logging
-from collections import namedtuple
 from typing import Optional
 
+from django.conf import settings
 from django.core.exceptions import ObjectDoesNotExist
 from django.http import (
     HttpResponseBadRequest,
@@ -10,40 +10,23 @@ from django.http import (
 )
 from graphql.error import GraphQLError
 
-from ..account.models import User
-from ..app.models import App, AppInstallation
-from ..core.utils.events import call_event
 from ..graphql.core.utils import from_global_id_or_error
-from ..plugins.manager import get_plugins_manager
-from ..product.models import Category, Collection, ProductMedia
-from ..thumbnail.models import Thumbnail
+from ..thumbnail.models import (
+    ICON_TYPE_TO_MODEL_DATA_MAPPING,
+    TYPE_TO_MODEL_DATA_MAPPING,
+    UUID_IDENTIFIABLE_TYPES,
+    Thumbnail,
+)
 from . import ALLOWED_ICON_THUMBNAIL_FORMATS, ALLOWED_THUMBNAIL_FORMATS
+from .tasks import create_thumbnail, create_thumbnail_task
 from .utils import (
-    ProcessedIconImage,
-    ProcessedImage,
+    acquire_thumbnail_lock,
     get_thumbnail_size,
-    prepare_thumbnail_file_name,
+    release_thumbnail_lock,
 )
 
 logger = logging.getLogger(__name__)
 
-ModelData = namedtuple("ModelData", ["model", "image_field", "thumbnail_field"])
-
-ICON_TYPE_TO_MODEL_DATA_MAPPING = {
-    "App": ModelData(App, "brand_logo_default", "app"),
-    "AppInstallation": ModelData(
-        AppInstallation, "brand_logo_default", "app_installation"
-    ),
-}
-TYPE_TO_MODEL_DATA_MAPPING = {
-    "User": ModelData(User, "avatar", "user"),
-    "Category": ModelData(Category, "background_image", "category"),
-    "Collection": ModelData(Collection, "background_image", "collection"),
-    "ProductMedia": ModelData(ProductMedia, "image", "product_media"),
-    **ICON_TYPE_TO_MODEL_DATA_MAPPING,
-}
-UUID_IDENTIFIABLE_TYPES = ["User", "App", "AppInstallation"]
-
 
 def handle_thumbnail(
     request, instance_id: str, size: str, format: Optional[str] = None
@@ -99,32 +82,47 @@ def handle_thumbnail(
     if not bool(image):
         return HttpResponseNotFound("There is no image for provided instance.")
 
-    # prepare thumbnail
-    if object_type in ICON_TYPE_TO_MODEL_DATA_MAPPING:
-        processed_image: ProcessedImage = ProcessedIconImage(
-            image.name, size_px, format
-        )
-    else:
-        processed_image = ProcessedImage(image.name, size_px, format)
+    # Only one worker generates a given thumbnail at a time, other requests are
+    # redirected to a placeholder until the thumbnail is ready.
+    if not acquire_thumbnail_lock(object_type, pk, size_px, format):
+        return get_placeholder_redirect(image, instance_id_lookup, pk, size_px, format)
+
+    if settings.THUMBNAIL_ASYNC_GENERATION:
+        create_thumbnail_task.delay(object_type, pk, size_px, format)
+        return get_placeholder_redirect(image, instance_id_lookup, pk, size_px, format)
+
     try:
-        thumbnail_file, _ = processed_image.create_thumbnail()
+        # another worker might have generated the thumbnail and released the lock
+        # since the first check
+        if thumbnail := Thumbnail.objects.filter(
+            format=format, size=size_px, **{instance_id_lookup: pk}
+        ).first():
+            return HttpResponseRedirect(thumbnail.image.url)
+        thumbnail = create_thumbnail(object_type, instance, size_px, format)
     except ValueError as error:
         logger.info(str(error))
         return HttpResponseBadRequest("Invalid image.")
+    finally:
+        release_thumbnail_lock(object_type, pk, size_px, format)
 
-    thumbnail_file_name = prepare_thumbnail_file_name(image.name, size_px, format)
+    return HttpResponseRedirect(thumbnail.image.url)
 
-    # save image thumbnail
-    thumbnail = Thumbnail(
-        size=size_px, format=format, **{model_data.thumbnail_field: instance}
-    )
-    thumbnail.image.save(thumbnail_file_name, thumbnail_file)
-    thumbnail.save()
 
-    # set additional `instance` attribute, to easily get instance data
-    # for ThumbnailCreated subscription type
-    setattr(thumbnail, "instance", instance)
-    manager = get_plugins_manager(allow_replica=False)
-    call_event(manager.thumbnail_created, thumbnail)
+def get_placeholder_redirect(
+    image, instance_id_lookup: str, pk: str, size: int, format: Optional[str]
+) -> HttpResponseRedirect:
+    """Redirect to the largest smaller thumbnail or to the original image.
 
-    return HttpResponseRedirect(thumbnail.image.url)
+    The response must not be cached, so the client requests the proper thumbnail
+    once it's generated.
+    """
+    thumbnail = (
+        Thumbnail.objects.filter(
+            format=format, size__lt=size, **{instance_id_lookup: pk}
+        )
+        .order_by("-size")
+        .first()
+    )
+    response = HttpResponseRedirect(thumbnail.image.url if thumbnail else image.url)
+    response["Cache-Control"] = "no-store"
+    return response
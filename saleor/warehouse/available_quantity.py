@@ -0,0 +1,120 @@
+from collections.abc import Iterable
+from typing import Optional
+from uuid import uuid4
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+AVAILABLE_QUANTITY_VERSION_KEY = "variant_available_quantity_version"
+
+# Variant ID, country code and channel slug of a single cached available quantity.
+VariantAvailableQuantityKey = tuple[int, Optional[str], str]
+
+
+def is_available_quantity_cache_enabled() -> bool:
+    return bool(settings.AVAILABLE_QUANTITY_CACHE_TIMEOUT)
+
+
+def _get_cache_version() -> str:
+    version = cache.get(AVAILABLE_QUANTITY_VERSION_KEY)
+    if version is None:
+        cache.add(AVAILABLE_QUANTITY_VERSION_KEY, uuid4().hex, timeout=None)
+        version = cache.get(AVAILABLE_QUANTITY_VERSION_KEY)
+    return version
+
+
+def get_available_quantity_token_key(version: str, variant_id: int) -> str:
+    return f"variant_available_quantity_token:{version}:{variant_id}"
+
+
+def get_available_quantity_key(
+    token: str,
+    variant_id: int,
+    country_code: Optional[str],
+    channel_slug: str,
+) -> str:
+    return (
+        f"variant_available_quantity:{token}:{variant_id}:{country_code}:{channel_slug}"
+    )
+
+
+def get_available_quantity_tokens(variant_ids: Iterable[int]) -> dict[int, str]:
+    """Return the current cache tokens of the given variants.
+
+    Quantities are stored under the token of the variant, which is dropped when the
+    variant's quantities are invalidated. Quantities calculated from data read before
+    the invalidation are stored under the old token, so they are never read.
+    """
+    version = _get_cache_version()
+    keys = {
+        get_available_quantity_token_key(version, variant_id): variant_id
+        for variant_id in variant_ids
+    }
+    tokens = cache.get_many(keys.keys())
+    missing_keys = [key for key in keys if key not in tokens]
+    for key in missing_keys:
+        cache.add(key, uuid4().hex, timeout=settings.AVAILABLE_QUANTITY_CACHE_TIMEOUT)
+    if missing_keys:
+        tokens.update(cache.get_many(missing_keys))
+    return {keys[key]: token for key, token in tokens.items()}
+
+
+def get_available_quantities(
+    tokens: dict[int, str], keys: Iterable[VariantAvailableQuantityKey]
+) -> dict[VariantAvailableQuantityKey, int]:
+    """Return cached available quantities of the given variants."""
+    cache_keys = {
+        get_available_quantity_key(tokens[key[0]], *key): key
+        for key in keys
+        if key[0] in tokens
+    }
+    quantities = cache.get_many(cache_keys.keys())
+    return {cache_keys[key]: value for key, value in quantities.items()}
+
+
+def set_available_quantities(
+    tokens: dict[int, str],
+    quantities: dict[VariantAvailableQuantityKey, int],
+    timeout: int,
+):
+    """Store available quantities under the tokens read before they were calculated."""
+    cache.set_many(
+        {
+            get_available_quantity_key(tokens[key[0]], *key): value
+            for key, value in quantities.items()
+            if key[0] in tokens
+        },
+        timeout=timeout,
+    )
+
+
+def invalidate_available_quantities(variant_ids: Iterable[int]):
+    """Drop cached available quantities of the given variants on commit.
+
+    Should be called whenever stock quantities, allocations or reservations
+    of the variants change.
+    """
+    if not is_available_quantity_cache_enabled():
+        return
+    variant_ids = set(variant_ids)
+    if not variant_ids:
+        return
+
+    def delete_quantities():
+        version = _get_cache_version()
+        cache.delete_many(
+            [
+                get_available_quantity_token_key(version, variant_id)
+                for variant_id in variant_ids
+            ]
+        )
+
+    transaction.on_commit(delete_quantities)
+
+
+def invalidate_all_available_quantities():
+    """Drop cached available quantities of all variants."""
+    if not is_available_quantity_cache_enabled():
+        return
+    cache.set(AVAILABLE_QUANTITY_VERSION_KEY, uuid4().hex, timeout=None)
@@ -1,6 +1,7 @@
 import math
 from collections import defaultdict, namedtuple
 from collections.abc import Iterable
+from functools import partial
 from typing import TYPE_CHECKING, Any, Optional, cast
 from uuid import UUID
 
@@ -22,6 +23,7 @@ from ..order.fetch import OrderLineInfo
 from ..order.models import OrderLine
 from ..plugins.manager import PluginsManager
 from ..product.models import ProductVariant, ProductVariantChannelListing
+from .available_quantity import invalidate_available_quantities
 from .models import (
     Allocation,
     ChannelWarehouse,
@@ -53,12 +55,15 @@ def allocate_stocks(
 ):
     """Allocate stocks for given `order_lines` in given country.
 
-    Function lock for update all stocks and allocations for variants in
-    given country and order by pk. Next, generate the dictionary
+    Function lock for update all stocks for variants in given country, skipping
+    the stocks already locked by concurrent allocations, so the allocation falls
+    back to the stocks in other warehouses. Next, generate the dictionary
     ({"stock_pk": "quantity_allocated"}) with actual allocated quantity for stocks.
     Iterate by stocks and allocate as many items as needed or available in stock
     for order line, until allocated all required quantity for the order line.
-    If there is less quantity in stocks then rise InsufficientStock exception.
+    If there is less quantity in not locked stocks, release the taken locks, wait
+    for all stocks and allocate again. If there is still less quantity in stocks then rise
+    InsufficientStock exception.
     """
     # allocation only applied to order lines with variants with track inventory
     # set to True
@@ -76,19 +81,102 @@ def allocate_stocks(
 
     # in case of click and collect order, we need to check local or global stock
     # regardless of the country code
-    stocks = (
+    stocks_qs = (
         Stock.objects.for_channel_and_click_and_collect(channel_slug)
         if collection_point_pk
         else Stock.objects.for_channel_and_country(channel_slug, country_code)
-    )
+    ).filter(**filter_lookup)
+
+    try:
+        # locks taken when skipping the locked stocks are released with the savepoint
+        # before waiting for all stocks, so concurrent allocations waiting for each
+        # other's stocks do not deadlock
+        with transaction.atomic():
+            stocks = _lock_stocks(stocks_qs, skip_locked=True)
+            allocations, quantity_allocation_for_stocks = _get_allocations(
+                order_lines_info,
+                stocks,
+                channel,
+                collection_point_pk,
+                check_reservations,
+                checkout_lines,
+            )
+    except InsufficientStock:
+        locked_stocks_ids = [stock_data["pk"] for stock_data in stocks]
+        if not stocks_qs.exclude(pk__in=locked_stocks_ids).exists():
+            raise
+        stocks = _lock_stocks(stocks_qs, skip_locked=False)
+        allocations, quantity_allocation_for_stocks = _get_allocations(
+            order_lines_info,
+            stocks,
+            channel,
+            collection_point_pk,
+            check_reservations,
+            checkout_lines,
+        )
+
+    if allocations:
+        Allocation.objects.bulk_create(allocations)
+        quantity_allocated_per_stock: dict[int, int] = defaultdict(int)
+        for allocation in allocations:
+            quantity_allocated_per_stock[
+                allocation.stock_id
+            ] += allocation.quantity_allocated
+        Stock.objects.bulk_update(
+            [
+                Stock(
+                    pk=stock_id,
+                    quantity_allocated=F("quantity_allocated") + quantity,
+                )
+                for stock_id, quantity in quantity_allocated_per_stock.items()
+            ],
+            ["quantity_allocated"],
+        )
+        invalidate_available_quantities(
+            stock_data["product_variant"] for stock_data in stocks
+        )
+
+        # stocks are locked, so the stock is out of stock when the already allocated
+        # quantity together with the new allocations covers the stock quantity
+        stock_quantities = {
+            stock_data["pk"]: stock_data["quantity"] for stock_data in stocks
+        }
+        out_of_stock_ids = [
+            stock_id
+            for stock_id, quantity in quantity_allocated_per_stock.items()
+            if stock_quantities[stock_id]
+            - quantity_allocation_for_stocks[stock_id]
+            - quantity
+            <= 0
+        ]
+        if out_of_stock_ids:
+            for stock in Stock.objects.filter(pk__in=out_of_stock_ids):
+                transaction.on_commit(
+                    partial(manager.product_variant_out_of_stock, stock)
+                )
+
 
-    stocks = list(
-        stocks.select_for_update(of=("self",))
-        .filter(**filter_lookup)
+def _lock_stocks(stocks_qs, skip_locked: bool) -> list[dict]:
+    return list(
+        stocks_qs.select_for_update(of=("self",), skip_locked=skip_locked)
         .order_by("pk")
-        .values("id", "product_variant", "pk", "quantity", "warehouse_id")
+        .values("product_variant", "pk", "quantity", "warehouse_id")
     )
-    stocks_id = (stock.pop("id") for stock in stocks)
+
+
+def _get_allocations(
+    order_lines_info: Iterable["OrderLineInfo"],
+    stocks: list[dict],
+    channel: "Channel",
+    collection_point_pk: Optional[UUID],
+    check_reservations: bool,
+    checkout_lines: Optional[Iterable["CheckoutLine"]],
+) -> tuple[list[Allocation], dict[int, int]]:
+    """Return allocations for order lines and quantity already allocated in stocks.
+
+    Raise InsufficientStock when any line cannot be allocated in given stocks.
+    """
+    stocks_id = [stock_data["pk"] for stock_data in stocks]
 
     quantity_reservation_for_stocks: dict = _prepare_stock_to_reserved_quantity_map(
         checkout_lines, check_reservations, stocks_id
@@ -110,7 +198,7 @@ def allocate_stocks(
 
     stocks = sort_stocks(
         channel.allocation_strategy,
-        stocks,
+        [stock_data.copy() for stock_data in stocks],
         channel,
         quantity_allocation_for_stocks,
         collection_point_pk,
@@ -138,27 +226,7 @@ def allocate_stocks(
     if insufficient_stock:
         raise InsufficientStock(insufficient_stock)
 
-    if allocations:
-        stocks_to_update = []
-        for alloc in Allocation.objects.bulk_create(allocations):
-            stock = alloc.stock
-            stock.quantity_allocated = (
-                F("quantity_allocated") + alloc.quantity_allocated
-            )
-            stocks_to_update.append(stock)
-        Stock.objects.bulk_update(stocks_to_update, ["quantity_allocated"])
-
-        for allocation in allocations:
-            allocated_stock = (
-                Allocation.objects.filter(stock_id=allocation.stock_id).aggregate(
-                    Sum("quantity_allocated")
-                )["quantity_allocated__sum"]
-                or 0
-            )
-            if not max(allocation.stock.quantity - allocated_stock, 0):
-                transaction.on_commit(
-                    lambda: manager.product_variant_out_of_stock(allocation.stock)
-                )
+    return allocations, quantity_allocation_for_stocks
 
 
 def _prepare_stock_to_reserved_quantity_map(
@@ -355,6 +423,9 @@ def deallocate_stock(
             )
 
     Stock.objects.bulk_update(stocks_to_update, ["quantity_allocated"])
+    invalidate_available_quantities(
+        stock.product_variant_id for stock in stocks_to_update
+    )
 
     if not_dellocated_lines:
         raise AllocationError(not_dellocated_lines)
@@ -400,6 +471,7 @@ def increase_stock(
             )
         stock.quantity_allocated = F("quantity_allocated") + quantity
         stock.save(update_fields=["quantity_allocated"])
+    invalidate_available_quantities([order_line.variant.pk])
 
 
 @traced_atomic_transaction()
@@ -432,6 +504,9 @@ def increase_allocations(
         stocks_to_update.append(stock)
     Allocation.objects.filter(pk__in=allocation_pks_to_delete).delete()
     Stock.objects.bulk_update(stocks_to_update, ["quantity_allocated"])
+    invalidate_available_quantities(
+        stock.product_variant_id for stock in stocks_to_update
+    )
 
     allocate_stocks(
         lines_info,
@@ -574,6 +649,9 @@ def _decrease_stocks_quantity(
         raise InsufficientStock(insufficient_stocks)
 
     Stock.objects.bulk_update(stocks_to_update, ["quantity"])
+    invalidate_available_quantities(
+        stock.product_variant_id for stock in stocks_to_update
+    )
 
 
 def get_order_lines_with_track_inventory(
@@ -611,6 +689,9 @@ def deallocate_stock_for_order(order: "Order", manager: PluginsManager):
 
     allocations.update(quantity_allocated=0)
     Stock.objects.bulk_update(stocks_to_update, ["quantity_allocated"])
+    invalidate_available_quantities(
+        stock.product_variant_id for stock in stocks_to_update
+    )
 
 
 @traced_atomic_transaction()
@@ -635,6 +716,9 @@ def deallocate_stock_for_orders(orders_id, manager: PluginsManager):
 
     allocations.update(quantity_allocated=0)
     Stock.objects.bulk_update(stocks_to_update, ["quantity_allocated"])
+    invalidate_available_quantities(
+        stock.product_variant_id for stock in stocks_to_update
+    )
 
 
 @traced_atomic_transaction()
@@ -857,6 +941,7 @@ def deactivate_preorder_for_variant(product_variant: ProductVariant):
             "updated_at",
         ]
     )
+    invalidate_available_quantities([product_variant.pk])
 
     ProductVariantChannelListing.objects.filter(variant_id=product_variant.pk).update(
         preorder_quantity_threshold=None
@@ -10,6 +10,7 @@ from django.utils import timezone
 from ..core.exceptions import InsufficientStock, InsufficientStockData
 from ..core.tracing import traced_atomic_transaction
 from ..product.models import ProductVariant, ProductVariantChannelListing
+from .available_quantity import invalidate_available_quantities
 from .management import sort_stocks
 from .models import Allocation, PreorderReservation, Reservation, Stock
 
@@ -173,6 +174,7 @@ def reserve_stocks(
         if replace:
             Reservation.objects.filter(checkout_line__in=checkout_lines).delete()
         Reservation.objects.bulk_create(reservations)
+        invalidate_available_quantities(variants_ids)
 
 
 def _create_stock_reservations(
@@ -4,6 +4,11 @@ from django.db.models.functions import Coalesce
 from django.utils import timezone
 
 from ..celeryconf import app
+from .available_quantity import (
+    invalidate_all_available_quantities,
+    invalidate_available_quantities,
+    is_available_quantity_cache_enabled,
+)
 from .models import Allocation, PreorderReservation, Reservation, Stock
 
 task_logger = get_task_logger(__name__)
@@ -53,7 +58,23 @@ def update_stocks_quantity_allocated_task():
         stocks_to_update.append(mismatched_stock)
 
     Stock.objects.bulk_update(stocks_to_update, ["quantity_allocated"])
+    invalidate_available_quantities(
+        stock.product_variant_id for stock in stocks_to_update
+    )
     task_logger.info(
         "Finished updating quantity_allocated on stocks, %d were corrected.",
         len(stocks_to_update),
     )
+
+
+@app.task
+def reconcile_available_quantities_task():
+    """Drop all cached available quantities, so they are recalculated.
+
+    Covers changes that are not invalidated explicitly, e.g. expired reservations
+    or changes of shipping zones and channel warehouses.
+    """
+    if not is_available_quantity_cache_enabled():
+        return
+    invalidate_all_available_quantities()
+    task_logger.info("Cached available quantities of variants have been dropped.")
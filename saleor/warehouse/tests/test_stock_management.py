@@ -1,6 +1,10 @@
+import threading
+import time
 from unittest import mock
 
 import pytest
+from django.core.cache import cache
+from django.db import connection, transaction
 from django.db.models import Sum
 from django.db.models.functions import Coalesce
 
@@ -11,6 +15,13 @@ from ...order.models import OrderLine
 from ...plugins.manager import get_plugins_manager
 from ...tests.utils import flush_post_commit_hooks
 from ...warehouse.models import Stock
+from .. import management
+from ..available_quantity import (
+    AVAILABLE_QUANTITY_VERSION_KEY,
+    get_available_quantities,
+    get_available_quantity_tokens,
+    set_available_quantities,
+)
 from ..management import (
     allocate_preorders,
     allocate_stocks,
@@ -45,6 +56,33 @@ def test_allocate_stocks(order_line, stock, channel_USD):
     assert allocation.quantity_allocated == stock.quantity_allocated == 50
 
 
+def test_allocate_stocks_invalidates_cached_available_quantities(
+    order_line, stock, channel_USD, settings, django_capture_on_commit_callbacks
+):
+    # given
+    settings.AVAILABLE_QUANTITY_CACHE_TIMEOUT = 60
+    variant = order_line.variant
+    key = (variant.pk, COUNTRY_CODE, channel_USD.slug)
+    set_available_quantities(
+        get_available_quantity_tokens([variant.pk]), {key: 10}, timeout=60
+    )
+    line_data = OrderLineInfo(line=order_line, variant=variant, quantity=5)
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        allocate_stocks(
+            [line_data],
+            COUNTRY_CODE,
+            channel_USD,
+            manager=get_plugins_manager(allow_replica=False),
+        )
+
+    # then
+    tokens = get_available_quantity_tokens([variant.pk])
+    assert get_available_quantities(tokens, [key]) == {}
+    cache.delete(AVAILABLE_QUANTITY_VERSION_KEY)
+
+
 def test_allocate_stocks_multiple_lines_the_highest_stock_strategy(
     order_line, order, product, stock, channel_USD
 ):
@@ -107,6 +145,225 @@ def test_allocate_stock_many_stocks_the_highest_stock_strategy(
     assert allocations[1].quantity_allocated == stocks[1].quantity_allocated == 1
 
 
+def _lock_stock_in_thread(stock, hold_for):
+    """Lock the stock row in a separate transaction for the given number of seconds."""
+    locked = threading.Event()
+
+    def lock_stock():
+        try:
+            with transaction.atomic():
+                Stock.objects.select_for_update().get(pk=stock.pk)
+                locked.set()
+                time.sleep(hold_for)
+        finally:
+            connection.close()
+
+    thread = threading.Thread(target=lock_stock)
+    thread.start()
+    locked.wait(timeout=10)
+    return thread
+
+
+@pytest.mark.django_db(transaction=True)
+def test_allocate_stocks_skips_stock_locked_by_concurrent_allocation(
+    order_line, variant_with_many_stocks, channel_USD
+):
+    # given
+    stock_1, stock_2 = variant_with_many_stocks.stocks.order_by("-quantity")
+    line_data = OrderLineInfo(line=order_line, variant=order_line.variant, quantity=2)
+    thread = _lock_stock_in_thread(stock_1, hold_for=0.5)
+
+    # when
+    allocate_stocks(
+        [line_data],
+        COUNTRY_CODE,
+        channel_USD,
+        manager=get_plugins_manager(allow_replica=False),
+    )
+    thread.join()
+
+    # then
+    allocation = Allocation.objects.get(order_line=order_line)
+    assert allocation.stock == stock_2
+    assert allocation.quantity_allocated == 2
+
+
+@pytest.mark.django_db(transaction=True)
+def test_allocate_stocks_waits_for_locked_stock_when_other_stocks_insufficient(
+    order_line, variant_with_many_stocks, channel_USD
+):
+    # given
+    stock_1, stock_2 = variant_with_many_stocks.stocks.order_by("-quantity")
+    line_data = OrderLineInfo(line=order_line, variant=order_line.variant, quantity=6)
+    thread = _lock_stock_in_thread(stock_1, hold_for=0.2)
+
+    # when
+    allocate_stocks(
+        [line_data],
+        COUNTRY_CODE,
+        channel_USD,
+        manager=get_plugins_manager(allow_replica=False),
+    )
+    thread.join()
+
+    # then
+    stock_1.refresh_from_db()
+    stock_2.refresh_from_db()
+    assert stock_1.quantity_allocated == 4
+    assert stock_2.quantity_allocated == 2
+
+
+@pytest.mark.django_db(transaction=True)
+def test_allocate_stocks_concurrently_for_single_variant(
+    order_line, variant_with_many_stocks, channel_USD
+):
+    # given
+    stocks = variant_with_many_stocks.stocks.all()
+    available_quantity = sum(stock.quantity for stock in stocks)
+    parallel_allocations_count = available_quantity + 3
+
+    order_lines = []
+    for _ in range(parallel_allocations_count):
+        line = OrderLine.objects.get(pk=order_line.pk)
+        line.pk = None
+        line.save()
+        order_lines.append(line)
+
+    barrier = threading.Barrier(parallel_allocations_count)
+    results = []
+
+    def allocate(line):
+        line_data = OrderLineInfo(line=line, variant=line.variant, quantity=1)
+        barrier.wait(timeout=10)
+        try:
+            allocate_stocks(
+                [line_data],
+                COUNTRY_CODE,
+                channel_USD,
+                manager=get_plugins_manager(allow_replica=False),
+            )
+            results.append(True)
+        except InsufficientStock:
+            results.append(False)
+        finally:
+            connection.close()
+
+    threads = [threading.Thread(target=allocate, args=(line,)) for line in order_lines]
+
+    # when
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # then
+    assert results.count(True) == available_quantity
+    assert results.count(False) == 3
+    for stock in stocks:
+        stock.refresh_from_db()
+        allocated = Allocation.objects.filter(stock=stock).aggregate(
+            total=Sum("quantity_allocated")
+        )["total"]
+        assert stock.quantity_allocated == allocated == stock.quantity
+
+
+@pytest.mark.django_db(transaction=True)
+def test_allocate_stocks_concurrently_falling_back_to_locked_stocks(
+    order_line, variant_with_many_stocks, channel_USD
+):
+    # given
+    stocks = list(variant_with_many_stocks.stocks.order_by("pk"))
+    order_lines = []
+    for _ in stocks:
+        line = OrderLine.objects.get(pk=order_line.pk)
+        line.pk = None
+        line.save()
+        order_lines.append(line)
+
+    # each allocation gets a different stock when skipping the locked ones and
+    # needs both stocks, so both fall back to waiting for the other's stock
+    stock_pk_per_thread = {}
+    barrier = threading.Barrier(len(stocks))
+    lock_stocks = management._lock_stocks
+
+    def lock_stocks_skipping_other_thread_stock(stocks_qs, skip_locked):
+        if not skip_locked:
+            return lock_stocks(stocks_qs, skip_locked)
+        stock_pk = stock_pk_per_thread[threading.get_ident()]
+        locked_stocks = lock_stocks(stocks_qs.filter(pk=stock_pk), skip_locked)
+        barrier.wait(timeout=10)
+        return locked_stocks
+
+    results = []
+
+    def allocate(line, stock):
+        stock_pk_per_thread[threading.get_ident()] = stock.pk
+        line_data = OrderLineInfo(line=line, variant=line.variant, quantity=5)
+        try:
+            allocate_stocks(
+                [line_data],
+                COUNTRY_CODE,
+                channel_USD,
+                manager=get_plugins_manager(allow_replica=False),
+            )
+            results.append(True)
+        except InsufficientStock:
+            results.append(False)
+        except Exception as e:
+            results.append(e)
+        finally:
+            connection.close()
+
+    threads = [
+        threading.Thread(target=allocate, args=(line, stock))
+        for line, stock in zip(order_lines, stocks)
+    ]
+
+    # when
+    with mock.patch.object(
+        management,
+        "_lock_stocks",
+        side_effect=lock_stocks_skipping_other_thread_stock,
+    ):
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    # then
+    assert results.count(True) == 1, results
+    assert results.count(False) == 1, results
+    assert Allocation.objects.aggregate(total=Sum("quantity_allocated")) == {"total": 5}
+
+
+@mock.patch("saleor.plugins.manager.PluginsManager.product_variant_out_of_stock")
+def test_allocate_stocks_triggers_out_of_stock_for_each_emptied_stock(
+    product_variant_out_of_stock_mock,
+    order_line,
+    variant_with_many_stocks,
+    channel_USD,
+    django_capture_on_commit_callbacks,
+):
+    # given
+    stocks = variant_with_many_stocks.stocks.all()
+    line_data = OrderLineInfo(line=order_line, variant=order_line.variant, quantity=7)
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        allocate_stocks(
+            [line_data],
+            COUNTRY_CODE,
+            channel_USD,
+            manager=get_plugins_manager(allow_replica=False),
+        )
+
+    # then
+    assert product_variant_out_of_stock_mock.call_count == 2
+    assert {call.args[0] for call in product_variant_out_of_stock_mock.mock_calls} == (
+        set(stocks)
+    )
+
+
 def test_allocate_stocks_the_highest_stock_strategy_with_collection_point(
     order_line, variant_with_many_stocks, channel_USD, warehouse_for_cc
 ):
@@ -1,11 +1,19 @@
 from datetime import timedelta
 
 import pytest
+from django.core.cache import cache
 from django.utils import timezone
 
+from ..available_quantity import (
+    AVAILABLE_QUANTITY_VERSION_KEY,
+    get_available_quantities,
+    get_available_quantity_tokens,
+    set_available_quantities,
+)
 from ..models import PreorderReservation, Reservation
 from ..tasks import (
     delete_expired_reservations_task,
+    reconcile_available_quantities_task,
     update_stocks_quantity_allocated_task,
 )
 
@@ -85,3 +93,20 @@ def test_update_stocks_quantity_allocated_task_stock_without_allocations(stock):
 
     stock.refresh_from_db()
     assert stock.quantity_allocated == 0
+
+
+def test_reconcile_available_quantities_task(variant, channel_USD, settings):
+    # given
+    settings.AVAILABLE_QUANTITY_CACHE_TIMEOUT = 60
+    key = (variant.pk, "US", channel_USD.slug)
+    set_available_quantities(
+        get_available_quantity_tokens([variant.pk]), {key: 10}, timeout=60
+    )
+
+    # when
+    reconcile_available_quantities_task()
+
+    # then
+    tokens = get_available_quantity_tokens([variant.pk])
+    assert get_available_quantities(tokens, [key]) == {}
+    cache.delete(AVAILABLE_QUANTITY_VERSION_KEY)
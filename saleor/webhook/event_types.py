@@ -791,6 +791,7 @@ class WebhookEventSyncType:
 
     CHECKOUT_CALCULATE_TAXES = "checkout_calculate_taxes"
     ORDER_CALCULATE_TAXES = "order_calculate_taxes"
+    ORDER_CALCULATE_TAXES_BULK = "order_calculate_taxes_bulk"
 
     TRANSACTION_CHARGE_REQUESTED = "transaction_charge_requested"
     TRANSACTION_REFUND_REQUESTED = "transaction_refund_requested"
@@ -854,6 +855,10 @@ class WebhookEventSyncType:
             "name": "Calculate taxes for order",
             "permission": CheckoutPermissions.HANDLE_TAXES,
         },
+        ORDER_CALCULATE_TAXES_BULK: {
+            "name": "Calculate taxes for many orders",
+            "permission": CheckoutPermissions.HANDLE_TAXES,
+        },
         TRANSACTION_CHARGE_REQUESTED: {
             "name": "Transaction charge requested",
             "permission": PaymentPermissions.HANDLE_PAYMENTS,
@@ -120,7 +120,8 @@ class EventDeliveryPayload(TypedDict):
 
 
 class EventDelivery(TypedDict):
-    id: str
+    # not set for deliveries of synchronous webhooks that were not saved
+    id: Optional[str]
     status: str
     event_type: str
     event_sync: bool
@@ -139,7 +140,8 @@ class EventDeliveryAttemptResponse(TypedDict):
 
 
 class EventDeliveryAttemptPayload(ObservabilityEventBase):
-    id: str
+    # not set for attempts of synchronous webhooks that were not saved
+    id: Optional[str]
     time: datetime
     duration: Optional[float]
     status: str
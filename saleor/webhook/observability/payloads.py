@@ -191,6 +191,10 @@ def generate_api_call_payload(
     return dump_payload(payload)
 
 
+def get_global_id_or_none(type_name: str, pk: Optional[int]) -> Optional[str]:
+    return graphene.Node.to_global_id(type_name, pk) if pk is not None else None
+
+
 @traced_payload_generator
 def generate_event_delivery_attempt_payload(
     attempt: "EventDeliveryAttempt",
@@ -208,8 +212,9 @@ def generate_event_delivery_attempt_payload(
             "payload set. Can't generate payload."
         )
     response_body = attempt.response or ""
+    event_delivery_data = attempt.delivery.payload.get_payload()
     payload = EventDeliveryAttemptPayload(
-        id=graphene.Node.to_global_id("EventDeliveryAttempt", attempt.pk),
+        id=get_global_id_or_none("EventDeliveryAttempt", attempt.pk),
         event_type=ObservabilityEventTypes.EVENT_DELIVERY_ATTEMPT,
         time=attempt.created_at,
         duration=attempt.duration,
@@ -225,12 +230,12 @@ def generate_event_delivery_attempt_payload(
             status_code=attempt.response_status_code,
         ),
         event_delivery=EventDelivery(
-            id=graphene.Node.to_global_id("EventDelivery", attempt.delivery.pk),
+            id=get_global_id_or_none("EventDelivery", attempt.delivery.pk),
             status=attempt.delivery.status,
             event_type=attempt.delivery.event_type,
             event_sync=attempt.delivery.event_type in WebhookEventSyncType.ALL,
             payload=EventDeliveryPayload(
-                content_length=len(attempt.delivery.payload.payload.encode("utf-8")),
+                content_length=len(event_delivery_data.encode("utf-8")),
                 body=TRUNC_PLACEHOLDER,
             ),
         ),
@@ -262,7 +267,7 @@ def generate_event_delivery_attempt_payload(
     payload["response"]["body"] = JsonTruncText.truncate(response_body, remaining // 2)
     remaining -= payload["response"]["body"].byte_size
 
-    event_delivery_payload = json.loads(attempt.delivery.payload.payload)
+    event_delivery_payload = json.loads(event_delivery_data)
     event_delivery_payload = anonymize_event_payload(
         subscription_query,
         attempt.delivery.event_type,
@@ -9,7 +9,9 @@ from django.http import JsonResponse
 from django.utils import timezone
 
 from ....core import EventDeliveryStatus
-from ....webhook.event_types import WebhookEventAsyncType
+from ....core.models import EventDelivery as EventDeliveryModel
+from ....core.models import EventDeliveryAttempt, EventPayload
+from ....webhook.event_types import WebhookEventAsyncType, WebhookEventSyncType
 from ..exceptions import TruncationError
 from ..obfuscation import MASK
 from ..payload_schema import (
@@ -416,6 +418,32 @@ def test_generate_event_delivery_attempt_payload(event_attempt):
     )
 
 
+def test_generate_event_delivery_attempt_payload_for_not_saved_attempt(webhook):
+    # given
+    payload = EventPayload(payload='{"key": "value"}')
+    delivery = EventDeliveryModel(
+        event_type=WebhookEventSyncType.PAYMENT_CAPTURE,
+        status=EventDeliveryStatus.SUCCESS,
+        payload=payload,
+        webhook=webhook,
+    )
+    attempt = EventDeliveryAttempt(
+        delivery=delivery,
+        status=EventDeliveryStatus.SUCCESS,
+        created_at=datetime(1914, 6, 28, 10, 50, tzinfo=timezone.utc),
+    )
+
+    # when
+    attempt_payload = generate_event_delivery_attempt_payload(attempt, None, 1024)
+
+    # then
+    data = json.loads(attempt_payload)
+    assert data["id"] is None
+    assert data["eventDelivery"]["id"] is None
+    assert data["eventDelivery"]["eventSync"] is True
+    assert data["webhook"]["id"] == graphene.Node.to_global_id("Webhook", webhook.pk)
+
+
 def test_generate_event_delivery_attempt_payload_raises_truncation_error(event_attempt):
     too_small_bytes_limit = 10
     with pytest.raises(TruncationError):
@@ -1441,6 +1441,16 @@ def generate_order_payload_for_tax_calculation(order: "Order"):
     return order_data
 
 
+@traced_payload_generator
+def generate_orders_payload_for_tax_calculation(orders: Iterable["Order"]):
+    return json.dumps(
+        [
+            json.loads(generate_order_payload_for_tax_calculation(order))[0]
+            for order in orders
+        ]
+    )
+
+
 @traced_payload_generator
 def generate_transaction_action_request_payload(
     transaction_data: "TransactionActionData",
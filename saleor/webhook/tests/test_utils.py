@@ -1,6 +1,10 @@
 import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
 from ...app.models import App
+from .. import utils as webhook_utils
 from ..event_types import WebhookEventAsyncType, WebhookEventSyncType
 from ..models import Webhook
 from ..observability.exceptions import (
@@ -9,7 +13,11 @@ from ..observability.exceptions import (
     TruncationError,
 )
 from ..observability.payload_schema import ObservabilityEventTypes
-from ..utils import get_webhooks_for_event
+from ..utils import (
+    WEBHOOKS_ROUTING_TABLE_VERSION_CACHE_KEY,
+    get_webhooks_for_event,
+    invalidate_webhooks_routing_table,
+)
 
 
 @pytest.fixture
@@ -114,6 +122,108 @@ def test_get_webhook_for_event_not_returning_any_webhook_for_sync_event_types(
     assert set(webhooks) == {sync_webhook}
 
 
+@pytest.fixture
+def _webhooks_routing_table_enabled(settings):
+    settings.WEBHOOK_ROUTING_TABLE_ENABLED = True
+    yield
+    webhook_utils._webhooks_routing_table = None
+    cache.delete(WEBHOOKS_ROUTING_TABLE_VERSION_CACHE_KEY)
+
+
+@pytest.mark.usefixtures("_webhooks_routing_table_enabled")
+def test_get_webhooks_for_event_from_routing_table(
+    sync_webhook, async_app_factory, async_type, sync_type
+):
+    # given
+    _, async_webhook = async_app_factory()
+    _, any_webhook = async_app_factory(any_webhook=True)
+    async_app_factory(active_app=False)
+    async_app_factory(active_webhook=False)
+    app, _ = async_app_factory(any_webhook=True)
+    app.permissions.clear()
+
+    # when
+    async_webhooks = get_webhooks_for_event(async_type)
+    sync_webhooks = get_webhooks_for_event(sync_type)
+
+    # then
+    assert set(async_webhooks) == {async_webhook, any_webhook}
+    assert set(sync_webhooks) == {sync_webhook}
+
+
+@pytest.mark.usefixtures("_webhooks_routing_table_enabled")
+def test_get_webhooks_for_event_from_routing_table_skips_removed_apps(
+    async_app_factory, async_type, permission_manage_apps
+):
+    # given
+    app, webhook = async_app_factory(any_webhook=True)
+    app.permissions.add(permission_manage_apps)
+    app.removed_at = "2024-01-01T00:00:00Z"
+    app.save(update_fields=["removed_at"])
+
+    # when
+    async_webhooks = get_webhooks_for_event(async_type)
+    app_deleted_webhooks = get_webhooks_for_event(WebhookEventAsyncType.APP_DELETED)
+
+    # then
+    assert async_webhooks == []
+    assert app_deleted_webhooks == [webhook]
+
+
+@pytest.mark.usefixtures("_webhooks_routing_table_enabled")
+def test_get_webhooks_for_event_routing_table_reloaded_after_invalidation(
+    async_app_factory, async_type, django_capture_on_commit_callbacks
+):
+    # given
+    _, webhook = async_app_factory()
+    assert get_webhooks_for_event(async_type) == [webhook]
+    webhook.is_active = False
+    webhook.save(update_fields=["is_active"])
+
+    # when
+    webhooks_before_invalidation = get_webhooks_for_event(async_type)
+    with django_capture_on_commit_callbacks(execute=True):
+        invalidate_webhooks_routing_table()
+    webhooks_after_invalidation = get_webhooks_for_event(async_type)
+
+    # then
+    assert webhooks_before_invalidation == [webhook]
+    assert webhooks_after_invalidation == []
+
+
+@pytest.mark.parametrize("routing_table_enabled", [False, True])
+def test_get_webhooks_for_event_dispatch_overhead(
+    routing_table_enabled, async_app_factory, settings
+):
+    # given
+    settings.WEBHOOK_ROUTING_TABLE_ENABLED = routing_table_enabled
+    for _ in range(3):
+        async_app_factory(any_webhook=True)
+    event_types = [
+        WebhookEventAsyncType.ORDER_CREATED,
+        WebhookEventAsyncType.ORDER_UPDATED,
+        WebhookEventAsyncType.ORDER_FULLY_PAID,
+    ]
+    dispatches = 100
+
+    # when
+    with CaptureQueriesContext(connection) as queries:
+        for _ in range(dispatches):
+            for event_type in event_types:
+                assert len(list(get_webhooks_for_event(event_type))) == 3
+
+    # then
+    webhook_utils._webhooks_routing_table = None
+    cache.delete(WEBHOOKS_ROUTING_TABLE_VERSION_CACHE_KEY)
+    if routing_table_enabled:
+        # webhooks, their events and app permissions are loaded only once
+        assert len(queries) == 4
+    else:
+        # webhooks, app permissions and their content types are queried for each
+        # dispatched event
+        assert len(queries) == 3 * dispatches * len(event_types)
+
+
 @pytest.mark.parametrize(
     ("error", "event_type"),
     [
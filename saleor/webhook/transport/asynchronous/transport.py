@@ -2,16 +2,20 @@ import datetime
 import json
 import logging
 from collections.abc import Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
 from typing import TYPE_CHECKING, Optional
 from urllib.parse import urlparse
 
 from celery import group
 from celery.utils.log import get_task_logger
 from django.conf import settings
+from django.utils import timezone
 
 from ....celeryconf import app
 from ....core import EventDeliveryStatus
-from ....core.models import EventDelivery, EventPayload
+from ....core.http_client import HTTPClient
+from ....core.models import EventDelivery, EventDeliveryAttempt, EventPayload
 from ....core.tracing import webhooks_opentracing_trace
 from ....core.utils import get_domain
 from ....graphql.core.dataloaders import DataLoader
@@ -34,6 +38,7 @@ from ..utils import (
     get_delivery_for_webhook,
     handle_webhook_retry,
     send_webhook_using_scheme_method,
+    set_attempt_response,
 )
 
 if TYPE_CHECKING:
@@ -43,6 +48,11 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 task_logger = get_task_logger(__name__)
 
+# Deliveries collected by `webhook_deliveries_batch`, as (webhook id, delivery id).
+_deliveries_batch: ContextVar[Optional[list[tuple[int, int]]]] = ContextVar(
+    "webhook_deliveries_batch", default=None
+)
+
 
 def create_deliveries_for_subscriptions(
     event_type,
@@ -118,7 +128,8 @@ def create_deliveries_for_subscriptions(
                 )
                 continue
 
-        event_payload = EventPayload(payload=json.dumps({**data}))
+        event_payload = EventPayload()
+        event_payload.set_payload(json.dumps({**data}))
         event_payloads.append(event_payload)
         event_deliveries.append(
             EventDelivery(
@@ -190,7 +201,7 @@ def trigger_webhooks_async(
         elif data is None:
             raise NotImplementedError("No payload was provided for regular webhooks.")
 
-        payload = EventPayload.objects.create(payload=data)
+        payload = EventPayload.objects.create_with_payload(data)
         deliveries.extend(
             create_event_delivery_list_for_webhooks(
                 webhooks=regular_webhooks,
@@ -211,8 +222,48 @@ def trigger_webhooks_async(
             )
         )
 
-    for delivery in deliveries:
-        send_webhook_request_async.delay(delivery.id)
+    delivery_keys = [(delivery.webhook_id, delivery.id) for delivery in deliveries]
+    batch = _deliveries_batch.get()
+    if batch is not None:
+        batch.extend(delivery_keys)
+    else:
+        send_webhook_requests(delivery_keys)
+
+
+@contextmanager
+def webhook_deliveries_batch():
+    """Collect async webhook deliveries triggered within the block.
+
+    Collected deliveries are sent once the block exits, in batches of
+    `WEBHOOK_ASYNC_BATCH_SIZE`, so bulk operations emitting an event per object
+    queue a few batch tasks instead of a task per delivery.
+    """
+    if _deliveries_batch.get() is not None:
+        yield
+        return
+    token = _deliveries_batch.set([])
+    try:
+        yield
+    finally:
+        delivery_keys = _deliveries_batch.get() or []
+        _deliveries_batch.reset(token)
+        send_webhook_requests(delivery_keys)
+
+
+def send_webhook_requests(delivery_keys: list[tuple[int, int]]):
+    """Queue sending of deliveries given as (webhook id, delivery id) pairs.
+
+    Deliveries of the same webhook are put next to each other, so a batch task can
+    send them over a single HTTP session.
+    """
+    batch_size = settings.WEBHOOK_ASYNC_BATCH_SIZE
+    if batch_size <= 1 or len(delivery_keys) <= 1:
+        for _, delivery_id in delivery_keys:
+            send_webhook_request_async.delay(delivery_id)
+        return
+    delivery_ids = [delivery_id for _, delivery_id in sorted(delivery_keys)]
+    for index in range(0, len(delivery_ids), batch_size):
+        send_webhook_request_batch_async.delay(delivery_ids[index : index + batch_size])
 
 
 @app.task(
@@ -235,7 +286,7 @@ def send_webhook_request_async(self, event_delivery_id):
             raise ValueError(
                 "Event delivery id: %r has no payload." % event_delivery_id
             )
-        data = delivery.payload.payload
+        data = delivery.payload.get_payload()
         with webhooks_opentracing_trace(delivery.event_type, domain, app=webhook.app):
             response = send_webhook_using_scheme_method(
                 webhook.target_url,
@@ -267,6 +318,156 @@ def send_webhook_request_async(self, event_delivery_id):
     clear_successful_delivery(delivery)
 
 
+@app.task(
+    queue=settings.WEBHOOK_CELERY_QUEUE_NAME,
+    bind=True,
+    retry_backoff=10,
+    retry_kwargs={"max_retries": 5},
+)
+def send_webhook_request_batch_async(self, event_delivery_ids):
+    """Send a batch of async webhook deliveries.
+
+    Deliveries are sent over a single HTTP session, so requests to the same webhook
+    reuse the connection. Attempts and statuses are saved in bulk. A failed
+    delivery that should be retried is handed over to `send_webhook_request_async`
+    as its first retry, so each delivery keeps the retry schedule of a single
+    delivery task.
+    """
+    deliveries = list(
+        EventDelivery.objects.select_related("payload", "webhook__app")
+        .filter(id__in=event_delivery_ids)
+        .order_by("webhook_id", "id")
+    )
+    missing_ids = set(event_delivery_ids) - {delivery.id for delivery in deliveries}
+    for delivery_id in missing_ids:
+        logger.error("Event delivery id: %r not found", delivery_id)
+
+    inactive_deliveries = []
+    active_deliveries = []
+    for delivery in deliveries:
+        if delivery.webhook.is_active:
+            active_deliveries.append(delivery)
+        else:
+            logger.info("Event delivery id: %r webhook is disabled.", delivery.id)
+            delivery.status = EventDeliveryStatus.FAILED
+            inactive_deliveries.append(delivery)
+
+    attempts = EventDeliveryAttempt.objects.bulk_create(
+        [
+            EventDeliveryAttempt(
+                delivery=delivery,
+                task_id=self.request.id,
+                status=EventDeliveryStatus.PENDING,
+            )
+            for delivery in active_deliveries
+        ]
+    )
+    domain = get_domain()
+    retries = []
+    with HTTPClient.get_batch_session() as session:
+        for delivery, attempt in zip(active_deliveries, attempts):
+            try:
+                response = _send_batched_webhook_request(
+                    delivery, domain, session=session
+                )
+            except ValueError as e:
+                response = WebhookResponse(
+                    content=str(e), status=EventDeliveryStatus.FAILED
+                )
+                set_attempt_response(attempt, response)
+                delivery.status = EventDeliveryStatus.FAILED
+                continue
+            set_attempt_response(attempt, response)
+            if response.status == EventDeliveryStatus.SUCCESS:
+                delivery.status = EventDeliveryStatus.SUCCESS
+                task_logger.info(
+                    "[Webhook ID:%r] Payload sent to %r for event %r. "
+                    "Delivery id: %r",
+                    delivery.webhook.id,
+                    delivery.webhook.target_url,
+                    delivery.event_type,
+                    delivery.id,
+                )
+            elif _should_retry_batched_delivery(delivery, attempt, response):
+                retries.append((delivery, attempt))
+            else:
+                delivery.status = EventDeliveryStatus.FAILED
+
+    EventDeliveryAttempt.objects.bulk_update(
+        attempts,
+        [
+            "duration",
+            "response",
+            "response_headers",
+            "response_status_code",
+            "request_headers",
+            "status",
+        ],
+    )
+    EventDelivery.objects.bulk_update(
+        inactive_deliveries + active_deliveries, ["status"]
+    )
+
+    countdown = self.retry_backoff
+    next_retry = timezone.now() + datetime.timedelta(seconds=countdown)
+    retry_attempt_ids = set()
+    for delivery, attempt in retries:
+        retry_attempt_ids.add(attempt.id)
+        send_webhook_request_async.apply_async(
+            (delivery.id,), countdown=countdown, retries=1
+        )
+        observability.report_event_delivery_attempt(attempt, next_retry)
+    for attempt in attempts:
+        if attempt.id not in retry_attempt_ids:
+            observability.report_event_delivery_attempt(attempt)
+
+    successful_deliveries = [
+        delivery
+        for delivery in active_deliveries
+        if delivery.status == EventDeliveryStatus.SUCCESS
+    ]
+    if successful_deliveries:
+        EventDelivery.objects.filter(
+            id__in=[delivery.id for delivery in successful_deliveries]
+        ).delete()
+        EventPayload.objects.filter(
+            pk__in={delivery.payload_id for delivery in successful_deliveries},
+            deliveries__isnull=True,
+        ).delete()
+
+
+def _send_batched_webhook_request(delivery, domain, session) -> WebhookResponse:
+    webhook = delivery.webhook
+    if not delivery.payload:
+        raise ValueError("Event delivery id: %r has no payload." % delivery.id)
+    with webhooks_opentracing_trace(delivery.event_type, domain, app=webhook.app):
+        return send_webhook_using_scheme_method(
+            webhook.target_url,
+            domain,
+            webhook.secret_key,
+            delivery.event_type,
+            delivery.payload.get_payload(),
+            webhook.custom_headers,
+            session=session,
+        )
+
+
+def _should_retry_batched_delivery(delivery, attempt, response) -> bool:
+    webhook = delivery.webhook
+    task_logger.info(
+        "[Webhook ID: %r] Failed request to %r: %r for event: %r."
+        " Delivery attempt id: %r",
+        webhook.id,
+        webhook.target_url,
+        response.content,
+        delivery.event_type,
+        attempt.id,
+    )
+    status_code = response.response_status_code
+    # Do not retry for 30x and 40x status codes.
+    return not (status_code and 300 <= status_code < 500)
+
+
 def send_observability_events(webhooks: list[WebhookData], events: list[bytes]):
     event_type = WebhookEventAsyncType.OBSERVABILITY
     for webhook in webhooks:
@@ -2,11 +2,11 @@ import base64
 import json
 import logging
 from collections import defaultdict
+from collections.abc import Iterable
 from typing import Any, Callable, Optional, Union
 
 from django.conf import settings
 from django.core.cache import cache
-from django.db.models import QuerySet
 from graphql import GraphQLError
 from prices import Money
 
@@ -19,6 +19,7 @@ from ...plugins.base_plugin import ExcludedShippingMethod
 from ...shipping.interface import ShippingMethodData
 from ...webhook.utils import get_webhooks_for_event
 from ..const import APP_ID_PREFIX, CACHE_EXCLUDED_SHIPPING_TIME
+from ..models import Webhook
 from .synchronous.transport import trigger_webhook_sync
 
 logger = logging.getLogger(__name__)
@@ -97,7 +98,7 @@ def _compare_order_payloads(payload: str, cached_payload: str) -> bool:
 
 
 def get_excluded_shipping_methods_or_fetch(
-    webhooks: QuerySet,
+    webhooks: Iterable[Webhook],
     event_type: str,
     payload: str,
     cache_key: str,
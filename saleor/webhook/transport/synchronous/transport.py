@@ -1,5 +1,6 @@
 import json
 import logging
+import random
 from json import JSONDecodeError
 from typing import TYPE_CHECKING, Any, Callable, Optional, TypeVar
 from urllib.parse import urlparse
@@ -7,10 +8,11 @@ from urllib.parse import urlparse
 from celery.utils.log import get_task_logger
 from django.conf import settings
 from django.core.cache import cache
+from django.utils import timezone
 
 from ....celeryconf import app
 from ....core import EventDeliveryStatus
-from ....core.models import EventDelivery, EventPayload
+from ....core.models import EventDelivery, EventDeliveryAttempt, EventPayload
 from ....core.tracing import webhooks_opentracing_trace
 from ....core.utils import get_domain
 from ....graphql.webhook.subscription_payload import (
@@ -38,7 +40,9 @@ from ..utils import (
     generate_cache_key_for_webhook,
     get_delivery_for_webhook,
     handle_webhook_retry,
+    save_in_memory_delivery,
     send_webhook_using_http,
+    set_attempt_response,
 )
 
 if TYPE_CHECKING:
@@ -88,7 +92,7 @@ def _send_webhook_request_sync(
     delivery, timeout=settings.WEBHOOK_SYNC_TIMEOUT, attempt=None
 ) -> tuple[WebhookResponse, Optional[dict[Any, Any]]]:
     event_payload = delivery.payload
-    data = event_payload.payload
+    data = event_payload.get_payload()
     webhook = delivery.webhook
     parts = urlparse(webhook.target_url)
     domain = get_domain()
@@ -96,7 +100,11 @@ def _send_webhook_request_sync(
     signature = signature_for_payload(message, webhook.secret_key)
 
     if parts.scheme.lower() not in [WebhookSchemes.HTTP, WebhookSchemes.HTTPS]:
-        delivery_update(delivery, EventDeliveryStatus.FAILED)
+        if delivery.pk is None:
+            delivery.status = EventDeliveryStatus.FAILED
+            save_in_memory_delivery(delivery)
+        else:
+            delivery_update(delivery, EventDeliveryStatus.FAILED)
         raise ValueError(f"Unknown webhook scheme: {parts.scheme!r}")
 
     logger.debug(
@@ -105,9 +113,13 @@ def _send_webhook_request_sync(
         delivery.event_type,
     )
     if attempt is None:
-        attempt = create_attempt(delivery=delivery, task_id=None)
+        if delivery.pk is None:
+            attempt = EventDeliveryAttempt(delivery=delivery, created_at=timezone.now())
+        else:
+            attempt = create_attempt(delivery=delivery, task_id=None)
     response = WebhookResponse(content="")
     response_data = None
+    json_error = None
 
     try:
         with webhooks_opentracing_trace(
@@ -125,36 +137,111 @@ def _send_webhook_request_sync(
             response_data = json.loads(response.content)
 
     except JSONDecodeError as e:
+        json_error = e
+        response.status = EventDeliveryStatus.FAILED
+
+    if delivery.pk is None:
+        _finish_in_memory_delivery(delivery, attempt, response)
+        _log_webhook_response(webhook.target_url, attempt, response, json_error)
+        return response, response_data
+
+    attempt_update(attempt, response)
+    delivery_update(delivery, response.status)
+    _log_webhook_response(webhook.target_url, attempt, response, json_error)
+    observability.report_event_delivery_attempt(attempt)
+    clear_successful_delivery(delivery)
+    return response, response_data
+
+
+def _log_webhook_response(
+    target_url: str,
+    attempt: EventDeliveryAttempt,
+    response: WebhookResponse,
+    json_error: Optional[JSONDecodeError],
+):
+    """Log the webhook response once the attempt is saved.
+
+    Successful attempts of non-persistent deliveries are not saved, so they are
+    logged without the id.
+    """
+    if json_error:
         logger.info(
             "[Webhook] Failed parsing JSON response from %r: %r."
             "ID of failed DeliveryAttempt: %r . ",
-            webhook.target_url,
-            e,
+            target_url,
+            json_error,
             attempt.id,
         )
-        response.status = EventDeliveryStatus.FAILED
-    else:
-        if response.status == EventDeliveryStatus.FAILED:
-            logger.info(
-                "[Webhook] Failed request to %r: %r. "
-                "ID of failed DeliveryAttempt: %r . ",
-                webhook.target_url,
-                response.content,
-                attempt.id,
-            )
-        if response.status == EventDeliveryStatus.SUCCESS:
+    elif response.status == EventDeliveryStatus.FAILED:
+        logger.info(
+            "[Webhook] Failed request to %r: %r. "
+            "ID of failed DeliveryAttempt: %r . ",
+            target_url,
+            response.content,
+            attempt.id,
+        )
+    elif response.status == EventDeliveryStatus.SUCCESS:
+        if attempt.id is None:
+            logger.debug("[Webhook] Success response from %r.", target_url)
+        else:
             logger.debug(
                 "[Webhook] Success response from %r."
                 "Successful DeliveryAttempt id: %r",
-                webhook.target_url,
+                target_url,
                 attempt.id,
             )
 
-    attempt_update(attempt, response)
-    delivery_update(delivery, response.status)
+
+def _finish_in_memory_delivery(
+    delivery: EventDelivery, attempt: EventDeliveryAttempt, response: WebhookResponse
+):
+    """Save an in-memory delivery only when it failed or was sampled.
+
+    Attempts that are not saved are reported to observability without ids.
+    """
+    set_attempt_response(attempt, response)
+    delivery.status = response.status
+    if (
+        response.status != EventDeliveryStatus.SUCCESS
+        or random.random() < settings.WEBHOOK_SYNC_DELIVERIES_SAMPLE_RATE
+    ):
+        save_in_memory_delivery(delivery, attempt)
     observability.report_event_delivery_attempt(attempt)
-    clear_successful_delivery(delivery)
-    return response, response_data
+
+
+def create_sync_event_payload(payload: str, persistent: bool = True) -> EventPayload:
+    """Create the payload of a synchronous webhook.
+
+    Non-persistent payloads are kept in memory and offloaded to the file storage,
+    if needed, only when they are saved by `save_in_memory_delivery`.
+    """
+    if persistent:
+        return EventPayload.objects.create_with_payload(payload)
+    return EventPayload(payload=payload, created_at=timezone.now())
+
+
+def create_sync_event_delivery(
+    event_type: str,
+    event_payload: EventPayload,
+    webhook: "Webhook",
+    persistent: bool = True,
+) -> EventDelivery:
+    """Create a pending delivery of a synchronous webhook.
+
+    Non-persistent deliveries are only built in memory and are saved by
+    `_send_webhook_request_sync` if the request fails or the delivery is sampled.
+    """
+    delivery = EventDelivery(
+        status=EventDeliveryStatus.PENDING,
+        event_type=event_type,
+        payload=event_payload,
+        webhook=webhook,
+    )
+    if persistent:
+        delivery.save()
+    else:
+        delivery.created_at = timezone.now()
+    return delivery
 
 
 def send_webhook_request_sync(
@@ -211,6 +298,7 @@ def create_delivery_for_subscription_sync_event(
     requestor=None,
     request=None,
     allow_replica=False,
+    persistent=True,
 ) -> Optional[EventDelivery]:
     """Generate webhook payload based on subscription query and create delivery object.
 
@@ -224,6 +312,7 @@ def create_delivery_for_subscription_sync_event(
     :param request: used to share context between sync event calls
     :return: List of event deliveries to send via webhook tasks.
     :param allow_replica: use replica database.
+    :param persistent: save the delivery in the database, otherwise keep it in memory.
     """
     if event_type not in WEBHOOK_TYPES_MAP:
         logger.info(
@@ -252,14 +341,8 @@ def create_delivery_for_subscription_sync_event(
         # Return None so if subscription query returns no data Saleor will not crash but
         # log the issue and continue without creating a delivery.
         return None
-    event_payload = EventPayload.objects.create(payload=json.dumps({**data}))
-    event_delivery = EventDelivery.objects.create(
-        status=EventDeliveryStatus.PENDING,
-        event_type=event_type,
-        payload=event_payload,
-        webhook=webhook,
-    )
-    return event_delivery
+    event_payload = create_sync_event_payload(json.dumps({**data}), persistent)
+    return create_sync_event_delivery(event_type, event_payload, webhook, persistent)
 
 
 def trigger_webhook_sync(
@@ -272,6 +355,7 @@ def trigger_webhook_sync(
     request=None,
 ) -> Optional[dict[Any, Any]]:
     """Send a synchronous webhook request."""
+    persistent = settings.WEBHOOK_SYNC_DELIVERIES_PERSISTENT
     if webhook.subscription_query:
         delivery = create_delivery_for_subscription_sync_event(
             event_type=event_type,
@@ -279,16 +363,14 @@ def trigger_webhook_sync(
             webhook=webhook,
             request=request,
             allow_replica=allow_replica,
+            persistent=persistent,
         )
         if not delivery:
             return None
     else:
-        event_payload = EventPayload.objects.create(payload=payload)
-        delivery = EventDelivery.objects.create(
-            status=EventDeliveryStatus.PENDING,
-            event_type=event_type,
-            payload=event_payload,
-            webhook=webhook,
+        event_payload = create_sync_event_payload(payload, persistent)
+        delivery = create_sync_event_delivery(
+            event_type, event_payload, webhook, persistent
         )
 
     kwargs = {}
@@ -315,6 +397,7 @@ def trigger_all_webhooks_sync(
     this function returns None.
     """
     webhooks = get_webhooks_for_event(event_type)
+    persistent = settings.WEBHOOK_SYNC_DELIVERIES_PERSISTENT
     request_context = None
     event_payload = None
     for webhook in webhooks:
@@ -333,17 +416,17 @@ def trigger_all_webhooks_sync(
                 webhook=webhook,
                 request=request_context,
                 requestor=requestor,
+                persistent=persistent,
             )
             if not delivery:
                 return None
         else:
             if event_payload is None:
-                event_payload = EventPayload.objects.create(payload=generate_payload())
-            delivery = EventDelivery.objects.create(
-                status=EventDeliveryStatus.PENDING,
-                event_type=event_type,
-                payload=event_payload,
-                webhook=webhook,
+                event_payload = create_sync_event_payload(
+                    generate_payload(), persistent
+                )
+            delivery = create_sync_event_delivery(
+                event_type, event_payload, webhook, persistent
             )
 
         response_data = send_webhook_request_sync(delivery)
@@ -18,6 +18,7 @@ from django.conf import settings
 from django.urls import reverse
 from google.cloud import pubsub_v1
 from requests import RequestException
+from requests_hardened import HTTPSession
 from requests_hardened.ip_filter import InvalidIPAddress
 
 from ...app.headers import AppHeaders, DeprecatedAppHeaders
@@ -108,6 +109,7 @@ def send_webhook_using_http(
     event_type,
     timeout=settings.WEBHOOK_TIMEOUT,
     custom_headers: Optional[dict[str, str]] = None,
+    session: Optional[HTTPSession] = None,
 ) -> WebhookResponse:
     """Send a webhook request using http / https protocol.
 
@@ -118,6 +120,8 @@ def send_webhook_using_http(
     :param event_type: Webhook event type.
     :param timeout: Request timeout.
     :param custom_headers: Custom headers which will be added to request headers.
+    :param session: Open HTTP session to reuse its connections; a new session is
+        created for the request when not provided.
 
     :return: WebhookResponse object.
     """
@@ -136,15 +140,17 @@ def send_webhook_using_http(
     if custom_headers:
         headers.update(custom_headers)
 
+    request_kwargs = {
+        "data": message,
+        "headers": headers,
+        "timeout": timeout,
+        "allow_redirects": False,
+    }
     try:
-        response = HTTPClient.send_request(
-            "POST",
-            target_url,
-            data=message,
-            headers=headers,
-            timeout=timeout,
-            allow_redirects=False,
-        )
+        if session is not None:
+            response = session.request("POST", target_url, **request_kwargs)
+        else:
+            response = HTTPClient.send_request("POST", target_url, **request_kwargs)
     except RequestException as e:
         if e.response:
             return WebhookResponse(
@@ -269,6 +275,7 @@ def send_webhook_using_scheme_method(
     event_type,
     data,
     custom_headers=None,
+    session=None,
 ) -> WebhookResponse:
     parts = urlparse(target_url)
     message = data if isinstance(data, bytes) else data.encode("utf-8")
@@ -281,7 +288,7 @@ def send_webhook_using_scheme_method(
     }
 
     if send_method := scheme_matrix.get(parts.scheme.lower()):
-        # try:
+        kwargs = {"session": session} if session is not None else {}
         return send_method(
             target_url,
             message,
@@ -289,6 +296,7 @@ def send_webhook_using_scheme_method(
             signature,
             event_type,
             custom_headers=custom_headers,
+            **kwargs,
         )
     raise ValueError(f"Unknown webhook scheme: {parts.scheme!r}")
 
@@ -394,7 +402,7 @@ def create_attempt(
     return attempt
 
 
-def attempt_update(
+def set_attempt_response(
     attempt: "EventDeliveryAttempt",
     webhook_response: "WebhookResponse",
 ):
@@ -404,6 +412,13 @@ def attempt_update(
     attempt.response_status_code = webhook_response.response_status_code
     attempt.request_headers = json.dumps(webhook_response.request_headers)
     attempt.status = webhook_response.status
+
+
+def attempt_update(
+    attempt: "EventDeliveryAttempt",
+    webhook_response: "WebhookResponse",
+):
+    set_attempt_response(attempt, webhook_response)
     attempt.save(
         update_fields=[
             "duration",
@@ -429,6 +444,25 @@ def delivery_update(delivery: "EventDelivery", status: str):
     delivery.save(update_fields=["status"])
 
 
+def save_in_memory_delivery(
+    delivery: "EventDelivery", attempt: Optional["EventDeliveryAttempt"] = None
+):
+    """Save a delivery kept in memory together with its payload and attempt.
+
+    The payload may be shared between several deliveries, so it is saved only once.
+    Large payloads are offloaded to the file storage before saving.
+    """
+    payload = delivery.payload
+    if payload is not None and payload.pk is None:
+        payload.set_payload(payload.payload)
+        payload.save()
+    delivery.payload = payload
+    delivery.save()
+    if attempt is not None:
+        attempt.delivery = delivery
+        attempt.save()
+
+
 def trigger_transaction_request(
     transaction_data: "TransactionActionData", event_type: str, requestor
 ):
@@ -486,7 +520,7 @@ def trigger_transaction_request(
         payload = generate_transaction_action_request_payload(
             transaction_data, requestor
         )
-        event_payload = EventPayload.objects.create(payload=payload)
+        event_payload = EventPayload.objects.create_with_payload(payload)
         delivery = EventDelivery.objects.create(
             status=EventDeliveryStatus.PENDING,
             event_type=event_type,
@@ -510,6 +544,15 @@ def parse_tax_data(
         return None
 
 
+def parse_tax_data_bulk(
+    response_data: Any, tax_bases_count: int
+) -> Optional[list[Optional[TaxData]]]:
+    """Parse tax data of many tax bases, listed in the order they were sent."""
+    if not isinstance(response_data, list) or len(response_data) != tax_bases_count:
+        return None
+    return [parse_tax_data(tax_data) for tax_data in response_data]
+
+
 def parse_payment_action_response(
     payment_information: "PaymentData",
     response_data: Any,
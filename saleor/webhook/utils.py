@@ -1,6 +1,11 @@
-from typing import TYPE_CHECKING, Optional
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Optional, Union, overload
+from uuid import uuid4
 
 from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
 from django.db.models import Q
 from django.db.models.expressions import Exists, OuterRef
 
@@ -11,20 +16,183 @@ from .models import Webhook, WebhookEvent
 if TYPE_CHECKING:
     from django.db.models import QuerySet
 
+WEBHOOKS_ROUTING_TABLE_VERSION_CACHE_KEY = "webhooks_routing_table_version"
 
+
+@dataclass
+class WebhooksRoutingTable:
+    """Active webhooks of active apps, shared by all event dispatches of a process.
+
+    Webhooks matching an event type are resolved on the first lookup and memoized
+    until the table version changes.
+    """
+
+    version: str
+    webhooks: list[Webhook]
+    event_types: dict[int, set[str]]
+    app_permissions: dict[int, set[str]]
+    routes: dict[str, list[Webhook]] = field(default_factory=dict)
+
+    def get_webhooks(self, event_type: str) -> list[Webhook]:
+        webhooks = self.routes.get(event_type)
+        if webhooks is None:
+            webhooks = self._match_webhooks(event_type)
+            self.routes[event_type] = webhooks
+        return webhooks
+
+    def _match_webhooks(self, event_type: str) -> list[Webhook]:
+        required_permission = _get_required_permission(event_type)
+        event_types = {event_type}
+        if event_type in WebhookEventAsyncType.ALL:
+            event_types.add(WebhookEventAsyncType.ANY)
+        include_removed_apps = event_type == WebhookEventAsyncType.APP_DELETED
+        return [
+            webhook
+            for webhook in self.webhooks
+            if self.event_types[webhook.id] & event_types
+            and (include_removed_apps or webhook.app.removed_at is None)
+            and (
+                required_permission is None
+                or required_permission in self.app_permissions[webhook.app_id]
+            )
+        ]
+
+
+_webhooks_routing_table: Optional[WebhooksRoutingTable] = None
+
+
+def get_webhooks_routing_table_version() -> str:
+    version = cache.get(WEBHOOKS_ROUTING_TABLE_VERSION_CACHE_KEY)
+    if version is None:
+        cache.add(WEBHOOKS_ROUTING_TABLE_VERSION_CACHE_KEY, uuid4().hex, timeout=None)
+        version = cache.get(WEBHOOKS_ROUTING_TABLE_VERSION_CACHE_KEY)
+    return version
+
+
+def invalidate_webhooks_routing_table():
+    """Make all processes reload the webhooks routing table.
+
+    Should be called whenever webhooks, their events, apps or app permissions
+    change. The version is bumped once the current transaction is committed.
+    """
+
+    def bump_version():
+        cache.set(WEBHOOKS_ROUTING_TABLE_VERSION_CACHE_KEY, uuid4().hex, timeout=None)
+
+    transaction.on_commit(bump_version)
+
+
+def get_webhooks_routing_table() -> WebhooksRoutingTable:
+    global _webhooks_routing_table
+
+    version = get_webhooks_routing_table_version()
+    table = _webhooks_routing_table
+    if table is None or table.version != version:
+        table = _load_webhooks_routing_table(version)
+        _webhooks_routing_table = table
+    return table
+
+
+def _load_webhooks_routing_table(version: str) -> WebhooksRoutingTable:
+    # The table is shared with all requests, so it's always loaded from the default
+    # database to not cache replication lag.
+    database = settings.DATABASE_CONNECTION_DEFAULT_NAME
+    webhooks = list(
+        Webhook.objects.using(database)
+        .filter(is_active=True, app__is_active=True)
+        .select_related("app")
+        .prefetch_related("app__permissions__content_type")
+        .order_by("id")
+    )
+    event_types: dict[int, set[str]] = defaultdict(set)
+    for webhook_id, event_type in (
+        WebhookEvent.objects.using(database)
+        .filter(webhook_id__in=[webhook.id for webhook in webhooks])
+        .values_list("webhook_id", "event_type")
+    ):
+        event_types[webhook_id].add(event_type)
+    app_permissions = {
+        webhook.app_id: {
+            f"{permission.content_type.app_label}.{permission.codename}"
+            for permission in webhook.app.permissions.all()
+        }
+        for webhook in webhooks
+    }
+    return WebhooksRoutingTable(version, webhooks, event_types, app_permissions)
+
+
+def _get_required_permission(event_type: str) -> Optional[str]:
+    required_permission = WebhookEventAsyncType.PERMISSIONS.get(
+        event_type, WebhookEventSyncType.PERMISSIONS.get(event_type)
+    )
+    return required_permission.value if required_permission else None
+
+
+@overload
 def get_webhooks_for_event(
     event_type: str,
-    webhooks: Optional["QuerySet[Webhook]"] = None,
+    webhooks: None = None,
+    apps_ids: None = None,
+    apps_identifier: None = None,
+) -> Union["QuerySet[Webhook]", list[Webhook]]:
+    ...
+
+
+@overload
+def get_webhooks_for_event(
+    event_type: str,
+    webhooks: "QuerySet[Webhook]",
     apps_ids: Optional["list[int]"] = None,
     apps_identifier: Optional[list[str]] = None,
 ) -> "QuerySet[Webhook]":
-    """Get active webhooks from the database for an event."""
+    ...
+
+
+@overload
+def get_webhooks_for_event(
+    event_type: str,
+    webhooks: Optional["QuerySet[Webhook]"] = None,
+    *,
+    apps_ids: "list[int]",
+    apps_identifier: Optional[list[str]] = None,
+) -> "QuerySet[Webhook]":
+    ...
+
+
+@overload
+def get_webhooks_for_event(
+    event_type: str,
+    webhooks: Optional["QuerySet[Webhook]"] = None,
+    apps_ids: Optional["list[int]"] = None,
+    *,
+    apps_identifier: list[str],
+) -> "QuerySet[Webhook]":
+    ...
+
+
+def get_webhooks_for_event(
+    event_type: str,
+    webhooks: Optional["QuerySet[Webhook]"] = None,
+    apps_ids: Optional["list[int]"] = None,
+    apps_identifier: Optional[list[str]] = None,
+) -> Union["QuerySet[Webhook]", list[Webhook]]:
+    """Get active webhooks for an event.
+
+    When `WEBHOOK_ROUTING_TABLE_ENABLED` is set, webhooks of all apps are returned
+    from the process-local routing table instead of being queried from the database.
+    """
+    if (
+        settings.WEBHOOK_ROUTING_TABLE_ENABLED
+        and webhooks is None
+        and not apps_ids
+        and not apps_identifier
+    ):
+        return get_webhooks_routing_table().get_webhooks(event_type)
+
     permissions = {}
-    required_permission = WebhookEventAsyncType.PERMISSIONS.get(
-        event_type, WebhookEventSyncType.PERMISSIONS.get(event_type)
-    )
+    required_permission = _get_required_permission(event_type)
     if required_permission:
-        app_label, codename = required_permission.value.split(".")
+        app_label, codename = required_permission.split(".")
         permissions["permissions__content_type__app_label"] = app_label
         permissions["permissions__codename"] = codename
 